@@ -32,6 +32,7 @@ from pygsti.circuits.circuitlist import CircuitList as _CircuitList
 from pygsti.baseobjs.resourceallocation import ResourceAllocation as _ResourceAllocation
 from pygsti.optimize.customlm import CustomLMOptimizer as _CustomLMOptimizer
 from pygsti.optimize.customlm import Optimizer as _Optimizer
+from pygsti.optimize.customlm import OptimizerResult as _OptimizerResult
 
 _dummy_profiler = _DummyProfiler()
 
@@ -698,7 +699,8 @@ def run_gst_fit(mdc_store, optimizer, objective_function_builder, verbosity=0):
 
 def run_iterative_gst(dataset, start_model, circuit_lists,
                       optimizer, iteration_objfn_builders, final_objfn_builders,
-                      resource_alloc, verbosity=0):
+                      resource_alloc, verbosity=0, minibatch_fractions=None, minibatch_seed=None,
+                      minibatch_min_size=None):
     """
     Performs Iterative Gate Set Tomography on the dataset.
 
@@ -709,7 +711,8 @@ def run_iterative_gst(dataset, start_model, circuit_lists,
 
     start_model : Model
         The Model used as a starting point for the least-squares
-        optimization.
+        optimization.  If its forward simulator computes in reduced (single)
+        precision, it is switched to double precision for the last iteration.
 
     circuit_lists : list of lists of (tuples or Circuits)
         The i-th element is a list of the circuits to be used in the i-th iteration
@@ -738,13 +741,37 @@ def run_iterative_gst(dataset, start_model, circuit_lists,
     verbosity : int, optional
         How much detail to send to stdout.
 
+    minibatch_fractions : list of floats, optional
+        If not None, an increasing sequence of fractions (in (0, 1]) of each iteration's circuits.
+        Each iteration but the last then fits the model, using `iteration_objfn_builders`, only
+        to random subsets ("mini-batches") of its circuits of these sizes in turn.  The circuits
+        of a mini-batch are weighted so that its objective function is an unbiased estimate of
+        the objective function of all the circuits, and a mini-batch contains at least
+        `minibatch_min_size` circuits.  Fractions for which this is all of an iteration's circuits
+        are replaced by a single fit to all of them.  Early iterations, which mainly serve to find a
+        good starting point for later ones, are then much cheaper when there are many circuits.
+        Each mini-batch's layout is created from the iteration's layout (see
+        :method:`ForwardSimulator.extend_layout`).  The optimizer result recorded for such an
+        iteration (see `optimums` below) gives the last of `iteration_objfn_builders`'s objective
+        function of *all* the iteration's circuits, evaluated at the model fit to the last mini-batch.
+
+    minibatch_seed : int, optional
+        A seed for the random selection of mini-batches.
+
+    minibatch_min_size : int, optional
+        The minimum number of circuits in a mini-batch.  If None, twice the number of
+        model parameters is used, so that the parameters are well constrained by each
+        mini-batch.
+
     Returns
     -------
     models : list of Models
         list whose i-th element is the model corresponding to the results
         of the i-th iteration.
     optimums : list of OptimizerResults
-        list whose i-th element is the final optimizer result from that iteration.
+        list whose i-th element is the final optimizer result from that iteration.  For
+        iterations fit to mini-batches, this holds the objective function of all the
+        iteration's circuits (see `minibatch_fractions`).
     final_objfn : MDSObjectiveFunction
         The final iteration's objective function / store, which encapsulated the final objective
         function evaluated at the best-fit point (an "evaluated" model-dataSet-circuits store).
@@ -760,10 +787,16 @@ def run_iterative_gst(dataset, start_model, circuit_lists,
     tStart = _time.time()
     tRef = tStart
     final_objfn = None
+    layout = None
 
     iteration_objfn_builders = [_objfns.ObjectiveFunctionBuilder.cast(ofb) for ofb in iteration_objfn_builders]
     final_objfn_builders = [_objfns.ObjectiveFunctionBuilder.cast(ofb) for ofb in final_objfn_builders]
 
+    if minibatch_fractions:
+        if any([not (0 < fraction <= 1) for fraction in minibatch_fractions]):
+            raise ValueError("Mini-batch fractions must be between 0 and 1, not: %s" % str(minibatch_fractions))
+        rng = _np.random.RandomState(minibatch_seed)
+
     def _max_array_types(artypes_list):  # get the maximum number of each array type and return as an array-types tuple
         max_cnts = {}
         for artypes in artypes_list:
@@ -786,20 +819,68 @@ def run_iterative_gst(dataset, start_model, circuit_lists,
 
             if circuitsToEstimate is None or len(circuitsToEstimate) == 0: continue
 
+            if i == nIters - 1 and getattr(mdl.sim, 'precision', "double") != "double":
+                # reduced precision is only for exploring - the final estimate is always computed in double precision
+                printer.log("Using double precision for the last iteration", 2)
+                mdl.sim.precision = "double"
+
             mdl.basis = start_model.basis  # set basis in case of CPTP constraints (needed?)
             method_names = optimizer.called_objective_methods
             array_types = optimizer.array_types + \
                 _max_array_types([builder.compute_array_types(method_names, mdl.sim)
                                   for builder in iteration_objfn_builders + final_objfn_builders])
-            initial_mdc_store = _objfns.ModelDatasetCircuitsStore(mdl, dataset, circuitsToEstimate, resource_alloc,
-                                                                  array_types=array_types, verbosity=printer - 1)
+
+            # each iteration's circuits usually extend the last's, so build each layout from the previous one
+            bulk_circuits = circuitsToEstimate if isinstance(circuitsToEstimate, _CircuitList) \
+                else _CircuitList(circuitsToEstimate)
+            if layout is None:
+                layout = mdl.sim.create_layout(bulk_circuits, dataset, resource_alloc, array_types,
+                                               verbosity=printer - 1)
+            else:
+                layout = mdl.sim.extend_layout(layout, bulk_circuits, dataset, resource_alloc, array_types,
+                                               verbosity=printer - 1)
+            initial_mdc_store = _objfns.ModelDatasetCircuitsStore(mdl, dataset, bulk_circuits, resource_alloc,
+                                                                  array_types=array_types, precomp_layout=layout,
+                                                                  verbosity=printer - 1)
             mdc_store = initial_mdc_store
 
-            for j, obj_fn_builder in enumerate(iteration_objfn_builders):
-                tNxt = _time.time()
-                optimizer.fditer = optimizer.first_fditer if (i == 0 and j == 0) else 0
-                opt_result, mdc_store = run_gst_fit(mdc_store, optimizer, obj_fn_builder, printer - 1)
-                profiler.add_time('run_iterative_gst: iter %d %s-opt' % (i + 1, obj_fn_builder.name), tNxt)
+            # mini-batches are only used before the last iteration, and only when they are smaller than all
+            # of the iteration's circuits (otherwise a single fit to all of them is done instead)
+            batch_sizes = [_minibatch_size(len(bulk_circuits), fraction,
+                                           2 * mdl.num_params if (minibatch_min_size is None) else minibatch_min_size)
+                           for fraction in (minibatch_fractions if (minibatch_fractions and i < nIters - 1) else ())]
+            fit_all_circuits = len(batch_sizes) == 0 or len(bulk_circuits) in batch_sizes
+            for k, batch_size in enumerate([sz for sz in batch_sizes if sz < len(bulk_circuits)]):
+                batch_circuits = _sample_circuit_minibatch(bulk_circuits, batch_size, rng, comm)
+                printer.log("Fitting to a mini-batch of %d circuits" % len(batch_circuits), 2)
+                batch_layout = mdl.sim.extend_layout(layout, batch_circuits, dataset, resource_alloc, array_types,
+                                                     verbosity=printer - 1)
+                batch_mdc_store = _objfns.ModelDatasetCircuitsStore(mdl, dataset, batch_circuits, resource_alloc,
+                                                                    array_types=array_types,
+                                                                    precomp_layout=batch_layout,
+                                                                    verbosity=printer - 1)
+                for j, obj_fn_builder in enumerate(iteration_objfn_builders):
+                    tNxt = _time.time()
+                    optimizer.fditer = optimizer.first_fditer if (i == 0 and j == 0 and k == 0) else 0
+                    opt_result, batch_mdc_store = run_gst_fit(batch_mdc_store, optimizer, obj_fn_builder, printer - 1)
+                    profiler.add_time('run_iterative_gst: iter %d %s-opt (mini-batch)' % (i + 1, obj_fn_builder.name),
+                                      tNxt)
+
+            if fit_all_circuits:
+                for j, obj_fn_builder in enumerate(iteration_objfn_builders):
+                    tNxt = _time.time()
+                    optimizer.fditer = optimizer.first_fditer if (i == 0 and j == 0) else 0
+                    opt_result, mdc_store = run_gst_fit(mdc_store, optimizer, obj_fn_builder, printer - 1)
+                    profiler.add_time('run_iterative_gst: iter %d %s-opt' % (i + 1, obj_fn_builder.name), tNxt)
+            elif len(iteration_objfn_builders) > 0:
+                # `opt_result` is the fit to the last mini-batch, so record the objective of all the circuits instead
+                objective = iteration_objfn_builders[-1].build_from_store(mdc_store, printer - 1)
+                x = objective.model.to_vector()
+                fval = objective.fn(x)
+                opt_result = _OptimizerResult(objective, x, fval,
+                                              chi2_k_distributed_qty=objective.chi2k_distributed_qty(fval))
+                printer.log("%s of all %d circuits after mini-batch fits = %g"
+                            % (objective.name, len(bulk_circuits), fval), 2)
 
             tNxt = _time.time()
             printer.log("Iteration %d took %.1fs\n" % (i + 1, tNxt - tRef), 2)
@@ -834,6 +915,67 @@ def run_iterative_gst(dataset, start_model, circuit_lists,
     return models, optimums, final_objfn
 
 
+def _minibatch_size(num_circuits, fraction, min_size):
+    """
+    The number of circuits in a mini-batch of a `fraction` of `num_circuits` circuits.
+
+    Parameters
+    ----------
+    num_circuits : int
+        The number of circuits to select from.
+
+    fraction : float
+        The fraction of the circuits to select.
+
+    min_size : int
+        The minimum number of circuits to select (if there are that many), e.g. a multiple of the
+        number of model parameters, so that the parameters are well constrained by the mini-batch.
+
+    Returns
+    -------
+    int
+    """
+    return min(max(int(round(fraction * num_circuits)), min_size, 1), num_circuits)
+
+
+def _sample_circuit_minibatch(circuits, size, rng, comm):
+    """
+    Randomly select a subset ("mini-batch") of `circuits`, weighted to be representative of all of them.
+
+    The weights of the selected circuits are scaled by the inverse of the fraction of the
+    circuits that are selected, so that an objective function (a sum over circuits) of the
+    mini-batch is an unbiased estimate of the objective function of all the circuits.
+
+    Parameters
+    ----------
+    circuits : CircuitList
+        The circuits to select from.
+
+    size : int
+        The number of circuits to select (see :func:`_minibatch_size`).
+
+    rng : numpy.random.RandomState
+        The random number generator used to select circuits.
+
+    comm : mpi4py.MPI.Comm
+        When not None, the circuits selected by the root processor are used by all processors.
+
+    Returns
+    -------
+    CircuitList
+    """
+    nCircuits = len(circuits)
+    indices = _np.sort(rng.choice(nCircuits, size, replace=False)) \
+        if (comm is None or comm.Get_rank() == 0) else None
+    if comm is not None:
+        indices = comm.bcast(indices, root=0)
+
+    weights = circuits.circuit_weights[indices] if (circuits.circuit_weights is not None) \
+        else _np.ones(size, 'd')
+    return _CircuitList([circuits[k] for k in indices], circuits.op_label_aliases, circuits.circuit_rules,
+                        weights * (nCircuits / size))
+
+
 def _do_runopt(objective, optimizer, printer):
     """
     Runs the core model-optimization step within a GST routine by optimizing
@@ -983,6 +1125,7 @@ def _do_term_runopt(objective, optimizer, printer):
             pathSet = mdl.sim.find_minimal_paths_set(layout)  # `mdl.sim` instead of `fwdsim` to
             #MEM debug_prof.print_memory("do_term_runopt4", True)
             mdl.sim.select_paths_set(layout, pathSet)  # ensure paramvec is updated
+            objective.clear_probs_cache()  # probabilities change with the path set, even at the same paramvec
             #MEM debug_prof.print_memory("do_term_runopt5", True)
             pathFraction = pathSet.allowed_path_fraction
             optimizer.init_munu = opt_result.optimizer_specific_qtys['mu'], opt_result.optimizer_specific_qtys['nu']
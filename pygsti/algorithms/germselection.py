@@ -516,7 +516,48 @@ def compute_composite_germ_set_score(score_fn, threshold_ac=1e6, init_n=1,
 
     combinedDDD = _np.sum(partial_deriv_dagger_deriv, axis=0)
     sortedEigenvals = _np.sort(_np.real(_nla.eigvalsh(combinedDDD)))
-    observableEigenvals = sortedEigenvals[-num_nongauge_params:]
+    return _composite_score_from_eigenvalues(sortedEigenvals, score_fn, threshold_ac, init_n,
+                                             num_nongauge_params, opScore + l1Score)
+
+
+def _composite_score_from_eigenvalues(sorted_eigenvals, score_fn, threshold_ac, init_n,
+                                      num_nongauge_params, penalty):
+    """
+    Compute the composite score of a germ set from the eigenvalues of its combined deriv-dagger-deriv.
+
+    See :func:`compute_composite_germ_set_score`.
+
+    Parameters
+    ----------
+    sorted_eigenvals : numpy.ndarray
+        The eigenvalues of the germ set's combined deriv-dagger-deriv matrix, in increasing
+        order.  Eigenvalues that are left out are taken to be zero.
+
+    score_fn : callable
+        A function that takes as input a list of sorted eigenvalues and returns a score.
+
+    threshold_ac : float
+        Value which the score (before penalties are applied) must be lower than
+        for the germ set to be considered AC.
+
+    init_n : int
+        The number of largest eigenvalues to begin with checking.
+
+    num_nongauge_params : int
+        The number of non-gauge parameters, i.e. the number of largest eigenvalues that
+        are observable.
+
+    penalty : float
+        The (op and l1) penalty added to the major score.
+
+    Returns
+    -------
+    CompositeScore
+    """
+    if len(sorted_eigenvals) < num_nongauge_params:
+        sorted_eigenvals = _np.concatenate((_np.zeros(num_nongauge_params - len(sorted_eigenvals), 'd'),
+                                            sorted_eigenvals))
+    observableEigenvals = sorted_eigenvals[-num_nongauge_params:]
     N_AC = 0
     AC_score = _np.inf
     for N in range(init_n, len(observableEigenvals) + 1):
@@ -534,12 +575,9 @@ def compute_composite_germ_set_score(score_fn, threshold_ac=1e6, init_n=1,
     #minor_score = AC_score + l1Score + opScore
 
     # Apply penalties to the major score
-    major_score = -N_AC + opScore + l1Score
+    major_score = -N_AC + penalty
     minor_score = AC_score
-    ret = _scoring.CompositeScore(major_score, minor_score, N_AC)
-    #DEBUG: ret.extra = {'opScore': opScore,
-    #    'sum(germ_lengths)': _np.sum(germ_lengths), 'l1': l1Score}
-    return ret
+    return _scoring.CompositeScore(major_score, minor_score, N_AC)
 
 
 def _compute_bulk_twirled_ddd(model, germs_list, eps=1e-6, check=False,
@@ -635,6 +673,140 @@ def _compute_twirled_ddd(model, germ, eps=1e-6):
     return twirledDerivDaggerDeriv
 
 
+def _compute_bulk_twirled_ddd_factors(model, germs_list, eps=1e-6, check=False,
+                                      germ_lengths=None, comm=None):
+    """
+    Calculate low-rank factors of the positive squares of the germ Jacobians.
+
+    Each germ's twirled Jacobian `J` has (far) fewer rows than there are
+    model parameters, so its positive square `J.H*J` (see
+    :func:`_compute_bulk_twirled_ddd`) has low rank and is given by a factor
+    `V`, with `J.H*J == V*V.H`, that has only as many columns as this rank.
+
+    Parameters
+    ----------
+    model : Model
+        The model defining the parameters to differentiate with respect to.
+
+    germs_list : list
+        The germ set
+
+    eps : float, optional
+        Tolerance used for testing whether two eigenvectors are degenerate
+        (i.e. abs(eval1 - eval2) < eps ? )
+
+    check : bool, optional
+        Whether to perform internal consistency checks, at the expense of
+        making the function slower.
+
+    germ_lengths : numpy.ndarray, optional
+        A pre-computed array of the length (depth) of each germ.
+
+    comm : mpi4py.MPI.Comm, optional
+        When not ``None``, an MPI communicator for distributing the computation
+        across multiple processors.
+
+    Returns
+    -------
+    twirledDerivDaggerDerivFactors : numpy.ndarray
+        A complex array of shape `(len(germs), model.num_params, rank)`, where
+        `rank` is the largest rank of any germ's `J.H*J` (smaller-rank factors
+        are padded with zero columns).
+    """
+    if germ_lengths is None:
+        germ_lengths = _np.array([len(germ) for germ in germs_list])
+
+    twirledDeriv = _bulk_twirled_deriv(model, germs_list, eps, check, comm) / germ_lengths[:, None, None]
+    factors = [_twirled_ddd_factor(twirledDeriv[i]) for i in range(len(germs_list))]
+    rank = max([factor.shape[1] for factor in factors] + [1])
+
+    ret = _np.zeros((len(germs_list), twirledDeriv.shape[2], rank), 'complex')
+    for i, factor in enumerate(factors):
+        ret[i, :, 0:factor.shape[1]] = factor
+    return ret
+
+
+def _twirled_ddd_factor(twirled_deriv):
+    """
+    Compute a low-rank factor `V` of a twirled Jacobian's positive square, `J.H*J == V*V.H`.
+
+    Parameters
+    ----------
+    twirled_deriv : numpy.ndarray
+        The twirled Jacobian `J`, of shape `(flattened_op_dim, vec_model_dim)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape `(vec_model_dim, rank)`, where `rank` is the numerical rank of `J`.
+    """
+    return _compact_ddd_factor(twirled_deriv.conjugate().T)
+
+
+def _compact_ddd_factor(factor):
+    """
+    Compute a factor of `V*V.H` with only as many columns as its numerical rank.
+
+    From the eigendecomposition of the small matrix `V.H*V = X*diag(s)*X.H`, the
+    columns of `V*X` are orthogonal eigenvectors of `V*V.H` scaled by the square
+    roots of their eigenvalues `s`, so those with zero eigenvalues can be dropped.
+
+    Parameters
+    ----------
+    factor : numpy.ndarray
+        The factor `V`, of shape `(vec_model_dim, k)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape `(vec_model_dim, rank)` with mutually orthogonal columns.
+    """
+    if factor.shape[1] == 0:
+        return factor
+    s, X = _nla.eigh(_np.dot(factor.conjugate().T, factor))
+    nonzero = s > max(s[-1], 0.0) * max(factor.shape) * _np.finfo(float).eps
+    return _np.dot(factor, X[:, nonzero])
+
+
+def _low_rank_update_eigenvalues(current_ddd_factor, factors):
+    """
+    Compute the eigenvalues of a deriv-dagger-deriv matrix after each of several low-rank additions.
+
+    The eigenvalues of `A + V*V.H` are computed for each factor `V` in `factors`, where
+    `A = W*W.H` is given by its factor `W`.  Since `A + V*V.H = [W, V]*[W, V].H`, its
+    nonzero eigenvalues are those of the much smaller matrix
+    `[W, V].H*[W, V] = [[W.H*W, W.H*V], [V.H*W, V.H*V]]`, whose dimension is the number
+    of columns of `W` and `V` rather than the number of model parameters.  The eigenvalues
+    for all the factors are computed by a single (stacked) `eigvalsh` call.
+
+    Parameters
+    ----------
+    current_ddd_factor : numpy.ndarray
+        The factor `W` of `A`, of shape `(vec_model_dim, r)`.
+
+    factors : numpy.ndarray
+        The factors `V` to add, of shape `(num_factors, vec_model_dim, k)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape `(num_factors, r + k)` holding the eigenvalues of each `A + V*V.H`
+        in increasing order.  Its remaining `vec_model_dim - r - k` eigenvalues are zero.
+    """
+    nFactors, _, k = factors.shape
+    r = current_ddd_factor.shape[1]
+    current_factor_dagger = current_ddd_factor.conjugate().T
+
+    M = _np.empty((nFactors, r + k, r + k), 'complex')
+    M[:, 0:r, 0:r] = _np.dot(current_factor_dagger, current_ddd_factor)
+    # shape (nFactors, r, k), computed as a single (r, vec_model_dim) x (vec_model_dim, nFactors * k) product
+    cross = _np.tensordot(current_factor_dagger, factors, (1, 1)).transpose(1, 0, 2)
+    M[:, 0:r, r:] = cross
+    M[:, r:, 0:r] = cross.conjugate().transpose(0, 2, 1)
+    M[:, r:, r:] = _np.matmul(factors.conjugate().transpose(0, 2, 1), factors)
+    return _nla.eigvalsh(M)
+
+
 def _germ_set_score_slack(weights, model_num, score_func, deriv_dagger_deriv_list,
                           force_indices, force_score,
                           n_gauge_params, op_penalty, germ_lengths, l1_penalty=1e-2,
@@ -1482,8 +1654,8 @@ def find_germs_breadthfirst(model_list, germs_list, randomize=True,
     # front and store them separately (requires lots of mem)
 
     if mem_limit is not None:
-        memEstimate = FLOATSIZE * len(model_list) * len(germs_list) * Np**2
-        # for _compute_bulk_twirled_ddd
+        memEstimate = FLOATSIZE * len(model_list) * len(germs_list) * dim**2 * Np
+        # for _compute_bulk_twirled_ddd_factors (at most dim**2 factor columns per germ)
         memEstimate += FLOATSIZE * len(model_list) * len(germs_list) * dim**2 * Np
         # for _bulk_twirled_deriv sub-call
         printer.log("Memory estimate of %.1f GB (%.1f GB limit) for all-Jac mode." %
@@ -1492,64 +1664,59 @@ def find_germs_breadthfirst(model_list, germs_list, randomize=True,
         if memEstimate > mem_limit:
             mode = "single-Jac"  # compute a single germ's jacobian at a time
             # and store the needed J-sum over chosen germs.
-            memEstimate = FLOATSIZE * 3 * len(model_list) * Np**2 + \
+            memEstimate = FLOATSIZE * len(model_list) * Np**2 + \
                 FLOATSIZE * 3 * len(model_list) * dim**2 * Np
-            #Factor of 3 accounts for currentDDDs, testDDDs, and bestDDDs
+            #Factors of the current germ set's deriv-dagger-derivs have at most Np columns
             printer.log("Memory estimate of %.1f GB (%.1f GB limit) for single-Jac mode." %
                         (memEstimate / 1024.0**3, mem_limit / 1024.0**3), 1)
 
             if memEstimate > mem_limit:
                 raise MemoryError("Too little memory, even for single-Jac mode!")
 
-    twirledDerivDaggerDerivList = None
+    twirledDerivDaggerDerivFactorsList = None
 
+    # Each germ's deriv-dagger-deriv, J.H*J, has low rank and is stored as a factor V, with
+    # J.H*J = V*V.H, and likewise the current germ set's sum of them (see _compact_ddd_factor).
     if mode == "all-Jac":
-        twirledDerivDaggerDerivList = \
-            [_compute_bulk_twirled_ddd(model, germs_list, tol,
-                                       check, germLengths, comm)
+        twirledDerivDaggerDerivFactorsList = \
+            [_compute_bulk_twirled_ddd_factors(model, germs_list, tol,
+                                               check, germLengths, comm)
              for model in model_list]
 
-        currentDDDList = []
-        for i, derivDaggerDeriv in enumerate(twirledDerivDaggerDerivList):
-            currentDDDList.append(_np.sum(derivDaggerDeriv[_np.where(weights == 1)[0], :, :], axis=0))
+        currentFactorsList = []
+        for i, derivDaggerDerivFactors in enumerate(twirledDerivDaggerDerivFactorsList):
+            goodFactors = derivDaggerDerivFactors[_np.where(weights == 1)[0], :, :]
+            currentFactorsList.append(_compact_ddd_factor(
+                goodFactors.transpose(1, 0, 2).reshape(goodFactors.shape[1], -1)))
 
     elif mode == "single-Jac":
-        currentDDDList = [_np.zeros((Np, Np), 'complex') for mdl in model_list]
-
         loc_Indices, _, _ = _mpit.distribute_indices(
             list(range(len(goodGerms))), comm, False)
 
+        currentFactorsList = [[] for mdl in model_list]
         with printer.progress_logging(3):
             for i, goodGermIdx in enumerate(loc_Indices):
                 printer.show_progress(i, len(loc_Indices),
                                       prefix="Initial germ set computation",
-                                      suffix=germs_list[goodGermIdx].str)
+                                      suffix=goodGerms[goodGermIdx].str)
                 #print("DB: Rank%d computing initial index %d" % (comm.Get_rank(),goodGermIdx))
 
                 for k, model in enumerate(model_list):
-                    currentDDDList[k] += _compute_twirled_ddd(
-                        model, germs_list[goodGermIdx], tol)
+                    currentFactorsList[k].append(_twirled_ddd_factor(
+                        _twirled_deriv(model, goodGerms[goodGermIdx], tol) / len(goodGerms[goodGermIdx])))
 
-        #aggregate each currendDDDList across all procs
-        if comm is not None and comm.Get_size() > 1:
-            for k, model in enumerate(model_list):
-                result = _np.empty((Np, Np), 'complex')
-                comm.Allreduce(currentDDDList[k], result, op=MPI.SUM)
-                currentDDDList[k][:, :] = result[:, :]
-                result = None  # free mem
+        #aggregate each currentFactorsList across all procs
+        for k, model in enumerate(model_list):
+            if comm is not None and comm.Get_size() > 1:
+                currentFactorsList[k] = [factor for factors in comm.allgather(currentFactorsList[k])
+                                         for factor in factors]
+            currentFactorsList[k] = _compact_ddd_factor(_np.concatenate(
+                [_np.zeros((Np, 0), 'complex')] + currentFactorsList[k], axis=1))
 
     else:  # should be unreachable since we set 'mode' internally above
         raise ValueError("Invalid mode: %s" % mode)  # pragma: no cover
 
-    # Dict of keyword arguments passed to compute_score_non_AC that don't
-    # change from call to call
-    nonAC_kwargs = {
-        'score_fn': lambda x: _scoring.list_score(x, score_func=score_func),
-        'threshold_ac': threshold,
-        'num_nongauge_params': numNonGaugeParams,
-        'op_penalty': op_penalty,
-        'germ_lengths': germLengths,
-    }
+    score_fn = lambda x: _scoring.list_score(x, score_func=score_func)  # noqa: E731
 
     initN = 1
     while _np.any(weights == 0):
@@ -1564,53 +1731,62 @@ def find_germs_breadthfirst(model_list, germs_list, randomize=True,
         loc_candidateIndices, owners, _ = _mpit.distribute_indices(
             candidateGermIndices, comm, False)
 
+        # Rather than adding each candidate germ's deriv-dagger-deriv to a copy of the current one and
+        # diagonalizing the (model-parameter-sized) sum, its eigenvalues are obtained from the factors
+        # in batches of candidates (see _low_rank_update_eigenvalues).
+        goodGermsLength = sum([len(germ) for germ in goodGerms])
+        maxRank = twirledDerivDaggerDerivFactorsList[0].shape[2] if (mode == "all-Jac") else dim**2
+        maxSize = max([currentFactors.shape[1] for currentFactors in currentFactorsList]) + maxRank
+        batchSize = max(1, int(2**28 // (2 * FLOATSIZE * maxSize**2)))  # ~256MB of stacked matrices per batch
+
         # Since the germs aren't sufficient, add the best single candidate germ
-        bestDDDs = None
+        bestFactors = None
         bestGermScore = _scoring.CompositeScore(1.0e100, 0, None)  # lower is better
         iBestCandidateGerm = None
         with printer.progress_logging(3):
-            for i, candidateGermIdx in enumerate(loc_candidateIndices):
-                printer.show_progress(i, len(loc_candidateIndices),
+            for iBatch in range(0, len(loc_candidateIndices), batchSize):
+                batchIndices = list(loc_candidateIndices[iBatch:iBatch + batchSize])
+                printer.show_progress(iBatch, len(loc_candidateIndices),
                                       prefix="Inner iter over candidate germs",
-                                      suffix=germs_list[candidateGermIdx].str)
+                                      suffix=germs_list[batchIndices[0]].str)
 
-                #print("DB: Rank%d computing index %d" % (comm.Get_rank(),candidateGermIdx))
-                worstScore = _scoring.CompositeScore(-1.0e100, 0, None)  # worst of all models
+                # worst score of all models for each candidate
+                worstScores = [_scoring.CompositeScore(-1.0e100, 0, None)] * len(batchIndices)
 
                 # Loop over all models
-                testDDDs = []
-                for k, currentDDD in enumerate(currentDDDList):
-                    testDDD = currentDDD.copy()
-
+                batchFactors = []
+                for k, currentFactors in enumerate(currentFactorsList):
                     if mode == "all-Jac":
-                        #just get cached value of deriv-dagger-deriv
-                        derivDaggerDeriv = twirledDerivDaggerDerivList[k][candidateGermIdx]
-                        testDDD += derivDaggerDeriv
+                        #just get cached value of deriv-dagger-deriv factors
+                        factors = twirledDerivDaggerDerivFactorsList[k][batchIndices]
 
                     elif mode == "single-Jac":
-                        #compute value of deriv-dagger-deriv
+                        #compute value of deriv-dagger-deriv factors
                         model = model_list[k]
-                        testDDD += _compute_twirled_ddd(
-                            model, germs_list[candidateGermIdx], tol)
+                        germFactors = [_twirled_ddd_factor(_twirled_deriv(model, germs_list[idx], tol)
+                                                           / len(germs_list[idx])) for idx in batchIndices]
+                        factors = _np.zeros((len(batchIndices), Np, max([f.shape[1] for f in germFactors] + [1])),
+                                            'complex')
+                        for i, germFactor in enumerate(germFactors):
+                            factors[i, :, 0:germFactor.shape[1]] = germFactor
                     # (else already checked above)
 
-                    nonAC_kwargs['germ_lengths'] = \
-                        _np.array([len(germ) for germ in
-                                   (goodGerms + [germs_list[candidateGermIdx]])])
-                    worstScore = max(worstScore, compute_composite_germ_set_score(
-                        partial_deriv_dagger_deriv=testDDD[None, :, :], init_n=initN,
-                        **nonAC_kwargs))
-                    testDDDs.append(testDDD)  # save in case this is a keeper
+                    testEigenvals = _low_rank_update_eigenvalues(currentFactors, factors)
+                    for i, candidateGermIdx in enumerate(batchIndices):
+                        worstScores[i] = max(worstScores[i], _composite_score_from_eigenvalues(
+                            testEigenvals[i], score_fn, threshold, initN, numNonGaugeParams,
+                            op_penalty * (goodGermsLength + germLengths[candidateGermIdx])))
+                    batchFactors.append(factors)  # save in case one is a keeper
 
-                # Take the score for the current germ to be its worst score
+                # Take the score for each germ to be its worst score
                 # over all the models.
-                germScore = worstScore
-                printer.log(str(germScore), 4)
-                if germScore < bestGermScore:
-                    bestGermScore = germScore
-                    iBestCandidateGerm = candidateGermIdx
-                    bestDDDs = testDDDs
-                testDDDs = None
+                for i, germScore in enumerate(worstScores):
+                    printer.log(str(germScore), 4)
+                    if germScore < bestGermScore:
+                        bestGermScore = germScore
+                        iBestCandidateGerm = batchIndices[i]
+                        bestFactors = [factors[i] for factors in batchFactors]
+                batchFactors = None
 
         # Add the germ that gives the best germ score
         if comm is not None and comm.Get_size() > 1:
@@ -1623,8 +1799,8 @@ def find_germs_breadthfirst(model_list, germs_list, randomize=True,
             bestGermScore = globalMinScore
             toCast = iBestCandidateGerm if (comm.Get_rank() == winningRank) else None
             iBestCandidateGerm = comm.bcast(toCast, root=winningRank)
-            for k in range(len(model_list)):
-                comm.Bcast(bestDDDs[k], root=winningRank)
+            bestFactors = comm.bcast(bestFactors if (comm.Get_rank() == winningRank) else None,
+                                     root=winningRank)
 
         #Update variables for next outer iteration
         weights[iBestCandidateGerm] = 1
@@ -1632,8 +1808,9 @@ def find_germs_breadthfirst(model_list, germs_list, randomize=True,
         goodGerms.append(germs_list[iBestCandidateGerm])
 
         for k in range(len(model_list)):
-            currentDDDList[k][:, :] = bestDDDs[k][:, :]
-            bestDDDs[k] = None
+            currentFactorsList[k] = _compact_ddd_factor(
+                _np.concatenate((currentFactorsList[k], bestFactors[k]), axis=1))
+            bestFactors[k] = None
 
             printer.log("Added %s to final germs (%s)" %
                         (germs_list[iBestCandidateGerm].str, str(bestGermScore)), 3)
@@ -29,6 +29,10 @@ class NicelySerializable(object):
     distinction cannot be assumed to be preserved during serialization.
     """
 
+    # When not None, a dictionary that dense arrays are stored in (and referenced by name)
+    # rather than being encoded as lists, as done by binary formats (see pygsti.serialization.npz)
+    _array_store = None
+
     @classmethod
     def read(cls, path, format=None):
         """
@@ -311,6 +315,10 @@ class NicelySerializable(object):
             return {'sparse_matrix_type': 'csr',
                     'data': cls._encodemx(csr_mx.data), 'indices': cls._encodemx(csr_mx.indices),
                     'indptr': cls._encodemx(csr_mx.indptr), 'shape': csr_mx.shape}
+        elif NicelySerializable._array_store is not None:
+            name = 'arr%d' % len(NicelySerializable._array_store)
+            NicelySerializable._array_store[name] = _np.asarray(mx)
+            return {'array_ref': name}
         else:
             enc = str if _np.iscomplexobj(mx) else \
                 ((lambda x: int(x)) if (mx.dtype == _np.int64) else (lambda x: x))
@@ -321,6 +329,8 @@ class NicelySerializable(object):
     def _decodemx(cls, mx):
         if mx is None:
             decoded = None
+        elif isinstance(mx, dict) and 'array_ref' in mx:
+            decoded = NicelySerializable._array_store[mx['array_ref']]
         elif isinstance(mx, dict):  # then a sparse mx
             assert (mx['sparse_matrix_type'] == 'csr')
             data = cls._decodemx(mx['data'])
@@ -13,12 +13,69 @@ Defines SmartCache and supporting functions
 import functools as _functools
 import hashlib as _hashlib
 import inspect as _inspect
+import os as _os
 import pickle as _pickle
-from collections import Counter, defaultdict
+import sys as _sys
+import tempfile as _tempfile
+import uuid as _uuid
+from collections import Counter, OrderedDict, defaultdict
 
 import numpy as _np
 
-DIGEST_TIMES = defaultdict(list)
+
+class TimingAggregate(object):
+    """
+    The number, total, minimum and maximum of a series of timings.
+
+    Unlike a list of the individual times, this holds a fixed amount of data
+    however many timings are added.  Timings are added using :meth:`append`,
+    so a `defaultdict(TimingAggregate)` can be given to
+    :func:`pygsti.tools.opttools.timed_block` as its `time_dict`.
+
+    Parameters
+    ----------
+    times : iterable, optional
+        Initial timings to add.
+    """
+
+    def __init__(self, times=()):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        for t in times: self.append(t)
+
+    def append(self, t):
+        """
+        Add a timing.
+
+        Parameters
+        ----------
+        t : float
+            The time, in seconds.
+
+        Returns
+        -------
+        None
+        """
+        self.count += 1
+        self.total += t
+        self.min = t if (self.min is None or t < self.min) else self.min
+        self.max = t if (self.max is None or t > self.max) else self.max
+
+    @property
+    def mean(self):
+        """ The average timing (zero if there are no timings). """
+        return self.total / max(1, self.count)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return "TimingAggregate(count=%d, total=%g, mean=%g)" % (self.count, self.total, self.mean)
+
+
+DIGEST_TIMES = defaultdict(TimingAggregate)
 
 
 def _csize(counter):
@@ -34,24 +91,51 @@ def _csize(counter):
     -------
     int
     """
-    return len(list(counter.elements()))
+    return sum(counter.values())
 
 
-def _average(l):
+def _estimate_nbytes(obj, depth=4, visited=None):
     """
-    Computes the _average of the items in a list
+    Estimates the memory used by `obj`, dominated by the `nbytes` of any numpy arrays it holds.
+
+    Containers and the attributes of general objects are descended into up to
+    `depth` levels, and each object is only counted once.
 
     Parameters
     ----------
-    l : list
-        the list
+    obj : object
+        The object to size.
+
+    depth : int, optional
+        The maximum number of levels of contained objects to descend into.
+
+    visited : set, optional
+        The ids of objects already counted.
 
     Returns
     -------
     int
     """
-    nCalls = max(1, len(l))
-    return sum(l) / nCalls
+    if visited is None: visited = set()
+    if id(obj) in visited: return 0
+    visited.add(id(obj))
+
+    if isinstance(obj, _np.ndarray):
+        return obj.nbytes
+    nbytes = _sys.getsizeof(obj, 0)
+    if depth <= 0 or isinstance(obj, (str, bytes, int, float, complex)):
+        return nbytes
+    if isinstance(obj, dict):
+        items = list(obj.keys()) + list(obj.values())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = obj
+    elif isinstance(obj, SmartCache):
+        return nbytes  # don't count back-references to a cache
+    elif hasattr(obj, '__dict__'):
+        items = list(obj.__dict__.values())
+    else:
+        return nbytes
+    return nbytes + sum([_estimate_nbytes(x, depth - 1, visited) for x in items])
 
 
 def _show_cache_percents(hits, misses, printer):
@@ -111,11 +195,41 @@ class SmartCache(object):
     """
     Cache object that profiles itself
 
+    By default a smart cache keeps every result it computes.  When `max_bytes`
+    is given, the (estimated) memory used by the cached results is kept below
+    this budget by evicting entries, either least-recently-used ones or, with
+    `eviction="cost"`, those that are cheapest to recompute per byte they
+    occupy.  Evicted entries can optionally be "spilled" to a directory on
+    disk, from which they are re-loaded when they're next needed.
+
     Parameters
     ----------
     decorating : tuple
         module and function being decorated by the smart cache
 
+    max_bytes : int, optional
+        The maximum number of bytes (as estimated from the `nbytes` of the numpy
+        arrays within each result) used by the cached results.  `None` means
+        there is no limit.
+
+    eviction : {"lru", "cost"}
+        How entries are chosen for eviction.  `"lru"` evicts the least recently
+        used entry.  `"cost"` evicts the entry with the lowest "greedy-dual-size"
+        priority, so that results which took longer to compute per byte of
+        memory are retained longer.
+
+    spill_dir : str, optional
+        A directory into which evicted entries are pickled, and from which they
+        are re-loaded when requested.  If `None`, evicted entries are discarded.
+
+    persistent_dir : str, optional
+        A directory holding a persistent, content-addressed store of results
+        that can be shared between processes and across sessions.  Every computed
+        result is written to its own file, named by a :func:`stable_digest` of the
+        function and its arguments, and results missing from memory are looked up
+        there (lazily) before being computed.  Calls with arguments that can't be
+        stably digested are only cached in memory.
+
     Attributes
     ----------
     StaticCacheList : list
@@ -123,7 +237,8 @@ class SmartCache(object):
     """
     StaticCacheList = []
 
-    def __init__(self, decorating=(None, None)):
+    def __init__(self, decorating=(None, None), max_bytes=None, eviction="lru", spill_dir=None,
+                 persistent_dir=None):
         '''
         Construct a smart cache object
 
@@ -131,9 +246,38 @@ class SmartCache(object):
         ----------
         decorating : tuple
             module and function being decorated by the smart cache
+
+        max_bytes : int, optional
+            The maximum (estimated) number of bytes used by the cached results,
+            or `None` for no limit.
+
+        eviction : {"lru", "cost"}
+            How entries are chosen for eviction.
+
+        spill_dir : str, optional
+            A directory to pickle evicted entries into, or `None` to discard them.
+
+        persistent_dir : str, optional
+            A directory of persistent, content-addressed results shared between
+            processes, or `None` to only cache results in memory.
         '''
-        self.cache = dict()
+        if eviction not in ("lru", "cost"):
+            raise ValueError("Invalid `eviction` value: %s (must be 'lru' or 'cost')" % str(eviction))
+        self.cache = OrderedDict()  # ordered from least- to most-recently used
         self.outargs = dict()
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.spill_dir = spill_dir
+        self.nbytes = 0  # estimated total size of the in-memory entries
+        self.entry_nbytes = dict()
+        self.entry_costs = dict()  # time taken to compute each entry
+        self.entry_priorities = dict()  # greedy-dual-size priorities (when eviction == "cost")
+        self.priority_floor = 0.0
+        self.spilled = dict()  # key => filename of an entry spilled to disk
+        self.evictions = 0
+        self.persistent_dir = persistent_dir
+        self.persistent_hits = 0
+        self.pickle_context = None  # optional function returning a context manager to (un)pickle entries within
         self.ineffective = set()
         self.decoratingModule, self.decoratingFn = decorating
         self.customDigests = []
@@ -145,11 +289,11 @@ class SmartCache(object):
         self.requests = Counter()
         self.ineffectiveRequests = Counter()
 
-        self.effectiveTimes = defaultdict(list)
-        self.ineffectiveTimes = defaultdict(list)
+        self.effectiveTimes = defaultdict(TimingAggregate)
+        self.ineffectiveTimes = defaultdict(TimingAggregate)
 
-        self.hashTimes = defaultdict(list)
-        self.callTimes = defaultdict(list)
+        self.hashTimes = defaultdict(TimingAggregate)
+        self.callTimes = defaultdict(TimingAggregate)
 
         self.typesigs = dict()
         self.saved = 0
@@ -159,13 +303,25 @@ class SmartCache(object):
         SmartCache.StaticCacheList.append(self)
 
     def __setstate__(self, d):
+        #Update caches pickled before timings were aggregated and entries could be evicted
+        for k in ('effectiveTimes', 'ineffectiveTimes', 'hashTimes', 'callTimes'):
+            if k in d and d[k].default_factory is not TimingAggregate:
+                d[k] = defaultdict(TimingAggregate, {nm: TimingAggregate(v) for nm, v in d[k].items()})
+        if 'max_bytes' not in d:
+            d.update({'max_bytes': None, 'eviction': "lru", 'spill_dir': None, 'nbytes': 0, 'entry_nbytes': {},
+                      'entry_costs': {}, 'entry_priorities': {}, 'priority_floor': 0.0, 'spilled': {},
+                      'evictions': 0})
+            d['cache'] = OrderedDict(d['cache'])
+            d['entry_nbytes'] = {k: 0 for k in d['cache']}  # unknown, so don't count towards budget
+        if 'persistent_dir' not in d:
+            d.update({'persistent_dir': None, 'persistent_hits': 0, 'pickle_context': None})
         return self.__dict__.update(d)
 
     def __getstate__(self):
         d = dict(self.__dict__)
 
         def _get_pickleable_dict(cache_dict):
-            pickleableCache = dict()
+            pickleableCache = type(cache_dict)()  # an OrderedDict keeps `cache` in least- to most-recently used order
             for k, v in cache_dict.items():
                 try:
                     _pickle.dumps(v)
@@ -181,6 +337,11 @@ class SmartCache(object):
 
         d['cache'] = _get_pickleable_dict(self.cache)
         d['outargs'] = _get_pickleable_dict(self.outargs)
+
+        #Drop the bookkeeping of entries that can't be pickled
+        for k in ('entry_nbytes', 'entry_costs', 'entry_priorities'):
+            d[k] = {key: v for key, v in d[k].items() if key in d['cache']}
+        d['nbytes'] = sum(d['entry_nbytes'].values())
         return d
 
     def __pygsti_getstate__(self):  # same but for json/msgpack
@@ -202,6 +363,157 @@ class SmartCache(object):
         d['outargs'] = _get_jsonable_dict(self.outargs)
         return d
 
+    def _lookup(self, key):
+        """
+        Whether `key` is cached, re-loading it from disk if it was spilled there.
+
+        Also marks `key` as the most recently used entry.
+        """
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            if self.eviction == "cost":
+                self.entry_priorities[key] = self.priority_floor + \
+                    self.entry_costs.get(key, 0.0) / max(1, self.entry_nbytes[key])
+            return True
+
+        filename = self.spilled.pop(key, None)
+        if filename is not None:
+            entry = self._read_entry(filename)
+            if entry is None: return False  # e.g. the spill directory was cleared, so just recompute
+            _os.remove(filename)
+            self._store(key, *entry)
+            return key in self.cache
+        return False
+
+    def _read_entry(self, filename):
+        """
+        Read a `(value, outargs, cost)` entry from a file, returning `None` if this isn't possible.
+        """
+        try:
+            with open(filename, 'rb') as f:
+                if self.pickle_context is None:
+                    return _pickle.load(f)
+                with self.pickle_context():
+                    return _pickle.load(f)
+        except (OSError, EOFError, ValueError, AttributeError, ImportError, _pickle.UnpicklingError):
+            return None
+
+    def _write_entry(self, filename, value, outargs, cost):
+        """
+        Atomically write a `(value, outargs, cost)` entry to a file, returning whether this succeeded.
+
+        The entry is written to a temporary file that is then renamed, so that
+        concurrent readers (possibly in other processes) never see partial files.
+        """
+        dirname = _os.path.dirname(filename)
+        _os.makedirs(dirname, exist_ok=True)
+        fd, tmp_filename = _tempfile.mkstemp(dir=dirname, suffix='.tmp')
+        try:
+            with _os.fdopen(fd, 'wb') as f:
+                if self.pickle_context is None:
+                    _pickle.dump((value, outargs, cost), f)
+                else:
+                    with self.pickle_context():
+                        _pickle.dump((value, outargs, cost), f)
+            _os.replace(tmp_filename, filename)
+            return True
+        except (TypeError, AttributeError, _pickle.PicklingError):
+            _os.remove(tmp_filename)  # unpickleable entries just aren't written
+            return False
+
+    def _persistent_filename(self, fn, arg_vals, kwargs):
+        """
+        The name of the file in the persistent store holding the result of `fn(*arg_vals, **kwargs)`.
+
+        Returns `None` if there is no persistent store or if the call's arguments
+        can't be stably digested.
+        """
+        if self.persistent_dir is None: return None
+        args = tuple(arg_vals) + (kwargs,)
+        if fn.__name__ != "_create" and hasattr(fn, '__self__'):  # as in _call_key
+            args = (fn.__self__,) + args
+        from pygsti import __version__ as _pygsti_version
+        name = _get_fn_name_key(fn)
+        try:  # include the version, as results of the same call may differ between versions
+            key_digest = stable_digest((name, _pygsti_version) + args, self.customDigests)
+        except CustomDigestError:
+            return None
+        return _os.path.join(self.persistent_dir, name, key_digest.hex() + '.pkl')
+
+    def _lookup_persistent(self, key, filename):
+        """
+        Load the entry for `key` from the persistent store file `filename` into memory, if it exists.
+
+        Returns whether `key` is now in the (in-memory) cache.
+        """
+        if filename is None or not _os.path.exists(filename): return False
+        entry = self._read_entry(filename)
+        if entry is None: return False  # corrupt or stale files are treated as misses (and overwritten)
+        self._store(key, *entry)
+        self.persistent_hits += 1
+        return key in self.cache
+
+    def _store(self, key, value, outargs=None, cost=0.0):
+        """
+        Add an entry to the cache, evicting others if needed to stay within the byte budget.
+        """
+        nbytes = _estimate_nbytes((value, outargs)) if (self.max_bytes is not None) else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return  # never fits, so don't bother caching it
+
+        self.cache[key] = value
+        if outargs is not None: self.outargs[key] = outargs
+        self.entry_nbytes[key] = nbytes
+        self.entry_costs[key] = cost
+        if self.eviction == "cost":
+            self.entry_priorities[key] = self.priority_floor + cost / max(1, nbytes)
+        self.nbytes += nbytes
+
+        while self.max_bytes is not None and self.nbytes > self.max_bytes:
+            if self.eviction == "cost":
+                victim = min(self.entry_priorities, key=self.entry_priorities.get)
+                self.priority_floor = self.entry_priorities[victim]  # "age" the remaining entries
+            else:
+                victim = next(iter(self.cache))  # least recently used
+            self._evict(victim)
+
+    def _discard(self, key):
+        """
+        Remove an entry from memory, returning its `(value, outargs, cost)`.
+        """
+        self.nbytes -= self.entry_nbytes.pop(key)
+        self.entry_priorities.pop(key, None)
+        return self.cache.pop(key), self.outargs.pop(key, None), self.entry_costs.pop(key, 0.0)
+
+    def _evict(self, key):
+        """
+        Remove an entry from memory, spilling it to disk if `self.spill_dir` is set.
+        """
+        value, outargs, cost = self._discard(key)
+        self.evictions += 1
+
+        if self.spill_dir is not None:
+            filename = _os.path.join(self.spill_dir, _hashlib.md5(_pickle.dumps(key)).hexdigest() + '.pkl')
+            if self._write_entry(filename, value, outargs, cost):  # otherwise the entry is just discarded
+                self.spilled[key] = filename
+
+    def update(self, cache_dict):
+        """
+        Add the entries of `cache_dict` (e.g. another cache's `cache` dictionary) to this cache.
+
+        Parameters
+        ----------
+        cache_dict : dict
+            A dictionary of cache keys and values.
+
+        Returns
+        -------
+        None
+        """
+        for key, value in cache_dict.items():
+            if key in self.cache: self._discard(key)
+            self._store(key, value)
+
     def add_digest(self, custom):
         """
         Add a "custom" digest function, used for hashing otherwise un-hashable types.
@@ -250,12 +562,18 @@ class SmartCache(object):
             times = dict()
             with _timed_block('hash', times):
                 key = _call_key(fn, tuple(arg_vals) + (kwargs,), self.customDigests)  # cache by call key
-            if key not in self.cache:
+                found = self._lookup(key)
+                persistent_filename = None if found else self._persistent_filename(fn, arg_vals, kwargs)
+            if found or self._lookup_persistent(key, persistent_filename):
+                result = self.cache[key]
+            else:
                 with _timed_block('call', times):
-                    self.cache[key] = fn(*arg_vals, **kwargs)
+                    result = fn(*arg_vals, **kwargs)
+                self._store(key, result, cost=times['call'])
+                if persistent_filename is not None:
+                    self._write_entry(persistent_filename, result, None, times['call'])
                 if times['hash'] > times['call']:
                     self.ineffective.add(name_key)
-            result = self.cache[key]
         return key, result
 
     def cached_compute(self, fn, arg_vals, kwargs=None):
@@ -293,14 +611,16 @@ class SmartCache(object):
             key = 'INEFFECTIVE'
             result = fn(*arg_vals, **kwargs)
             self.ineffectiveRequests[name_key] += 1
-            self.misses[key] += 1
+            self.misses[name_key] += 1
             #DB: print(fn.__name__, " --> Ineffective!") # DB
         else:
             from pygsti.tools.opttools import timed_block as _timed_block
             times = dict()
             with _timed_block('hash', times):
                 key = _call_key(fn, tuple(arg_vals) + (kwargs,), self.customDigests)  # cache by call key
-            if key not in self.cache:
+                found = self._lookup(key)
+                persistent_filename = None if found else self._persistent_filename(fn, arg_vals, kwargs)
+            if not (found or self._lookup_persistent(key, persistent_filename)):
                 #DB: if "_compute_sub_mxs" in fn.__name__:
                 #DB: print(fn.__name__, " --> computing... (not found in %d keys)" % len(list(self.cache.keys()))) # DB
                 #DB: print("Key detail: ",key[0]) # DB
@@ -308,12 +628,16 @@ class SmartCache(object):
                 typesig = str(tuple(str(type(arg)) for arg in arg_vals)) + \
                     str({k: str(type(v)) for k, v in kwargs.items()})
                 self.typesigs[name_key] = typesig
+                outargs = None
                 with _timed_block('call', times):
-                    self.cache[key] = fn(*arg_vals, **kwargs)
+                    result = fn(*arg_vals, **kwargs)
                     if "_filledarrays" in special_kwargs:
-                        self.outargs[key] = tuple((arg_vals[i] if isinstance(i, int) else kwargs[i]
-                                                   for i in special_kwargs['_filledarrays']))  # copy?
-                self.misses[key] += 1
+                        outargs = tuple((arg_vals[i] if isinstance(i, int) else kwargs[i]
+                                         for i in special_kwargs['_filledarrays']))  # copy?
+                self._store(key, result, outargs, times['call'])
+                if persistent_filename is not None:
+                    self._write_entry(persistent_filename, result, outargs, times['call'])
+                self.misses[name_key] += 1
                 hashtime = times['hash']
                 calltime = times['call']
                 if hashtime > calltime:
@@ -326,7 +650,8 @@ class SmartCache(object):
             else:
                 #DB: print('The function {} experienced a cache hit'.format(name_key)) # DB
                 #DB: print(fn.__name__, " --> cache hit!") # DB
-                self.hits[key] += 1
+                result = self.cache[key]
+                self.hits[name_key] += 1
                 self.fhits[name_key] += 1
 
                 #Special kwarg processing: any keyword argument that starts with an
@@ -340,7 +665,6 @@ class SmartCache(object):
 
             #Note - maybe we should .view or .copy arrays upon return
             # (now we just trust user not to alter mutable returned vals)
-            result = self.cache[key]
         return key, result
 
     @staticmethod
@@ -385,9 +709,9 @@ class SmartCache(object):
 
         with printer.verbosity_env(2):
             printer.log('Average hash times by object:')
-            for k, v in sorted(DIGEST_TIMES.items(), key=lambda t: sum(t[1])):
-                total = sum(v)
-                avg = _average(v)
+            for k, v in sorted(DIGEST_TIMES.items(), key=lambda t: t[1].total):
+                total = v.total
+                avg = v.mean
                 printer.log('    {:<65} avg | {}s'.format(k, avg))
                 printer.log('    {:<65} tot | {}s'.format('', total))
                 printer.log('-' * 100)
@@ -414,12 +738,12 @@ class SmartCache(object):
 
     def avg_timedict(self, d):
         """
-        Given a dictionary of lists of times (`d`), returns a dict of the summed times.
+        Given a dictionary of timing aggregates (`d`), returns a dict of the summed times.
 
         Parameters
         ----------
         d : dict
-            A dictionary whose values are lists of times.
+            A dictionary whose values are :class:`TimingAggregate` objects.
 
         Returns
         -------
@@ -430,7 +754,7 @@ class SmartCache(object):
             if k not in self.fhits:
                 time = 0
             else:
-                time = _average(v) * len(v)
+                time = v.total
             ret[k] = time
         return ret
 
@@ -450,6 +774,12 @@ class SmartCache(object):
         printer.log('Status of smart cache decorating {}.{}:\n'.format(
             self.decoratingModule, self.decoratingFn))
         _show_cache_percents(self.hits, self.misses, printer)
+        if self.max_bytes is not None:
+            printer.log('    {:<10} bytes cached (of {} allowed)'.format(self.nbytes, self.max_bytes))
+            printer.log('    {:<10} evictions ({} entries spilled to disk)\n'.format(self.evictions, len(self.spilled)))
+        if self.persistent_dir is not None:
+            printer.log('    {:<10} hits loaded from persistent store {}\n'.format(self.persistent_hits,
+                                                                                   self.persistent_dir))
 
         with printer.verbosity_env(2):
             _show_kvs('Most common requests:\n', self.requests.most_common(), printer)
@@ -458,7 +788,7 @@ class SmartCache(object):
 
             printer.log('Type signatures of functions and their hash times:\n')
             for k, v in self.typesigs.items():
-                avg = _average(self.hashTimes[k])
+                avg = self.hashTimes[k].mean
                 printer.log('    {:<40} {}'.format(k, v))
                 printer.log('    {:<40} {}'.format(k, avg))
                 printer.log('')
@@ -584,6 +914,112 @@ def digest(obj, custom_digests=None):
     return M.digest()  # return native hash of the MD5 digest
 
 
+class UnstableDigestError(CustomDigestError):
+    """
+    Raised when an object can't be digested in a way that is reproducible across processes.
+    """
+    pass
+
+
+def stable_digest(obj, custom_digests=None):
+    """
+    Returns an MD5 digest of the *contents* of `obj` that is the same in every Python process.
+
+    Unlike :func:`digest`, which uses Python's `hash` when it can (and so depends on
+    the process's hash seed and, for many objects, on their memory address), this
+    function only digests values: the bytes of strings and arrays, the elements of
+    containers, the "nice" serializations of :class:`NicelySerializable` objects and,
+    failing these, the attributes of other objects.
+
+    Parameters
+    ----------
+    obj : object
+        Object to digest.
+
+    custom_digests : list, optional
+        A list of custom digest functions, as for :func:`digest`.
+
+    Returns
+    -------
+    bytes
+        The MD5 digest.
+
+    Raises
+    ------
+    UnstableDigestError
+        If `obj` contains a value that can't be stably digested (e.g. a function or a
+        C-extension object without a `__dict__`).
+    """
+    import json as _json
+    from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
+    from pygsti.circuits.circuit import Circuit as _Circuit
+
+    if custom_digests is None:
+        custom_digests = []
+
+    def add(md5, v, path):
+        md5.update(type(v).__name__.encode('utf-8'))
+        if v is None or isinstance(v, (bool, int, float, complex, range, slice, _uuid.UUID)):
+            md5.update(repr(v).encode('utf-8'))
+        elif isinstance(v, str):
+            md5.update(v.encode('utf-8'))
+        elif isinstance(v, bytes):
+            md5.update(v)
+        elif isinstance(v, _np.generic):
+            md5.update(v.dtype.str.encode('utf-8') + v.tobytes())
+        elif isinstance(v, _np.ndarray):
+            md5.update((v.dtype.str + str(v.shape)).encode('utf-8'))
+            if v.dtype == object:
+                for el in v.flat: add(md5, el, path)
+            else:
+                md5.update(_np.ascontiguousarray(v).tobytes())
+        elif isinstance(v, type):
+            md5.update((v.__module__ + '.' + v.__qualname__).encode('utf-8'))
+        elif isinstance(v, _np.dtype):
+            md5.update(v.str.encode('utf-8'))
+        elif isinstance(v, _Circuit):
+            md5.update(v.str.encode('utf-8'))  # includes line labels and occurrence id
+        elif isinstance(v, SmartCache) or type(v).__module__ == 'mpi4py.MPI':
+            pass  # don't digest caches or comm objects (as in `digest`)
+        elif id(v) in path:
+            md5.update(b'<cycle>')  # reference back to an object already being digested
+        else:
+            path.add(id(v))
+            for custom_digest in custom_digests:
+                try:
+                    custom_digest(md5, v)
+                    break
+                except CustomDigestError:
+                    pass
+            else:
+                if isinstance(v, (tuple, list)):
+                    for el in v: add(md5, el, path)
+                elif isinstance(v, (dict, set, frozenset)):
+                    items = v.items() if isinstance(v, dict) else [(el, None) for el in v]
+                    for kd, k, val in sorted([(stable_digest(k, custom_digests), k, val) for k, val in items],
+                                             key=lambda x: x[0]):
+                        md5.update(kd); add(md5, val, path)
+                elif isinstance(v, _NicelySerializable):
+                    try:
+                        md5.update(_json.dumps(v.to_nice_serialization(), sort_keys=True).encode('utf-8'))
+                    except (TypeError, ValueError, NotImplementedError) as e:
+                        raise UnstableDigestError("Cannot stably digest %s: %s" % (type(v).__name__, str(e)))
+                elif hasattr(v, '__dict__') and not _inspect.isroutine(v):
+                    md5.update(type(v).__module__.encode('utf-8'))
+                    for k in sorted(v.__dict__.keys()):
+                        a = v.__dict__[k]
+                        if k.startswith('__') or _inspect.isroutine(a): continue
+                        add(md5, k, path)
+                        add(md5, a, path)
+                else:
+                    raise UnstableDigestError("Cannot stably digest object of type %s" % type(v).__name__)
+            path.discard(id(v))
+
+    M = _hashlib.md5()
+    add(M, obj, set())
+    return M.digest()
+
+
 def _get_fn_name_key(fn):
     """
     Get the name (str) used to hash the function `fn`
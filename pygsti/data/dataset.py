@@ -13,7 +13,10 @@ Defines the DataSet class and supporting classes and functions
 import bisect as _bisect
 import copy as _copy
 import itertools as _itertools
+import json as _json
 import numbers as _numbers
+import os as _os
+import pathlib as _pathlib
 import pickle as _pickle
 import uuid as _uuid
 import warnings as _warnings
@@ -889,7 +892,8 @@ class DataSet(object):
 
     file_to_load_from : string or file object
         Specify this argument and no others to create a static DataSet by loading
-        from a file (just like using the load(...) function).
+        from a file (just like using the load(...) function).  If this is the name
+        of a directory, the data set is loaded using :method:`read_columnar`.
 
     collision_action : {"aggregate","overwrite","keepseparate"}
         Specifies how duplicate circuits should be handled.  "aggregate"
@@ -967,7 +971,8 @@ class DataSet(object):
 
         file_to_load_from : string or file object
             Specify this argument and no others to create a static DataSet by loading
-            from a file (just like using the load(...) function).
+            from a file (just like using the load(...) function).  If this is the name
+            of a directory, the data set is loaded using :method:`read_columnar`.
 
         collision_action : {"aggregate","overwrite","keepseparate"}
             Specifies how duplicate circuits should be handled.  "aggregate"
@@ -1000,7 +1005,10 @@ class DataSet(object):
             assert(oli_data is None and time_data is None and rep_data is None
                    and circuits is None and circuit_indices is None
                    and outcome_labels is None and outcome_label_indices is None)
-            self.read_binary(file_to_load_from)
+            if isinstance(file_to_load_from, (str, _pathlib.Path)) and _os.path.isdir(file_to_load_from):
+                self.read_columnar(file_to_load_from)
+            else:
+                self.read_binary(file_to_load_from)
             return
 
         # self.cirIndex  :  Ordered dictionary where keys = Circuit objects,
@@ -3016,6 +3024,111 @@ class DataSet(object):
 
         if bOpen: f.close()
 
+    def write_columnar(self, dirname):
+        """
+        Write this (static) data set to a directory in a columnar, memory-mappable format.
+
+        The outcome-label-index, timestamp, and repetition-count data are each written
+        as a raw binary file (one per column), alongside a separate circuit index and a
+        JSON file holding the outcome-label table and column data types.  Such a directory
+        can be loaded using :method:`read_columnar` (or by passing its name as the
+        `file_to_load_from` argument of the constructor).
+
+        Parameters
+        ----------
+        dirname : str or Path
+            The directory to write to.  It is created if it doesn't exist.
+
+        Returns
+        -------
+        None
+        """
+        if not self.bStatic:
+            raise ValueError("Only static DataSets can be written in columnar format (call `done_adding_data` first)")
+
+        root = _pathlib.Path(dirname)
+        root.mkdir(parents=True, exist_ok=True)
+        meta = {'oliType': _np.dtype(self.oliType).str,
+                'timeType': _np.dtype(self.timeType).str,
+                'repType': _np.dtype(self.repType).str,
+                'numBins': len(self.oliData),
+                'useReps': bool(self.repData is not None),
+                'outcomeLabels': [[list(ol), i] for ol, i in self.olIndex.items()],
+                'olIndex_max': self.olIndex_max,
+                'collisionAction': self.collisionAction,
+                'uuid': str(self.uuid) if (self.uuid is not None) else None,
+                'comment': self.comment}
+        with open(root / 'meta.json', 'w') as f:
+            _json.dump(meta, f, indent=4)
+
+        _np.ascontiguousarray(self.oliData, self.oliType).tofile(str(root / 'oli_data.bin'))
+        _np.ascontiguousarray(self.timeData, self.timeType).tofile(str(root / 'time_data.bin'))
+        if self.repData is not None:
+            _np.ascontiguousarray(self.repData, self.repType).tofile(str(root / 'rep_data.bin'))
+
+        circuit_index = {'cirIndexKeys': list(map(_cir.CompressedCircuit, self.cirIndex.keys())),
+                         'starts': _np.array([slc.start for slc in self.cirIndex.values()], _np.int64),
+                         'stops': _np.array([slc.stop for slc in self.cirIndex.values()], _np.int64),
+                         'auxInfo': dict(self.auxInfo)}
+        with open(root / 'circuit_index.pkl', 'wb') as f:
+            _pickle.dump(circuit_index, f)
+
+    def read_columnar(self, dirname, mmap_mode='r'):
+        """
+        Read a DataSet from a directory written by :method:`write_columnar`.
+
+        Only the circuit index and outcome-label table are read into memory; the
+        data columns are memory-mapped, so that the data of a circuit is only paged
+        in from disk when it is accessed (e.g. by `dataset[circuit]`).
+
+        Parameters
+        ----------
+        dirname : str or Path
+            The directory to load from.
+
+        mmap_mode : {'r', 'c', None}, optional
+            The mode used to memory-map the data columns (see :class:`numpy.memmap`).
+            `'r'` maps them read-only and `'c'` copy-on-write.  If None, the
+            columns are read entirely into memory.
+
+        Returns
+        -------
+        None
+        """
+        root = _pathlib.Path(dirname)
+        with open(root / 'meta.json') as f:
+            meta = _json.load(f)
+        with open(root / 'circuit_index.pkl', 'rb') as f:
+            circuit_index = _pickle.load(f)
+
+        def load_column(filename, dtype):
+            if meta['numBins'] == 0:
+                return _np.empty((0,), dtype)  # can't memory-map an empty file
+            if mmap_mode is None:
+                return _np.fromfile(str(root / filename), dtype)
+            return _np.memmap(str(root / filename), dtype, mmap_mode, shape=(meta['numBins'],))
+
+        self.oliType = _np.dtype(meta['oliType'])
+        self.timeType = _np.dtype(meta['timeType'])
+        self.repType = _np.dtype(meta['repType'])
+        self.oliData = load_column('oli_data.bin', self.oliType)
+        self.timeData = load_column('time_data.bin', self.timeType)
+        self.repData = load_column('rep_data.bin', self.repType) if meta['useReps'] else None
+
+        self.cirIndex = _OrderedDict([(ccircuit.expand(), slice(start, stop)) for ccircuit, start, stop
+                                      in zip(circuit_index['cirIndexKeys'], circuit_index['starts'].tolist(),
+                                             circuit_index['stops'].tolist())])
+        self.olIndex = _OrderedDict([(tuple(ol), i) for ol, i in meta['outcomeLabels']])
+        self.olIndex_max = meta['olIndex_max']
+        self.ol = _OrderedDict([(i, ol) for (ol, i) in self.olIndex.items()])
+        self.bStatic = True
+        self.collisionAction = meta['collisionAction']
+        self.uuid = _uuid.UUID(meta['uuid']) if (meta['uuid'] is not None) else None
+        self.comment = meta['comment']
+        self.auxInfo = _defaultdict(dict, circuit_index['auxInfo'])
+        self.ffdata = {}
+        self.cnt_cache = {opstr: _ld.OutcomeLabelDict() for opstr in self.cirIndex}
+
     def rename_outcome_labels(self, old_to_new_dict):
         """
         Replaces existing output labels with new ones as per `old_to_new_dict`.
@@ -17,9 +17,11 @@ import warnings as _warnings
 import numpy as _np
 import numpy.random as _rndm
 
+from pygsti.circuits import circuit as _cir
 from pygsti.circuits import circuitconstruction as _gstrc
 from pygsti.data import dataset as _ds
 from pygsti.baseobjs import label as _lbl, outcomelabeldict as _ld
+from pygsti.tools import slicetools as _slct
 
 
 def simulate_data(model_or_dataset, circuit_list, num_samples,
@@ -135,17 +137,27 @@ def simulate_data(model_or_dataset, circuit_list, num_samples,
     if isinstance(circuit_list, _ExperimentDesign):
         circuit_list = circuit_list.all_circuits_needing_data
 
-    if gsGen and times is None:
+    if gsGen:
         if alias_dict is not None:
             trans_circuit_list = [_gstrc.translate_circuit(s, alias_dict)
                                   for s in circuit_list]
         else:
             trans_circuit_list = circuit_list
-        all_probs = gsGen.bulk_probabilities(trans_circuit_list, comm=comm, mem_limit=mem_limit)
+        if times is None:
+            all_probs = gsGen.bulk_probabilities(trans_circuit_list, comm=comm, mem_limit=mem_limit)
     else:
         trans_circuit_list = circuit_list
 
-    if comm is None or comm.Get_rank() == 0:  # only root rank computes
+    if gsGen and times is not None:
+        if comm is None or comm.Get_rank() == 0:  # only root rank computes
+            if sample_error in ("binomial", "multinomial") and rand_state is None:
+                rndm = _rndm.RandomState(seed)  # ok if seed is None
+            else:
+                rndm = rand_state  # can be None
+            dataset = _simulate_timedep_data(gsGen, circuit_list, trans_circuit_list, num_samples, times,
+                                             sample_error, rndm, collision_action, record_zero_counts, TOL)
+
+    elif comm is None or comm.Get_rank() == 0:  # only root rank computes
 
         if sample_error in ("binomial", "multinomial") and rand_state is None:
             rndm = _rndm.RandomState(seed)  # ok if seed is None
@@ -155,21 +167,12 @@ def simulate_data(model_or_dataset, circuit_list, num_samples,
         circuit_times = times if times is not None else ["N/A dummy"]
         count_lists = _collections.OrderedDict()
 
+        # (time-dependent data from a model is simulated in bulk by _simulate_timedep_data)
         for tm in circuit_times:
-            #print("Time ", tm)
-
-            #It would be nice to be able to do something like this (time dependent calc for all probs at ptic time)
-            #if gsGen and times is not None:
-            #    all_probs = gsGen.bulk_probabilities(trans_circuit_list, comm=comm, mem_limit=mem_limit, time=tm)
-
             for k, (s, trans_s) in enumerate(zip(circuit_list, trans_circuit_list)):
 
                 if gsGen:
-                    if times is None:
-                        ps = all_probs[trans_s]
-                    else:
-                        ps = gsGen.probabilities(trans_s, time=tm)
-
+                    ps = all_probs[trans_s]
                     if sample_error in ("binomial", "multinomial"):
                         _adjust_probabilities_inbounds(ps, TOL)
                 else:
@@ -209,6 +212,149 @@ def simulate_data(model_or_dataset, circuit_list, num_samples,
     return dataset
 
 
+def _simulate_timedep_data(model, circuit_list, trans_circuit_list, num_samples, times,
+                           sample_error, rndm_state, collision_action, record_zero_counts, tol):
+    """
+    Simulate time-series data from a model, evaluating and sampling all circuits and times in bulk.
+
+    The probabilities of every circuit at every time are computed using a single layout,
+    counts are sampled with vectorized (conditional binomial) multinomial draws, and the
+    resulting arrays are written directly into a static :class:`DataSet`.
+
+    Parameters
+    ----------
+    model : Model
+        The model whose probabilities generate the data.
+
+    circuit_list : list of Circuits
+        The circuits (keys of the returned data set).
+
+    trans_circuit_list : list of Circuits
+        The circuits, with any aliases applied, that are simulated.
+
+    num_samples : int or list of ints
+        The number of samples for each circuit at each time.
+
+    times : iterable
+        The time-stamps at which data is sampled.
+
+    sample_error : str
+        The type of sample error (see :func:`simulate_data`).
+
+    rndm_state : numpy.random.RandomState
+        The random state used to sample from binomial or multinomial distributions.
+
+    collision_action : {"aggregate", "overwrite", "keepseparate"}
+        How duplicate circuits are handled.
+
+    record_zero_counts : bool
+        Whether zero-counts are recorded in the returned data set.
+
+    tol : float
+        The tolerance used when checking that probabilities are in bounds and sum to 1.
+
+    Returns
+    -------
+    DataSet
+        A static data set.
+    """
+    from pygsti.layouts.copalayout import CircuitOutcomeProbabilityArrayLayout as _COPALayout
+    times = _np.array(times, _ds.Time_type)
+    nTimes, nCircuits = len(times), len(circuit_list)
+
+    # A plain (non-distributed) layout, as time-dependent probabilities are computed circuit by circuit
+    trans_circuit_list = [c if isinstance(c, _cir.Circuit) else _cir.Circuit(c) for c in trans_circuit_list]
+    unique_circuits = list(_collections.OrderedDict.fromkeys(trans_circuit_list))
+    layout = _COPALayout.create_from(unique_circuits, model)
+    probs = _np.empty((nTimes, layout.num_elements), 'd')
+    for i, tm in enumerate(times):
+        model.sim._bulk_fill_probs_at_times(probs[i], layout, [tm] * len(unique_circuits))
+
+    # Gather probabilities into a (time, circuit, outcome) array, padded with zero-probability outcomes
+    outcomes_by_circuit = []; element_indices = []
+    for trans_s in trans_circuit_list:
+        elinds, outcomes = layout.indices_and_outcomes(trans_s)
+        element_indices.append(_slct.indices(elinds) if isinstance(elinds, slice) else list(elinds))
+        outcomes_by_circuit.append(outcomes)
+    nOutcomes = _np.array([len(outcomes) for outcomes in outcomes_by_circuit], _np.int64)
+    padded_indices = _np.zeros((nCircuits, max(nOutcomes)), _np.int64)
+    present = _np.zeros((nCircuits, max(nOutcomes)), bool)
+    for k, inds in enumerate(element_indices):
+        padded_indices[k, 0:nOutcomes[k]] = inds
+        present[k, 0:nOutcomes[k]] = True
+    ps = _np.where(present, probs[:, padded_indices], 0.0)  # shape (nTimes, nCircuits, maxOutcomes)
+
+    N = _np.array(num_samples, 'd') * _np.ones(nCircuits, 'd')  # one total count per circuit
+    if sample_error in ("binomial", "multinomial"):
+        if _np.any(ps < -tol): _warnings.warn("Clipping probs < 0 to 0")
+        if _np.any(ps > 1 + tol): _warnings.warn("Clipping probs > 1 to 1")
+        ps = _np.clip(ps, 0, 1)
+        psums = ps.sum(axis=2)
+        if _np.any(_np.abs(psums - 1.0) > tol):
+            _warnings.warn("Adjusting sum(probs) = %g to 1" % psums.flat[_np.argmax(_np.abs(psums - 1.0))])
+            ps /= psums[:, :, None]
+
+    if sample_error == "binomial":
+        assert(_np.all(nOutcomes <= 2)), "Binomial sampling requires at most two outcomes per circuit!"
+
+    if sample_error in ("binomial", "multinomial"):
+        # A multinomial sample is a sequence of binomial samples conditioned on the preceding outcomes
+        counts = _np.zeros(ps.shape, _np.int64)
+        remaining = _np.broadcast_to(N.astype(_np.int64), (nTimes, nCircuits)).copy()
+        remaining_p = _np.ones((nTimes, nCircuits), 'd')
+        for j in range(ps.shape[2]):
+            cond_p = _np.clip(_np.divide(ps[:, :, j], remaining_p, out=_np.zeros_like(remaining_p),
+                                         where=remaining_p > 0), 0, 1)
+            counts[:, :, j] = rndm_state.binomial(remaining, cond_p)
+            remaining -= counts[:, :, j]
+            remaining_p -= ps[:, :, j]
+        counts[:, _np.arange(nCircuits), nOutcomes - 1] += remaining  # any round-off remainder -> last outcome
+    elif sample_error == "none":
+        counts = N[None, :, None] * ps
+    elif sample_error == "clip":
+        counts = N[None, :, None] * _np.clip(ps, 0, 1)
+    elif sample_error == "round":
+        counts = _np.round(N[None, :, None] * _np.clip(ps, 0, 1))
+    else:
+        raise ValueError(
+            "Invalid sample error parameter: '%s'  "
+            "Valid options are 'none', 'round', 'binomial', or 'multinomial'" % sample_error)
+
+    # Build the static data set's arrays directly, one circuit at a time (outcome labels sorted as by add_series_data)
+    dataset = _ds.DataSet(collision_action=collision_action)
+    dataset.add_outcome_labels([ol for outcomes in outcomes_by_circuit for ol in sorted(outcomes)])
+    row_arrays = _collections.OrderedDict()
+    for k, (s, outcomes) in enumerate(zip(circuit_list, outcomes_by_circuit)):
+        perm = sorted(range(nOutcomes[k]), key=lambda j: outcomes[j])
+        oli_array = _np.tile(_np.array([dataset.olIndex[outcomes[j]] for j in perm], _ds.Oindex_type), nTimes)
+        time_array = _np.repeat(times, nOutcomes[k])
+        rep_array = counts[:, k, perm].astype(_ds.Repcount_type).ravel()
+        if not record_zero_counts:
+            mask = rep_array != 0
+            oli_array, time_array, rep_array = oli_array[mask], time_array[mask], rep_array[mask]
+        circuit = s.copy() if isinstance(s, _cir.Circuit) else _cir.Circuit(s)
+        if collision_action == "keepseparate":
+            i = 0  # tag duplicates with the next available occurrence id (as DataSet does)
+            while circuit in row_arrays:
+                i += 1; circuit.occurrence = i
+        elif circuit.occurrence is not None:
+            circuit.occurrence = None  # so duplicates overwrite existing data
+        row_arrays[circuit] = (oli_array, time_array, rep_array)
+
+    circuit_indices = _collections.OrderedDict(); offset = 0
+    for circuit, (oli_array, _, _) in row_arrays.items():
+        circuit_indices[circuit] = slice(offset, offset + len(oli_array))
+        offset += len(oli_array)
+
+    def concat(arrays, typ):
+        return _np.concatenate(arrays) if len(arrays) > 0 else _np.empty(0, typ)
+    return _ds.DataSet(concat([a[0] for a in row_arrays.values()], _ds.Oindex_type),
+                       concat([a[1] for a in row_arrays.values()], _ds.Time_type),
+                       concat([a[2] for a in row_arrays.values()], _ds.Repcount_type),
+                       circuit_indices=circuit_indices, outcome_label_indices=dataset.olIndex,
+                       static=True, collision_action=collision_action)
+
+
 def _adjust_probabilities_inbounds(ps, tol):
     #Adjust to probabilities if needed (and warn if not close to in-bounds)
     # ps is a dict w/keys = outcome labels and values = probabilities
@@ -40,8 +40,8 @@ cdef extern from "effectcreps.h" namespace "CReps_densitymx":
     cdef cppclass EffectCRep:
         EffectCRep() except +
         EffectCRep(INT) except +
-        double probability(StateCRep* state)
-        double probability_using_cache(StateCRep* state, StateCRep* precomp_state, INT& precomp_id)
+        double probability(StateCRep* state) nogil
+        double probability_using_cache(StateCRep* state, StateCRep* precomp_state, INT& precomp_id) nogil
         INT _dim
 
     cdef cppclass EffectCRep_Dense(EffectCRep):
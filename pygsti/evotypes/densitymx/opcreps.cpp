@@ -34,14 +34,38 @@ namespace CReps_densitymx {
     :OpCRep(dim)
   {
     _dataptr = data;
+    _diagptr = NULL;
+    _csr_data = NULL;
+    _csr_indices = NULL;
+    _csr_indptr = NULL;
   }
   OpCRep_Dense::~OpCRep_Dense() { }
 
+  void OpCRep_Dense::set_structure(double* diag, double* csr_data, INT* csr_indices, INT* csr_indptr) {
+    _diagptr = diag;
+    _csr_data = csr_data;
+    _csr_indices = csr_indices;
+    _csr_indptr = csr_indptr;
+  }
+
   StateCRep* OpCRep_Dense::acton(StateCRep* state,
 				       StateCRep* outstate) {
     DEBUG(std::cout << "Dense acton called!" << std::endl);
     DEBUG(state->print("INPUT"));
     INT k;
+    if(_diagptr != NULL) { // diagonal matrix: scale each element
+      for(INT i=0; i< _dim; i++)
+	outstate->_dataptr[i] = _diagptr[i] * state->_dataptr[i];
+      return outstate;
+    }
+    if(_csr_indptr != NULL) { // sparse matrix: csr_matvec
+      for(INT i=0; i< _dim; i++) {
+	outstate->_dataptr[i] = 0.0;
+	for(k=_csr_indptr[i]; k<_csr_indptr[i+1]; k++)
+	  outstate->_dataptr[i] += _csr_data[k] * state->_dataptr[_csr_indices[k]];
+      }
+      return outstate;
+    }
     for(INT i=0; i< _dim; i++) {
       outstate->_dataptr[i] = 0.0;
       k = i*_dim; // "row" offset into _dataptr, so dataptr[k+j] ~= dataptr[i,j]
@@ -57,6 +81,19 @@ namespace CReps_densitymx {
 					       StateCRep* outstate) {
     DEBUG(std::cout << "Dense adjoint_acton called!" << std::endl);
     DEBUG(state->print("INPUT"));
+    if(_diagptr != NULL) { // diagonal matrix: scale each element
+      for(INT i=0; i< _dim; i++)
+	outstate->_dataptr[i] = _diagptr[i] * state->_dataptr[i];
+      return outstate;
+    }
+    if(_csr_indptr != NULL) { // sparse matrix: multiply by the transpose of the CSR matrix
+      for(INT i=0; i< _dim; i++) outstate->_dataptr[i] = 0.0;
+      for(INT i=0; i< _dim; i++) {
+	for(INT k=_csr_indptr[i]; k<_csr_indptr[i+1]; k++)
+	  outstate->_dataptr[_csr_indices[k]] += _csr_data[k] * state->_dataptr[i];
+      }
+      return outstate;
+    }
     for(INT i=0; i< _dim; i++) {
       outstate->_dataptr[i] = 0.0;
       for(INT j=0; j< _dim; j++) {
@@ -459,6 +496,7 @@ namespace CReps_densitymx {
     :OpCRep(dim)
   {
     _errgen_rep = errgen_rep;
+    _exp_rep = NULL;
     
     _mu = mu;
     _eta = eta;
@@ -470,6 +508,8 @@ namespace CReps_densitymx {
 
   StateCRep* OpCRep_ExpErrorgen::acton(StateCRep* state, StateCRep* out_state)
   {
+    if(_exp_rep != NULL) return _exp_rep->acton(state, out_state);
+
     //INT i, j;
     StateCRep* init_state = new StateCRep(_dim);
     DEBUG(std::cout << "Lindblad acton called!" << std::endl);
@@ -508,6 +548,7 @@ namespace CReps_densitymx {
   }
 
   StateCRep* OpCRep_ExpErrorgen::adjoint_acton(StateCRep* state, StateCRep* out_state) {
+    if(_exp_rep != NULL) return _exp_rep->adjoint_acton(state, out_state);
     assert(false); //ajoint_acton not implemented yet for Lindblad gates (TODO LATER)
     return NULL; //to avoid compiler warning
   }
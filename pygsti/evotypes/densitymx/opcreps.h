@@ -35,7 +35,15 @@ namespace CReps_densitymx {
   class OpCRep_Dense :public OpCRep {
     public:
     double* _dataptr;
+    // Optional structure of the matrix at _dataptr, used to act with it more cheaply: when
+    // _diagptr is non-NULL the matrix is diagonal with these elements, and otherwise when
+    // _csr_indptr is non-NULL it is given by the _csr_* (CSR sparse matrix) arrays.
+    double* _diagptr;
+    double* _csr_data;
+    INT* _csr_indices;
+    INT* _csr_indptr;
     OpCRep_Dense(double* data, INT dim);
+    void set_structure(double* diag, double* csr_data, INT* csr_indices, INT* csr_indptr);
     virtual ~OpCRep_Dense();
     virtual StateCRep* acton(StateCRep* state, StateCRep* out_state);
     virtual StateCRep* adjoint_acton(StateCRep* state, StateCRep* out_state);
@@ -94,6 +102,7 @@ namespace CReps_densitymx {
   class OpCRep_ExpErrorgen :public OpCRep{
     public:
     OpCRep* _errgen_rep;
+    OpCRep* _exp_rep; // when non-NULL, a precomputed exp(errgen) that is used instead of a Taylor series
     double _mu;
     double _eta;
     INT _m_star;
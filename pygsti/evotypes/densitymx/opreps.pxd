@@ -31,12 +31,13 @@ ctypedef unsigned long long UINT
 cdef extern from "opcreps.h" namespace "CReps_densitymx":
     cdef cppclass OpCRep:
         OpCRep(INT) except +
-        StateCRep* acton(StateCRep*, StateCRep*)
-        StateCRep* adjoint_acton(StateCRep*, StateCRep*)
+        StateCRep* acton(StateCRep*, StateCRep*) nogil
+        StateCRep* adjoint_acton(StateCRep*, StateCRep*) nogil
         INT _dim
 
     cdef cppclass OpCRep_Dense(OpCRep):
         OpCRep_Dense(double*,INT) except +
+        void set_structure(double*, double*, INT*, INT*)
         StateCRep* acton(StateCRep*, StateCRep*)
         StateCRep* adjoint_acton(StateCRep*, StateCRep*)
         double* _dataptr
@@ -72,6 +73,7 @@ cdef extern from "opcreps.h" namespace "CReps_densitymx":
 			   double mu, double eta, INT m_star, INT s, INT dim) except +
         StateCRep* acton(StateCRep*, StateCRep*)
         StateCRep* adjoint_acton(StateCRep*, StateCRep*)
+        OpCRep* _exp_rep
         double _mu
         double _eta
         INT _m_star
@@ -15,6 +15,7 @@ import sys
 import numpy as _np
 import copy as _copy
 import scipy.sparse as _sps
+import scipy.linalg as _spl
 
 import itertools as _itertools
 from ...baseobjs.statespace import StateSpace as _StateSpace
@@ -25,6 +26,9 @@ from ...tools import internalgates as _itgs
 from ...tools import lindbladtools as _lbt
 from scipy.sparse.linalg import LinearOperator as ScipyLinearOperator
 
+# the largest dimension of an exponentiated error generator that is precomputed (see OpRepExpErrorgen)
+_MAX_PRECOMPUTED_EXP_DIM = 256
+
 
 cdef class OpRep(_basereps_cython.OpRep):
     def __cinit__(self):
@@ -72,8 +76,29 @@ cdef class OpRep(_basereps_cython.OpRep):
         return ScipyLinearOperator((dim,dim), matvec=mv, rmatvec=rmv, dtype='d') # transpose, adjoint, dot, matmat?
 
 
+def _cheapest_superop_structure(mx):
+    """
+    The cheapest way of acting with the superoperator `mx`, as a `(structure, nonzero, cost)` tuple.
+
+    `structure` is `"diagonal"`, `"sparse"` or `"dense"`, `nonzero` is a boolean array marking
+    the significant elements of `mx` and `cost` is the approximate number of multiply-adds needed
+    to act with `mx` in this way (counting an indexed, sparse, element as two).
+    """
+    dim = mx.shape[0]
+    abs_mx = _np.abs(mx)
+    nonzero = abs_mx > 1e-15 * max(1.0, _np.max(abs_mx, initial=0.0))
+    nnz = _np.count_nonzero(nonzero)
+    if nnz == _np.count_nonzero(_np.diag(nonzero)):
+        return "diagonal", nonzero, dim
+    if 2 * nnz + dim < dim**2:
+        return "sparse", nonzero, 2 * nnz + dim
+    return "dense", nonzero, dim**2
+
+
 cdef class OpRepDenseSuperop(OpRep):
     cdef public _np.ndarray base
+    cdef public object structure  # how the C-rep acts with `base`: "dense", "diagonal" or "sparse"
+    cdef object structure_arrays  # arrays (other than `base`) the C-rep uses to act with `base`
 
     def __init__(self, mx, state_space):
         state_space = _StateSpace.cast(state_space)
@@ -86,10 +111,47 @@ cdef class OpRepDenseSuperop(OpRep):
         self.c_rep = new OpCRep_Dense(<double*>self.base.data,
                                      <INT>self.base.shape[0])
         self.state_space = state_space
+        self.structure = "dense"
 
     def base_has_changed(self):
         pass
 
+    def update_structure(self):
+        """
+        Act with `self.base` using its structure (as a diagonal, sparse or dense matrix), whichever is cheapest.
+
+        Because the structure is only determined by this call, it must be called again whenever
+        `self.base` is changed.  It is therefore only used by reps that update their own `base`.
+
+        Returns
+        -------
+        int
+            The approximate number of multiply-adds needed to act with `self.base`.
+        """
+        cdef _np.ndarray[double, ndim=1, mode='c'] diag
+        cdef _np.ndarray[double, ndim=1, mode='c'] csr_data
+        cdef _np.ndarray[_np.int64_t, ndim=1, mode='c'] csr_indices
+        cdef _np.ndarray[_np.int64_t, ndim=1, mode='c'] csr_indptr
+        cdef OpCRep_Dense* dense_crep = <OpCRep_Dense*>self.c_rep
+
+        structure, nonzero, cost = _cheapest_superop_structure(self.base)
+        if structure == "diagonal":
+            diag = _np.ascontiguousarray(_np.diag(self.base), 'd')
+            dense_crep.set_structure(<double*>diag.data, NULL, NULL, NULL)
+            self.structure_arrays = (diag,)
+        elif structure == "sparse":
+            csr = _sps.csr_matrix(_np.where(nonzero, self.base, 0.0))
+            csr_data = _np.ascontiguousarray(csr.data, 'd')
+            csr_indices = _np.ascontiguousarray(csr.indices, _np.int64)
+            csr_indptr = _np.ascontiguousarray(csr.indptr, _np.int64)
+            dense_crep.set_structure(NULL, <double*>csr_data.data, <INT*>csr_indices.data, <INT*>csr_indptr.data)
+            self.structure_arrays = (csr_data, csr_indices, csr_indptr)
+        else:
+            dense_crep.set_structure(NULL, NULL, NULL, NULL)
+            self.structure_arrays = None
+        self.structure = structure
+        return cost
+
     def to_dense(self, on_space):
         if on_space not in ('minimal', 'HilbertSchmidt'):
             raise ValueError("'densitymx' evotype cannot produce Hilbert-space ops!")
@@ -182,6 +244,7 @@ cdef class OpRepStandard(OpRepDenseSuperop):
         assert(superop.shape[0] == state_space.dim)
 
         super(OpRepStandard, self).__init__(superop, state_space)
+        self.update_structure()  # e.g. Clifford gates are signed permutations in a Pauli-product basis
 
     def __reduce__(self):
         return (OpRepStandard, (self.name, self.basis, self.state_space))
@@ -215,6 +278,7 @@ cdef class OpRepStochastic(OpRepDenseSuperop):
         for rate, ss in zip(self.rates, self.stochastic_superops):
             errormap += rate * ss
         self.base[:, :] = errormap
+        self.update_structure()  # diagonal in a Pauli-product basis
 
     def __reduce__(self):
         return (OpRepStochastic, (self.basis, None, self.rates, None, self.state_space))
@@ -450,9 +514,11 @@ cdef class OpRepEmbedded(OpRep):
 
 cdef class OpRepExpErrorgen(OpRep):
     cdef public object errorgen_rep
+    cdef public object exp_rep  # a precomputed OpRepDenseSuperop of exp(errorgen), or None
 
     def __init__(self, errorgen_rep):
         self.errorgen_rep = errorgen_rep
+        self.exp_rep = None
         cdef INT dim = errorgen_rep.dim
         cdef double mu = 1.0
         cdef double eta = 1.0
@@ -470,6 +536,42 @@ cdef class OpRepExpErrorgen(OpRep):
             self.errorgen_rep.aslinearoperator(),
             a_1_norm=onenorm_upperbound)
         self.set_exp_params(mu, eta, m_star, s)
+        self.update_exp_rep()
+
+    def update_exp_rep(self):
+        """
+        Precompute exp(errorgen) when acting with it is cheaper than acting with its Taylor series.
+
+        The Taylor series used by the C-rep needs `m_star * s` actions of the error generator,
+        whereas acting with the precomputed exponential costs at most `dim**2` multiply-adds, and
+        fewer when it's diagonal or sparse (e.g. for Pauli-stochastic error generators in a
+        Pauli-product basis).  Exponentials with dimension above `_MAX_PRECOMPUTED_EXP_DIM`,
+        which are expensive to compute, are never precomputed.
+        """
+        cdef OpRepDenseSuperop exp_rep
+        cdef INT dim = self.errorgen_rep.dim
+        mu, eta, m_star, s = self.exp_params()
+        errgen_cost = self.errorgen_rep.data.shape[0] if isinstance(self.errorgen_rep, OpRepSparse) else dim**2
+        taylor_cost = m_star * s * (errgen_cost + 3 * dim)  # (+ the vector operations of each term)
+
+        if taylor_cost > dim and dim <= _MAX_PRECOMPUTED_EXP_DIM:
+            try:
+                errgen_mx = self.errorgen_rep.to_dense('HilbertSchmidt')
+            except AttributeError:  # e.g. sums of error generators
+                errgen_mx = self.errorgen_rep.aslinearoperator().matmat(_np.identity(dim, 'd'))
+            exp_mx = _spl.expm(errgen_mx)
+            if self.exp_rep is None:
+                exp_rep = OpRepDenseSuperop(exp_mx, self.state_space)
+            else:
+                exp_rep = self.exp_rep
+                exp_rep.base[:, :] = exp_mx
+            if exp_rep.update_structure() < taylor_cost:
+                (<OpCRep_ExpErrorgen*>self.c_rep)._exp_rep = exp_rep.c_rep
+                self.exp_rep = exp_rep
+                return
+
+        (<OpCRep_ExpErrorgen*>self.c_rep)._exp_rep = NULL
+        self.exp_rep = None
 
     def set_exp_params(self, double mu, double eta, INT m_star, INT s):
         (<OpCRep_ExpErrorgen*>self.c_rep)._mu = mu
@@ -498,7 +600,9 @@ cdef class OpRepExpErrorgen(OpRep):
         self.c_rep = new OpCRep_ExpErrorgen((<OpRep?>errorgen_rep).c_rep,
                                             mu, eta, m_star, s, dim)
         self.state_space = errorgen_rep.state_space
-        
+        self.exp_rep = None
+        self.update_exp_rep()
+
     def copy(self):
         return _copy.deepcopy(self)  # I think this should work using reduce/setstate framework TODO - test and maybe put in base class?
 
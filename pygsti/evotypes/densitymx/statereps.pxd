@@ -21,7 +21,7 @@ cdef extern from "statecreps.h" namespace "CReps_densitymx":
         StateCRep() except +
         StateCRep(INT) except +
         StateCRep(double*,INT,bool) except +
-        void copy_from(StateCRep*)
+        void copy_from(StateCRep*) nogil
         INT _dim
         double* _dataptr
 
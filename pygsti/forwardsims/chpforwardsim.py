@@ -20,11 +20,13 @@ from ..baseobjs.label import Label as _Label
 # in compliance with the License.  You may obtain a copy of the License at
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 # ***************************************************************************************************
+import io as _io
 import os as _os
 import re as _re
 import subprocess as _sp
 import tempfile as _tf
 import numpy as _np
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from pathlib import Path as _Path
 
 from pygsti.forwardsims.weakforwardsim import WeakForwardSimulator as _WeakForwardSimulator
@@ -34,12 +36,38 @@ from pygsti.modelmembers import povms as _povm
 from pygsti.baseobjs.outcomelabeldict import OutcomeLabelDict as _OutcomeLabelDict
 # from . import povm as _povm
 
+_CHP_OUTCOME_PATTERN = _re.compile(r'Outcome of measuring qubit (\d+): (\d)')
+
+
+def _offset_chp_str(chp_str, offset):
+    """
+    Shift the qubit indices of every instruction in a CHP string by `offset`.
+
+    Parameters
+    ----------
+    chp_str : str
+        Newline-separated CHP instructions, e.g. `"h 0\\nc 0 1\\n"`.
+
+    offset : int
+        The amount to add to each qubit index.
+
+    Returns
+    -------
+    str
+    """
+    lines = []
+    for line in chp_str.splitlines():
+        parts = line.split()
+        if len(parts) == 0: continue
+        lines.append(' '.join([parts[0]] + [str(int(q) + offset) for q in parts[1:]]) + '\n')
+    return ''.join(lines)
+
 
 class CHPForwardSimulator(_WeakForwardSimulator):
     """
     A WeakForwardSimulator returning probabilities with Scott Aaronson's CHP code
     """
-    def __init__(self, chpexe, shots, model=None):
+    def __init__(self, chpexe, shots, model=None, num_workers=1, shots_per_run=1):
         """
         Construct a new CHPForwardSimulator.
 
@@ -51,15 +79,93 @@ class CHPForwardSimulator(_WeakForwardSimulator):
             Number of times to run each circuit to obtain an approximate probability
         model : Model
             Optional parent Model to be stored with the Simulator
+        num_workers : int, optional
+            The number of CHP processes that are run concurrently.  Worker threads
+            (which just drive and wait on CHP processes) are created once and reused
+            for all circuits.  `None` means use all the local cores.
+        shots_per_run : int, optional
+            The (maximum) number of shots simulated by a single CHP process.  Shots are
+            laid out on disjoint blocks of qubits within one CHP program, so the cost of
+            starting a CHP process is paid once per batch instead of once per shot.
+            Note that CHP's runtime grows quadratically with the total number of qubits,
+            so this should be kept moderate for many-qubit circuits.
         """
         self.chpexe = _Path(chpexe)
         assert self.chpexe.is_file(), "A valid CHP executable must be passed to CHPForwardSimulator"
+        assert(shots_per_run >= 1), "`shots_per_run` must be a positive integer"
+
+        self.num_workers = _os.cpu_count() if num_workers is None else num_workers
+        self.shots_per_run = shots_per_run
+        self._executor = None  # created on first use
 
         super().__init__(shots, model)
 
+    def __getstate__(self):
+        state_dict = super().__getstate__()
+        state_dict['_executor'] = None  # thread pools cannot be pickled
+        return state_dict
+
+    def close(self):
+        """
+        Shut down the worker processes and threads (if any) used to run CHP.
+
+        New ones are created if they are needed again.
+
+        Returns
+        -------
+        None
+        """
+        super().close()
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def _compute_circuit_outcome_for_shot(self, circuit, resource_alloc, time=None):
         assert(time is None), "CHPForwardSimulator cannot be used to simulate time-dependent circuits yet"
 
+        layer_ops = self._resolve_circuit_layer_operators(circuit)
+        return self._parse_chp_output(self._run_chp_program(self._create_chp_program(layer_ops, 1)), 1)[0]
+
+    def _compute_circuit_outcomes_for_shots(self, spc_circuit, num_shots, resource_alloc, time=None):
+        assert(time is None), "CHPForwardSimulator cannot be used to simulate time-dependent circuits yet"
+
+        # Operators are looked up once per circuit and reused for every shot
+        layer_ops = self._resolve_circuit_layer_operators(spc_circuit)
+        batch_sizes = [self.shots_per_run] * (num_shots // self.shots_per_run)
+        if num_shots % self.shots_per_run > 0:
+            batch_sizes.append(num_shots % self.shots_per_run)
+
+        # Programs are built serially since stochastic ops draw from (non-thread-safe) random states
+        programs = [self._create_chp_program(layer_ops, nshots) for nshots in batch_sizes]
+        if self.num_workers > 1 and len(programs) > 1:
+            if self._executor is None:
+                self._executor = _ThreadPoolExecutor(max_workers=self.num_workers)
+            outputs = list(self._executor.map(self._run_chp_program, programs))
+        else:
+            outputs = [self._run_chp_program(program) for program in programs]
+
+        outcome_indices = {}
+        shot_indices = _np.empty(num_shots, _np.int64)
+        i = 0
+        for out, nshots in zip(outputs, batch_sizes):
+            for outcome in self._parse_chp_output(out, nshots):
+                shot_indices[i] = outcome_indices.setdefault(outcome, len(outcome_indices))
+                i += 1
+        return tuple(outcome_indices.keys()), _np.bincount(shot_indices, minlength=len(outcome_indices))
+
+    def _resolve_circuit_layer_operators(self, circuit):
+        """Helper function to look up the prep, layer and POVM operators of a circuit.
+
+        Parameters
+        ----------
+        circuit: Circuit
+            The circuit to simulate.
+
+        Returns
+        -------
+        tuple
+            A `(rho, ops, povm, povm_label)` tuple.
+        """
         # Don't error on POVM, in case it's just an issue of marginalization
         prep_label, op_labels, povm_label = self.model.split_circuit(circuit, erroron=('prep',))
         # Try to get unmarginalized POVM
@@ -71,24 +177,61 @@ class CHPForwardSimulator(_WeakForwardSimulator):
         assert (povm_label is not None), \
             "Unable to get default POVM for %s" % str(circuit)
 
+        rho = self.model.circuit_layer_operator(prep_label, 'prep')
+        ops = [self.model.circuit_layer_operator(op_label, 'op') for op_label in op_labels]
+        # POVM (sort of, actually using it more like a straight PVM)
+        povm = self.model.circuit_layer_operator(_Label(povm_label.name), 'povm')
+        return rho, ops, povm, povm_label
+
+    def _create_chp_program(self, layer_ops, nshots):
+        """Helper function to build a CHP program simulating `nshots` shots of a circuit.
+
+        The i-th shot acts on qubits `i*nqubits` to `(i+1)*nqubits - 1`.  Each shot's
+        CHP string is generated separately so that stochastic operations are re-sampled.
+
+        Parameters
+        ----------
+        layer_ops: tuple
+            The `(rho, ops, povm, povm_label)` tuple from :meth:`_resolve_circuit_layer_operators`.
+
+        nshots: int
+            The number of shots.
+
+        Returns
+        -------
+        str
+        """
+        rho, ops, povm, povm_label = layer_ops
+        nqubits = self.model.state_space.num_qubits
+        program = _io.StringIO()
+        program.write('#\n')
+        for i in range(nshots):
+            shot = _io.StringIO()
+            self._process_state(rho, shot)
+            for op in ops:
+                shot.write(op._rep.chp_str())
+            self._process_povm(povm, povm_label, shot)
+            program.write(_offset_chp_str(shot.getvalue(), i * nqubits))
+        return program.getvalue()
+
+    def _run_chp_program(self, program):
+        """Helper function to run CHP on a program and return its (decoded) output.
+
+        Parameters
+        ----------
+        program: str
+            A CHP program, as returned by :meth:`_create_chp_program`.
+
+        Returns
+        -------
+        str
+        """
+        # CHP reads its program by path (more than once), so it can't be fed through a pipe.
         # Use temporary file as per https://stackoverflow.com/a/8577225
         fd, path = _tf.mkstemp()
         try:
             with _os.fdopen(fd, 'w') as tmp:
-                tmp.write('#\n')
-
-                # Prep
-                rho = self.model.circuit_layer_operator(prep_label, 'prep')
-                self._process_state(rho, tmp)
-
-                # Op layers
-                for op_label in op_labels:
-                    op = self.model.circuit_layer_operator(op_label, 'op')
-                    tmp.write(op._rep.chp_str())
-
-                # POVM (sort of, actually using it more like a straight PVM)
-                povm = self.model.circuit_layer_operator(_Label(povm_label.name), 'povm')
-                self._process_povm(povm, povm_label, tmp)
+                tmp.write(program)
 
             # Run CHP
             process = _sp.Popen([f'{self.chpexe.resolve()}', f'{path}'], stdout=_sp.PIPE, stderr=_sp.PIPE)
@@ -96,18 +239,33 @@ class CHPForwardSimulator(_WeakForwardSimulator):
             out, err = process.communicate()
         finally:
             _os.remove(path)
+        return out.decode('utf-8')
 
-        # Extract outputs
-        pattern = _re.compile('Outcome of measuring qubit (\d): (\d)')
-        qubit_outcomes = []
-        for match in pattern.finditer(out.decode('utf-8')):
-            qubit_outcomes.append((int(match.group(1)), match.group(2)))
+    def _parse_chp_output(self, out, nshots):
+        """Helper function to extract the outcome labels of `nshots` shots from CHP output.
 
-        # TODO: Make sure this handles intermediate measurements
-        outcome = ''.join([qo[1] for qo in sorted(qubit_outcomes)])
-        outcome_label = _OutcomeLabelDict.to_outcome(outcome)
+        Parameters
+        ----------
+        out: str
+            The output of a CHP program built by :meth:`_create_chp_program`.
+
+        nshots: int
+            The number of shots the program simulated.
 
-        return outcome_label
+        Returns
+        -------
+        list
+            A list of `nshots` outcome labels.
+        """
+        nqubits = self.model.state_space.num_qubits
+        qubit_outcomes = [[] for _ in range(nshots)]
+        for match in _CHP_OUTCOME_PATTERN.finditer(out):
+            ishot, iqubit = divmod(int(match.group(1)), nqubits)
+            qubit_outcomes[ishot].append((iqubit, match.group(2)))
+
+        # TODO: Make sure this handles intermediate measurements
+        return [_OutcomeLabelDict.to_outcome(''.join([qo[1] for qo in sorted(shot_outcomes)]))
+                for shot_outcomes in qubit_outcomes]
 
     def _process_state(self, rho, file_handle):
         """Helper function to process state prep for CHP circuits.
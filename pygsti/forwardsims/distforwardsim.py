@@ -58,6 +58,11 @@ class DistributableForwardSimulator(_ForwardSimulator):
         this can be a 0-, 1- or 2-tuple of integers or `None` values.  A block size of `None`
         means that there should be no division into blocks, and that each block processor
         computes all of its parameter indices at once.
+
+    layout_cache_dir : str, optional
+        A directory in which layouts created by :method:`create_layout` store their atoms,
+        so that later layouts for the same circuits, model structure and data set (e.g. in
+        repeated fits of the same data) load rather than recreate them.  See :class:`LayoutCache`.
     """
 
     @classmethod
@@ -71,11 +76,13 @@ class DistributableForwardSimulator(_ForwardSimulator):
                 + cls._array_types_for_method('_bulk_fill_hprobs_block')
         return super()._array_types_for_method(method_name)
 
-    def __init__(self, model=None, num_atoms=None, processor_grid=None, param_blk_sizes=None):
+    def __init__(self, model=None, num_atoms=None, processor_grid=None, param_blk_sizes=None,
+                 layout_cache_dir=None):
         super().__init__(model)
         self._num_atoms = num_atoms
         self._processor_grid = processor_grid
         self._pblk_sizes = param_blk_sizes
+        self.layout_cache_dir = layout_cache_dir
         self._default_distribute_method = "circuits"
 
     def _set_param_block_size(self, wrt_filter, wrt_block_size, comm):
@@ -107,6 +114,23 @@ class DistributableForwardSimulator(_ForwardSimulator):
         # class (note: layouts hold their own resource-alloc, atom's don't)
         self._bulk_fill_probs_block(array_to_fill, layout_atom.as_layout(resource_alloc))
 
+    def _bulk_fill_probs_multi(self, array_to_fill, layout, param_vectors):
+        """Note: we expect that the rows of array_to_fill point to the memory specifically for this processor """
+        atom_resource_alloc = layout.resource_alloc('atom-processing')
+        atom_resource_alloc.host_comm_barrier()  # ensure all procs have finished w/shared memory before we reinit
+
+        for atom in layout.atoms:  # layout only holds local atoms
+            self._bulk_fill_probs_multi_atom(array_to_fill[:, atom.element_slice], atom, param_vectors,
+                                             atom_resource_alloc)
+
+        atom_resource_alloc.host_comm_barrier()  # don't exit until all procs' array_to_fill is ready
+
+    def _bulk_fill_probs_multi_atom(self, array_to_fill, layout_atom, param_vectors, resource_alloc):
+        # Derived classes can process the parameter vectors together; by default they're processed one by one.
+        for k, param_vec in enumerate(param_vectors):
+            self.model.from_vector(param_vec)
+            self._bulk_fill_probs_atom(array_to_fill[k], layout_atom, resource_alloc)
+
     def _bulk_fill_dprobs(self, array_to_fill, layout, pr_array_to_fill):
         """Note: we expect that array_to_fill points to the memory specifically for this processor
            (a subset of the memory for the host when memory is shared) """
@@ -351,6 +351,49 @@ class ForwardSimulator(_NicelySerializable):
         return _CircuitOutcomeProbabilityArrayLayout.create_from(circuits, self.model, dataset, derivative_dimensions,
                                                                  resource_alloc=resource_alloc)
 
+    def extend_layout(self, layout, circuits, dataset=None, resource_alloc=None,
+                      array_types=(), derivative_dimensions=None, verbosity=0):
+        """
+        Constructs a COPA layout for `circuits` and `dataset`, reusing the work that created `layout`.
+
+        This is useful when a sequence of layouts is created for growing lists of
+        circuits, e.g. over the iterations of long-sequence GST, as forward simulators
+        that support it only need to process the circuits that aren't in `layout`, or
+        for subsets of a list of circuits, e.g. when fitting to random mini-batches of
+        them.  By default, a new layout is created as by :method:`create_layout`.
+
+        Parameters
+        ----------
+        layout : CircuitOutcomeProbabilityArrayLayout
+            A layout previously created by this forward simulator, usually for a list
+            of circuits that `circuits` begins with or contains.  This layout is not altered.
+
+        circuits : list
+            The circuits whose outcome probabilities should be computed.
+
+        dataset : DataSet
+            The source of data counts that will be compared to the circuit outcome
+            probabilities.
+
+        resource_alloc : ResourceAllocation
+            A available resources and allocation information.
+
+        array_types : tuple, optional
+            A tuple of string-valued array types.  See :method:`create_layout`.
+
+        derivative_dimensions : tuple, optional
+            The parameter-space dimensions used when taking derivatives.  See :method:`create_layout`.
+
+        verbosity : int or VerbosityPrinter
+            Determines how much output to send to stdout.  0 means no output, higher
+            integers mean more output.
+
+        Returns
+        -------
+        CircuitOutcomeProbabilityArrayLayout
+        """
+        return self.create_layout(circuits, dataset, resource_alloc, array_types, derivative_dimensions, verbosity)
+
     #TODO UPDATE
     #def bulk_prep_probs(self, eval_tree, comm=None, mem_limit=None):
     #    """
@@ -563,6 +606,53 @@ class ForwardSimulator(_NicelySerializable):
             self._compute_circuit_outcome_probabilities(array_to_fill[element_indices], circuit,
                                                         outcomes, layout.resource_alloc(), time=None)
 
+    def bulk_fill_probs_multi(self, array_to_fill, layout, param_vectors):
+        """
+        Compute the outcome probabilities for a list circuits at many different model parameter vectors.
+
+        This is equivalent to setting the model's parameters to each row of `param_vectors` in
+        turn (via `model.from_vector`) and calling :method:`bulk_fill_probs`, but allows the
+        simulator to reuse everything that doesn't depend on the parameter values (the layout's
+        label lookups, cache buffers, etc.) and to process several parameter vectors together.
+        The model's parameter vector is restored before this method returns.
+
+        Parameters
+        ----------
+        array_to_fill : numpy ndarray
+            an already-allocated 2D numpy array of shape `(K, len(layout))`, where `K` is the
+            number of parameter vectors.  Row `k` is filled with the probabilities computed
+            using the parameter vector `param_vectors[k]`.
+
+        layout : CircuitOutcomeProbabilityArrayLayout
+            A layout for the rows of `array_to_fill`, describing what circuit outcome each
+            element corresponds to.  Usually given by a prior call to :method:`create_layout`.
+
+        param_vectors : numpy ndarray
+            A 2D array of shape `(K, model.num_params)` whose rows are the model parameter vectors.
+
+        Returns
+        -------
+        None
+        """
+        param_vectors = _np.asarray(param_vectors, 'd')
+        if param_vectors.ndim != 2 or param_vectors.shape[1] != self.model.num_params:
+            raise ValueError("`param_vectors` must have shape (K, %d), not %s!"
+                             % (self.model.num_params, str(param_vectors.shape)))
+        if array_to_fill.shape[0] != param_vectors.shape[0]:
+            raise ValueError("`array_to_fill` must have a row for each of the %d parameter vectors!"
+                             % param_vectors.shape[0])
+
+        orig_vec = self.model.to_vector().copy()
+        try:
+            self._bulk_fill_probs_multi(array_to_fill, layout, param_vectors)
+        finally:
+            self.model.from_vector(orig_vec)
+
+    def _bulk_fill_probs_multi(self, array_to_fill, layout, param_vectors):
+        for k, param_vec in enumerate(param_vectors):
+            self.model.from_vector(param_vec)
+            self._bulk_fill_probs(array_to_fill[k], layout)
+
     def _bulk_fill_probs_at_times(self, array_to_fill, layout, times):
         # A separate function because computation with time-dependence is often approached differently
         return self._bulk_fill_probs_block_at_times(array_to_fill, layout, times)
@@ -910,7 +1000,9 @@ def _array_type_parameter_dimension_letters():
 def _bytes_for_array_type(array_type, global_elements, max_local_elements, max_atom_size,
                           total_circuits, max_local_circuits,
                           global_num_params, max_local_num_params, max_param_block_size,
-                          max_per_processor_cachesize, dim, dtype='d'):
+                          max_per_processor_cachesize, dim, dtype='d', cache_dtype=None):
+    # `cache_dtype`, if given, is the dtype of the per-processor caches of process matrices ('z...dd...' types)
+    if cache_dtype is not None and 'z' in array_type and 'd' in array_type: dtype = cache_dtype
     bytes_per_item = _np.dtype(dtype).itemsize
 
     size = 1; cur_deriv_dim = 0
@@ -934,8 +1026,9 @@ def _bytes_for_array_type(array_type, global_elements, max_local_elements, max_a
 def _bytes_for_array_types(array_types, global_elements, max_local_elements, max_atom_size,
                            total_circuits, max_local_circuits,
                            global_num_params, max_local_num_params, max_param_block_size,
-                           max_per_processor_cachesize, dim, dtype='d'):  # cache is only local to processors
+                           max_per_processor_cachesize, dim, dtype='d', cache_dtype=None):  # cache is only local
     return sum([_bytes_for_array_type(array_type, global_elements, max_local_elements, max_atom_size,
                                       total_circuits, max_local_circuits,
                                       global_num_params, max_local_num_params, max_param_block_size,
-                                      max_per_processor_cachesize, dim, dtype) for array_type in array_types])
+                                      max_per_processor_cachesize, dim, dtype, cache_dtype)
+                for array_type in array_types])
@@ -99,8 +99,8 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
 
     Interfaces with a model via its `circuit_layer_operator` method and applies the resulting
     operators in order to propagate states and finally compute outcome probabilities.  Derivatives
-    are computed using finite-differences, and the prefix tables construbed by :class:`MapCOPALayout`
-    layout object are used to avoid duplicating (some) computation.
+    are computed using finite-differences (or, optionally, the adjoint method), and the prefix tables
+    construbed by :class:`MapCOPALayout` layout object are used to avoid duplicating (some) computation.
 
     Parameters
     ----------
@@ -133,6 +133,30 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
         this can be a 0-, 1- or 2-tuple of integers or `None` values.  A block size of `None`
         means that there should be no division into blocks, and that each block processor
         computes all of its parameter indices at once.
+
+    derivative_eps : float, optional
+        The finite-difference step used to compute derivatives.
+
+    hessian_eps : float, optional
+        The finite-difference step used to compute second derivatives.
+
+    derivative_mode : {"finite-difference", "adjoint"}
+        How the derivatives of circuit outcome probabilities are computed.  `"finite-difference"`
+        re-propagates (parts of) the prefix table for each perturbed parameter.  `"adjoint"` computes
+        exact derivatives by propagating states forward and effect vectors backward through each
+        circuit, and contracting these with each operation's `deriv_wrt_params()`.  This requires
+        a density-matrix evolution type, and is usually much faster for models with many parameters.
+
+    layout_cache_dir : str, optional
+        A directory in which layouts created by :method:`create_layout` store their atoms,
+        so that later layouts for the same circuits, model structure and data set (e.g. in
+        repeated fits of the same data) load rather than recreate them.  See :class:`LayoutCache`.
+
+    num_threads : int, optional
+        The number of threads each processor uses to propagate states through the independent
+        rows of its prefix tables (only used by the compiled density-matrix calculator).  This
+        is useful for using the cores of a shared-memory machine without MPI, and can be
+        combined with multiple processors.
     """
 
     @classmethod
@@ -149,18 +173,27 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
         return super()._array_types_for_method(method_name)
 
     def __init__(self, model=None, max_cache_size=0, num_atoms=None, processor_grid=None, param_blk_sizes=None,
-                 derivative_eps=1e-7, hessian_eps=1e-5):
+                 derivative_eps=1e-7, hessian_eps=1e-5, derivative_mode="finite-difference", layout_cache_dir=None,
+                 num_threads=1):
         #super().__init__(model, num_atoms, processor_grid, param_blk_sizes)
-        _DistributableForwardSimulator.__init__(self, model, num_atoms, processor_grid, param_blk_sizes)
+        if derivative_mode not in ("finite-difference", "adjoint"):
+            raise ValueError("Invalid `derivative_mode`: %s" % str(derivative_mode))
+        if num_threads < 1:
+            raise ValueError("`num_threads` must be at least 1 (given %s)" % str(num_threads))
+        _DistributableForwardSimulator.__init__(self, model, num_atoms, processor_grid, param_blk_sizes,
+                                                layout_cache_dir)
         self._max_cache_size = max_cache_size
         self.derivative_eps = derivative_eps  # for finite difference derivative calculations
         self.hessian_eps = hessian_eps
+        self.derivative_mode = derivative_mode
+        self.num_threads = num_threads
 
     def _to_nice_serialization(self):
         state = super()._to_nice_serialization()
         state.update({'max_cache_size': self._max_cache_size,
                       'derivative_epsilon': self.derivative_eps,
                       'hessian_epsilon': self.hessian_eps,
+                      'derivative_mode': self.derivative_mode,
                       # (don't serialize parent model or processor distribution info)
                       })
         return state
@@ -170,7 +203,8 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
         #Note: resets processor-distribution information
         return cls(None, state['max_cache_size'],
                    derivative_eps=state.get('derivative_epsilon', 1e-7),
-                   hessian_eps=state.get('hessian_epsilon', 1e-5))
+                   hessian_eps=state.get('hessian_epsilon', 1e-5),
+                   derivative_mode=state.get('derivative_mode', 'finite-difference'))
 
     def copy(self):
         """
@@ -181,7 +215,9 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
         MapForwardSimulator
         """
         return MapForwardSimulator(self.model, self._max_cache_size, self._num_atoms,
-                                   self._processor_grid, self._pblk_sizes)
+                                   self._processor_grid, self._pblk_sizes, self.derivative_eps,
+                                   self.hessian_eps, self.derivative_mode, self.layout_cache_dir,
+                                   self.num_threads)
 
     def create_layout(self, circuits, dataset=None, resource_alloc=None, array_types=('E',),
                       derivative_dimension=None, verbosity=0):
@@ -248,7 +284,8 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
         assert(_np.product((na,) + npp) <= nprocs), "Processor grid size exceeds available processors!"
 
         layout = _MapCOPALayout(circuits, self.model, dataset, self._max_cache_size, natoms, na, npp,
-                                param_dimensions, param_blk_sizes, resource_alloc, verbosity)
+                                param_dimensions, param_blk_sizes, resource_alloc, verbosity,
+                                self.layout_cache_dir)
 
         if mem_limit is not None:
             loc_nparams1 = num_params / npp[0] if len(npp) > 0 else 0
@@ -296,11 +333,108 @@ class MapForwardSimulator(_DistributableForwardSimulator, SimpleMapForwardSimula
         self.calclib.mapfill_probs_atom(self, array_to_fill, slice(0, array_to_fill.shape[0]),  # all indices
                                         layout_atom, resource_alloc)
 
+    def _bulk_fill_probs_multi_atom(self, array_to_fill, layout_atom, param_vectors, resource_alloc):
+        resource_alloc.check_can_allocate_memory(layout_atom.cache_size * self.model.dim)
+        self.calclib.mapfill_probs_atom_multi(self, array_to_fill, slice(0, array_to_fill.shape[1]),  # all indices
+                                              layout_atom, param_vectors, resource_alloc)
+
     def _bulk_fill_dprobs_atom(self, array_to_fill, dest_param_slice, layout_atom, param_slice, resource_alloc):
         # Note: *don't* set dest_indices arg = layout.element_slice, as this is already done by caller
         resource_alloc.check_can_allocate_memory(layout_atom.cache_size * self.model.dim * _slct.length(param_slice))
-        self.calclib.mapfill_dprobs_atom(self, array_to_fill, slice(0, array_to_fill.shape[0]), dest_param_slice,
-                                         layout_atom, param_slice, resource_alloc, self.derivative_eps)
+        if self.derivative_mode == "adjoint":
+            self._mapfill_dprobs_atom_adjoint(array_to_fill, slice(0, array_to_fill.shape[0]), dest_param_slice,
+                                              layout_atom, param_slice, resource_alloc)
+        else:
+            self.calclib.mapfill_dprobs_atom(self, array_to_fill, slice(0, array_to_fill.shape[0]), dest_param_slice,
+                                             layout_atom, param_slice, resource_alloc, self.derivative_eps)
+
+    def _mapfill_dprobs_atom_adjoint(self, array_to_fill, dest_indices, dest_param_indices, layout_atom,
+                                     param_indices, resource_alloc):
+        """
+        Helper function for populating derivative values using the adjoint method.
+
+        For a circuit outcome probability `p = E^T G_n ... G_1 rho`, the derivative with respect
+        to the parameters of the k-th layer is `b_k^T dG_k s_{k-1}`, where `s_{k-1} = G_{k-1}...G_1 rho`
+        is computed by propagating `rho` forward (using the prefix table to share the states of common
+        prefixes) and `b_k^T = E^T G_n ... G_{k+1}` by propagating the effect vectors backward.  Outer
+        products of these are summed for each layer operation, and then contracted with its
+        `deriv_wrt_params()`, so that all derivatives are obtained in one forward and one backward sweep.
+        """
+        if self.model.evotype.name not in ('densitymx', 'densitymx_slow'):
+            raise ValueError("The adjoint derivative mode requires a density-matrix evolution type, not '%s'"
+                             % self.model.evotype.name)
+        shared_mem_leader = resource_alloc.is_host_leader if (resource_alloc is not None) else True
+
+        if param_indices is None:
+            param_indices = list(range(self.model.num_params))
+        if dest_param_indices is None:
+            dest_param_indices = list(range(_slct.length(param_indices)))
+        param_indices = _slct.to_array(param_indices)
+        dest_indices = _slct.to_array(dest_indices)
+
+        #Map each model parameter to its column in each row's derivative (-1 if it isn't needed)
+        column_of_param = _np.full(self.model.num_params, -1, _np.int64)
+        column_of_param[param_indices] = _np.arange(len(param_indices))
+
+        dense_cache = {}
+
+        def dense_and_deriv(lbl, typ):
+            """ The dense (minimal-space) form of a layer operation, its derivative, and the columns it affects """
+            if (lbl, typ) not in dense_cache:
+                op = self.model._circuit_layer_operator(lbl, typ)
+                columns = column_of_param[op.gpindices_as_array()]
+                needed = _np.nonzero(columns >= 0)[0]
+                deriv = op.deriv_wrt_params()[:, needed] if len(needed) > 0 else None
+                dense_cache[(lbl, typ)] = (op.to_dense(on_space='minimal'), deriv, columns[needed])
+            return dense_cache[(lbl, typ)]
+
+        full_effect_labels = list(layout_atom.full_effect_labels)
+        states_by_cache_index = {}
+        for iDest, iStart, remainder, iCache in layout_atom.table.contents:
+            layers = remainder.circuit_without_povm.layertup
+
+            #Forward sweep: states[k] is the state after the k-th layer of the full circuit
+            if iStart is None:  # then first element of remainder is a state prep label
+                prep_lbl = layers[0]; layers = layers[1:]
+                states = [dense_and_deriv(prep_lbl, 'prep')[0]]; layer_lbls = ()
+            else:
+                prep_lbl, states, layer_lbls = states_by_cache_index[iStart]
+                states = states[:]  # the cached list is shared with other rows
+            for lbl in layers:
+                states.append(_np.dot(dense_and_deriv(lbl, 'op')[0], states[-1]))
+            layer_lbls = layer_lbls + layers
+            if iCache is not None:
+                states_by_cache_index[iCache] = (prep_lbl, states, layer_lbls)
+
+            #Effect terms, and the backward sweep (b[j] = E_j^T G_n ... G_{k+1} after processing layer k+1)
+            effects = [dense_and_deriv(full_effect_labels[j], 'povm')
+                       for j in layout_atom.elbl_indices_by_expcircuit[iDest]]
+            nE = len(effects)
+            dprobs = _np.zeros((nE, len(param_indices)), 'd')
+            for j, (_, deriv, columns) in enumerate(effects):
+                if deriv is not None: dprobs[j, columns] += _np.dot(states[-1], deriv)
+
+            b = _np.array([E for E, _, _ in effects])  # shape (nE, dim)
+            outer_sums = {}
+            for k in range(len(layer_lbls), 0, -1):
+                G, deriv, _ = dense_and_deriv(layer_lbls[k - 1], 'op')
+                if deriv is not None:
+                    outer = b[:, :, None] * states[k - 1][None, None, :]
+                    if layer_lbls[k - 1] in outer_sums:
+                        outer_sums[layer_lbls[k - 1]] += outer
+                    else:
+                        outer_sums[layer_lbls[k - 1]] = outer
+                b = _np.dot(b, G)
+
+            for lbl, outer in outer_sums.items():
+                _, deriv, columns = dense_and_deriv(lbl, 'op')
+                dprobs[:, columns] += _np.dot(outer.reshape(nE, -1), deriv)
+            _, deriv, columns = dense_and_deriv(prep_lbl, 'prep')
+            if deriv is not None: dprobs[:, columns] += _np.dot(b, deriv)
+
+            if shared_mem_leader:
+                final_indices = dest_indices[layout_atom.elindices_by_expcircuit[iDest]]
+                _fas(array_to_fill, [final_indices, dest_param_indices], dprobs)
 
     def _bulk_fill_hprobs_atom(self, array_to_fill, dest_param_slice1, dest_param_slice2, layout_atom,
                                param_slice1, param_slice2, resource_alloc):
@@ -19,6 +19,8 @@ from ..evotypes.densitymx.opreps cimport OpRep, OpCRep
 from ..evotypes.densitymx.effectreps cimport EffectRep, EffectCRep
 
 import time as pytime
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+
 import numpy as np
 cimport numpy as np
 cimport cython
@@ -147,156 +149,238 @@ cdef vector[EffectCRep*] convert_ereps(ereps):
 # Mapfill functions
 # -----------------------------------------
 
-def mapfill_probs_atom(fwdsim, np.ndarray[double, mode="c", ndim=1] array_to_fill,
-                       dest_indices, layout_atom, resource_alloc):
+# the fewest state propagations ("applies") worth handing to a separate thread
+_MIN_THREAD_APPLIES = 64
+
+
+cdef class _TableRowPropagator:
+    """
+    The C representations of a layout atom's prefix table and of the model's operations it uses.
+
+    :method:`propagate` computes the outcome probabilities of a subset of the table's rows
+    *without holding the GIL*, so that groups of mutually independent rows (see
+    :method:`PrefixTable.row_levels`) can be computed concurrently by separate threads.
+    """
+    cdef vector[vector[INT]] c_layout_atom
+    cdef vector[OpCRep*] c_opreps
+    cdef vector[StateCRep*] c_rhos
+    cdef vector[EffectCRep*] c_ereps
+    cdef vector[StateCRep*] rho_cache
+    cdef vector[StateCRep*]* prho_cache  # the cache propagated rows use (`rho_cache` unless changed)
+    cdef vector[vector[INT]] elabel_indices_per_circuit
+    cdef vector[vector[INT]] final_indices_per_circuit
+    cdef INT dim
+    cdef double[::1] array_to_fill
+    cdef object row_levels
+    cdef object row_costs
+    cdef object reps  # keeps the python rep objects (owning the C-reps above) alive
+
+    def __dealloc__(self):
+        free_rhocache(self.rho_cache)  #delete cache entries
+
+    def propagate(self, np.int64_t[::1] rows):
+        """
+        Compute the probabilities of table rows `rows` (in order), writing them to `self.array_to_fill`.
+        """
+        if rows.shape[0] == 0: return
+        cdef StateCRep *prop2 = new StateCRep(self.dim)
+        cdef StateCRep *shelved = new StateCRep(self.dim)
+        cdef double* dest = &self.array_to_fill[0]
+        cdef INT* prows = <INT*>&rows[0]
+        cdef INT num_rows = rows.shape[0]
+        with nogil:
+            dm_mapfill_probs(dest, self.c_layout_atom, prows, num_rows, self.c_opreps, self.c_rhos, self.c_ereps,
+                             self.prho_cache, self.elabel_indices_per_circuit, self.final_indices_per_circuit,
+                             &prop2, &shelved)
+        del prop2
+        del shelved
+
+    def propagate_concurrently(self, rows, thread_pool, num_threads):
+        """
+        Compute the probabilities of table rows `rows` using the threads of `thread_pool`.
+
+        Rows are computed one "level" at a time, with each level's rows divided
+        into (at most) `num_threads` contiguous groups of roughly equal cost.  Levels
+        with too little work to be worth dividing are computed by the calling thread.
+        """
+        if thread_pool is None or num_threads <= 1:
+            self.propagate(rows); return
+
+        levels = self.row_levels[rows]
+        if len(rows) > 1 and np.any(levels[1:] < levels[:-1]):
+            order = np.argsort(levels, kind='stable')
+            rows = rows[order]; levels = levels[order]
+        for level_rows in np.split(rows, np.flatnonzero(levels[1:] != levels[:-1]) + 1):
+            cum_costs = np.cumsum(self.row_costs[level_rows])
+            num_groups = min(num_threads, cum_costs[-1] // _MIN_THREAD_APPLIES)
+            if num_groups <= 1:
+                self.propagate(level_rows); continue
+            splits = np.searchsorted(cum_costs, cum_costs[-1] * np.arange(1, num_groups) / num_groups)
+            groups = [grp for grp in np.split(level_rows, splits) if len(grp) > 0]
+            if len(groups) == 1:
+                self.propagate(groups[0])
+            else:
+                list(thread_pool.map(self.propagate, groups))
 
-    # The required ending condition is that array_to_fill on each processor has been filled.  But if
-    # memory is being shared and resource_alloc contains multiple processors on a single host, we only
-    # want *one* (the rank=0) processor to perform the computation, since array_to_fill will be
-    # shared memory that we don't want to have muliple procs using simultaneously to compute the
-    # same thing.  Thus, we carefully guard any shared mem updates/usage
-    # using "if shared_mem_leader" (and barriers, if needed) below.
-    shared_mem_leader = resource_alloc.is_host_leader if (resource_alloc is not None) else True
 
-    dest_indices = _slct.to_array(dest_indices)  # make sure this is an array and not a slice
-    #dest_indices = np.ascontiguousarray(dest_indices) #unneeded
+cdef _TableRowPropagator create_row_propagator(fwdsim, layout_atom, dest_indices):
+    # dest_indices (if not None) maps the atom's element indices to those of the array being filled
+    cdef _TableRowPropagator propagator = _TableRowPropagator()
 
     #Get (extension-type) representation objects
+    # NOTE: the circuit_layer_operator(lbl) functions cache the returned operation
+    # inside fwdsim.model's opcache.  This speeds up future calls, but
+    # more importantly causes fwdsim.model.from_vector to be aware of these operations and to
+    # re-initialize them with updated parameter vectors as is necessary for the finite difference loop.
     rho_lookup = { lbl:i for i,lbl in enumerate(layout_atom.rho_labels) } # rho labels -> ints for faster lookup
     rhoreps = { i: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl,i in rho_lookup.items() }
     operation_lookup = { lbl:i for i,lbl in enumerate(layout_atom.op_labels) } # operation labels -> ints for faster lookup
     operationreps = { i:fwdsim.model._circuit_layer_operator(lbl, 'op')._rep for lbl,i in operation_lookup.items() }
     ereps = [fwdsim.model._circuit_layer_operator(elbl, 'povm')._rep for elbl in layout_atom.full_effect_labels]  # cache these in future
+    propagator.reps = (rhoreps, operationreps, ereps)
 
     # convert to C-mode:  evaltree, operation_lookup, operationreps
-    cdef vector[vector[INT]] c_layout_atom = convert_maplayout(layout_atom, operation_lookup, rho_lookup)
-    cdef vector[StateCRep*] c_rhos = convert_rhoreps(rhoreps)
-    cdef vector[EffectCRep*] c_ereps = convert_ereps(ereps)
-    cdef vector[OpCRep*] c_opreps = convert_opreps(operationreps)
+    propagator.c_layout_atom = convert_maplayout(layout_atom, operation_lookup, rho_lookup)
+    propagator.c_rhos = convert_rhoreps(rhoreps)
+    propagator.c_ereps = convert_ereps(ereps)
+    propagator.c_opreps = convert_opreps(operationreps)
 
     # create rho_cache = vector of StateCReps
     #print "DB: creating rho_cache of size %d * %g GB => %g GB" % \
     #   (layout_atom.cache_size, 8.0 * fwdsim.model.dim / 1024.0**3, layout_atom.cache_size * 8.0 * fwdsim.model.dim / 1024.0**3)
-    cdef vector[StateCRep*] rho_cache = create_rhocache(layout_atom.cache_size, fwdsim.model.dim)
-    cdef vector[vector[INT]] elabel_indices_per_circuit = convert_dict_of_intlists(layout_atom.elbl_indices_by_expcircuit)
-    cdef vector[vector[INT]] final_indices_per_circuit = convert_and_wrap_dict_of_intlists(
-        layout_atom.elindices_by_expcircuit, dest_indices)
-
-    #DEBUG REMOVE
-    #print_mem_usage("MAPFILL PROBS begin")
-    #for i in [1808, 419509, 691738, 497424]:
-    #    from ..evotypes.densitymx.opreps import OpRepComposed
-    #    op = operationreps[i]
-    #    if isinstance(op.embedded_rep, OpRepComposed):
-    #        extra = " factors = " + ', '.join([str(type(opp)) for opp in op.embedded_rep.factor_reps])
-    #    else:
-    #        extra = ""
-    #    print("ID ",i,str(type(op)),str(type(op.embedded_rep)), extra)
+    propagator.rho_cache = create_rhocache(layout_atom.cache_size, fwdsim.model.dim)
+    propagator.prho_cache = &propagator.rho_cache
+    propagator.elabel_indices_per_circuit = convert_dict_of_intlists(layout_atom.elbl_indices_by_expcircuit)
+    propagator.final_indices_per_circuit = convert_dict_of_intlists(layout_atom.elindices_by_expcircuit) \
+        if (dest_indices is None) else convert_and_wrap_dict_of_intlists(layout_atom.elindices_by_expcircuit, dest_indices)
+    propagator.dim = fwdsim.model.dim
+
+    propagator.row_levels = layout_atom.table.row_levels()
+    propagator.row_costs = np.array([propagator.c_layout_atom[k].size() - 2
+                                      for k in range(<INT>propagator.c_layout_atom.size())], np.int64)
+    return propagator
+
+
+def mapfill_probs_atom(fwdsim, np.ndarray[double, mode="c", ndim=1] array_to_fill,
+                       dest_indices, layout_atom, resource_alloc):
+
+    # The required ending condition is that array_to_fill on each processor has been filled.  But if
+    # memory is being shared and resource_alloc contains multiple processors on a single host, we only
+    # want *one* (the rank=0) processor to perform the computation, since array_to_fill will be
+    # shared memory that we don't want to have muliple procs using simultaneously to compute the
+    # same thing.  Thus, we carefully guard any shared mem updates/usage
+    # using "if shared_mem_leader" (and barriers, if needed) below.
+    shared_mem_leader = resource_alloc.is_host_leader if (resource_alloc is not None) else True
+
+    dest_indices = _slct.to_array(dest_indices)  # make sure this is an array and not a slice
+    #dest_indices = np.ascontiguousarray(dest_indices) #unneeded
+
+    cdef _TableRowPropagator propagator = create_row_propagator(fwdsim, layout_atom, dest_indices)
+    propagator.array_to_fill = array_to_fill
+    all_rows = np.arange(len(layout_atom.table), dtype=np.int64)
 
     if shared_mem_leader:
-        #Note: dm_mapfill_probs could have taken a resource_alloc to employ multiple cpus to do computation.
-        # Since array_fo_fill is assumed to be shared mem it would need to only update `array_to_fill` *if*
-        # it were the host leader.
-        dm_mapfill_probs(array_to_fill, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache,
-                         elabel_indices_per_circuit, final_indices_per_circuit, fwdsim.model.dim)
+        #Note: only the host leader updates `array_to_fill`, as it is assumed to be shared mem.  The leader
+        # can still use multiple (shared-memory) threads to do the computation.
+        num_threads = fwdsim.num_threads
+        thread_pool = _ThreadPoolExecutor(num_threads) if num_threads > 1 else None
+        propagator.propagate_concurrently(all_rows, thread_pool, num_threads)
+        if thread_pool is not None: thread_pool.shutdown()
 
-    free_rhocache(rho_cache)  #delete cache entries
 
+def mapfill_probs_atom_multi(fwdsim, array_to_fill, dest_indices, layout_atom, param_vectors, resource_alloc):
+    """ Fills row `k` of the 2D `array_to_fill` with the probabilities computed using `param_vectors[k]` """
+    shared_mem_leader = resource_alloc.is_host_leader if (resource_alloc is not None) else True
+    dest_indices = _slct.to_array(dest_indices)  # make sure this is an array and not a slice
 
-cdef dm_mapfill_probs(double[:] array_to_fill,
-                      vector[vector[INT]] c_layout_atom,
-                      vector[OpCRep*] c_opreps,
-                      vector[StateCRep*] c_rhoreps, vector[EffectCRep*] c_ereps,
-                      vector[StateCRep*]* prho_cache,
-                      vector[vector[INT]] elabel_indices_per_circuit,
-                      vector[vector[INT]] final_indices_per_circuit,
-                      INT dim):
+    # The C-reps of the model's operations are updated in place by `from_vector`, so the label lookups,
+    # C-reps and state cache of a single propagator are reused for all the parameter vectors.
+    cdef _TableRowPropagator propagator = create_row_propagator(fwdsim, layout_atom, dest_indices)
+    cdef np.ndarray[double, mode="c", ndim=1] probs = np.empty(array_to_fill.shape[1], 'd')
+    propagator.array_to_fill = probs
+    all_rows = np.arange(len(layout_atom.table), dtype=np.int64)
+
+    num_threads = fwdsim.num_threads
+    thread_pool = _ThreadPoolExecutor(num_threads) if (num_threads > 1 and shared_mem_leader) else None
+    for k, param_vec in enumerate(param_vectors):
+        fwdsim.model.from_vector(param_vec)
+        if shared_mem_leader:  # only the host leader updates `array_to_fill`, as it is assumed to be shared mem
+            propagator.propagate_concurrently(all_rows, thread_pool, num_threads)
+            array_to_fill[k, dest_indices] = probs[dest_indices]
+    if thread_pool is not None: thread_pool.shutdown()
+
+
+cdef void dm_mapfill_probs(double* array_to_fill,
+                           vector[vector[INT]]& c_layout_atom, INT* rows, INT num_rows,
+                           vector[OpCRep*]& c_opreps,
+                           vector[StateCRep*]& c_rhoreps, vector[EffectCRep*]& c_ereps,
+                           vector[StateCRep*]* prho_cache,
+                           vector[vector[INT]]& elabel_indices_per_circuit,
+                           vector[vector[INT]]& final_indices_per_circuit,
+                           StateCRep** pprop2, StateCRep** pshelved) nogil:
 
     #Note: we need to take in rho_cache as a pointer b/c we may alter the values its
     # elements point to (instead of copying the states) - we just guarantee that in the end
     # all of the cache entries are filled with allocated (by 'new') states that the caller
-    # can deallocate at will.
-    cdef INT k,l,i,istart, icache, iFirstOp, precomp_id
-    cdef double p
+    # can deallocate at will.  The same holds for the two scratch states, `*pprop2` and `*pshelved`.
+    # Rows only read the cache entries written by earlier rows and each writes its own entry, so
+    # disjoint sets of rows that don't depend on one another can be computed concurrently.
+    cdef INT k,l,i,j,istart, icache, iFirstOp, precomp_id
     cdef StateCRep *init_state
     cdef StateCRep *prop1
     cdef StateCRep *tprop
     cdef StateCRep *final_state
-    cdef StateCRep *prop2 = new StateCRep(dim)
-    cdef StateCRep *shelved = new StateCRep(dim)
+    cdef StateCRep *prop2 = pprop2[0]
+    cdef StateCRep *shelved = pshelved[0]
     cdef StateCRep *precomp_state
-
-    cdef vector[INT] final_indices
-    cdef vector[INT] elabel_indices
+    cdef vector[INT]* intarray
+    cdef vector[INT]* final_indices
+    cdef vector[INT]* elabel_indices
 
     #Invariants required for proper memory management:
     # - upon loop entry, prop2 is allocated and prop1 is not (it doesn't "own" any memory)
     # - all rho_cache entries have been allocated via "new"
-    #REMOVE print("MAPFILL PROBS begin cfn")
-    for k in range(<INT>c_layout_atom.size()):
-        t0 = pytime.time() # DEBUG
-        intarray = c_layout_atom[k]
-        i = intarray[0]
-        istart = intarray[1]
-        icache = intarray[2]
-
-        #REMOVE print_mem_usage("mapfill_probs_block: BEGIN %d of %d: sz=%d" % (k, c_layout_atom.size(), intarray.size()))
+    for k in range(num_rows):
+        intarray = &c_layout_atom[rows[k]]
+        i = deref(intarray)[0]
+        istart = deref(intarray)[1]
+        icache = deref(intarray)[2]
 
         if istart == -1:
-            init_state = c_rhoreps[intarray[3]]
+            init_state = c_rhoreps[deref(intarray)[3]]
             iFirstOp = 4
         else:
             init_state = deref(prho_cache)[istart]
             iFirstOp = 3
 
-        #DEBUG
-        #print "LOOP i=",i," istart=",istart," icache=",icache," remcnt=",(intarray.size()-3)
-        #print [ init_state._dataptr[t] for t in range(4) ]
-
         #Propagate state rep
         # prop2 should already be alloc'd; need to "allocate" prop1 - either take from cache or from "shelf"
         prop1 = shelved if icache == -1 else deref(prho_cache)[icache]
         prop1.copy_from(init_state) # copy init_state -> prop1
-        #print " prop1:";  print [ prop1._dataptr[t] for t in range(4) ]
-        #t1 = pytime.time() # DEBUG
         for l in range(iFirstOp,<INT>intarray.size()): #during loop, both prop1 & prop2 are alloc'd
-            #print "begin acton %d: %.2fs since last, %.2fs elapsed" % (l-2,pytime.time()-t1,pytime.time()-t0) # DEBUG
-            #t1 = pytime.time() #DEBUG
-
-            c_opreps[intarray[l]].acton(prop1,prop2)
-            #REMOVE print(" -> after ", intarray[l], " mem bytes = ",process.memory_info().rss)
-
-            #print " post-act prop2:"; print [ prop2._dataptr[t] for t in range(4) ]
-            #print("Acton %d (oprep index %d): %.3fs" % (l, intarray[l], pytime.time() - t1))
+            c_opreps[deref(intarray)[l]].acton(prop1,prop2)
             tprop = prop1; prop1 = prop2; prop2 = tprop # swap prop1 <-> prop2
         final_state = prop1 # output = prop1 (after swap from loop above)
         # Note: prop2 is the other alloc'd state and this maintains invariant
-        #print " final:"; print [ final_state._dataptr[t] for t in range(4) ]
 
-        #print "begin prob comps: %.2fs since last, %.2fs elapsed" % (pytime.time()-t1, pytime.time()-t0) # DEBUG
-        final_indices = final_indices_per_circuit[i]
-        elabel_indices = elabel_indices_per_circuit[i]
-        #print("Op actons done - computing %d probs" % elabel_indices.size());t1 = pytime.time() # DEBUG
+        final_indices = &final_indices_per_circuit[i]
+        elabel_indices = &elabel_indices_per_circuit[i]
 
         precomp_state = prop2  # used as cache/scratch space
         precomp_id = 0  # this should be a number that is *never* a Python id()
         for j in range(<INT>elabel_indices.size()):
-            #print("Erep prob %d of %d: elapsed = %.2fs" % (j, elabel_indices.size(), pytime.time() - t1))
             #OLD: array_to_fill[ final_indices[j] ] = c_ereps[elabel_indices[j]].probability(final_state) #outcome probability
-            array_to_fill[ final_indices[j] ] = c_ereps[elabel_indices[j]].probability_using_cache(final_state, precomp_state, precomp_id) #outcome probability
+            array_to_fill[deref(final_indices)[j]] = c_ereps[deref(elabel_indices)[j]].probability_using_cache(
+                final_state, precomp_state, precomp_id) #outcome probability
 
         if icache != -1:
             deref(prho_cache)[icache] = final_state # store this state in the cache
         else: # our 2nd state was pulled from the shelf before; return it
             shelved = final_state
             final_state = NULL
-        #print "%d of %d (i=%d,istart=%d,remlen=%d): %.1fs" % (k, c_layout_atom.size(), i, istart,
-        #                                                      intarray.size()-3, pytime.time()-t0)
-        #print("mapfill_probs_block: %d of %d: %.1fs" % (k, c_layout_atom.size(), pytime.time()-t0))
 
-    #delete our temp states
-    del prop2
-    del shelved
+    pprop2[0] = prop2
+    pshelved[0] = shelved
 
 
 def mapfill_dprobs_atom(fwdsim,
@@ -315,30 +399,11 @@ def mapfill_dprobs_atom(fwdsim,
     param_indices = _slct.to_array(param_indices)
     dest_param_indices = _slct.to_array(dest_param_indices)
 
-    #Get (extension-type) representation objects
-    # NOTE: the circuit_layer_operator(lbl) functions cache the returned operation
-    # inside fwdsim.model's opcache.  This speeds up future calls, but
-    # more importantly causes fwdsim.model.from_vector to be aware of these operations and to
-    # re-initialize them with updated parameter vectors as is necessary for the finite difference loop.
-    rho_lookup = { lbl:i for i,lbl in enumerate(layout_atom.rho_labels) } # rho labels -> ints for faster lookup
-    rhoreps = { i: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl,i in rho_lookup.items() }
-    operation_lookup = { lbl:i for i,lbl in enumerate(layout_atom.op_labels) } # operation labels -> ints for faster lookup
-    operationreps = { i:fwdsim.model._circuit_layer_operator(lbl, 'op')._rep for lbl,i in operation_lookup.items() }
-    ereps = [fwdsim.model._circuit_layer_operator(elbl, 'povm')._rep for elbl in layout_atom.full_effect_labels]  # cache these in future
-
-    # convert to C-mode:  evaltree, operation_lookup, operationreps
-    cdef vector[vector[INT]] c_layout_atom = convert_maplayout(layout_atom, operation_lookup, rho_lookup)
-    cdef vector[StateCRep*] c_rhos = convert_rhoreps(rhoreps)
-    cdef vector[EffectCRep*] c_ereps = convert_ereps(ereps)
-    cdef vector[OpCRep*] c_opreps = convert_opreps(operationreps)
-
-    # create rho_cache = vector of StateCReps
-    #print "DB: creating rho_cache of size %d * %g GB => %g GB" % \
-    #   (layout_atom.cache_size, 8.0 * fwdsim.model.dim / 1024.0**3, layout_atom.cache_size * 8.0 * fwdsim.model.dim / 1024.0**3)
-    cdef vector[StateCRep*] rho_cache = create_rhocache(layout_atom.cache_size, fwdsim.model.dim)
-
-    cdef vector[vector[INT]] elabel_indices_per_circuit = convert_dict_of_intlists(layout_atom.elbl_indices_by_expcircuit)
-    cdef vector[vector[INT]] final_indices_per_circuit = convert_dict_of_intlists(layout_atom.elindices_by_expcircuit)
+    # NOTE: creating the propagator calls the circuit_layer_operator(lbl) functions, which cache the returned
+    # operations inside fwdsim.model's opcache.  This causes fwdsim.model.from_vector to be aware of these
+    # operations and to re-initialize them with updated parameter vectors as is necessary for the finite
+    # difference loop.
+    cdef _TableRowPropagator propagator = create_row_propagator(fwdsim, layout_atom, None)
 
     orig_vec = fwdsim.model.to_vector().copy()
     fwdsim.model.from_vector(orig_vec, close=False)  # ensure we call with close=False first
@@ -346,11 +411,13 @@ def mapfill_dprobs_atom(fwdsim,
     nEls = layout_atom.num_elements
     probs = np.empty(nEls, 'd') #must be contiguous!
     probs2 = np.empty(nEls, 'd') #must be contiguous!
+    num_threads = fwdsim.num_threads
+    thread_pool = _ThreadPoolExecutor(num_threads) if num_threads > 1 else None
 
     #if resource_alloc.comm_rank == 0:
     #    print("MAPFILL DPROBS ATOM 1"); t=pytime.time(); t0=pytime.time()
-    dm_mapfill_probs(probs, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache,
-                     elabel_indices_per_circuit, final_indices_per_circuit, fwdsim.model.dim)
+    propagator.array_to_fill = probs
+    propagator.propagate_concurrently(np.arange(len(layout_atom.table), dtype=np.int64), thread_pool, num_threads)
     #if resource_alloc.comm_rank == 0:
     #    print("MAPFILL DPROBS ATOM 2 %.3fs" % (pytime.time() - t)); t=pytime.time()
 
@@ -360,27 +427,60 @@ def mapfill_dprobs_atom(fwdsim,
     # final index within array_to_fill
     iParamToFinal = {i: dest_index for i, dest_index in zip(param_indices, dest_param_indices)}
 
+    # Only the table rows that depend on a parameter are recomputed when it's perturbed.  These rows start
+    # from either the (unperturbed) states in rho_cache or perturbed states computed earlier in the same
+    # pass, which are kept in `pert_cache_states` (allocated as needed).
+    rows_by_param = layout_atom.table_rows_by_param(fwdsim.model)
+    row_elindices = [layout_atom.elindices_by_expcircuit[iDest] for iDest, _, _, _ in layout_atom.table.contents]
+    dest_indices = _slct.to_array(dest_indices)
+    cdef INT k, c, icache
+    cdef vector[StateCRep*] pert_cache = vector[StateCRep_ptr](propagator.rho_cache.size())
+    cdef vector[StateCRep*] pert_cache_states = vector[StateCRep_ptr](propagator.rho_cache.size(), NULL)
+    propagator.array_to_fill = probs2
+    propagator.prho_cache = &pert_cache
+
     for i in range(fwdsim.model.num_params):
         #print("dprobs cache %d of %d" % (i,self.Np))
         if i in iParamToFinal:
             #if resource_alloc.comm_rank == 0:
             #    print("MAPFILL DPROBS ATOM 3 (i=%d) %.3fs elapssed=%.1fs" % (i, pytime.time() - t, pytime.time() - t0)); t=pytime.time()
             iFinal = iParamToFinal[i]
+            rows = rows_by_param.get(i, [])
+            if shared_mem_leader:  # don't fill assumed-shared array-to_fill on non-mem-leaders
+                array_to_fill[dest_indices, iFinal] = 0.0
+            if len(rows) == 0: continue  # no probabilities depend on this parameter
+
             vec = orig_vec.copy(); vec[i] += eps
             fwdsim.model.from_vector(vec, close=True)
-            #Note: dm_mapfill_probs could have taken a resource_alloc to employ multiple cpus to do computation.
+
+            for c in range(<INT>pert_cache.size()):
+                pert_cache[c] = propagator.rho_cache[c]
+            for k in rows:
+                icache = propagator.c_layout_atom[k][2]
+                if icache != -1:  # this row's (perturbed) state can't be stored in rho_cache
+                    if pert_cache_states[icache] == NULL:
+                        pert_cache_states[icache] = new StateCRep(fwdsim.model.dim)
+                    pert_cache[icache] = pert_cache_states[icache]
+
             # If probs2 were shared mem (seems not benefit to this?) it would need to only update `probs2` *if*
             # it were the host leader.
             if shared_mem_leader:  # don't fill assumed-shared array-to_fill on non-mem-leaders
-                dm_mapfill_probs(probs2, c_layout_atom, c_opreps, c_rhos, c_ereps, &rho_cache,
-                                 elabel_indices_per_circuit, final_indices_per_circuit, fwdsim.model.dim)
-                #_fas(array_to_fill, [dest_indices, iFinal], (probs2 - probs) / eps)  # I don't think this is needed
-                array_to_fill[dest_indices, iFinal] = (probs2 - probs) / eps
+                propagator.propagate_concurrently(np.array(rows, np.int64), thread_pool, num_threads)
+                els = np.concatenate([row_elindices[k] for k in rows])
+                array_to_fill[dest_indices[els], iFinal] = (probs2[els] - probs[els]) / eps
+
+            # propagating rows may exchange the states they write, so reclaim them
+            for k in rows:
+                icache = propagator.c_layout_atom[k][2]
+                if icache != -1: pert_cache_states[icache] = pert_cache[icache]
 
     #if resource_alloc.comm_rank == 0:
     #    print("MAPFILL DPROBS ATOM 4 elapsed=%.1fs" % (pytime.time() - t0))
+    if thread_pool is not None: thread_pool.shutdown()
+    propagator.prho_cache = &propagator.rho_cache
     fwdsim.model.from_vector(orig_vec, close=True)
-    free_rhocache(rho_cache)  #delete cache entries
+    for c in range(<INT>pert_cache_states.size()):
+        if pert_cache_states[c] != NULL: del pert_cache_states[c]
 
 
 cdef double TDchi2_obj_fn(double p, double f, double n_i, double n, double omitted_p, double min_prob_clip_for_weighting, double extra):
@@ -39,6 +39,25 @@ def mapfill_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, resource_a
     #Create rhoCache
     rho_cache = [None] * cacheSize  # so we can store (s,p) tuples in cache
 
+    _mapfill_probs_rows(fwdsim, mx_to_fill, dest_indices, layout_atom, layout_atom.table.contents, rho_cache,
+                        shared_mem_leader)
+    return rho_cache
+
+
+def mapfill_probs_atom_multi(fwdsim, mx_to_fill, dest_indices, layout_atom, param_vectors, resource_alloc):
+    """ Fills row `k` of the 2D `mx_to_fill` with the probabilities computed using `param_vectors[k]` """
+    shared_mem_leader = resource_alloc.is_host_leader if (resource_alloc is not None) else True
+    dest_indices = _slct.to_array(dest_indices)  # make sure this is an array and not a slice
+    rho_cache = [None] * layout_atom.cache_size  # allocated once and reused for all the parameter vectors
+
+    for k, param_vec in enumerate(param_vectors):
+        fwdsim.model.from_vector(param_vec)
+        _mapfill_probs_rows(fwdsim, mx_to_fill[k], dest_indices, layout_atom, layout_atom.table.contents, rho_cache,
+                            shared_mem_leader)
+
+
+def _mapfill_probs_rows(fwdsim, mx_to_fill, dest_indices, layout_atom, table_rows, rho_cache, shared_mem_leader):
+    """ Computes the probabilities of the given prefix-table rows, storing their states in `rho_cache` """
     #Get operationreps and ereps now so we don't make unnecessary ._rep references
     rhoreps = {rholbl: fwdsim.model._circuit_layer_operator(rholbl, 'prep')._rep for rholbl in layout_atom.rho_labels}
     operationreps = {gl: fwdsim.model._circuit_layer_operator(gl, 'op')._rep for gl in layout_atom.op_labels}
@@ -46,7 +65,7 @@ def mapfill_probs_atom(fwdsim, mx_to_fill, dest_indices, layout_atom, resource_a
                   for i, Elbl in enumerate(layout_atom.full_effect_labels)}  # cache these in future
 
     #TODO: if layout_atom is split, distribute somehow among processors(?) instead of punting for all but rank-0 above
-    for iDest, iStart, remainder, iCache in layout_atom.table.contents:
+    for iDest, iStart, remainder, iCache in table_rows:
         remainder = remainder.circuit_without_povm.layertup
 
         if iStart is None:  # then first element of remainder is a state prep label
@@ -94,16 +113,29 @@ def mapfill_dprobs_atom(fwdsim, mx_to_fill, dest_indices, dest_param_indices, la
     nEls = layout_atom.num_elements
     probs, shm = _smt.create_shared_ndarray(resource_alloc, (nEls,), 'd', memory_tracker=None)
     probs2, shm2 = _smt.create_shared_ndarray(resource_alloc, (nEls,), 'd', memory_tracker=None)
-    mapfill_probs_atom(fwdsim, probs, slice(0, nEls), layout_atom, resource_alloc)  # probs != shared
+    rho_cache = mapfill_probs_atom(fwdsim, probs, slice(0, nEls), layout_atom, resource_alloc)  # probs != shared
+    shared_mem_leader = resource_alloc.is_host_leader if (resource_alloc is not None) else True
+
+    # Only the table rows that depend on a parameter are recomputed when it's perturbed,
+    # starting from the unperturbed cached states of the rows that don't.
+    rows_by_param = layout_atom.table_rows_by_param(fwdsim.model)
+    dest_indices = _slct.to_array(dest_indices)
 
     for i in range(fwdsim.model.num_params):
         #print("dprobs cache %d of %d" % (i,self.Np))
         if i in iParamToFinal:
             iFinal = iParamToFinal[i]
+            rows = rows_by_param.get(i, [])
+            _fas(mx_to_fill, [dest_indices, iFinal], _np.zeros(len(dest_indices), 'd'))
+            if len(rows) == 0: continue  # no probabilities depend on this parameter
+
             vec = orig_vec.copy(); vec[i] += eps
             fwdsim.model.from_vector(vec, close=True)
-            mapfill_probs_atom(fwdsim, probs2, slice(0, nEls), layout_atom, resource_alloc)
-            _fas(mx_to_fill, [dest_indices, iFinal], (probs2 - probs) / eps)
+            table_rows = [layout_atom.table.contents[k] for k in rows]
+            _mapfill_probs_rows(fwdsim, probs2, _np.arange(nEls), layout_atom, table_rows, rho_cache[:],
+                                shared_mem_leader)
+            els = _np.concatenate([layout_atom.elindices_by_expcircuit[iDest] for iDest, _, _, _ in table_rows])
+            _fas(mx_to_fill, [dest_indices[els], iFinal], (probs2[els] - probs[els]) / eps)
     fwdsim.model.from_vector(orig_vec, close=True)
     _smt.cleanup_shared_ndarray(shm)
     _smt.cleanup_shared_ndarray(shm2)
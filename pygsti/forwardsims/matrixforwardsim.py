@@ -37,6 +37,24 @@ _dummy_profiler = _DummyProfiler()
 _PSMALL = 1e-100
 _DSMALL = 1e-100
 _HSMALL = 1e-100
+_PSMALL_SINGLE = 1e-20  # products are rescaled well before single-precision values underflow (~1e-38)
+
+_MAX_WAVE_BLOCK_ELEMENTS = 2**22  # max. number of elements in the stacked operands of a batched product
+_MAX_BATCH_CACHE_ELEMENTS = 2**20  # max. elements in a product cache over many parameter vectors (kept in-cache)
+
+
+def _wave_blocks(waves, item_size):
+    """
+    Iterate over blocks of the waves of a levelized :class:`EvalTree`.
+
+    Each wave is split into blocks whose stacked (per-item) operands hold
+    at most about `_MAX_WAVE_BLOCK_ELEMENTS` elements, where each item holds
+    `item_size` elements, to bound the memory used by batched products.
+    """
+    block_len = max(_MAX_WAVE_BLOCK_ELEMENTS // max(item_size, 1), 1)
+    for iDest, iLeft, iRight in waves:
+        for start in range(0, len(iDest), block_len):
+            yield iDest[start:start + block_len], iLeft[start:start + block_len], iRight[start:start + block_len]
 
 
 class SimpleMatrixForwardSimulator(_ForwardSimulator):
@@ -646,6 +664,17 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         this can be a 0-, 1- or 2-tuple of integers or `None` values.  A block size of `None`
         means that there should be no division into blocks, and that each block processor
         computes all of its parameter indices at once.
+
+    layout_cache_dir : str, optional
+        A directory in which layouts created by :method:`create_layout` store their atoms,
+        so that later layouts for the same circuits, model structure and data set (e.g. in
+        repeated fits of the same data) load rather than recreate them.  See :class:`LayoutCache`.
+
+    precision : {"double", "single"}
+        The floating point precision of the product, product-derivative and product-Hessian caches.
+        `"single"` halves their memory and speeds up their computation at the cost of accuracy, which
+        is useful for exploratory fits and early iterations of GST.  Computed probabilities and their
+        derivatives and Hessians are always returned as double-precision values.
     """
 
     @classmethod
@@ -666,13 +695,22 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         return super()._array_types_for_method(method_name)
 
     def __init__(self, model=None, distribute_by_timestamp=False, num_atoms=None, processor_grid=None,
-                 param_blk_sizes=None):
-        super().__init__(model, num_atoms, processor_grid, param_blk_sizes)
+                 param_blk_sizes=None, layout_cache_dir=None, precision="double"):
+        super().__init__(model, num_atoms, processor_grid, param_blk_sizes, layout_cache_dir)
         self._mode = "distribute_by_timestamp" if distribute_by_timestamp else "time_independent"
+        if precision not in ("double", "single"):
+            raise ValueError("Invalid `precision`: %s (must be 'double' or 'single')" % str(precision))
+        self.precision = precision
+
+    @property
+    def _cache_dtype(self):
+        """ The numpy dtype of the product, product-derivative and product-Hessian caches """
+        return 'f' if self.precision == "single" else 'd'
 
     def _to_nice_serialization(self):
         state = super()._to_nice_serialization()
         state.update({'mode': self._mode,
+                      'precision': self.precision,
                       # (don't serialize parent model or processor distribution info)
                       })
         return state
@@ -680,7 +718,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
     @classmethod
     def _from_nice_serialization(cls, state):
         #Note: resets processor-distribution information
-        return cls(None, state['mode'] == "distribute_by_timestamp")
+        return cls(None, state['mode'] == "distribute_by_timestamp", precision=state.get('precision', "double"))
 
     def copy(self):
         """
@@ -690,16 +728,21 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         -------
         MatrixForwardSimulator
         """
-        return MatrixForwardSimulator(self.model)
+        return MatrixForwardSimulator(self.model, layout_cache_dir=self.layout_cache_dir, precision=self.precision)
 
-    def _compute_product_cache(self, layout_atom_tree, resource_alloc):
+    def _compute_product_cache(self, layout_atom_tree, resource_alloc, layer_mxs=None, batch_size=None):
         """
         Computes an array of operation sequence products (process matrices).
 
+        If `batch_size` is not None, then `layer_mxs` must be a dictionary mapping each
+        layer label to an array of `batch_size` stacked process matrices, and the returned
+        caches have an additional (second) axis that indexes these.
+
         Note: will *not* parallelize computation:  parallelization should be
         done at a higher level.
         """
         dim = self.model.evotype.minimal_dim(self.model.state_space)
+        batch_shape = () if (batch_size is None) else (batch_size,)
 
         #Note: resource_alloc gives procs that could work together to perform
         # computation, e.g. paralllel dot products but NOT to just partition
@@ -708,37 +751,47 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
 
         eval_tree = layout_atom_tree
         cacheSize = len(eval_tree)
-        prodCache = _np.zeros((cacheSize, dim, dim), 'd')
-        scaleCache = _np.zeros(cacheSize, 'd')
+        prodCache = _np.zeros((cacheSize,) + batch_shape + (dim, dim), self._cache_dtype)
+        scaleCache = _np.zeros((cacheSize,) + batch_shape, 'd')
+        leaves, waves = eval_tree.levelize()
+        psmall = _PSMALL_SINGLE if (self.precision == "single") else _PSMALL
 
-        for iDest, iRight, iLeft in eval_tree:
+        for iDest, iRight, iLeft in leaves:
 
             #Special case of an "initial operation" that can be filled directly
-            if iRight is None:  # then iLeft gives operation:
-                opLabel = iLeft
-                if opLabel is None:
-                    prodCache[iDest] = _np.identity(dim)
-                    # Note: scaleCache[i] = 0.0 from initialization
-                else:
-                    gate = self.model.circuit_layer_operator(opLabel, 'op').to_dense(on_space='minimal')
-                    nG = max(_nla.norm(gate), 1.0)
-                    prodCache[iDest] = gate / nG
-                    scaleCache[iDest] = _np.log(nG)
-                continue
+            opLabel = iLeft  # iRight is None, so iLeft gives operation
+            if opLabel is None:
+                prodCache[iDest] = _np.identity(dim)
+                # Note: scaleCache[i] = 0.0 from initialization
+            else:
+                gate = self.model.circuit_layer_operator(opLabel, 'op').to_dense(on_space='minimal') \
+                    if (batch_size is None) else layer_mxs[opLabel]
+                nG = _np.maximum(_nla.norm(gate, axis=(-2, -1)), 1.0)
+                prodCache[iDest] = gate / nG[..., None, None]
+                scaleCache[iDest] = _np.log(nG)
+
+        # Each wave's products only depend on those of earlier waves, so compute them (in blocks) together
+        for iDest, iRight, iLeft in _wave_blocks(waves, dim * dim * (batch_size or 1)):
 
             # combine iLeft + iRight => iDest
             # LEXICOGRAPHICAL VS MATRIX ORDER Note: we reverse iLeft <=> iRight from eval_tree because
             # (iRight,iLeft,iFinal) = tup implies circuit[i] = circuit[iLeft] + circuit[iRight], but we want:
             # since then matrixOf(circuit[i]) = matrixOf(circuit[iLeft]) * matrixOf(circuit[iRight])
             L, R = prodCache[iLeft], prodCache[iRight]
-            prodCache[iDest] = _np.dot(L, R)
-            scaleCache[iDest] = scaleCache[iLeft] + scaleCache[iRight]
+            prods = _np.matmul(L, R)
+            scales = scaleCache[iLeft] + scaleCache[iRight]
+
+            small = (prods.max(axis=(-2, -1)) < psmall) & (prods.min(axis=(-2, -1)) > -psmall)
+            if small.any():
+                nL = _np.maximum(_np.maximum(_nla.norm(L[small], axis=(1, 2)), _np.exp(-scaleCache[iLeft][small])),
+                                 1e-300)
+                nR = _np.maximum(_np.maximum(_nla.norm(R[small], axis=(1, 2)), _np.exp(-scaleCache[iRight][small])),
+                                 1e-300)
+                sL, sR = L[small] / nL[:, None, None], R[small] / nR[:, None, None]
+                prods[small] = _np.matmul(sL, sR); scales[small] += _np.log(nL) + _np.log(nR)
 
-            if prodCache[iDest].max() < _PSMALL and prodCache[iDest].min() > -_PSMALL:
-                nL, nR = max(_nla.norm(L), _np.exp(-scaleCache[iLeft]),
-                             1e-300), max(_nla.norm(R), _np.exp(-scaleCache[iRight]), 1e-300)
-                sL, sR = L / nL, R / nR
-                prodCache[iDest] = _np.dot(sL, sR); scaleCache[iDest] += _np.log(nL) + _np.log(nR)
+            prodCache[iDest] = prods
+            scaleCache[iDest] = scales
 
         nanOrInfCacheIndices = (~_np.isfinite(prodCache)).nonzero()[0]  # may be duplicates (a list, not a set)
         # since all scaled gates start with norm <= 1, products should all have norm <= 1
@@ -808,22 +861,23 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         ## ------------------------------------------------------------------
 
         tSerialStart = _time.time()
-        dProdCache = _np.zeros((cacheSize,) + deriv_shape)
+        dProdCache = _np.zeros((cacheSize,) + deriv_shape, self._cache_dtype)
         wrtIndices = _slct.indices(wrt_slice) if (wrt_slice is not None) else None
 
-        for iDest, iRight, iLeft in eval_tree:
+        leaves, waves = eval_tree.levelize()
+
+        for iDest, iRight, iLeft in leaves:
 
             #Special case of an "initial operation" that can be filled directly
-            if iRight is None:  # then iLeft gives operation:
-                opLabel = iLeft
-                if opLabel is None:
-                    dProdCache[iDest] = _np.zeros(deriv_shape)
-                else:
-                    #doperation = self.dproduct( (opLabel,) , wrt_filter=wrtIndices)
-                    doperation = self._doperation(opLabel, wrt_filter=wrtIndices)
-                    dProdCache[iDest] = doperation / _np.exp(scale_cache[iDest])
-                continue
+            opLabel = iLeft  # iRight is None, so iLeft gives operation
+            if opLabel is None:
+                dProdCache[iDest] = _np.zeros(deriv_shape)
+            else:
+                #doperation = self.dproduct( (opLabel,) , wrt_filter=wrtIndices)
+                doperation = self._doperation(opLabel, wrt_filter=wrtIndices)
+                dProdCache[iDest] = doperation / _np.exp(scale_cache[iDest])
 
+        for iDest, iRight, iLeft in _wave_blocks(waves, nDerivCols * dim * dim):
             tm = _time.time()
 
             # combine iLeft + iRight => i
@@ -832,19 +886,22 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
             # since then matrixOf(circuit[i]) = matrixOf(circuit[iLeft]) * matrixOf(circuit[iRight])
             L, R = prod_cache[iLeft], prod_cache[iRight]
             dL, dR = dProdCache[iLeft], dProdCache[iRight]
-            dProdCache[iDest] = _np.dot(dL, R) + \
-                _np.swapaxes(_np.dot(L, dR), 0, 1)  # dot(dS, T) + dot(S, dT)
+            dProds = _np.matmul(dL, R[:, None]) + _np.matmul(L[:, None], dR)  # dot(dS, T) + dot(S, dT)
             profiler.add_time("compute_dproduct_cache: dots", tm)
-            profiler.add_count("compute_dproduct_cache: dots")
+            profiler.add_count("compute_dproduct_cache: dots", len(iDest))
+
+            scales = scale_cache[iDest] - (scale_cache[iLeft] + scale_cache[iRight])
+            rescaled = abs(scales) > 1e-8  # _np.isclose(scale,0) is SLOW!
+            if rescaled.any():
+                dProds[rescaled] /= _np.exp(scales[rescaled])[:, None, None, None]
 
-            scale = scale_cache[iDest] - (scale_cache[iLeft] + scale_cache[iRight])
-            if abs(scale) > 1e-8:  # _np.isclose(scale,0) is SLOW!
-                dProdCache[iDest] /= _np.exp(scale)
-                if dProdCache[iDest].max() < _DSMALL and dProdCache[iDest].min() > -_DSMALL:
+            if nDerivCols > 0:
+                small = (dProds.max(axis=(1, 2, 3)) < _DSMALL) & (dProds.min(axis=(1, 2, 3)) > -_DSMALL)
+                if (small & rescaled).any():
                     _warnings.warn("Scaled dProd small in order to keep prod managable.")
-            elif (_np.count_nonzero(dProdCache[iDest]) and dProdCache[iDest].max() < _DSMALL
-                  and dProdCache[iDest].min() > -_DSMALL):
-                _warnings.warn("Would have scaled dProd but now will not alter scale_cache.")
+                if (small & ~rescaled & dProds.any(axis=(1, 2, 3))).any():
+                    _warnings.warn("Would have scaled dProd but now will not alter scale_cache.")
+            dProdCache[iDest] = dProds
 
         #profiler.print_mem("DEBUGMEM: POINT2"); profiler.comm.barrier()
 
@@ -954,27 +1011,29 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         #
         ## ------------------------------------------------------------------
 
-        hProdCache = _np.zeros((cacheSize,) + hessn_shape)
+        hProdCache = _np.zeros((cacheSize,) + hessn_shape, self._cache_dtype)
         wrtIndices1 = _slct.indices(wrt_slice1) if (wrt_slice1 is not None) else None
         wrtIndices2 = _slct.indices(wrt_slice2) if (wrt_slice2 is not None) else None
 
-        for iDest, iRight, iLeft in eval_tree:
+        leaves, waves = eval_tree.levelize()
+
+        for iDest, iRight, iLeft in leaves:
 
             #Special case of an "initial operation" that can be filled directly
-            if iRight is None:  # then iLeft gives operation:
-                opLabel = iLeft
-                if opLabel is None:
-                    hProdCache[iDest] = _np.zeros(hessn_shape)
-                elif not self.model.circuit_layer_operator(opLabel, 'op').has_nonzero_hessian():
-                    #all gate elements are at most linear in params, so
-                    # all hessians for single- or zero-circuits are zero.
-                    hProdCache[iDest] = _np.zeros(hessn_shape)
-                else:
-                    hoperation = self._hoperation(opLabel,
-                                                  wrt_filter1=wrtIndices1,
-                                                  wrt_filter2=wrtIndices2)
-                    hProdCache[iDest] = hoperation / _np.exp(scale_cache[iDest])
-                continue
+            opLabel = iLeft  # iRight is None, so iLeft gives operation
+            if opLabel is None:
+                hProdCache[iDest] = _np.zeros(hessn_shape)
+            elif not self.model.circuit_layer_operator(opLabel, 'op').has_nonzero_hessian():
+                #all gate elements are at most linear in params, so
+                # all hessians for single- or zero-circuits are zero.
+                hProdCache[iDest] = _np.zeros(hessn_shape)
+            else:
+                hoperation = self._hoperation(opLabel,
+                                              wrt_filter1=wrtIndices1,
+                                              wrt_filter2=wrtIndices2)
+                hProdCache[iDest] = hoperation / _np.exp(scale_cache[iDest])
+
+        for iDest, iRight, iLeft in _wave_blocks(waves, nDerivCols1 * nDerivCols2 * dim * dim):
 
             # combine iLeft + iRight => i
             # LEXICOGRAPHICAL VS MATRIX ORDER Note: we reverse iLeft <=> iRight from eval_tree because
@@ -984,27 +1043,31 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
             dL1, dR1 = d_prod_cache1[iLeft], d_prod_cache1[iRight]
             dL2, dR2 = d_prod_cache2[iLeft], d_prod_cache2[iRight]
             hL, hR = hProdCache[iLeft], hProdCache[iRight]
-            # Note: L, R = GxG ; dL,dR = vgs x GxG ; hL,hR = vgs x vgs x GxG
+            # Note: L, R = N x GxG ; dL,dR = N x vgs x GxG ; hL,hR = N x vgs x vgs x GxG
 
-            dLdRa = _np.swapaxes(_np.dot(dL1, dR2), 1, 2)
-            dLdRb = _np.swapaxes(_np.dot(dL2, dR1), 1, 2)
-            dLdR_sym = dLdRa + _np.swapaxes(dLdRb, 0, 1)
+            dLdRa = _np.matmul(dL1[:, :, None], dR2[:, None])  # [k,i,j] = dot(dL1[k,i], dR2[k,j])
+            dLdRb = _np.matmul(dL2[:, None], dR1[:, :, None])  # [k,i,j] = dot(dL2[k,j], dR1[k,i])
+            dLdR_sym = dLdRa + dLdRb
 
-            hProdCache[iDest] = _np.dot(hL, R) + dLdR_sym + _np.transpose(_np.dot(L, hR), (1, 2, 0, 3))
+            hProds = _np.matmul(hL, R[:, None, None]) + dLdR_sym + _np.matmul(L[:, None, None], hR)
 
-            scale = scale_cache[iDest] - (scale_cache[iLeft] + scale_cache[iRight])
-            if abs(scale) > 1e-8:  # _np.isclose(scale,0) is SLOW!
-                hProdCache[iDest] /= _np.exp(scale)
-                if hProdCache[iDest].max() < _HSMALL and hProdCache[iDest].min() > -_HSMALL:
+            scales = scale_cache[iDest] - (scale_cache[iLeft] + scale_cache[iRight])
+            rescaled = abs(scales) > 1e-8  # _np.isclose(scale,0) is SLOW!
+            if rescaled.any():
+                hProds[rescaled] /= _np.exp(scales[rescaled])[:, None, None, None, None]
+
+            if nDerivCols1 > 0 and nDerivCols2 > 0:
+                small = (hProds.max(axis=(1, 2, 3, 4)) < _HSMALL) & (hProds.min(axis=(1, 2, 3, 4)) > -_HSMALL)
+                if (small & rescaled).any():
                     _warnings.warn("Scaled hProd small in order to keep prod managable.")
-            elif (_np.count_nonzero(hProdCache[iDest]) and hProdCache[iDest].max() < _HSMALL
-                  and hProdCache[iDest].min() > -_HSMALL):
-                _warnings.warn("hProd is small (oh well!).")
+                if (small & ~rescaled & hProds.any(axis=(1, 2, 3, 4))).any():
+                    _warnings.warn("hProd is small (oh well!).")
+            hProdCache[iDest] = hProds
 
         return hProdCache
 
     def create_layout(self, circuits, dataset=None, resource_alloc=None, array_types=('E',),
-                      derivative_dimension=None, verbosity=0):
+                      derivative_dimension=None, verbosity=0, base_layout=None):
         """
         Constructs an circuit-outcome-probability-array (COPA) layout for a list of circuits.
 
@@ -1034,6 +1097,10 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
             Determines how much output to send to stdout.  0 means no output, higher
             integers mean more output.
 
+        base_layout : MatrixCOPALayout, optional
+            A layout previously created by this simulator whose work should be reused
+            where possible.  See :method:`extend_layout`.
+
         Returns
         -------
         MatrixCOPALayout
@@ -1076,8 +1143,10 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         printer.log("   %d atoms, parameter block size limits %s" % (natoms, str(param_blk_sizes)))
         assert(_np.product((na,) + npp) <= nprocs), "Processor grid size exceeds available processors!"
 
+        if not isinstance(base_layout, _MatrixCOPALayout): base_layout = None
         layout = _MatrixCOPALayout(circuits, self.model, dataset, natoms,
-                                   na, npp, param_dimensions, param_blk_sizes, resource_alloc, verbosity)
+                                   na, npp, param_dimensions, param_blk_sizes, resource_alloc, verbosity,
+                                   base_layout, self.layout_cache_dir)
 
         if mem_limit is not None:
             loc_nparams1 = num_params / npp[0] if len(npp) > 0 else 0
@@ -1102,7 +1171,8 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
                                                   global_layout.num_circuits, max_local_circuits,
                                                   layout._param_dimensions, (loc_nparams1, loc_nparams2),
                                                   (blk1, blk2), max_atom_cachesize,
-                                                  self.model.evotype.minimal_dim(self.model.state_space))
+                                                  self.model.evotype.minimal_dim(self.model.state_space),
+                                                  cache_dtype=self._cache_dtype)
 
             #def approx_mem_estimate(natoms, np1, np2):
             #    approx_cachesize = (num_circuits / natoms) * 1.3  # inflate expected # circuits per atom => cache_size
@@ -1120,6 +1190,49 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
 
         return layout
 
+    def extend_layout(self, layout, circuits, dataset=None, resource_alloc=None, array_types=('E',),
+                      derivative_dimension=None, verbosity=0):
+        """
+        Constructs a COPA layout for `circuits`, reusing the work that created `layout`.
+
+        When both layouts have a single atom (the default when not using multiple
+        processors) and `circuits` begins with `layout`'s circuits, `layout`'s evaluation
+        tree is extended with only the new circuits (see :method:`EvalTree.create_extension`).  If
+        instead `circuits` only contains circuits of `layout`, the part of `layout`'s evaluation
+        tree needed for them is used (see :method:`EvalTree.create_subtree`).
+
+        Parameters
+        ----------
+        layout : MatrixCOPALayout
+            A layout previously created by this simulator.  It is not altered.
+
+        circuits : list
+            The circuits whose outcome probabilities should be included in the layout.
+
+        dataset : DataSet
+            The source of data counts that will be compared to the circuit outcome
+            probabilities.
+
+        resource_alloc : ResourceAllocation
+            A available resources and allocation information.
+
+        array_types : tuple, optional
+            A tuple of string-valued array types.  See :method:`ForwardSimulator.create_layout`.
+
+        derivative_dimension : int, optional
+            The parameter-space dimension used when taking derivatives.  See :method:`create_layout`.
+
+        verbosity : int or VerbosityPrinter
+            Determines how much output to send to stdout.  0 means no output, higher
+            integers mean more output.
+
+        Returns
+        -------
+        MatrixCOPALayout
+        """
+        return self.create_layout(circuits, dataset, resource_alloc, array_types, derivative_dimension, verbosity,
+                                  base_layout=layout)
+
     def _scale_exp(self, scale_exps):
         old_err = _np.seterr(over='ignore')
         scaleVals = _np.exp(scale_exps)  # may overflow, but OK if infs occur here
@@ -1132,6 +1245,8 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         rho = self.model.circuit_layer_operator(rholabel, 'prep').to_dense(on_space='minimal')[:, None]
         E = _np.conjugate(_np.transpose(self.model.circuit_layer_operator(
             elabel, 'povm').to_dense(on_space='minimal')[:, None]))
+        if self.precision == "single":  # so contracting with single-precision caches doesn't promote (copy) them
+            rho, E = rho.astype('f'), E.astype('f')
         return rho, E
 
     def _probs_from_rho_e(self, rho, e, gs, scale_vals):
@@ -1389,6 +1504,48 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
                  self._probs_from_rho_e(rho, E, Gs[tree_indices], scaleVals[tree_indices]))
         _np.seterr(**old_err)
 
+    def _bulk_fill_probs_multi_atom(self, array_to_fill, layout_atom, param_vectors, resource_alloc):
+        if self.model.evotype == "statevec": raise NotImplementedError("Unitary evolution not fully supported yet!")
+        if not resource_alloc.is_host_leader:
+            return  # Non-root host processors aren't used to compute the result on the root proc (see above)
+
+        # The layer matrices and SPAM vectors for (a batch of) the parameter vectors are stacked so
+        # that the products for all of them can be computed together by a batched product cache.
+        dim = self.model.evotype.minimal_dim(self.model.state_space)
+        leaves, _ = layout_atom.tree.levelize()
+        op_labels = set([opLabel for _, _, opLabel in leaves if opLabel is not None])
+        spam_tuples = list(layout_atom.indices_by_spamtuple.keys())
+        batch_len = max(_MAX_BATCH_CACHE_ELEMENTS // max(layout_atom.cache_size * dim**2, 1), 1)
+
+        old_err = _np.seterr(over='ignore')
+        for batch_start in range(0, len(param_vectors), batch_len):
+            batch_vectors = param_vectors[batch_start:batch_start + batch_len]
+            nBatch = len(batch_vectors)
+            resource_alloc.check_can_allocate_memory(layout_atom.cache_size * dim**2 * nBatch)  # prod cache
+
+            layer_mxs = {opLabel: _np.empty((nBatch, dim, dim), 'd') for opLabel in op_labels}
+            rhos = {spam_tuple: _np.empty((nBatch, dim), 'd') for spam_tuple in spam_tuples}
+            Es = {spam_tuple: _np.empty((nBatch, dim), 'd') for spam_tuple in spam_tuples}
+            for k, param_vec in enumerate(batch_vectors):
+                self.model.from_vector(param_vec)
+                for opLabel, mxs in layer_mxs.items():
+                    mxs[k] = self.model.circuit_layer_operator(opLabel, 'op').to_dense(on_space='minimal')
+                for spam_tuple in spam_tuples:
+                    rho, E = self._rho_e_from_spam_tuple(spam_tuple)
+                    rhos[spam_tuple][k] = rho[:, 0].real; Es[spam_tuple][k] = E[0, :].real
+
+            prodCache, scaleCache = self._compute_product_cache(layout_atom.tree, resource_alloc, layer_mxs, nBatch)
+            scaleVals = self._scale_exp(layout_atom.nonscratch_cache_view(scaleCache, axis=0))
+            Gs = layout_atom.nonscratch_cache_view(prodCache, axis=0)
+            # ( n_circuits, nBatch, dim, dim )
+
+            for spam_tuple, (element_indices, tree_indices) in layout_atom.indices_by_spamtuple.items():
+                rho, E = rhos[spam_tuple], Es[spam_tuple]
+                probs = _np.matmul(E[:, None, :], _np.matmul(Gs[tree_indices], rho[:, :, None]))[..., 0, 0] \
+                    * scaleVals[tree_indices]  # shape == (len(tree_indices), nBatch) ; may overflow but OK
+                _fas(array_to_fill, [slice(batch_start, batch_start + nBatch), element_indices], probs.T)
+        _np.seterr(**old_err)
+
     def _bulk_fill_dprobs_atom(self, array_to_fill, dest_param_slice, layout_atom, param_slice, resource_alloc):
         dim = self.model.evotype.minimal_dim(self.model.state_space)
         resource_alloc.check_can_allocate_memory(layout_atom.cache_size * dim * dim * _slct.length(param_slice))
@@ -10,6 +10,10 @@ Defines the WeakForwardSimulator calculator class
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import multiprocessing as _mp
+
+import numpy as _np
+
 from pygsti.forwardsims.forwardsim import ForwardSimulator as _ForwardSimulator
 from pygsti.baseobjs import outcomelabeldict as _ld
 
@@ -22,9 +26,14 @@ class WeakForwardSimulator(_ForwardSimulator):
     Due to their ability to only sample outcome probabilities, WeakForwardSimulators
     rely heavily on implementing the _compute_sparse_circuit_outcome_probabilities
     function of ForwardSimulators.
+
+    Shots are sampled in batches through :meth:`_compute_circuit_outcomes_for_shots`,
+    which derived classes may override with a vectorized implementation.  The
+    default implementation samples shots one at a time, optionally spreading them
+    across several processes.
     """
 
-    def __init__(self, shots, model=None):
+    def __init__(self, shots, model=None, num_processes=1):
         """
         Construct a new WeakForwardSimulator object.
 
@@ -34,10 +43,48 @@ class WeakForwardSimulator(_ForwardSimulator):
             Number of times to run each circuit to obtain an approximate probability
         model : Model
             Optional parent Model to be stored with the Simulator
+        num_processes : int, optional
+            The number of processes used to sample shots (by the default implementation
+            of :meth:`_compute_circuit_outcomes_for_shots`) and circuits (by :meth:`bulk_probs`).
+            Each process holds a copy of the model.  The processes are created once, when
+            first needed, and reused until :meth:`close` is called.
         """
         self.shots = shots
+        self.num_processes = num_processes
+        self._pool = None  # created on first use
         super().__init__(model)
 
+    def __getstate__(self):
+        state_dict = super().__getstate__()
+        state_dict['_pool'] = None  # process pools cannot be pickled
+        return state_dict
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the worker processes (if any) used to sample shots and circuits.
+
+        New processes are created if they are needed again.
+
+        Returns
+        -------
+        None
+        """
+        if getattr(self, '_pool', None) is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    def _starmap(self, fn, args_list):
+        """Run `fn` on each argument tuple of `args_list` in this simulator's pool of processes.
+
+        Returns the list of results.
+        """
+        if getattr(self, '_pool', None) is None:
+            self._pool = _mp.Pool(self.num_processes)
+        return self._pool.starmap(fn, args_list)
+
     def _compute_circuit_outcome_for_shot(self, spc_circuit, resource_alloc, time=None):
         """Compute outcome for a single shot of a circuit.
 
@@ -61,18 +108,65 @@ class WeakForwardSimulator(_ForwardSimulator):
         """
         raise NotImplementedError("WeakForwardSimulator-derived classes should implement this!")
 
-    def _compute_sparse_circuit_outcome_probabilities(self, circuit, resource_alloc, time=None):
-        probs = _ld.OutcomeLabelDict()
+    def _compute_circuit_outcomes_for_shots(self, spc_circuit, num_shots, resource_alloc, time=None):
+        """Compute the outcome counts of many shots of a circuit.
 
-        # TODO: For parallelization, block over this for loop
-        for _ in range(self.shots):
-            outcome = self._compute_circuit_outcome_for_shot(circuit, resource_alloc, time)
-            if outcome in probs:
-                probs[outcome] += 1.0 / self.shots
-            else:
-                probs[outcome] = 1.0 / self.shots
+        Derived classes can override this method to sample many shots at once (e.g. by
+        propagating a stack of trajectories with NumPy).  The default implementation calls
+        :meth:`_compute_circuit_outcome_for_shot` once per shot, splitting the shots among
+        `self.num_processes` processes.  Each of these processes reseeds NumPy's global
+        random number generator; derived classes that sample from other random states
+        should override this method.
 
-        return probs
+        Parameters
+        ----------
+        spc_circuit : SeparatePOVMCircuit
+            A tuple-like object of *simplified* gates (e.g. may include
+            instrument elements like 'Imyinst_0') generated by
+            Circuit.expand_instruments_and_separate_povm()
+
+        num_shots : int
+            The number of shots to sample.
+
+        resource_alloc: ResourceAlloc
+            Currently not used
+
+        time : float, optional
+            The *start* time at which `circuit` is evaluated.
+
+        Returns
+        -------
+        outcome_labels: tuple
+            The distinct outcome labels that were sampled.
+        counts: numpy.ndarray
+            An integer array of the same length as `outcome_labels` giving the number of
+            times each outcome was sampled.
+        """
+        if self.num_processes == 1 or num_shots < 2:
+            return self._sample_circuit_outcomes_for_shots(spc_circuit, num_shots, resource_alloc, time)
+
+        num_chunks = min(self.num_processes, num_shots)
+        chunk_sizes = [num_shots // num_chunks + (1 if i < num_shots % num_chunks else 0) for i in range(num_chunks)]
+        seeds = _np.random.randint(0, 2**31 - 1, size=num_chunks)
+        args_list = [(self.model, spc_circuit, nshots, time, seed) for nshots, seed in zip(chunk_sizes, seeds)]
+        results = self._starmap(_sample_circuit_outcomes_in_subprocess, args_list)
+        return _merge_outcome_counts(results)
+
+    def _sample_circuit_outcomes_for_shots(self, spc_circuit, num_shots, resource_alloc, time=None):
+        """Serially sample `num_shots` shots using :meth:`_compute_circuit_outcome_for_shot`.
+
+        Returns the same `(outcome_labels, counts)` tuple as :meth:`_compute_circuit_outcomes_for_shots`.
+        """
+        outcome_indices = {}
+        shot_indices = _np.empty(num_shots, _np.int64)
+        for i in range(num_shots):
+            outcome = self._compute_circuit_outcome_for_shot(spc_circuit, resource_alloc, time)
+            shot_indices[i] = outcome_indices.setdefault(outcome, len(outcome_indices))
+        return tuple(outcome_indices.keys()), _np.bincount(shot_indices, minlength=len(outcome_indices))
+
+    def _compute_sparse_circuit_outcome_probabilities(self, circuit, resource_alloc, time=None):
+        outcome_labels, counts = self._compute_circuit_outcomes_for_shots(circuit, self.shots, resource_alloc, time)
+        return _ld.OutcomeLabelDict([(outcome, cnt / self.shots) for outcome, cnt in zip(outcome_labels, counts)])
 
     # For WeakForwardSimulator, provide "bulk" interface based on the sparse interface
     # This will be highly inefficient for large numbers of qubits due to the dense storage of outcome probabilities
@@ -111,4 +205,55 @@ class WeakForwardSimulator(_ForwardSimulator):
             A dictionary such that `probs[circuit]` is an ordered dictionary of
             outcome probabilities whose keys are outcome labels.
         """
-        return {circ: self._compute_sparse_circuit_outcome_probabilities(circ, resource_alloc) for circ in circuits}
+        circuits = list(circuits)
+        if self.num_processes == 1 or len(circuits) < 2:
+            return {circ: self._compute_sparse_circuit_outcome_probabilities(circ, resource_alloc)
+                    for circ in circuits}
+
+        # Spread whole circuits (rather than the shots of each circuit) across the processes
+        num_chunks = min(self.num_processes, len(circuits))
+        circuit_chunks = [circuits[i::num_chunks] for i in range(num_chunks)]
+        seeds = _np.random.randint(0, 2**31 - 1, size=num_chunks)
+        results = self._starmap(_compute_sparse_probabilities_in_subprocess,
+                                list(zip([self.model] * num_chunks, circuit_chunks, seeds)))
+        return {circ: probs for circuit_chunk, chunk_probs in zip(circuit_chunks, results)
+                for circ, probs in zip(circuit_chunk, chunk_probs)}
+
+
+def _merge_outcome_counts(outcome_counts):
+    """
+    Merge several `(outcome_labels, counts)` tuples into one.
+
+    Parameters
+    ----------
+    outcome_counts : list
+        A list of `(outcome_labels, counts)` tuples as returned by
+        :meth:`WeakForwardSimulator._compute_circuit_outcomes_for_shots`.
+
+    Returns
+    -------
+    outcome_labels: tuple
+    counts: numpy.ndarray
+    """
+    outcome_indices = {}
+    for outcome_labels, _ in outcome_counts:
+        for outcome in outcome_labels:
+            outcome_indices.setdefault(outcome, len(outcome_indices))
+
+    merged_counts = _np.zeros(len(outcome_indices), _np.int64)
+    for outcome_labels, counts in outcome_counts:
+        _np.add.at(merged_counts, [outcome_indices[outcome] for outcome in outcome_labels], counts)
+    return tuple(outcome_indices.keys()), merged_counts
+
+
+def _sample_circuit_outcomes_in_subprocess(model, spc_circuit, num_shots, time, seed):
+    # `model` is a copy unpickled in this process, and its simulator's `model` is restored by Model.__setstate__
+    _np.random.seed(seed)
+    return model.sim._sample_circuit_outcomes_for_shots(spc_circuit, num_shots, None, time)
+
+
+def _compute_sparse_probabilities_in_subprocess(model, circuits, seed):
+    _np.random.seed(seed)
+    sim = model.sim
+    sim.num_processes = 1
+    return [sim._compute_sparse_circuit_outcome_probabilities(circ, None) for circ in circuits]
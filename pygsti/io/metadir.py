@@ -22,6 +22,7 @@ from pygsti.io import readers as _load
 from pygsti.io import writers as _write
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
+from pygsti.serialization import npz as _npz
 
 QUICK_LOAD_MAX_SIZE = 10 * 1024  # 10 kilobytes
 
@@ -77,6 +78,7 @@ def _get_auxfile_ext(typ):
     elif typ == 'numpy-array': ext = '.npy'
     elif typ == 'json': ext = '.json'
     elif typ == 'pickle': ext = '.pkl'
+    elif typ == 'npz': ext = '.npz'
     elif typ == 'none': ext = '.NA'
     elif typ == 'reset': ext = '.NA'
     else:
@@ -294,6 +296,8 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
         elif typ == 'pickle':
             with open(str(pth), 'rb') as f:
                 val = _pickle.load(f)
+        elif typ == 'npz':
+            val = _npz.load(str(pth))
         else:
             raise ValueError("Invalid aux-file type: %s" % typ)
 
@@ -435,6 +439,8 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
         elif typ == 'pickle':
             with open(str(pth), 'wb') as f:
                 _pickle.dump(val, f)
+        elif typ == 'npz':
+            _npz.dump(val, str(pth))
         else:
             raise ValueError("Invalid aux-file type: %s" % typ)
 
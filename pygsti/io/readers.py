@@ -35,7 +35,7 @@ def load_dataset(filename, cache=False, collision_action="aggregate",
 
 def read_dataset(filename, cache=False, collision_action="aggregate",
                  record_zero_counts=True, ignore_zero_count_lines=True,
-                 with_times="auto", circuit_parse_cache=None, verbosity=1):
+                 with_times="auto", circuit_parse_cache=None, verbosity=1, num_processes=1):
     """
     Load a DataSet from a file.
 
@@ -86,6 +86,11 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
         If zero, no output is shown.  If greater than zero,
         loading progress is shown.
 
+    num_processes : int, optional
+        The number of processes used to parse a text-formatted data set file.
+        When greater than 1, the file is split into byte ranges that are
+        parsed in parallel.
+
     Returns
     -------
     DataSet
@@ -121,7 +126,7 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
                                        collision_action=collision_action,
                                        record_zero_counts=record_zero_counts,
                                        ignore_zero_count_lines=ignore_zero_count_lines,
-                                       with_times=with_times)
+                                       with_times=with_times, num_processes=num_processes)
 
             printer.log("Writing cache file (to speed future loads): %s"
                         % cache_filename)
@@ -133,7 +138,7 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
                                        collision_action=collision_action,
                                        record_zero_counts=record_zero_counts,
                                        ignore_zero_count_lines=ignore_zero_count_lines,
-                                       with_times=with_times)
+                                       with_times=with_times, num_processes=num_processes)
         return ds
 
 
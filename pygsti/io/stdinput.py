@@ -11,6 +11,7 @@ Text-parsing classes and functions to read input files.
 #***************************************************************************************************
 
 import ast as _ast
+import functools as _functools
 import os as _os
 import re as _re
 import sys as _sys
@@ -23,15 +24,19 @@ from scipy.linalg import expm as _expm
 
 from pygsti import baseobjs as _baseobjs
 from pygsti import tools as _tools
+from pygsti.tools import mptools as _mpt
 from pygsti.modelmembers import instruments as _instrument
 from pygsti.modelmembers import operations as _op
 from pygsti.modelmembers import povms as _povm
 from pygsti.modelmembers import states as _state
+from pygsti.baseobjs import outcomelabeldict as _ld
 from pygsti.baseobjs import statespace as _statespace
 from pygsti.models import gaugegroup as _gaugegroup
 from pygsti.circuits.circuit import Circuit as _Circuit
+from pygsti.circuits.circuit import _accumulate_explicit_sslbls
 from pygsti.circuits.circuitparser import CircuitParser as _CircuitParser
 from pygsti.data import DataSet as _DataSet, MultiDataSet as _MultiDataSet
+from pygsti.data import dataset as _ds
 
 # A dictionary mapping qubit string representations into created
 # :class:`Circuit` objects, which can improve performance by reducing
@@ -39,6 +44,17 @@ from pygsti.data import DataSet as _DataSet, MultiDataSet as _MultiDataSet
 _global_parse_cache = {False: {}, True: {}}  # key == create_subcircuits
 
 
+@_functools.lru_cache(maxsize=4096)
+def _layer_explicit_sslbls(layer):
+    """
+    The set of state-space labels that circuit-layer label `layer` explicitly acts on.
+
+    Used to infer the line labels of parsed circuits.  Results are cached (for a bounded
+    number of labels) since the same layers appear in most of the circuits of a file.
+    """
+    return frozenset(_accumulate_explicit_sslbls(layer))
+
+
 def _create_display_progress_fn(show_progress):
     """
     Create and return a progress-displaying function.
@@ -77,6 +93,272 @@ def _create_display_progress_fn(show_progress):
     return _display_progress
 
 
+#: Number of data lines buffered in Python lists before being appended to a parse's numpy arrays.
+_STREAMING_CHUNK_SIZE = 65536
+
+
+class _StreamingParseFallback(Exception):
+    """
+    Raised when a data file contains a construct the streaming data-line parser doesn't handle.
+
+    Currently this is only the multi-line, time-stamped circuit data block, which is
+    read by the general (line-by-line) parser in :meth:`StdInputParser.parse_datafile`.
+    """
+    pass
+
+
+class _GrowableArray(object):
+    """
+    A 1D numpy array that is filled in chunks and grows geometrically.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        The array's data type.
+
+    capacity : int, optional
+        The initial number of preallocated elements.
+    """
+
+    def __init__(self, dtype, capacity=1024):
+        self._data = _np.empty(max(capacity, 1), dtype)
+        self.size = 0
+
+    def extend(self, values):
+        """
+        Append the elements of the sequence or array `values`.
+        """
+        n = len(values)
+        if self.size + n > len(self._data):
+            new_data = _np.empty(max(2 * len(self._data), self.size + n), self._data.dtype)
+            new_data[0:self.size] = self._data[0:self.size]
+            self._data = new_data
+        self._data[self.size:self.size + n] = values
+        self.size += n
+
+    @property
+    def array(self):
+        """ The filled portion of this array (a view). """
+        return self._data[0:self.size]
+
+
+class _DataLineBlock(object):
+    """
+    The outcome data parsed from a contiguous block of a data file's lines.
+
+    Each non-skipped data line becomes a "row" holding a circuit, its auxiliary
+    information and a contiguous run of (outcome-index, [time,] [repetition-count])
+    entries.  Outcome indices are local to the block and index `outcome_labels`, so
+    blocks parsed independently (e.g. in different processes) can be merged.
+
+    Parameters
+    ----------
+    has_times : bool
+        Whether each entry has its own time stamp.  If False, all of a row's
+        entries share a single time stamp that is assigned when blocks are merged.
+
+    has_reps : bool
+        Whether each entry has a repetition count.
+
+    capacity : int, optional
+        The number of entries to preallocate space for.
+    """
+
+    def __init__(self, has_times, has_reps, capacity=1024):
+        self.circuits = []
+        self.aux = []
+        self.row_lengths = []
+        self.outcome_labels = []
+        self.warnings = []
+        self.oli = _GrowableArray(_ds.Oindex_type, capacity)
+        self.times = _GrowableArray(_ds.Time_type, capacity) if has_times else None
+        self.reps = _GrowableArray(_ds.Repcount_type, capacity) if has_reps else None
+
+    def __getstate__(self):
+        # only send the filled portions of the buffers between processes
+        state = self.__dict__.copy()
+        for k in ('oli', 'times', 'reps'):
+            if state[k] is not None: state[k] = state[k].array
+        return state
+
+    def __setstate__(self, state):
+        for k in ('oli', 'times', 'reps'):
+            if state[k] is not None:
+                buf = _GrowableArray(state[k].dtype, len(state[k])); buf.extend(state[k])
+                state[k] = buf
+        self.__dict__.update(state)
+
+
+def _parse_aux_comment(comment, filename, i_line, warnings):
+    """
+    Parse the dictionary-valued auxiliary information following a data line's '#'.
+
+    Unparseable comments result in an empty dictionary and a message appended to `warnings`.
+    """
+    comment = comment.strip()
+    if len(comment) == 0: return {}
+    try:
+        if comment.startswith("{") and comment.endswith("}"):
+            return _ast.literal_eval(comment)
+        else:  # put brackets around it
+            return _ast.literal_eval("{ " + comment + " }")
+    except:
+        warnings.append("%s Line %d: Could not parse comment '%s'" % (filename, i_line, comment))
+        return {}
+
+
+def _shard_byte_ranges(filename, num_shards):
+    """
+    Split a file into `num_shards` byte ranges that begin and end on line boundaries.
+
+    Returns
+    -------
+    list
+        A list of `(start, stop, first_line)` tuples, where `first_line` is the
+        (0-based) index of the line beginning at byte `start`.
+    """
+    filesize = _os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as f:
+        for k in range(1, num_shards):
+            f.seek(max(filesize * k // num_shards - 1, boundaries[-1]))
+            f.readline()  # advance to the start of the next line
+            boundaries.append(max(min(f.tell(), filesize), boundaries[-1]))
+        boundaries.append(filesize)
+
+        first_lines = [0]
+        f.seek(0)
+        for start, stop in zip(boundaries[:-1], boundaries[1:-1]):
+            nlines = 0; pos = start
+            while pos < stop:
+                buf = f.read(min(1 << 24, stop - pos))
+                nlines += buf.count(b'\n'); pos += len(buf)
+            first_lines.append(first_lines[-1] + nlines)
+
+    return [(start, stop, first_line) for start, stop, first_line
+            in zip(boundaries[:-1], boundaries[1:], first_lines) if stop > start]
+
+
+def _parse_datafile_shard(filename, start, stop, first_line, kind, opts):
+    """
+    Parse the data lines within bytes `[start, stop)` of `filename` (a worker-process entry point).
+
+    Returns
+    -------
+    _DataLineBlock or None
+        `None` when the shard contains data that requires the general parser.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        lines = f.read(stop - start).decode().splitlines()
+    parser = StdInputParser()
+    try:
+        if kind == "counts":
+            return parser._parse_count_datalines(lines, opts, first_line)
+        else:
+            return parser._parse_timeseries_datalines(lines, opts, first_line)
+    except _StreamingParseFallback:
+        return None
+
+
+def _merge_datalines_into_dataset(blocks, dataset, append_duplicates, record_aux):
+    """
+    Build a static :class:`DataSet` from the rows of one or more :class:`_DataLineBlock` objects.
+
+    Parameters
+    ----------
+    blocks : list
+        The parsed blocks, in file order.
+
+    dataset : DataSet
+        A non-static template data set giving the initial outcome labels, comment and
+        collision action of the returned data set.  Outcome labels in `blocks` that
+        aren't already present are added to this data set (in order of appearance).
+
+    append_duplicates : bool
+        If True, the rows of a circuit that appears multiple times are concatenated,
+        with successive rows time-stamped 0, 1, etc. (as :meth:`DataSet.add_count_arrays`
+        does in "aggregate" mode).  If False, the last row of such a circuit replaces
+        any earlier ones.
+
+    record_aux : bool
+        Whether the rows' auxiliary information should be stored in the data set.
+
+    Returns
+    -------
+    DataSet
+    """
+
+    circuits = []; aux = []; row_lengths = []; olis = []; times = []; reps = []
+    for block in blocks:
+        dataset.add_outcome_labels(block.outcome_labels, update_ol=False)
+        local_to_global = _np.array([dataset.olIndex[ol] for ol in block.outcome_labels], _ds.Oindex_type)
+        circuits.extend(block.circuits); aux.extend(block.aux); row_lengths.extend(block.row_lengths)
+        olis.append(local_to_global[block.oli.array] if block.oli.size > 0 else block.oli.array)
+        if block.times is not None: times.append(block.times.array)
+        if block.reps is not None: reps.append(block.reps.array)
+    dataset.update_ol()
+
+    def concat(arrays, typ):
+        return _np.concatenate(arrays) if len(arrays) > 0 else _np.empty(0, typ)
+    oli = concat(olis, _ds.Oindex_type)
+    time = concat(times, _ds.Time_type) if (len(blocks) > 0 and blocks[0].times is not None) else None
+    rep = concat(reps, _ds.Repcount_type) if (len(blocks) > 0 and blocks[0].reps is not None) else None
+    row_lengths = _np.array(row_lengths, _np.int64)
+
+    # group rows by circuit, hashing each distinct (interned) Circuit object only once
+    unique_circuits = []; unique_indices = {}; indices_by_id = {}; rows_by_circuit = []
+    for i, circuit in enumerate(circuits):
+        k = indices_by_id.get(id(circuit), None)
+        if k is None:
+            k = indices_by_id[id(circuit)] = unique_indices.setdefault(circuit, len(unique_circuits))
+            if k == len(unique_circuits):
+                unique_circuits.append(circuit); rows_by_circuit.append([])
+        rows_by_circuit[k].append(i)
+
+    if len(unique_circuits) == len(circuits):  # the common case: no duplicate circuits
+        row_order = _np.arange(len(circuits), dtype=_np.int64)
+        row_times = _np.zeros(len(circuits), _ds.Time_type)
+        circuit_nrows = [1] * len(circuits)
+    else:
+        row_order = []; row_times = []; circuit_nrows = []
+        for rows in rows_by_circuit:
+            if append_duplicates:
+                next_time = 0
+                for i in rows:
+                    row_order.append(i); row_times.append(next_time)
+                    if row_lengths[i] > 0: next_time = row_times[-1] + 1  # next time = 1 + max existing time
+                circuit_nrows.append(len(rows))
+            else:
+                row_order.append(rows[-1]); row_times.append(0); circuit_nrows.append(1)
+        row_order = _np.array(row_order, _np.int64)
+        row_times = _np.array(row_times, _ds.Time_type)
+
+    # gather the kept rows' entries, in order, from the concatenated block data
+    row_starts = _np.cumsum(row_lengths) - row_lengths
+    lengths = row_lengths[row_order]
+    total = int(lengths.sum())
+    offsets = _np.repeat(row_starts[row_order] - (_np.cumsum(lengths) - lengths), lengths)
+    indices = offsets + _np.arange(total, dtype=_np.int64)
+
+    oli = oli[indices]
+    time = time[indices] if (time is not None) else _np.repeat(row_times, lengths)
+    if rep is not None: rep = rep[indices]
+
+    circuit_indices = _OrderedDict(); aux_info = {}; i_row = 0; offset = 0
+    for circuit, nrows in zip(unique_circuits, circuit_nrows):
+        n = int(lengths[i_row:i_row + nrows].sum())
+        circuit_indices[circuit] = slice(offset, offset + n)
+        if record_aux and aux[row_order[i_row + nrows - 1]] is not None:
+            aux_info[circuit] = aux[row_order[i_row + nrows - 1]]
+        i_row += nrows; offset += n
+
+    return _DataSet(oli, time, rep, circuit_indices=circuit_indices,
+                    outcome_label_indices=dataset.olIndex, static=True,
+                    collision_action=dataset.collisionAction, comment=dataset.comment,
+                    aux_info=aux_info)
+
+
 class StdInputParser(object):
     """
     Encapsulates a text parser for reading GST input files.
@@ -118,7 +400,16 @@ class StdInputParser(object):
         if circuit is None:  # wasn't in cache
             layer_tuple, line_lbls, occurrence_id, compilable_indices = \
                 self.parse_circuit_raw(s, lookup, create_subcircuits)
-            if line_lbls is None:  # if there are no line labels then we need to use "auto" and do a full init
+            if line_lbls is None and compilable_indices is None:
+                # infer the line labels from the (cached) state-space labels of each distinct layer, which is
+                # equivalent to, but much faster than, a full init with line_labels="auto" (below)
+                explicit_sslbls = set()
+                for layer in set(layer_tuple):
+                    explicit_sslbls.update(_layer_explicit_sslbls(layer))
+                line_lbls = tuple(sorted(explicit_sslbls)) if len(explicit_sslbls) > 0 else ('*',)
+                circuit = _Circuit._fastinit(layer_tuple, line_lbls, editable=False,
+                                             name='', stringrep=s, occurrence=occurrence_id)
+            elif line_lbls is None:  # if there are no line labels then we need to use "auto" and do a full init
                 circuit = _Circuit(layer_tuple, stringrep=s, line_labels="auto",
                                    expand_subcircuits=False, check=False, occurrence=occurrence_id,
                                    compilable_layer_indices=compilable_indices)
@@ -360,10 +651,15 @@ class StdInputParser(object):
 
     def parse_datafile(self, filename, show_progress=True,
                        collision_action="aggregate", record_zero_counts=True,
-                       ignore_zero_count_lines=True, with_times="auto"):
+                       ignore_zero_count_lines=True, with_times="auto", num_processes=1):
         """
         Parse a data set file into a DataSet object.
 
+        Files containing only single-line (circuit followed by counts) data are
+        streamed directly into the arrays of a static DataSet, parsing each distinct
+        circuit string once.  Files with multi-line, time-stamped circuit data are
+        read by a slower, general line-by-line parser.
+
         Parameters
         ----------
         filename : string
@@ -391,6 +687,11 @@ class StdInputParser(object):
             "auto", then this format is allowed but not required.  Typically
             you only need to set this to False when reading in a template file.
 
+        num_processes : int, optional
+            The number of processes used to parse the file.  When greater than
+            1, the file is split into this many byte ranges (on line boundaries)
+            which are parsed in parallel and then merged.
+
         Returns
         -------
         DataSet
@@ -457,6 +758,22 @@ class StdInputParser(object):
         else:
             fixed_column_outcome_indices = None
 
+        if with_times is not True:
+            opts = {'filename': filename, 'lookup': lookupDict, 'n_data_cols': nDataCols,
+                    'column_labels': fixed_column_outcome_labels, 'record_zero_counts': record_zero_counts,
+                    'ignore_zero_count_lines': ignore_zero_count_lines, 'with_times': with_times,
+                    'create_subcircuits': not _Circuit.default_expand_subcircuits,
+                    'allowed_outcomes': set(dataset.olIndex.keys()) if outcome_labels_specified_in_preamble else None}
+            try:
+                blocks = self._read_datalines(filename, "counts", opts, num_processes, show_progress)
+            except _StreamingParseFallback:
+                pass  # file contains time-stamped data blocks, so parse it line-by-line below
+            else:
+                warnings = [msg for block in blocks for msg in block.warnings]
+                if warnings:
+                    _warnings.warn('\n'.join(warnings))  # to be displayed at end, after potential progress updates
+                return _merge_datalines_into_dataset(blocks, dataset, collision_action == "aggregate", True)
+
         nLines = 0
         with open(filename, 'r') as datafile:
             nLines = sum(1 for line in datafile)
@@ -852,7 +1169,7 @@ class StdInputParser(object):
         return count_dicts
 
     def parse_tddatafile(self, filename, show_progress=True, record_zero_counts=True,
-                         create_subcircuits=True):
+                         create_subcircuits=True, num_processes=1):
         """
         Parse a timstamped data set file into a DataSet object.
 
@@ -874,6 +1191,11 @@ class StdInputParser(object):
             string representations or to just expand these into non-subcircuit
             labels.
 
+        num_processes : int, optional
+            The number of processes used to parse the file.  When greater than
+            1, the file is split into this many byte ranges (on line boundaries)
+            which are parsed in parallel and then merged.
+
         Returns
         -------
         DataSet
@@ -910,35 +1232,222 @@ class StdInputParser(object):
 
         #Read data lines of data file
         dataset = _DataSet(outcome_labels=outcomeLabels)
-        with open(filename, 'r') as f:
-            nLines = sum(1 for line in f)
-        nSkip = int(nLines / 100.0)
-        if nSkip == 0: nSkip = 1
+        opts = {'filename': filename, 'lookup': lookupDict, 'create_subcircuits': create_subcircuits,
+                'outcome_abbreviations': _OrderedDict([(abbrev, _ld.OutcomeLabelDict.to_outcome(ol))
+                                                       for abbrev, ol in outcomeLabelAbbrevs.items()])}
+        blocks = self._read_datalines(filename, "timeseries", opts, num_processes, show_progress)
+        return _merge_datalines_into_dataset(blocks, dataset, False, False)
 
-        display_progress = _create_display_progress_fn(show_progress)
+    def _read_datalines(self, filename, kind, opts, num_processes, show_progress):
+        """
+        Parse the data lines of `filename` into a list of :class:`_DataLineBlock` objects.
 
+        When `num_processes > 1` the file is split into byte ranges (on line boundaries)
+        that are parsed in separate processes, yielding one block per range.  Otherwise
+        the file is streamed through a single block.  Raises :class:`_StreamingParseFallback`
+        if the file contains data the streaming parser can't handle.
+        """
+        if num_processes > 1:
+            shards = _shard_byte_ranges(filename, num_processes)
+            blocks = _mpt.starmap_with_kwargs(_parse_datafile_shard, len(shards), num_processes,
+                                              [(filename, start, stop, first_line, kind, opts)
+                                               for start, stop, first_line in shards], [{}] * len(shards))
+            if any([b is None for b in blocks]): raise _StreamingParseFallback()
+            return blocks
+
+        nbytes = _os.path.getsize(filename)
+        display_progress = _create_display_progress_fn(show_progress)
         with open(filename, 'r') as f:
-            for (iLine, line) in enumerate(f):
-                if iLine % nSkip == 0 or iLine + 1 == nLines: display_progress(iLine + 1, nLines, filename)
+            if show_progress:
+                def lines_with_progress():
+                    nread = 0
+                    for i, line in enumerate(f):
+                        nread += len(line)
+                        if i % _STREAMING_CHUNK_SIZE == 0: display_progress(nread, nbytes, filename)
+                        yield line
+                    display_progress(nbytes, nbytes, filename)
+                lines = lines_with_progress()
+            else:
+                lines = f
+            parse_fn = self._parse_count_datalines if kind == "counts" else self._parse_timeseries_datalines
+            return [parse_fn(lines, opts, 0, capacity=max(nbytes // 8, 1024))]
 
-                line = line.strip()
-                if len(line) == 0 or line[0] == '#': continue
-                try:
-                    parts = line.split()
-                    lastpart = parts[-1]
-                    circuitStr = line[:-len(lastpart)].strip()
-                    circuit = self.parse_circuit(circuitStr, lookupDict, create_subcircuits)
-                    timeSeriesStr = lastpart.strip()
-                except ValueError as e:
-                    raise ValueError("%s Line %d: %s" % (filename, iLine, str(e)))
+    def _parse_count_datalines(self, lines, opts, first_line=0, capacity=1024):
+        """
+        Parse count-format data lines (a circuit followed by counts) into a :class:`_DataLineBlock`.
 
-                seriesList = [outcomeLabelAbbrevs[abbrev] for abbrev in timeSeriesStr]  # iter over characters in str
-                timesList = list(range(len(seriesList)))  # FUTURE: specify an offset and step??
-                dataset.add_raw_series_data(circuit, seriesList, timesList,
-                                            record_zero_counts=record_zero_counts)
+        Circuit strings and outcome labels are interned, so that each distinct string is
+        only parsed once, and counts are appended to the block's arrays in chunks.
 
-        dataset.done_adding_data()
-        return dataset
+        Parameters
+        ----------
+        lines : iterable
+            The lines to parse (an open file, a list of strings, etc.).
+
+        opts : dict
+            Parse options, as assembled by :meth:`parse_datafile`.
+
+        first_line : int, optional
+            The index of the first line within the file, used in error messages.
+
+        capacity : int, optional
+            The number of count entries to preallocate space for.
+
+        Returns
+        -------
+        _DataLineBlock
+        """
+        filename = opts['filename']; lookup = opts['lookup']
+        n_data_cols = opts['n_data_cols']; column_labels = opts['column_labels']
+        record_zero_counts = opts['record_zero_counts']
+        ignore_zero_count_lines = opts['ignore_zero_count_lines']
+        create_subcircuits = opts['create_subcircuits']
+        allowed_outcomes = opts['allowed_outcomes']  # None when any outcome label is allowed
+
+        block = _DataLineBlock(has_times=False, has_reps=True, capacity=capacity)
+        warnings = block.warnings
+        circuit_cache = {}  # circuit string => Circuit
+        outcome_cache = {}  # outcome label => local index
+        token_cache = {}  # "<outcome label>:" prefix of an outcome:count token => local index
+
+        def outcome_index(ol):
+            i = outcome_cache.get(ol, None)
+            if i is None:
+                if allowed_outcomes is not None and ol not in allowed_outcomes:
+                    raise ValueError("Outcome label %s is not one of those given in the preamble" % str(ol))
+                i = outcome_cache[ol] = len(block.outcome_labels)
+                block.outcome_labels.append(ol)
+            return i
+
+        oli_chunk = []; rep_chunk = []; nchunk = 0
+        for i_line, line in enumerate(lines, first_line):
+            line = line.strip()
+            if '#' in line:
+                i = line.index('#')
+                dataline, comment = line[:i], line[i + 1:]
+            else:
+                dataline, comment = line, ""
+
+            parts = dataline.split()
+            if len(parts) == 0: continue
+            circuit_str = parts[0]; values = parts[1:]
+
+            try:
+                circuit = circuit_cache.get(circuit_str, None)
+                if circuit is None:
+                    circuit = circuit_cache[circuit_str] = self.parse_circuit(circuit_str, lookup, create_subcircuits)
+
+                olis = []; counts = []; bad = False
+                if column_labels is None:  # <outcomeLabel>:<count> items
+                    if len(values) == 0:
+                        if opts['with_times'] is not False:  # could begin a time-stamped data block
+                            raise _StreamingParseFallback()
+                    elif values[0] == "BAD":
+                        bad = True
+                    else:
+                        for p in values:
+                            k = p.rfind(':') + 1
+                            prefix = p[0:k]
+                            oli = token_cache.get(prefix, None)
+                            if oli is None:
+                                oli = token_cache[prefix] = outcome_index(tuple(prefix.split(':')[0:-1]))
+                            olis.append(oli); counts.append(float(p[k:]))
+                else:  # data is in columns as given by header
+                    if len(values) > n_data_cols: values = values[0:n_data_cols]
+                    if len(values) != n_data_cols:
+                        raise ValueError("Found %d count columns when %d were expected" % (len(values), n_data_cols))
+                    if "BAD" in values:
+                        bad = True
+                    else:
+                        for ol, v in zip(column_labels, values):
+                            if v == '--': continue  # drop "empty" sentinels
+                            olis.append(outcome_index(ol)); counts.append(float(v))
+            except ValueError as e:
+                raise ValueError("%s Line %d: %s" % (filename, i_line, str(e)))
+
+            if all([(abs(v) < 1e-9) for v in counts]):
+                if ignore_zero_count_lines is True:
+                    if not bad:  # supress "no data" warning for known-bad circuits
+                        s = circuit.str if len(circuit.str) < 40 else circuit.str[0:37] + "..."
+                        warnings.append("Dataline for circuit '%s' has zero counts and will be ignored" % s)
+                    continue  # skip lines in dataset file with zero counts (no experiments done)
+
+            if not record_zero_counts and 0.0 in counts:
+                olis, counts = [oli for oli, v in zip(olis, counts) if v != 0], [v for v in counts if v != 0]
+
+            block.circuits.append(circuit)
+            block.aux.append(_parse_aux_comment(comment, filename, i_line, warnings))
+            block.row_lengths.append(len(olis))
+            oli_chunk.extend(olis); rep_chunk.extend(counts); nchunk += 1
+            if nchunk == _STREAMING_CHUNK_SIZE:
+                block.oli.extend(oli_chunk); block.reps.extend(rep_chunk)
+                oli_chunk = []; rep_chunk = []; nchunk = 0
+
+        block.oli.extend(oli_chunk); block.reps.extend(rep_chunk)
+        return block
+
+    def _parse_timeseries_datalines(self, lines, opts, first_line=0, capacity=1024):
+        """
+        Parse time-series data lines (a circuit followed by a string of outcome abbreviations).
+
+        Parameters
+        ----------
+        lines : iterable
+            The lines to parse (an open file, a list of strings, etc.).
+
+        opts : dict
+            Parse options, as assembled by :meth:`parse_tddatafile`.
+
+        first_line : int, optional
+            The index of the first line within the file, used in error messages.
+
+        capacity : int, optional
+            The number of outcomes to preallocate space for.
+
+        Returns
+        -------
+        _DataLineBlock
+        """
+        filename = opts['filename']; lookup = opts['lookup']
+        create_subcircuits = opts['create_subcircuits']
+        abbrevs = opts['outcome_abbreviations']  # single-character abbreviation => outcome label
+
+        block = _DataLineBlock(has_times=True, has_reps=False, capacity=capacity)
+        block.outcome_labels = list(abbrevs.values())
+        abbrev_lookup = -_np.ones(128, _np.int64)  # ASCII code => local outcome index
+        for i, abbrev in enumerate(abbrevs.keys()):
+            if len(abbrev) == 1 and ord(abbrev) < 128: abbrev_lookup[ord(abbrev)] = i
+        circuit_cache = {}  # circuit string => Circuit
+
+        for i_line, line in enumerate(lines, first_line):
+            line = line.strip()
+            if len(line) == 0 or line[0] == '#': continue
+            try:
+                lastpart = line.split()[-1]
+                circuit_str = line[:-len(lastpart)].strip()
+                circuit = circuit_cache.get(circuit_str, None)
+                if circuit is None:
+                    circuit = self.parse_circuit(circuit_str, lookup, create_subcircuits)
+                    if circuit.occurrence is not None:  # duplicates overwrite existing data
+                        circuit = circuit.copy(); circuit.occurrence = None
+                    circuit_cache[circuit_str] = circuit
+
+                try:
+                    olis = abbrev_lookup[_np.frombuffer(lastpart.encode('ascii'), _np.uint8)]
+                except (UnicodeEncodeError, IndexError):
+                    olis = -_np.ones(1, _np.int64)
+                if _np.any(olis < 0):
+                    raise ValueError("Invalid outcome abbreviation(s) in '%s'" % lastpart)
+            except ValueError as e:
+                raise ValueError("%s Line %d: %s" % (filename, i_line, str(e)))
+
+            block.circuits.append(circuit)
+            block.aux.append(None)
+            block.row_lengths.append(len(olis))
+            block.oli.extend(olis)
+            block.times.extend(_np.arange(len(olis), dtype=_ds.Time_type))  # FUTURE: specify an offset and step??
+
+        return block
 
 
 def _eval_element(el, b_complex):
@@ -1278,7 +1278,6 @@ class DistributableCOPALayout(_CircuitOutcomeProbabilityArrayLayout):
         -------
         None
         """
-        param_ralloc = self.resource_alloc('param-processing')  # acts on (element, param) blocks
         interatom_ralloc = self.resource_alloc('param-interatom')  # procs w/same param slice & diff atoms
 
         if interatom_ralloc.comm is None:  # only 1 atom, so no need to sum below
@@ -1286,18 +1285,104 @@ class DistributableCOPALayout(_CircuitOutcomeProbabilityArrayLayout):
             return
 
         local_jtf = _np.dot(j.T, f)  # need to sum this value across all atoms
+        self._sum_over_atoms_into_fine_params(local_jtf, jtf)
+
+        #if param_comm.host_comm is not None and param_comm.host_comm.rank != 0:
+        #    return None  # this processor doesn't need to do any more - root host proc will fill returned shared mem
+
+    def fill_jtj_diag(self, j, jtj_diag):
+        """
+        Calculate the diagonal of the matrix-matrix product `j.T @ j`.
+
+        This is the column-wise sum of squares of `j`, and can be computed without
+        ever forming the (potentially very large) `j.T @ j` matrix.  This function
+        performs any necessary MPI/shared-memory communication when the arrays are
+        distributed over multiple processors.
+
+        Parameters
+        ----------
+        j : LocalNumpyArray
+            A local 2D array (matrix) allocated using `allocate_local_array` with the `"ep"`
+            (jacobian) type.
+
+        jtj_diag : LocalNumpyArray
+            The result.  This must be a pre-allocated local array of type `"jtf"`.
+
+        Returns
+        -------
+        None
+        """
+        interatom_ralloc = self.resource_alloc('param-interatom')  # procs w/same param slice & diff atoms
 
-        # assume jtf is created from allocate_local_array('jtf', 'd')
+        if interatom_ralloc.comm is None:  # only 1 atom, so no need to sum below
+            j_fine = j[:, self.fine_param_subslice]
+            jtj_diag[:] = _np.einsum('ij,ij->j', j_fine, j_fine)
+            return
+
+        local_diag = _np.einsum('ij,ij->j', j, j)  # need to sum this value across all atoms
+        self._sum_over_atoms_into_fine_params(local_diag, jtj_diag)
+
+    def _sum_over_atoms_into_fine_params(self, local_vec, result):
+        """
+        Sum a per-atom parameter vector over atoms and store this processor's "fine" portion in `result`.
+
+        `local_vec` holds values for this processor's `global_param_slice` that were computed
+        from this processor's atom(s) only, e.g. `dot(j.T, f)`.  `result` must be a local
+        array of type `"jtf"`.
+        """
+        param_ralloc = self.resource_alloc('param-processing')  # acts on (element, param) blocks
+        interatom_ralloc = self.resource_alloc('param-interatom')  # procs w/same param slice & diff atoms
+
+        # assume result is created from allocate_local_array('jtf', 'd')
         scratch, scratch_shm = _smt.create_shared_ndarray(
             interatom_ralloc, (_slct.length(self.host_param_slice),), 'd')
         interatom_ralloc.comm.barrier()  # wait for scratch to be ready
-        interatom_ralloc.allreduce_sum(scratch, local_jtf, unit_ralloc=param_ralloc)
-        jtf[:] = scratch[self.fine_param_subslice]  # takes sub-portion to move to "fine" parameter distribution
+        interatom_ralloc.allreduce_sum(scratch, local_vec, unit_ralloc=param_ralloc)
+        result[:] = scratch[self.fine_param_subslice]  # takes sub-portion to move to "fine" parameter distribution
         interatom_ralloc.comm.barrier()  # don't free scratch too early
         _smt.cleanup_shared_ndarray(scratch_shm)
 
-        #if param_comm.host_comm is not None and param_comm.host_comm.rank != 0:
-        #    return None  # this processor doesn't need to do any more - root host proc will fill returned shared mem
+    def fill_jv(self, j, global_v, jv):
+        """
+        Calculate the matrix-vector product `j @ v`.
+
+        Here `j` is often a jacobian matrix and `v` a direction in parameter space, so
+        that the result is a directional derivative of the objective function terms.
+        This function performs any necessary MPI/shared-memory communication when the
+        arrays are distributed over multiple processors.
+
+        Parameters
+        ----------
+        j : LocalNumpyArray
+            A local 2D array (matrix) allocated using `allocate_local_array` with the `"ep"`
+            (jacobian) type.
+
+        global_v : numpy.ndarray
+            The *global* (not distributed) parameter-space vector to multiply, of
+            length `self.global_num_params`.
+
+        jv : LocalNumpyArray
+            The result.  This must be a pre-allocated local array of type `"e"`, with
+            the same number of extra elements as `j` has.
+
+        Returns
+        -------
+        None
+        """
+        param_ralloc = self.resource_alloc('param-processing')  # acts on (element, param) blocks
+        atom_ralloc = self.resource_alloc('atom-processing')  # procs w/same atom & diff param slices
+
+        local_jv = _np.dot(j, global_v[self.global_param_slice])  # need to sum this value across all params
+        if atom_ralloc.comm is None:  # only 1 param slice, so no need to sum below
+            jv[:] = local_jv
+            return
+
+        scratch, scratch_shm = _smt.create_shared_ndarray(atom_ralloc, (len(local_jv),), 'd')
+        atom_ralloc.comm.barrier()  # wait for scratch to be ready
+        atom_ralloc.allreduce_sum(scratch, local_jv, unit_ralloc=param_ralloc)
+        jv[:] = scratch
+        atom_ralloc.comm.barrier()  # don't free scratch too early
+        _smt.cleanup_shared_ndarray(scratch_shm)
 
     def _allocate_jtj_shared_mem_buf(self):
         """
@@ -11,6 +11,7 @@ Defines the EvalTree class.
 #***************************************************************************************************
 
 import bisect as _bisect
+import collections as _collections
 import time as _time  # DEBUG TIMERS
 import warnings as _warnings
 
@@ -52,20 +53,194 @@ class EvalTree(list):
         # In particular, the evalTree[iDest] = eval_tree[iLeft] + eval_tree[iRight]
         #   so that matrix(evalTree[iDest]) = matrixOf(eval_tree[iRight]) * matrixOf(eval_tree[iLeft])
         eval_tree = cls()  # makes an empty list
+        eval_tree._add_circuits(circuits_to_evaluate, range(len(circuits_to_evaluate)), {}, [],
+                                len(circuits_to_evaluate))
+        return eval_tree
+
+    def create_extension(self, circuits_to_evaluate):
+        """
+        Create a tree for a list of circuits that begins with the circuits of this tree.
+
+        Only the circuits not already in this tree are processed, so this is much faster
+        than creating a new tree when most of the circuits are already present.  The
+        instructions of this tree are kept, and its circuits keep their indices (though
+        its intermediate, "scratch", indices are shifted to follow the new circuits).
+
+        Parameters
+        ----------
+        circuits_to_evaluate : list or dict
+            The circuits to evaluate, as for :method:`create`.  The first elements of this
+            list must be the circuits this tree was created for, in the same order.
+
+        Returns
+        -------
+        EvalTree
+        """
+        if not self.extendable:
+            raise ValueError("This tree cannot be extended, as it wasn't created by `EvalTree.create`")
+        nOld = self._num_circuits
+        nNew = len(circuits_to_evaluate) - nOld
+        if nNew < 0:
+            raise ValueError("Cannot extend a tree of %d circuits to only %d circuits!"
+                             % (nOld, len(circuits_to_evaluate)))
+
+        return self._create_extension(circuits_to_evaluate)
+
+    def _create_extension(self, circuits_to_evaluate, layer_tuples=None):
+        nOld = self._num_circuits
+        nNew = len(circuits_to_evaluate) - nOld
+
+        # the evaluation dictionary is handed over to the extended tree, which adds to it (it can be large, so
+        # isn't copied).  Its values don't depend on the number of circuits, so existing entries needn't change.
+        evalDict = getattr(self, '_eval_dict', None)
+        self._eval_dict = None
+        if evalDict is None:  # e.g. this tree was unpickled or already extended, so rebuild the dictionary
+            if layer_tuples is None: layer_tuples = self.layer_tuples()
+            evalDict = {}
+            for i, layertup in layer_tuples.items():
+                evalDict.setdefault(len(layertup), {})[layertup if len(layertup) > 0 else None] = \
+                    i if i < nOld else nOld - 1 - i
+
+        def shift(i):  # circuit indices are unchanged, but scratch indices move to make room for the new circuits
+            return i if i < nOld else i + nNew
+
+        eval_tree = EvalTree([(shift(iDest), None, iRight) if (iLeft is None)
+                              else (shift(iDest), shift(iLeft), shift(iRight)) for iDest, iLeft, iRight in self])
+        eval_tree._add_circuits(circuits_to_evaluate, range(nOld, nOld + nNew), evalDict, sorted(evalDict.keys()),
+                                self._next_scratch_index + nNew)
+        return eval_tree
+
+    @property
+    def extendable(self):
+        """ Whether :method:`create_extension` can be used with this tree """
+        return getattr(self, '_num_circuits', None) is not None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_eval_dict', None)  # can be large, so rebuilt from the instructions when needed
+        return state
+
+    def layer_tuples(self):
+        """
+        The layer tuples of the circuits and intermediate results evaluated by this tree.
+
+        Returns
+        -------
+        dict
+            A dictionary whose keys are the indices of this tree's elements and whose values
+            are the tuples of layer labels these elements evaluate (the empty tuple for a
+            length-0 circuit).
+        """
+        layer_tuples = {}
+        for iDest, iLeft, iRight in self:
+            if iLeft is None:
+                layer_tuples[iDest] = () if (iRight is None) else (iRight,)
+            else:
+                layer_tuples[iDest] = layer_tuples[iLeft] + layer_tuples[iRight]
+        return layer_tuples
+
+    def create_reusing(self, circuits_to_evaluate):
+        """
+        Create a tree for a list of circuits, reusing the instructions of this tree when possible.
+
+        If the first circuits of `circuits_to_evaluate` are those this tree was created for
+        (in the same order), this tree is extended (see :method:`create_extension`).  If instead
+        all the circuits are evaluated by this tree, the needed part of this tree is used
+        (see :method:`create_subtree`).  Otherwise a new tree is created.
+
+        Parameters
+        ----------
+        circuits_to_evaluate : list or dict
+            The circuits to evaluate, as for :method:`create`.
+
+        Returns
+        -------
+        EvalTree
+        """
+        layertups = [circuits_to_evaluate[i].layertup if isinstance(circuits_to_evaluate[i], _Circuit)
+                     else tuple(circuits_to_evaluate[i]) for i in range(len(circuits_to_evaluate))]
+        nOld = self._num_circuits if self.extendable else None
+        can_extend = nOld is not None and 0 < nOld <= len(layertups)
+
+        evalDict = getattr(self, '_eval_dict', None)
+        if can_extend and evalDict is not None:  # check the prefix without walking the tree
+            if all([evalDict.get(len(layertups[i]), {}).get(layertups[i] if len(layertups[i]) > 0 else None) == i
+                    for i in range(nOld)]):
+                return self._create_extension(circuits_to_evaluate)
+
+        # (duplicate circuits aren't found in the evaluation dictionary, so also fall back to this)
+        layer_tuples = self.layer_tuples()
+        if can_extend and all([layer_tuples[i] == layertups[i] for i in range(nOld)]):
+            return self._create_extension(circuits_to_evaluate, layer_tuples)
+
+        tree_index = {layertup: i for i, layertup in layer_tuples.items()}
+        indices = [tree_index.get(layertup, None) for layertup in layertups]
+        if len(indices) > 0 and None not in indices and len(set(indices)) == len(indices):
+            return self.create_subtree(indices)
+        return EvalTree.create(circuits_to_evaluate)
+
+    def create_subtree(self, circuit_indices):
+        """
+        Create a tree for a subset of the circuits of this tree, reusing its instructions.
+
+        No new evaluation strategy is planned: the returned tree contains just the instructions
+        of this tree that are needed to evaluate the given circuits, in the same order.  Circuits
+        and intermediate results of this tree that aren't among `circuit_indices` but are needed
+        become intermediate ("scratch") results of the returned tree.
+
+        Parameters
+        ----------
+        circuit_indices : list
+            The (distinct) indices of the circuits of this tree to include.  The i-th element
+            gives the index of the returned tree's i-th circuit.
+
+        Returns
+        -------
+        EvalTree
+        """
+        instructions = {iDest: (iLeft, iRight) for iDest, iLeft, iRight in self}
+        needed = set(circuit_indices)
+        to_walk = list(circuit_indices)
+        while len(to_walk) > 0:  # find everything the given circuits depend on (iteratively - trees can be deep)
+            iLeft, iRight = instructions[to_walk.pop()]
+            if iLeft is not None:
+                for i in (iLeft, iRight):
+                    if i not in needed:
+                        needed.add(i); to_walk.append(i)
+
+        new_index = {i: k for k, i in enumerate(circuit_indices)}
+        for iDest, _, _ in self:  # remaining needed items become scratch, following the circuits
+            if iDest in needed and iDest not in new_index:
+                new_index[iDest] = len(new_index)
+        return EvalTree([(new_index[iDest], None, iRight) if (iLeft is None)
+                         else (new_index[iDest], new_index[iLeft], new_index[iRight])
+                         for iDest, iLeft, iRight in self if iDest in needed])
+
+    def _add_circuits(self, circuits_to_evaluate, indices, evalDict, evalDict_keys, next_scratch_index):
+        """
+        Add instructions for evaluating the circuits at `indices` within `circuits_to_evaluate`.
+
+        `evalDict` maps circuit lengths to dictionaries of (the layer tuples of) the circuits that
+        have been evaluated so far to their indices, and is updated, along with `evalDict_keys`, its
+        sorted keys, as instructions are added.  New intermediate results are given indices starting
+        at `next_scratch_index`.  So that `evalDict` remains valid when more circuits are added, its
+        values are the indices of circuits but, for intermediate ("scratch") results, the negative
+        numbers -1, -2, ... in the order the results were added.  The evaluation dictionary is kept
+        by this tree (see :method:`create_extension`).
+        """
+        eval_tree = self
+        nCircuits = len(circuits_to_evaluate)
+
+        def tree_index(v):  # from a value of evalDict
+            return v if v >= 0 else nCircuits - 1 - v
 
-        #Evaluation dictionary:
-        # keys == operation sequences that have been evaluated so far
-        # values == index of operation sequence (key) within eval_tree
-        evalDict = {}  # _collections.defaultdict(dict)
-        evalDict_keys = []  # the sorted keys of evalDict
+        def evaldict_value(i):  # from a tree index
+            return i if i < nCircuits else nCircuits - 1 - i
 
         #Process circuits in order of length, so that we always place short strings
         # in the right place (otherwise assert stmt below can fail)
-        indices_sorted_by_circuit_len = \
-            sorted(list(range(len(circuits_to_evaluate))),
-                   key=lambda i: len(circuits_to_evaluate[i]))
+        indices_sorted_by_circuit_len = sorted(indices, key=lambda i: len(circuits_to_evaluate[i]))
 
-        next_scratch_index = len(circuits_to_evaluate)
         for k in indices_sorted_by_circuit_len:
 
             circuit = circuits_to_evaluate[k]
@@ -123,7 +298,8 @@ class EvalTree(list):
                     if 1 not in evalDict:
                         evalDict[1] = {}
                         _bisect.insort(evalDict_keys, 1)
-                    evalDict[1][layertup[start:start + 1]] = next_scratch_index; next_scratch_index += 1
+                    evalDict[1][layertup[start:start + 1]] = evaldict_value(next_scratch_index)
+                    next_scratch_index += 1
                     bite = 1
 
                 bFinal = bool(start + bite == L)
@@ -132,7 +308,7 @@ class EvalTree(list):
                 #      " (len=%d) in evalDict" % bite, "(final=%s)" % bFinal)
 
                 if start == 0:  # first in-evalDict bite - no need to add anything to self yet
-                    iCur = evalDict_bite[layertup[0:bite]]
+                    iCur = tree_index(evalDict_bite[layertup[0:bite]])
                     #print("DB: taking initial bite:", layertup[0:bite], "indx =", iCur)
                     if bFinal:
                         if iCur != k:  # then we have a duplicate final operation sequence
@@ -143,8 +319,10 @@ class EvalTree(list):
                             if iEmptyStr is None:  # then we need to add the empty string
                                 # duplicate final strs require the empty string to be included in the tree
                                 iEmptyStr = next_scratch_index; next_scratch_index += 1
-                                evalDict[0][None] = iEmptyStr
+                                evalDict[0][None] = evaldict_value(iEmptyStr)
                                 eval_tree.append((iEmptyStr, None, None))  # iLeft = iRight = None => no-op
+                            else:
+                                iEmptyStr = tree_index(iEmptyStr)
                             #assert(self[k] is None)  # make sure we haven't put anything here yet
                             eval_tree.append((k, iCur, iEmptyStr))
                             #self[k] = (iCur, iEmptyStr)  # compute the duplicate using by
@@ -152,7 +330,7 @@ class EvalTree(list):
                 else:
                     # add (iCur, iBite)
                     assert(layertup[0:start + bite] not in evalDict_bite)
-                    iBite = evalDict_bite[layertup[start:start + bite]]
+                    iBite = tree_index(evalDict_bite[layertup[start:start + bite]])
                     if start + bite not in evalDict:
                         evalDict[start + bite] = {}
                         _bisect.insort(evalDict_keys, start + bite)
@@ -166,7 +344,7 @@ class EvalTree(list):
                         #print("DB: add final %s (index %d)" % (str(layertup[0:start + bite]), iNew))
                     else:
                         iNew = next_scratch_index
-                        evalDict[start + bite][layertup[0:start + bite]] = iNew
+                        evalDict[start + bite][layertup[0:start + bite]] = evaldict_value(iNew)
                         eval_tree.append((iNew, iCur, iBite))
                         next_scratch_index += 1
                         #print("DB: add scratch %s (index %d)" % (str(layertup[0:start + bite]), iNew))
@@ -186,7 +364,49 @@ class EvalTree(list):
                                     "(e.g. MapForwardSimulator).") % test_ratio)
                     break  # don't print multiple warnings about the same inefficient tree
 
-        return eval_tree
+        # retain what's needed to extend this tree
+        self._eval_dict = evalDict
+        self._next_scratch_index = next_scratch_index
+        self._num_circuits = len(circuits_to_evaluate)
+
+    def levelize(self):
+        """
+        Group this tree's instructions into dependency "waves".
+
+        The instructions of each wave depend only on the results of earlier
+        waves (and of the tree's leaves), so that all the products within a wave
+        can be computed together, e.g. by a single batched matrix multiplication.
+
+        Returns
+        -------
+        leaves : list
+            The `(iDest, iLeft, iRight)` instructions with `iLeft == None`, which are
+            evaluated directly from the operation label `iRight` (or as the identity
+            when `iRight` is also None).
+        waves : list
+            A list of `(iDest, iLeft, iRight)` tuples of integer index arrays, one per
+            wave, in evaluation order.  As for the tree's elements,
+            `circuit[iDest[k]] = circuit[iLeft[k]] + circuit[iRight[k]]`.
+        """
+        levelization = getattr(self, '_levelization', None)  # trees don't change once they're created
+        if levelization is not None: return levelization
+
+        leaves = []
+        level_of = {}
+        instructions_by_level = _collections.defaultdict(list)
+        for iDest, iLeft, iRight in self:
+            if iLeft is None:
+                leaves.append((iDest, iLeft, iRight))
+                level_of[iDest] = 0
+            else:
+                level = 1 + max(level_of[iLeft], level_of[iRight])
+                level_of[iDest] = level
+                instructions_by_level[level].append((iDest, iLeft, iRight))
+
+        waves = [tuple(_np.array(indices, _np.int64) for indices in zip(*instructions_by_level[level]))
+                 for level in sorted(instructions_by_level.keys())]
+        self._levelization = (leaves, waves)
+        return self._levelization
 
     def _create_single_item_trees(self, num_elements):
         # num_elements == number of elements *to evaluate* (can be < len(self))
@@ -0,0 +1,131 @@
+"""
+Defines the LayoutCache class.
+"""
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import os as _os
+import pickle as _pickle
+import tempfile as _tempfile
+
+from pygsti.baseobjs.smartcache import stable_digest as _stable_digest
+
+
+class LayoutCache(object):
+    """
+    A directory of persisted layout components, keyed by a digest of everything that determines them.
+
+    Dividing a large list of circuits into atoms and building each atom's evaluation
+    strategy (tree or table) can take a long time, but depends only on the circuits, the
+    *structure* of the model (its labels - not its parameter values), the observed outcomes
+    in the data set and a few layout settings.  A `LayoutCache` stores these components in a
+    directory, in files named by a digest of all these inputs, so that later layouts for the
+    same circuits (in the same or a later process) just load them.
+
+    Only components that don't depend on how processors are divided are stored (processor
+    grids, communicators and shared memory are always set up anew), so a cached layout can
+    be reused with any number of processors.  Each processor only loads (or creates and
+    stores) the atoms it owns.
+
+    Parameters
+    ----------
+    directory : str or None
+        The directory holding the cached components.  It is created if needed.  If `None`,
+        nothing is cached, and :method:`get` always creates components.
+
+    layout_type : type
+        The class of the layout being created.
+
+    unique_circuits : list
+        The layout's unique circuits.
+
+    ds_circuits : list
+        The circuits in `unique_circuits` as they appear in `dataset` (i.e. with any
+        aliases applied).
+
+    model : Model
+        The model used to create the layout.
+
+    dataset : DataSet or None
+        The data set that limits the outcomes the layout includes.
+
+    layout_args : tuple
+        Any other arguments that determine the layout's components, e.g. the number of atoms.
+    """
+
+    def __init__(self, directory, layout_type, unique_circuits, ds_circuits, model, dataset, layout_args=()):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        if directory is None:
+            self.key_digest = None
+            return
+
+        # The (potentially long) lists of circuits and outcomes are digested as single strings, which is much
+        # faster than digesting them element by element.  How circuits are completed is given by the model structure.
+        from pygsti import __version__ as _pygsti_version
+        circuit_strs = '\n'.join([c.str for c in unique_circuits])
+        observed_outcomes = None if (dataset is None) else repr([dataset[c].outcomes for c in ds_circuits])
+        key = (layout_type, _pygsti_version, tuple(layout_args), self._model_structure(model),
+               circuit_strs, observed_outcomes)
+        self.key_digest = _stable_digest(key).hex()
+
+    @staticmethod
+    def _model_structure(model):
+        """ The labels of `model` that affect how circuits are completed and expanded into layouts """
+        return (type(model), str(model.state_space), model.primitive_prep_labels,
+                [(lbl, model._effect_labels_for_povm(lbl)) for lbl in model.primitive_povm_labels],
+                [(lbl, model._member_labels_for_instrument(lbl)) for lbl in model.primitive_instrument_labels],
+                model.primitive_op_labels)
+
+    def _filename(self, name):
+        return _os.path.join(self.directory, self.key_digest + '-' + name + '.pkl')
+
+    def get(self, name, create_fn):
+        """
+        Get a stored component, creating (and storing) it if it isn't present.
+
+        Parameters
+        ----------
+        name : str
+            The name of the component, e.g. `"atom0"`.
+
+        create_fn : function
+            A function taking no arguments that creates the component.
+
+        Returns
+        -------
+        object
+        """
+        if self.directory is None:
+            return create_fn()
+
+        filename = self._filename(name)
+        try:
+            with open(filename, 'rb') as f:
+                value = _pickle.load(f)
+            self.hits += 1
+            return value
+        except (OSError, EOFError, _pickle.UnpicklingError):
+            pass  # not present or unreadable => (re)create it below
+
+        value = create_fn()
+        self.misses += 1
+
+        # write to a temporary file that is then renamed so that concurrent readers (e.g. other
+        # processors loading the same atom) never see a partially-written file.
+        _os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_filename = _tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with _os.fdopen(fd, 'wb') as f:
+                _pickle.dump(value, f, protocol=_pickle.HIGHEST_PROTOCOL)
+            _os.replace(tmp_filename, filename)
+        except (TypeError, AttributeError, _pickle.PicklingError):
+            _os.remove(tmp_filename)  # unpickleable components just aren't stored
+        return value
@@ -14,6 +14,7 @@ import collections as _collections
 
 from pygsti.layouts.distlayout import DistributableCOPALayout as _DistributableCOPALayout
 from pygsti.layouts.distlayout import _DistributableAtom
+from pygsti.layouts.layoutcache import LayoutCache as _LayoutCache
 from pygsti.layouts.prefixtable import PrefixTable as _PrefixTable
 from pygsti.circuits.circuitlist import CircuitList as _CircuitList
 from pygsti.tools import listtools as _lt
@@ -76,7 +77,7 @@ class _MapCOPALayoutAtom(_DistributableAtom):
 
         self.rho_labels = sorted(all_rholabels)
         self.op_labels = sorted(all_oplabels)
-        self.full_effect_labels = all_elabels
+        self.full_effect_labels = sorted(all_elabels)  # a list, so its order is kept when pickled
         self.elabel_lookup = {elbl: i for i, elbl in enumerate(self.full_effect_labels)}
 
         #Lookup arrays for faster replib computation.
@@ -141,6 +142,61 @@ class _MapCOPALayoutAtom(_DistributableAtom):
         """The cache size of this atom."""
         return self.table.cache_size
 
+    def table_rows_by_param(self, model):
+        """
+        Finds, for each of `model`'s parameters, the rows of this atom's prefix table that depend on it.
+
+        A table row depends on a parameter when the parameter affects any of
+        the operations applied to compute the row's state - including those
+        applied to compute the cached state it starts from - or any of the
+        effects used to compute the row's outcome probabilities.  When a single
+        parameter changes, only these rows need to be recomputed, starting from
+        the (unchanged) cached states of the rows they don't include.
+
+        Parameters
+        ----------
+        model : Model
+            The model whose parameters are considered.
+
+        Returns
+        -------
+        dict
+            A dictionary whose keys are model-parameter indices and whose values are
+            ordered lists of table-row indices.  Parameters that don't affect any
+            row are absent.
+        """
+        all_params = frozenset(range(model.num_params))
+        param_deps = {}
+
+        def deps(lbl, typ):
+            if (lbl, typ) not in param_deps:
+                op = model._circuit_layer_operator(lbl, typ)
+                # an op whose parameters haven't been allocated could depend on anything
+                param_deps[(lbl, typ)] = all_params if (op.gpindices is None and op.num_params > 0) \
+                    else frozenset(op.gpindices_as_array())
+            return param_deps[(lbl, typ)]
+
+        full_effect_labels = list(self.full_effect_labels)
+        state_deps_by_cache_index = {}
+        rows_by_param = _collections.defaultdict(list)
+        for k, (iDest, iStart, remainder, iCache) in enumerate(self.table.contents):
+            remainder = remainder.circuit_without_povm.layertup
+            if iStart is None:  # then first element of remainder is a state prep label
+                state_deps = set(deps(remainder[0], 'prep'))
+                remainder = remainder[1:]
+            else:
+                state_deps = set(state_deps_by_cache_index[iStart])
+            for lbl in remainder:
+                state_deps.update(deps(lbl, 'op'))
+            if iCache is not None:
+                state_deps_by_cache_index[iCache] = state_deps
+
+            row_deps = state_deps.union(*[deps(full_effect_labels[j], 'povm')
+                                          for j in self.elbl_indices_by_expcircuit[iDest]])
+            for i in row_deps:
+                rows_by_param[i].append(k)
+        return dict(rows_by_param)
+
 
 class MapCOPALayout(_DistributableCOPALayout):
     """
@@ -197,24 +253,35 @@ class MapCOPALayout(_DistributableCOPALayout):
     verbosity : int or VerbosityPrinter
         Determines how much output to send to stdout.  0 means no output, higher
         integers mean more output.
+
+    cache_dir : str, optional
+        A directory in which to store this layout's atoms (and its division of the circuits
+        into atoms), so that later layouts for the same circuits, model structure and data set
+        can load rather than recreate them.  See :class:`LayoutCache`.
     """
 
     def __init__(self, circuits, model, dataset=None, max_cache_size=None,
                  num_sub_tables=None, num_table_processors=1, num_param_dimension_processors=(),
-                 param_dimensions=(), param_dimension_blk_sizes=(), resource_alloc=None, verbosity=0):
+                 param_dimensions=(), param_dimension_blk_sizes=(), resource_alloc=None, verbosity=0,
+                 cache_dir=None):
 
         unique_circuits, to_unique = self._compute_unique_circuits(circuits)
         aliases = circuits.op_label_aliases if isinstance(circuits, _CircuitList) else None
         ds_circuits = _lt.apply_aliases_to_circuits(unique_circuits, aliases)
         unique_complete_circuits = [model.complete_circuit(c) for c in unique_circuits]
-        unique_povmless_circuits = [model.split_circuit(c, split_prep=False)[1] for c in unique_complete_circuits]
-
-        max_sub_table_size = None  # was an argument but never used; remove in future
-        if (num_sub_tables is not None and num_sub_tables > 1) or max_sub_table_size is not None:
-            circuit_table = _PrefixTable(unique_povmless_circuits, max_cache_size)
-            groups = circuit_table.find_splitting(max_sub_table_size, num_sub_tables, verbosity=verbosity)
-        else:
-            groups = [set(range(len(unique_complete_circuits)))]
+        layout_cache = _LayoutCache(cache_dir, type(self), unique_circuits, ds_circuits, model, dataset,
+                                    (max_cache_size, num_sub_tables))
+
+        def _create_groups():
+            max_sub_table_size = None  # was an argument but never used; remove in future
+            if (num_sub_tables is not None and num_sub_tables > 1) or max_sub_table_size is not None:
+                unique_povmless_circuits = [model.split_circuit(c, split_prep=False)[1]
+                                            for c in unique_complete_circuits]
+                circuit_table = _PrefixTable(unique_povmless_circuits, max_cache_size)
+                return circuit_table.find_splitting(max_sub_table_size, num_sub_tables, verbosity=verbosity)
+            else:
+                return [set(range(len(unique_complete_circuits)))]
+        groups = layout_cache.get('groups', _create_groups)
 
         #atoms = []
         #elindex_outcome_tuples = _collections.OrderedDict(
@@ -226,12 +293,13 @@ class MapCOPALayout(_DistributableCOPALayout):
         #                                    model, dataset, offset, elindex_outcome_tuples, max_cache_size))
         #    offset += atoms[-1].num_elements
 
-        def _create_atom(group):
-            return _MapCOPALayoutAtom(unique_complete_circuits, ds_circuits, group,
-                                      model, dataset, max_cache_size)
+        def _create_atom(args):
+            iAtom, group = args
+            return layout_cache.get('atom%d' % iAtom, lambda: _MapCOPALayoutAtom(
+                unique_complete_circuits, ds_circuits, group, model, dataset, max_cache_size))
 
         super().__init__(circuits, unique_circuits, to_unique, unique_complete_circuits,
-                         _create_atom, groups, num_table_processors,
+                         _create_atom, list(enumerate(groups)), num_table_processors,
                          num_param_dimension_processors, param_dimensions,
                          param_dimension_blk_sizes, resource_alloc, verbosity)
 
@@ -17,6 +17,7 @@ import numpy as _np
 from pygsti.layouts.distlayout import DistributableCOPALayout as _DistributableCOPALayout
 from pygsti.layouts.distlayout import _DistributableAtom
 from pygsti.layouts.evaltree import EvalTree as _EvalTree
+from pygsti.layouts.layoutcache import LayoutCache as _LayoutCache
 from pygsti.circuits.circuitlist import CircuitList as _CircuitList
 from pygsti.tools import listtools as _lt
 from pygsti.tools import slicetools as _slct
@@ -65,10 +66,21 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
     dataset : DataSet
         The dataset, used to include only observed circuit outcomes in this atom
         and therefore the parent layout.
+
+    base_atom : _MatrixCOPALayoutAtom, optional
+        An atom of a previously-created layout whose work can be reused.  When this
+        atom's (expanded) circuits begin with those of `base_atom`, its evaluation
+        tree is extended rather than being created anew, and when they are a subset of
+        those of `base_atom`, the needed part of its evaluation tree is used.
     """
 
     def __init__(self, unique_complete_circuits, unique_nospam_circuits, circuits_by_unique_nospam_circuits,
-                 ds_circuits, group, helpful_scratch, model, dataset):
+                 ds_circuits, group, helpful_scratch, model, dataset, base_atom=None):
+
+        # expanding instruments and separating POVMs is repeated for every circuit, so reuse `base_atom`'s results.
+        # Like the expanded sub-circuits below, these aren't pickled.
+        base_instrument_expansions = getattr(base_atom, '_instrument_expansions', None) or {}
+        self._instrument_expansions = {}  # for creating later atoms
 
         #Note: group gives unique_nospam_circuits indices, which circuits_by_unique_nospam_circuits
         # turns into "unique complete circuit" indices, which the layout via it's to_unique can map
@@ -79,14 +91,23 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
                 nospam_c = unique_nospam_circuits[i]
                 for unique_i in circuits_by_unique_nospam_circuits[nospam_c]:  # "unique" circuits: add SPAM to nospam_c
                     observed_outcomes = None if (dataset is None) else dataset[ds_circuits[unique_i]].unique_outcomes
-                    expc_outcomes = unique_complete_circuits[unique_i].expand_instruments_and_separate_povm(
-                        model, observed_outcomes)
-                    #Note: unique_complete_circuits may have duplicates (they're only unique *pre*-completion)
-
-                    for sep_povm_c, outcomes in expc_outcomes.items():  # for each expanded cir from unique_i-th circuit
-                        prep_lbl = sep_povm_c.circuit_without_povm[0]
-                        exp_nospam_c = sep_povm_c.circuit_without_povm[1:]  # sep_povm_c *always* has prep lbl
-                        spam_tuples = [(prep_lbl, elabel) for elabel in sep_povm_c.full_effect_labels]
+                    expansion_key = (unique_complete_circuits[unique_i],
+                                     None if (observed_outcomes is None) else tuple(observed_outcomes))
+                    expansions = base_instrument_expansions.get(expansion_key, None)
+                    if expansions is None:
+                        expc_outcomes = unique_complete_circuits[unique_i].expand_instruments_and_separate_povm(
+                            model, observed_outcomes)
+                        #Note: unique_complete_circuits may have duplicates (they're only unique *pre*-completion)
+
+                        expansions = []  # (expanded circuit w/out SPAM, spam tuples, outcomes) tuples
+                        for sep_povm_c, outcomes in expc_outcomes.items():  # for each expanded cir from unique_i-th cir
+                            prep_lbl = sep_povm_c.circuit_without_povm[0]
+                            exp_nospam_c = sep_povm_c.circuit_without_povm[1:]  # sep_povm_c *always* has prep lbl
+                            spam_tuples = [(prep_lbl, elabel) for elabel in sep_povm_c.full_effect_labels]
+                            expansions.append((exp_nospam_c, spam_tuples, outcomes))
+                    self._instrument_expansions[expansion_key] = expansions
+
+                    for exp_nospam_c, spam_tuples, outcomes in expansions:
                         outcome_by_spamtuple = _collections.OrderedDict([(st, outcome)
                                                                          for st, outcome in zip(spam_tuples, outcomes)])
 
@@ -121,14 +142,22 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
         expanded_nospam_circuits_plus_scratch = _collections.OrderedDict(
             [(i, cir) for i, cir in enumerate(expanded_nospam_circuit_outcomes_plus_scratch.keys())])
 
+        # expanding sub-circuits is costly for long circuits, so reuse the expanded circuits of `base_atom`.  These
+        # aren't pickled (see __getstate__), so an atom loaded from a layout cache just expands its circuits anew.
+        base_double_expanded_circuits = getattr(base_atom, '_double_expanded_circuits', None) or {}
         double_expanded_nospam_circuits_plus_scratch = _collections.OrderedDict()
+        self._double_expanded_circuits = _collections.OrderedDict()  # for creating later atoms
         for i, cir in expanded_nospam_circuits_plus_scratch.items():
-            cir = cir.copy(editable=True)
-            cir.expand_subcircuits()  # expand sub-circuits for a more efficient tree
-            cir.done_editing()
-            double_expanded_nospam_circuits_plus_scratch[i] = cir
-
-        self.tree = _EvalTree.create(double_expanded_nospam_circuits_plus_scratch)
+            double_expanded_cir = base_double_expanded_circuits.get(cir, None)
+            if double_expanded_cir is None:
+                double_expanded_cir = cir.expand_subcircuits()  # expand sub-circuits for a more efficient tree
+            double_expanded_nospam_circuits_plus_scratch[i] = double_expanded_cir
+            self._double_expanded_circuits[cir] = double_expanded_cir
+
+        if base_atom is not None:
+            self.tree = base_atom.tree.create_reusing(double_expanded_nospam_circuits_plus_scratch)
+        else:
+            self.tree = _EvalTree.create(double_expanded_nospam_circuits_plus_scratch)
         #print("Atom tree: %d circuits => tree of size %d" % (len(expanded_nospam_circuits), len(self.tree)))
 
         self._num_nonscratch_tree_items = len(expanded_nospam_circuits)  # put this in EvalTree?
@@ -170,6 +199,12 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
 
         super().__init__(element_slice, num_elements)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_double_expanded_circuits', None)  # as large as the circuits themselves, so rebuilt when needed
+        state.pop('_instrument_expansions', None)
+        return state
+
     def nonscratch_cache_view(self, a, axis=None):
         """
         Create a view of array `a` restricting it to only the *final* results computed by this tree.
@@ -271,11 +306,22 @@ class MatrixCOPALayout(_DistributableCOPALayout):
     verbosity : int or VerbosityPrinter
         Determines how much output to send to stdout.  0 means no output, higher
         integers mean more output.
+
+    base_layout : MatrixCOPALayout, optional
+        A previously-created layout, typically for a subset or a superset of `circuits`,
+        whose work (e.g. its evaluation tree) is reused when possible.  This is only possible
+        when both layouts have a single atom.
+
+    cache_dir : str, optional
+        A directory in which to store this layout's atoms (and its division of the circuits
+        into atoms), so that later layouts for the same circuits, model structure and data set
+        can load rather than recreate them.  See :class:`LayoutCache`.
     """
 
     def __init__(self, circuits, model, dataset=None, num_sub_trees=None, num_tree_processors=1,
                  num_param_dimension_processors=(), param_dimensions=(),
-                 param_dimension_blk_sizes=(), resource_alloc=None, verbosity=0):
+                 param_dimension_blk_sizes=(), resource_alloc=None, verbosity=0, base_layout=None,
+                 cache_dir=None):
 
         #OUTDATED: TODO - revise this:
         # 1. pre-process => get complete circuits => spam-tuples list for each no-spam circuit (no expanding yet)
@@ -303,16 +349,19 @@ class MatrixCOPALayout(_DistributableCOPALayout):
                 circuits_by_unique_nospam_circuits[nospam_c] = [i]
         unique_nospam_circuits = list(circuits_by_unique_nospam_circuits.keys())
 
+        layout_cache = _LayoutCache(cache_dir, type(self), unique_circuits, ds_circuits, model, dataset,
+                                    (num_sub_trees,))
+
         # Split circuits into groups that will make good subtrees (all procs do this)
-        max_sub_tree_size = None  # removed from being an argument (unused)
-        if (num_sub_trees is not None and num_sub_trees > 1) or max_sub_tree_size is not None:
-            circuit_tree = _EvalTree.create(unique_nospam_circuits)
-            groups, helpful_scratch = circuit_tree.find_splitting(len(unique_nospam_circuits),
-                                                                  max_sub_tree_size, num_sub_trees, verbosity - 1)
-            #print("%d circuits => tree of size %d" % (len(unique_nospam_circuits), len(circuit_tree)))
-        else:
-            groups = [set(range(len(unique_nospam_circuits)))]
-            helpful_scratch = [set()]
+        def _create_groups():
+            max_sub_tree_size = None  # removed from being an argument (unused)
+            if (num_sub_trees is not None and num_sub_trees > 1) or max_sub_tree_size is not None:
+                circuit_tree = _EvalTree.create(unique_nospam_circuits)
+                return circuit_tree.find_splitting(len(unique_nospam_circuits),
+                                                   max_sub_tree_size, num_sub_trees, verbosity - 1)
+            else:
+                return [set(range(len(unique_nospam_circuits)))], [set()]
+        groups, helpful_scratch = layout_cache.get('groups', _create_groups)
         # (elements of `groups` contain indices into `unique_nospam_circuits`)
 
         # Divide `groups` into num_tree_processors roughly equal sets (each containing
@@ -334,13 +383,19 @@ class MatrixCOPALayout(_DistributableCOPALayout):
         #                                       elindex_outcome_tuples))
         #    offset += my_atoms[-1].num_elements
 
+        base_atom = base_layout.atoms[0] if (base_layout is not None and len(base_layout.atoms) == 1
+                                             and len(groups) == 1) else None
+
         def _create_atom(args):
-            group, helpful_scratch_group = args
-            return _MatrixCOPALayoutAtom(unique_complete_circuits, unique_nospam_circuits,
-                                         circuits_by_unique_nospam_circuits, ds_circuits,
-                                         group, helpful_scratch_group, model, dataset)
+            iAtom, group, helpful_scratch_group = args
+
+            def create():
+                return _MatrixCOPALayoutAtom(unique_complete_circuits, unique_nospam_circuits,
+                                             circuits_by_unique_nospam_circuits, ds_circuits,
+                                             group, helpful_scratch_group, model, dataset, base_atom)
+            return layout_cache.get('atom%d' % iAtom, create)
 
         super().__init__(circuits, unique_circuits, to_unique, unique_complete_circuits,
-                         _create_atom, list(zip(groups, helpful_scratch)), num_tree_processors,
+                         _create_atom, list(zip(range(len(groups)), groups, helpful_scratch)), num_tree_processors,
                          num_param_dimension_processors, param_dimensions,
                          param_dimension_blk_sizes, resource_alloc, verbosity)
@@ -10,7 +10,9 @@ Defines the PrefixTable class.
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
-import collections as _collections
+import heapq as _heapq
+
+import numpy as _np
 
 from pygsti.circuits.circuit import SeparatePOVMCircuit as _SeparatePOVMCircuit
 
@@ -38,6 +40,17 @@ class PrefixTable(object):
         `iDest` is always in the range [0,len(circuits_to_evaluate)-1], and
         indexes the result computed for each of the circuits.
 
+        Parameters
+        ----------
+        circuits_to_evaluate : list
+            The circuits (or :class:`SeparatePOVMCircuit` objects) to evaluate.
+
+        max_cache_size : int or None
+            The maximum number of (prefix) states that may be cached, which
+            is a hard limit on the cache's memory.  The cached prefixes are
+            those that save the most state-propagation ("apply") operations.
+            If None, every prefix that saves applies is cached.
+
         Returns
         -------
         tuple
@@ -45,69 +58,46 @@ class PrefixTable(object):
             of tuples as given above and `cache_size` is the total size of the state
             cache used to hold intermediate results.
         """
-        #Sort the operation sequences "alphabetically", so that it's trivial to find common prefixes
-        circuits_to_evaluate_fastlookup = {i: cir for i, cir in enumerate(circuits_to_evaluate)}
-        circuits_to_sort_by = [cir.circuit_without_povm if isinstance(cir, _SeparatePOVMCircuit) else cir
-                               for cir in circuits_to_evaluate]  # always Circuits - not SeparatePOVMCircuits
-        sorted_circuits_to_sort_by = sorted(list(enumerate(circuits_to_sort_by)), key=lambda x: x[1])
-        sorted_circuits_to_evaluate = [(i, circuits_to_evaluate_fastlookup[i]) for i, _ in sorted_circuits_to_sort_by]
-
-        distinct_line_labels = set([cir.line_labels for cir in circuits_to_sort_by])
-        if len(distinct_line_labels) == 1:  # if all circuits have the *same* line labels, we can just compare tuples
-            circuit_reps_to_compare_and_lengths = {i: (cir.layertup, len(cir))
-                                                   for i, cir in enumerate(circuits_to_sort_by)}
-        else:
-            circuit_reps_to_compare_and_lengths = {i: (cir, len(cir)) for i, cir in enumerate(circuits_to_sort_by)}
-
-        if max_cache_size is None or max_cache_size > 0:
-            #CACHE assessment pass: figure out what's worth keeping in the cache.
-            # In this pass, we cache *everything* and keep track of how many times each
-            # original index (after it's cached) is utilized as a prefix for another circuit.
-            # Not: this logic could be much better, e.g. computing a cost savings for each
-            #  potentially-cached item and choosing the best ones, and proper accounting
-            #  for chains of cached items.
-            cacheIndices = []  # indices into circuits_to_evaluate of the results to cache
-            cache_hits = _collections.defaultdict(lambda: 0)
-
-            for i, _ in sorted_circuits_to_evaluate:
-                circuit, L = circuit_reps_to_compare_and_lengths[i]  # can be a Circuit or a label tuple
-                for cached_index in reversed(cacheIndices):
-                    candidate, Lc = circuit_reps_to_compare_and_lengths[cached_index]
-                    if L >= Lc > 0 and circuit[0:Lc] == candidate:  # a cache hit!
-                        cache_hits[cached_index] += 1
-                        break  # stop looking through cache
-                cacheIndices.append(i)  # cache *everything* in this pass
-
-        # Build prefix table: construct list, only caching items with hits > 0 (up to max_cache_size)
-        cacheIndices = []  # indices into circuits_to_evaluate of the results to cache
+        circuits_to_index_by = [cir.circuit_without_povm if isinstance(cir, _SeparatePOVMCircuit) else cir
+                                for cir in circuits_to_evaluate]  # always Circuits - not SeparatePOVMCircuits
+
+        #Build a trie of the circuits' layers, so that common prefixes are common ancestor nodes.  Circuits
+        # with different line labels get separate tries, as their layers aren't comparable.
+        trie = _PrefixTrie()
+        roots = {}
+        for i, cir in enumerate(circuits_to_index_by):
+            root = roots.get(cir.line_labels, None)
+            if root is None: root = roots[cir.line_labels] = trie.add_node(None, 0)
+            trie.add_circuit(root, cir.layertup, i)
+
+        #CACHE assessment pass: figure out what's worth keeping in the cache.
+        cached_nodes = trie.select_cached_nodes(max_cache_size) \
+            if (max_cache_size is None or max_cache_size > 0) else set()
+
+        # Build prefix table by walking each trie depth-first, so that cached prefixes are
+        # computed before the circuits that start from them.
         table_contents = []
-        curCacheSize = 0
-
-        for i, circuit in sorted_circuits_to_evaluate:
-            circuit_rep, L = circuit_reps_to_compare_and_lengths[i]
-
-            #find longest existing prefix for circuit by working backwards
-            # and finding the first string that *is* a prefix of this string
-            # (this will necessarily be the longest prefix, given the sorting)
-            for i_in_cache in range(curCacheSize - 1, -1, -1):  # from curCacheSize-1 -> 0
-                candidate, Lc = circuit_reps_to_compare_and_lengths[cacheIndices[i_in_cache]]
-                if L >= Lc > 0 and circuit_rep[0:Lc] == candidate:  # ">=" allows for duplicates
-                    iStart = i_in_cache  # an index into the *cache*, not into circuits_to_evaluate
-                    remaining = circuit[Lc:]  # *always* a SeparatePOVMCircuit or Circuit
-                    break
-            else:  # no break => no prefix
-                iStart = None
-                remaining = circuit[:]
-
-            # if/where this string should get stored in the cache
-            if (max_cache_size is None or curCacheSize < max_cache_size) and cache_hits.get(i, 0) > 0:
-                iCache = len(cacheIndices)
-                cacheIndices.append(i); curCacheSize += 1
-            else:  # don't store in the cache
-                iCache = None
-
-            #Add instruction for computing this circuit
-            table_contents.append((i, iStart, remaining, iCache))
+        node_cache_indices = {}  # cache indices of the cached trie nodes
+
+        for root in roots.values():
+            stack = [(root, None, 0)]  # (node, cache index of nearest cached ancestor, depth of that ancestor)
+            while stack:
+                node, iStart, Lc = stack.pop()
+                for i in trie.ends[node]:
+                    circuit = circuits_to_evaluate[i]
+                    if node in node_cache_indices:  # a duplicate of a cached circuit: nothing left to apply
+                        table_contents.append((i, node_cache_indices[node], circuit[trie.depth[node]:], None))
+                    elif node in cached_nodes:  # compute from the nearest cached prefix & cache the result
+                        node_cache_indices[node] = len(node_cache_indices)
+                        table_contents.append((i, iStart, circuit[Lc:], node_cache_indices[node]))
+                    else:  # remainder is *always* a SeparatePOVMCircuit or Circuit
+                        table_contents.append((i, iStart, circuit[Lc:], None))
+
+                if node in node_cache_indices:
+                    iStart, Lc = node_cache_indices[node], trie.depth[node]
+                stack.extend([(child, iStart, Lc) for child in reversed(trie.children[node].values())])
+
+        curCacheSize = len(node_cache_indices)
 
         #FUTURE: could perform a second pass, and if there is
         # some threshold number of elements which share the
@@ -122,6 +112,27 @@ class PrefixTable(object):
     def __len__(self):
         return len(self.contents)
 
+    def row_levels(self):
+        """
+        The dependency level of each row of this table.
+
+        A row that starts from scratch (its `iStart` is `None`) has level 0, and a row that
+        starts from a cached state has a level one greater than the row that cached it.  Rows
+        with the same level don't depend on one another, and so can be evaluated concurrently
+        once all the rows of lower levels have been evaluated.
+
+        Returns
+        -------
+        numpy.ndarray
+            An integer array with an element for each row of `self.contents`.
+        """
+        levels = _np.empty(len(self.contents), _np.int64)
+        cache_levels = {}  # level of the row that writes each cache index
+        for k, (_, iStart, _, iCache) in enumerate(self.contents):
+            levels[k] = 0 if (iStart is None) else cache_levels[iStart] + 1
+            if iCache is not None: cache_levels[iCache] = levels[k]
+        return levels
+
     def find_splitting(self, max_sub_table_size=None, num_sub_tables=None, cost_metric="size", verbosity=0):
         """
         Find a partition of the indices of this table to define a set of sub-tables with the desire properties.
@@ -333,3 +344,95 @@ class PrefixTable(object):
 
         assert(sum(map(len, subTableSetList)) == len(self)), "sub-table sets are not disjoint!"
         return subTableSetList
+
+
+class _PrefixTrie(object):
+    """
+    A trie of circuit layers, used to find the common prefixes of a set of circuits.
+
+    Nodes are integers, and node data is held in lists indexed by node.  Each node
+    corresponds to a sequence of layers, i.e. the prefix of all the circuits whose
+    trie paths pass through it, and lists the circuits ending at it (`ends`).
+    """
+
+    def __init__(self):
+        self.children = []  # dicts of layer label => child node
+        self.parent = []
+        self.depth = []  # number of layers in the node's prefix
+        self.ends = []  # indices of the circuits ending at each node
+
+    def add_node(self, parent, depth):
+        self.children.append({}); self.parent.append(parent)
+        self.depth.append(depth); self.ends.append([])
+        return len(self.children) - 1
+
+    def add_circuit(self, root, layertup, index):
+        node = root
+        for depth, layer in enumerate(layertup, start=1):
+            child = self.children[node].get(layer, None)
+            if child is None:
+                child = self.children[node][layer] = self.add_node(node, depth)
+            node = child
+        self.ends[node].append(index)
+
+    def select_cached_nodes(self, max_cache_size):
+        """
+        Choose the circuit-ending nodes whose states should be cached.
+
+        Each cached node saves, for every circuit evaluated from it, the applies
+        needed to build its prefix from the nearest cached ancestor.  Nodes are chosen
+        greedily by these savings, accounting for the cached nodes they sit between,
+        until `max_cache_size` states are cached (or, if `max_cache_size` is None,
+        until caching more nodes saves nothing).
+
+        Parameters
+        ----------
+        max_cache_size : int or None
+            The maximum number of cached nodes.
+
+        Returns
+        -------
+        set
+        """
+        nNodes = len(self.children)
+        subtree_counts = [len(ends) for ends in self.ends]  # number of circuits ending at or below each node
+        for node in range(nNodes - 1, -1, -1):  # children always have larger indices than their parents
+            if self.parent[node] is not None: subtree_counts[self.parent[node]] += subtree_counts[node]
+
+        # number of circuits ending at or below each node that are evaluated from a cached descendant
+        covered_counts = [0] * nNodes
+        cached = set()
+
+        def nearest_cached_ancestor(node):
+            node = self.parent[node]
+            while node is not None and node not in cached: node = self.parent[node]
+            return node
+
+        def savings(node):
+            # every circuit at or below `node` - except the one whose state gets cached - that would be
+            # evaluated from `node` avoids re-applying the layers between `node` and its nearest cached ancestor.
+            ancestor = nearest_cached_ancestor(node)
+            nSaved = self.depth[node] - (0 if ancestor is None else self.depth[ancestor])
+            return nSaved * (subtree_counts[node] - covered_counts[node] - 1), ancestor
+
+        candidates = [(-self.depth[node] * (subtree_counts[node] - 1), node) for node in range(nNodes)
+                      if len(self.ends[node]) > 0 and subtree_counts[node] > 1]
+        _heapq.heapify(candidates)
+
+        # savings only decrease as nodes are cached, so a candidate whose (re-computed)
+        # savings are still the largest can be cached without re-checking the others
+        while candidates and (max_cache_size is None or len(cached) < max_cache_size):
+            _, node = _heapq.heappop(candidates)
+            saved, ancestor = savings(node)
+            if saved <= 0: continue
+            if candidates and saved < -candidates[0][0]:
+                _heapq.heappush(candidates, (-saved, node)); continue
+
+            # circuits below `node` are now evaluated from it rather than from higher up
+            newly_covered = subtree_counts[node] - covered_counts[node] - 1
+            cached.add(node)
+            other = self.parent[node]
+            while other is not None and other != ancestor:
+                covered_counts[other] += newly_covered; other = self.parent[other]
+            if ancestor is not None: covered_counts[ancestor] += newly_covered
+        return cached
@@ -1017,6 +1017,7 @@ class EvaluatedModelDatasetCircuitsStore(ModelDatasetCircuitsStore):
 
         #Note: don't add any tracked memory to self.resource_alloc, as none is used yet.
         self.probs = None
+        self._probs_paramvec = None  # the parameter vector self.probs was last computed at (None => unknown)
         self.dprobs = None
         self.jac = None
         self.v = None  # for time dependence - rename to objfn_terms or objfn_lsvec?
@@ -1124,6 +1125,21 @@ class MDCObjectiveFunction(ObjectiveFunction, EvaluatedModelDatasetCircuitsStore
         """
         return self.raw_objfn.chi2k_distributed_qty(objective_function_value)
 
+    def clear_probs_cache(self):
+        """
+        Forget which parameter vector the stored outcome probabilities correspond to.
+
+        Calls to :method:`lsvec`, :method:`dlsvec`, etc. reuse the probabilities computed by a previous
+        call at the same parameter vector.  This method must be called whenever the model's outcome
+        probabilities change *without* its parameter vector changing, e.g. when the path set of a
+        term-based forward simulator is updated, so that the probabilities are recomputed.
+
+        Returns
+        -------
+        None
+        """
+        self._probs_paramvec = None
+
     def lsvec(self, paramvec=None, oob_check=False):
         """
         Compute the least-squares vector of the objective function.
@@ -1172,6 +1188,29 @@ class MDCObjectiveFunction(ObjectiveFunction, EvaluatedModelDatasetCircuitsStore
         """
         raise NotImplementedError("Derived classes should implement this!")
 
+    def lsvec_and_dlsvec(self, paramvec=None):
+        """
+        Compute the least-squares vector and its derivative (jacobian) together.
+
+        This is equivalent to calling :method:`lsvec` and :method:`dlsvec` at the same
+        parameter vector, but derived classes may compute both from a single pass of
+        the forward simulator.
+
+        Parameters
+        ----------
+        paramvec : numpy.ndarray, optional
+            The vector of (model) parameters to evaluate the objective function at.
+            If `None`, then the model's current parameter vector is used (held internally).
+
+        Returns
+        -------
+        lsvec : numpy.ndarray
+            An array of shape `(nElements,)`, as returned by :method:`lsvec`.
+        dlsvec : numpy.ndarray
+            An array of shape `(nElements,nParams)`, as returned by :method:`dlsvec`.
+        """
+        return self.lsvec(paramvec), self.dlsvec(paramvec)
+
     def terms(self, paramvec=None):
         """
         Compute the terms of the objective function.
@@ -4267,6 +4306,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         if method_name == 'lsvec': return fsim._array_types_for_method('bulk_fill_probs') + ('e',)
         if method_name == 'terms': return fsim._array_types_for_method('bulk_fill_probs') + ('e',)
         if method_name == 'dlsvec': return fsim._array_types_for_method('bulk_fill_dprobs') + ('e', 'e')
+        if method_name == 'lsvec_and_dlsvec': return fsim._array_types_for_method('bulk_fill_dprobs') + ('e', 'e')
         if method_name == 'dterms': return fsim._array_types_for_method('bulk_fill_dprobs')
         if method_name == 'hessian_brute': return fsim._array_types_for_method('bulk_fill_hprobs') \
            + ('e', 'e', 'epp', 'epp', 'PP')
@@ -4280,7 +4320,8 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         # (not-intermediate). These are filled in other routines and *not* included in
         # the output of _array_types_for_method since these are *not* allocated in methods.
         array_types = ('e',) * 4  # self.probs + 3x add_count_vectors
-        if any([x in ('dlsvec', 'dterms', 'dpercircuit', 'jacobian', 'approximate_hessian', 'hessian')
+        if any([x in ('dlsvec', 'lsvec_and_dlsvec', 'dterms', 'dpercircuit', 'jacobian', 'approximate_hessian',
+                      'hessian')
                 for x in method_names]):
             array_types += ('ep',)
 
@@ -4724,6 +4765,19 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
             else:
                 _np.clip(self.probs, self.prob_clip_interval[0], self.prob_clip_interval[1], out=self.probs)
 
+    def _probs_are_current(self, paramvec):
+        """ Whether self.probs already holds the (clipped) probabilities computed at `paramvec` """
+        return self._probs_paramvec is not None and _np.array_equal(self._probs_paramvec, paramvec)
+
+    def _fill_dprobs_and_probs(self, dprobs, paramvec):
+        """ Fills `dprobs`, and also the (clipped) self.probs unless they are already current for `paramvec` """
+        if self._probs_are_current(paramvec):
+            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, None)
+        else:
+            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)
+            self._clip_probs()  # clips self.probs in place w/shared mem sync
+            self._probs_paramvec = paramvec.copy()
+
     #Objective Function
 
     def lsvec(self, paramvec=None, oob_check=False):
@@ -4773,8 +4827,10 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         shared_mem_leader = unit_ralloc.is_host_leader
 
         with self.resource_alloc.temporarily_track_memory(self.nelements):  # 'e' (lsvec)
-            self.model.sim.bulk_fill_probs(self.probs, self.layout)  # syncs shared mem
-            self._clip_probs()  # clips self.probs in place w/shared mem sync
+            if not self._probs_are_current(paramvec):
+                self.model.sim.bulk_fill_probs(self.probs, self.layout)  # syncs shared mem
+                self._clip_probs()  # clips self.probs in place w/shared mem sync
+                self._probs_paramvec = paramvec.copy()
 
             if oob_check:  # Only used for termgap cases
                 if not self.model.sim.bulk_test_if_paths_are_sufficient(self.layout, self.probs, verbosity=1):
@@ -4824,8 +4880,10 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         shared_mem_leader = unit_ralloc.is_host_leader
 
         with self.resource_alloc.temporarily_track_memory(self.nelements):  # 'e' (terms)
-            self.model.sim.bulk_fill_probs(self.probs, self.layout)
-            self._clip_probs()  # clips self.probs in place w/shared mem sync
+            if not self._probs_are_current(paramvec):
+                self.model.sim.bulk_fill_probs(self.probs, self.layout)
+                self._clip_probs()  # clips self.probs in place w/shared mem sync
+                self._probs_paramvec = paramvec.copy()
 
             if shared_mem_leader:
                 terms_no_penalty = self.raw_objfn.terms(self.probs, self.counts, self.total_counts, self.freqs)
@@ -4885,8 +4943,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
             #wrtSlice = resource_alloc.jac_slice if (resource_alloc.jac_distribution_method == "columns") \
             #           else slice(0, self.model.num_params)
 
-            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)  # wrtSlice)
-            self._clip_probs()  # clips self.probs in place w/shared mem sync
+            self._fill_dprobs_and_probs(dprobs, paramvec)  # wrtSlice)
 
             if shared_mem_leader:
                 if self.firsts is not None:
@@ -4919,6 +4976,30 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         self.raw_objfn.resource_alloc.profiler.add_time("JACOBIAN", tm)
         return self.jac
 
+    def lsvec_and_dlsvec(self, paramvec=None):
+        """
+        Compute the least-squares vector and its derivative (jacobian) together.
+
+        The outcome probabilities computed while filling the jacobian are reused to
+        compute the least-squares vector (including penalty terms and omitted-probability
+        corrections), so only a single forward-simulator pass is needed.
+
+        Parameters
+        ----------
+        paramvec : numpy.ndarray, optional
+            The vector of (model) parameters to evaluate the objective function at.
+            If `None`, then the model's current parameter vector is used (held internally).
+
+        Returns
+        -------
+        lsvec : numpy.ndarray
+            An array of shape `(nElements,)`, as returned by :method:`lsvec`.
+        dlsvec : numpy.ndarray
+            An array of shape `(nElements,nParams)`, as returned by :method:`dlsvec`.
+        """
+        jac = self.dlsvec(paramvec)  # also fills self.probs
+        return self.lsvec(), jac  # model is already at `paramvec`, and lsvec reuses self.probs
+
     def dterms(self, paramvec=None):
         """
         Compute the jacobian of the terms of the objective function.
@@ -4954,8 +5035,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         shared_mem_leader = unit_ralloc.is_host_leader
 
         with self.resource_alloc.temporarily_track_memory(2 * self.nelements):  # 'e' (dg_dprobs, lsvec)
-            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)
-            self._clip_probs()  # clips self.probs in place w/shared mem sync
+            self._fill_dprobs_and_probs(dprobs, paramvec)
 
             if shared_mem_leader:
                 if self.firsts is not None:
@@ -5027,6 +5107,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         with self.resource_alloc.temporarily_track_memory(2 * self.nelements + self.nelements * self.nparams**2):
             self.model.sim.bulk_fill_hprobs(hprobs, self.layout, self.probs, dprobs, dprobs2)
             self._clip_probs()  # clips self.probs in place w/shared mem sync
+            self._probs_paramvec = None  # (paramvec may be None) - just invalidate
 
             dg_dprobs = self.raw_objfn.dterms(self.probs, self.counts, self.total_counts, self.freqs)[:, None, None]
             d2g_dprobs2 = self.raw_objfn.hterms(self.probs, self.counts, self.total_counts, self.freqs)[:, None, None]
@@ -5089,6 +5170,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         with self.resource_alloc.temporarily_track_memory(self.nelements + self.nparams**2):
             self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)
             self._clip_probs()  # clips self.probs in place w/shared mem sync
+            self._probs_paramvec = None  # (paramvec may be None) - just invalidate
 
             d2g_dprobs2 = self.raw_objfn.hterms(self.probs, self.counts, self.total_counts, self.freqs)  # [:,None,None]
             #dprobs_dp1 = dprobs[:, :, None]  # (nelements,N,1)
@@ -13,6 +13,7 @@ pyGSTi Optimization Python Package
 from .arraysinterface import *
 from .customlm import *
 from .customsolve import *
+from .matrixfreelm import *
 # Import the most important/useful routines of each module into
 # the package namespace
 from .optimize import *
@@ -77,6 +77,16 @@ class UndistributedArraysInterface(ArraysInterface):
         """
         return _np.empty((self.num_global_elements, self.num_global_params), 'd')
 
+    def allocate_f(self):
+        """
+        Allocate an array for holding objective function terms (type `'e'`).
+
+        Returns
+        -------
+        numpy.ndarray or LocalNumpyArray
+        """
+        return _np.empty(self.num_global_elements, 'd')
+
     def deallocate_jtf(self, jtf):
         """
         Free an array for holding an objective function value (type `'jtf'`).
@@ -107,6 +117,16 @@ class UndistributedArraysInterface(ArraysInterface):
         """
         pass
 
+    def deallocate_f(self, f):
+        """
+        Free an array for holding objective function terms (type `'e'`).
+
+        Returns
+        -------
+        None
+        """
+        pass
+
     def global_num_elements(self):
         """
         The total number of objective function "elements".
@@ -511,6 +531,68 @@ class UndistributedArraysInterface(ArraysInterface):
         """
         jtf[:] = _np.dot(j.T, f)
 
+    def fill_jv(self, j, global_v, jv):
+        """
+        Compute dot(Jacobian, v) in supplied memory.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`).
+
+        global_v : numpy.ndarray
+            A global (not distributed) parameter-space vector, e.g. as produced by
+            :method:`allgather_x`.
+
+        jv : numpy.ndarray or LocalNumpyArray
+            Output array, type `e` (see :method:`allocate_f`).  Filled with `dot(j, v)` values.
+
+        Returns
+        -------
+        None
+        """
+        jv[:] = _np.dot(j, global_v)
+
+    def fill_jtj_diag(self, j, jtj_diag):
+        """
+        Compute the diagonal of dot(Jacobian.T, Jacobian) in supplied memory.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`).
+
+        jtj_diag : numpy.ndarray or LocalNumpyArray
+            Output array, type `jtf`.  Filled with the diagonal of `dot(j.T, j)`.
+
+        Returns
+        -------
+        None
+        """
+        jtj_diag[:] = _np.einsum('ij,ij->j', j, j)
+
+    def rank_one_update_jac(self, j, u, global_v):
+        """
+        Add the rank-one (outer product) matrix `outer(u, v)` to a Jacobian, in place.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`), updated in place.
+
+        u : numpy.ndarray or LocalNumpyArray
+            An element-space vector (type `e`, see :method:`allocate_f`).
+
+        global_v : numpy.ndarray
+            A global (not distributed) parameter-space vector, e.g. as produced by
+            :method:`allgather_x`.
+
+        Returns
+        -------
+        None
+        """
+        j += _np.outer(u, global_v)
+
     def fill_jtj(self, j, jtj, shared_mem_buf=None):
         """
         Compute dot(Jacobian.T, Jacobian) in supplied memory.
@@ -637,6 +719,21 @@ class DistributedArraysInterface(ArraysInterface):
         else:
             raise ValueError("Invlid lsvec_mode: %s" % str(self.lsvec_mode))
 
+    def allocate_f(self):
+        """
+        Allocate an array for holding objective function terms (type `'e'`).
+
+        Returns
+        -------
+        numpy.ndarray or LocalNumpyArray
+        """
+        if self.lsvec_mode == 'normal':
+            return self.layout.allocate_local_array('e', 'd', extra_elements=self.extra_elements)
+        elif self.lsvec_mode == 'percircuit':
+            return self.layout.allocate_local_array('c', 'd', extra_elements=self.extra_elements)
+        else:
+            raise ValueError("Invlid lsvec_mode: %s" % str(self.lsvec_mode))
+
     def deallocate_jtf(self, jtf):
         """
         Free an array for holding an objective function value (type `'jtf'`).
@@ -667,6 +764,16 @@ class DistributedArraysInterface(ArraysInterface):
         """
         self.layout.free_local_array(jac)  # cleaup shared memory, if it was used
 
+    def deallocate_f(self, f):
+        """
+        Free an array for holding objective function terms (type `'e'`).
+
+        Returns
+        -------
+        None
+        """
+        self.layout.free_local_array(f)  # cleaup shared memory, if it was used
+
     def global_num_elements(self):
         """
         The total number of objective function "elements".
@@ -1194,6 +1301,72 @@ class DistributedArraysInterface(ArraysInterface):
         """
         self.layout.fill_jtf(j, f, jtf)
 
+    def fill_jv(self, j, global_v, jv):
+        """
+        Compute dot(Jacobian, v) in supplied memory.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`).
+
+        global_v : numpy.ndarray
+            A global (not distributed) parameter-space vector, e.g. as produced by
+            :method:`allgather_x`.
+
+        jv : numpy.ndarray or LocalNumpyArray
+            Output array, type `e` (see :method:`allocate_f`).  Filled with `dot(j, v)` values.
+
+        Returns
+        -------
+        None
+        """
+        self.layout.fill_jv(j, global_v, jv)
+
+    def fill_jtj_diag(self, j, jtj_diag):
+        """
+        Compute the diagonal of dot(Jacobian.T, Jacobian) in supplied memory.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`).
+
+        jtj_diag : numpy.ndarray or LocalNumpyArray
+            Output array, type `jtf`.  Filled with the diagonal of `dot(j.T, j)`.
+
+        Returns
+        -------
+        None
+        """
+        self.layout.fill_jtj_diag(j, jtj_diag)
+
+    def rank_one_update_jac(self, j, u, global_v):
+        """
+        Add the rank-one (outer product) matrix `outer(u, v)` to a Jacobian, in place.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`), updated in place.
+
+        u : numpy.ndarray or LocalNumpyArray
+            An element-space vector (type `e`, see :method:`allocate_f`).
+
+        global_v : numpy.ndarray
+            A global (not distributed) parameter-space vector, e.g. as produced by
+            :method:`allgather_x`.
+
+        Returns
+        -------
+        None
+        """
+        # only the "leader" of the procs sharing this jacobian block modifies the (shared) memory
+        param_ralloc = self.layout.resource_alloc('param-processing')
+        if param_ralloc.is_host_leader:
+            j += _np.outer(u, global_v[self.layout.global_param_slice])
+        param_ralloc.host_comm_barrier()  # have non-leader procs wait for leaders to set shared mem
+
     def fill_jtj(self, j, jtj, shared_mem_buf=None):
         """
         Compute dot(Jacobian.T, Jacobian) in supplied memory.
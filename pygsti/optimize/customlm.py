@@ -205,11 +205,21 @@ class CustomLMOptimizer(Optimizer):
         by the objective function's `.terms()` and `.lsvec()` methods (`'normal'` mode) or the
         "per-circuit quantities" computed by the objective function's `.percircuit()` and
         `.lsvec_percircuit()` methods (`'percircuit'` mode).
+
+    max_broyden_updates : int, optional
+        The maximum number of consecutive iterations that may use a Jacobian obtained by a
+        Broyden rank-one update (from the observed change in the objective function terms)
+        instead of a true Jacobian evaluation.  Zero, the default, disables Broyden updates.
+
+    broyden_min_gain_ratio : float, optional
+        A Broyden update is only used when the gain ratio of the previous accepted step,
+        i.e. the actual over the predicted decrease in the objective, is at least this value.
     """
     def __init__(self, maxiter=100, maxfev=100, tol=1e-6, fditer=0, first_fditer=0, damping_mode="identity",
                  damping_basis="diagonal_values", damping_clip=None, use_acceleration=False,
                  uphill_step_threshold=0.0, init_munu="auto", oob_check_interval=0,
-                 oob_action="reject", oob_check_mode=0, serial_solve_proc_threshold=100, lsvec_mode="normal"):
+                 oob_action="reject", oob_check_mode=0, serial_solve_proc_threshold=100, lsvec_mode="normal",
+                 max_broyden_updates=0, broyden_min_gain_ratio=0.5):
 
         if isinstance(tol, float): tol = {'relx': 1e-8, 'relf': tol, 'f': 1.0, 'jac': tol, 'maxdx': 1.0}
         self.maxiter = maxiter
@@ -227,9 +237,12 @@ class CustomLMOptimizer(Optimizer):
         self.oob_action = oob_action
         self.oob_check_mode = oob_check_mode
         self.array_types = 3 * ('p',) + ('e', 'ep')  # see custom_leastsq fn "-type"s  -need to add 'jtj' type
+        if max_broyden_updates > 0: self.array_types += ('e', 'e')  # f_prev and broyden_u
         self.called_objective_methods = ('lsvec', 'dlsvec')  # the objective function methods we use (for mem estimate)
         self.serial_solve_proc_threshold = serial_solve_proc_threshold
         self.lsvec_mode = lsvec_mode
+        self.max_broyden_updates = max_broyden_updates
+        self.broyden_min_gain_ratio = broyden_min_gain_ratio
 
     def _to_nice_serialization(self):
         state = super()._to_nice_serialization()
@@ -251,7 +264,9 @@ class CustomLMOptimizer(Optimizer):
             'array_types': self.array_types,
             'called_objective_function_methods': self.called_objective_methods,
             'serial_solve_number_of_processors_threshold': self.serial_solve_proc_threshold,
-            'lsvec_mode': self.lsvec_mode
+            'lsvec_mode': self.lsvec_mode,
+            'maximum_broyden_updates': self.max_broyden_updates,
+            'broyden_minimum_gain_ratio': self.broyden_min_gain_ratio
         })
         return state
 
@@ -272,7 +287,9 @@ class CustomLMOptimizer(Optimizer):
                    oob_action=state['out_of_bounds_action'],
                    oob_check_mode=state['out_of_bounds_check_mode'],
                    serial_solve_proc_threshold=state['serial_solve_number_of_processors_threshold'],
-                   lsvec_mode=state.get('lsvec_mode', 'normal'))
+                   lsvec_mode=state.get('lsvec_mode', 'normal'),
+                   max_broyden_updates=state.get('maximum_broyden_updates', 0),
+                   broyden_min_gain_ratio=state.get('broyden_minimum_gain_ratio', 0.5))
 
     def run(self, objective, profiler, printer):
 
@@ -295,10 +312,12 @@ class CustomLMOptimizer(Optimizer):
         if self.lsvec_mode == 'normal':
             objective_func = objective.lsvec
             jacobian = objective.dlsvec
+            objective_and_jacobian = objective.lsvec_and_dlsvec
             nEls = objective.layout.num_elements + nExtra  # 'e' for array types
         elif self.lsvec_mode == 'percircuit':
             objective_func = objective.lsvec_percircuit
             jacobian = objective.dlsvec_percircuit
+            objective_and_jacobian = None
             nEls = objective.layout.num_circuits + nExtra  # 'e' for array types
         else:
             raise ValueError("Invalid `lsvec_mode`: %s" % str(self.lsvec_mode))
@@ -310,7 +329,8 @@ class CustomLMOptimizer(Optimizer):
 
         # Check memory limit can handle what custom_leastsq will "allocate"
         nP = len(x0)  # 'p' for array types
-        objective.resource_alloc.check_can_allocate_memory(3 * nP + nEls + nEls * nP + nP * nP)  # see array_types above
+        nBroyden = 2 * nEls if (self.max_broyden_updates > 0) else 0
+        objective.resource_alloc.check_can_allocate_memory(3 * nP + nEls + nEls * nP + nP * nP + nBroyden)  # see above
 
         from ..layouts.distlayout import DistributableCOPALayout as _DL
         ari = _ari.DistributedArraysInterface(objective.layout, self.lsvec_mode, nExtra) \
@@ -338,6 +358,9 @@ class CustomLMOptimizer(Optimizer):
             arrays_interface=ari,
             serial_solve_proc_threshold=self.serial_solve_proc_threshold,
             x_limits=x_limits,
+            max_broyden_updates=self.max_broyden_updates,
+            broyden_min_gain_ratio=self.broyden_min_gain_ratio,
+            obj_and_jac_fn=objective_and_jacobian,
             verbosity=printer - 1, profiler=profiler)
 
         printer.log("Least squares message = %s" % msg, 2)
@@ -381,7 +404,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                    damping_clip=None, use_acceleration=False, uphill_step_threshold=0.0,
                    init_munu="auto", oob_check_interval=0, oob_action="reject", oob_check_mode=0,
                    resource_alloc=None, arrays_interface=None, serial_solve_proc_threshold=100,
-                   x_limits=None, verbosity=0, profiler=None):
+                   x_limits=None, max_broyden_updates=0, broyden_min_gain_ratio=0.5, obj_and_jac_fn=None,
+                   linear_solver=None, verbosity=0, profiler=None):
     """
     An implementation of the Levenberg-Marquardt least-squares optimization algorithm customized for use within pyGSTi.
 
@@ -511,6 +535,31 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
         A (num_params, 2)-shaped array, holding on each row the (min, max) values for the corresponding
         parameter (element of the "x" vector).  If `None`, then no limits are imposed.
 
+    max_broyden_updates : int, optional
+        The maximum number of consecutive (outer) iterations that may use a Jacobian obtained
+        by a Broyden rank-one update of the previous one, from the observed change in `f`,
+        instead of calling `jac_fn`.  Zero disables Broyden updates.  A true Jacobian is always
+        recomputed before declaring convergence and after a step is rejected (but not when
+        `max_iter` is reached, so the returned JTJ may then be based on an updated Jacobian).
+
+    broyden_min_gain_ratio : float, optional
+        A Broyden update is only used when the gain ratio (actual over predicted decrease
+        in the sum of squares) of the previous accepted step is at least this value.
+
+    obj_and_jac_fn : function, optional
+        A function that accepts a 1D array of length N and returns the tuple
+        `(obj_fn(x), jac_fn(x))`, typically computing both from a single evaluation
+        of the underlying model.  When given (and `num_fd_iters == 0`), it is used to
+        evaluate the objective function and jacobian at `x0` together.
+
+    linear_solver : function, optional
+        A function `linear_solver(jac, jtj_diag, damping_diag, minus_jtf, dx)` that fills
+        `dx` with an (approximate) solution of `(J^T J + diag(damping_diag)) dx = minus_jtf`,
+        where `jtj_diag` holds the diagonal of `J^T J` and `damping_diag` is the damping
+        added to it (a float when `damping_mode == "identity"`).  When given, this function
+        is used for every linear solve and the `J^T J` matrix is never formed, so only
+        `damping_basis == "diagonal_values"` is supported and the returned JTJ is `None`.
+
     verbosity : int, optional
         Amount of detail to print to stdout.
 
@@ -538,7 +587,12 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     msg = ""
     converged = False
     global_x = x0.copy()
-    f = obj_fn(global_x)  # 'E'-type array
+    initial_jac_is_current = bool(obj_and_jac_fn is not None and num_fd_iters == 0)
+    if initial_jac_is_current:
+        f, Jac = obj_and_jac_fn(global_x)  # 'E'- and 'EP'-type arrays (objective fn mem)
+    else:
+        f = obj_fn(global_x)  # 'E'-type array
+        Jac = None
     norm_f = ari.norm2_f(f)  # _np.linalg.norm(f)**2
     half_max_nu = 2**62  # what should this be??
     tau = 1e-3
@@ -546,14 +600,28 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     nu = 2
     mu = 1  # just a guess - initialized on 1st iter and only used if rejected
 
+    if linear_solver is not None and damping_basis != "diagonal_values":
+        raise ValueError("A `linear_solver` can only be used with damping_basis == 'diagonal_values'")
+
     #Allocate potentially shared memory used in loop
-    JTJ = ari.allocate_jtj()
+    if linear_solver is None:
+        JTJ = ari.allocate_jtj()
+        jtj_buf = ari.allocate_jtj_shared_mem_buf()
+    else:
+        undamped_JTJ_diag = ari.allocate_jtf()  # the only part of JTJ a `linear_solver` needs
     JTf = ari.allocate_jtf()
     x = ari.allocate_jtf()
     #x_for_jac = ari.allocate_x_for_jac()
     if num_fd_iters > 0:
         fdJac = ari.allocate_jac()
 
+    if max_broyden_updates > 0:
+        f_prev = ari.allocate_f()  # f at the start of the previous outer iteration (f is objective fn mem)
+        broyden_u = ari.allocate_f()
+        global_x_prev = global_x.copy()
+    broyden_gain_ratio = None  # gain ratio of the last accepted step, when it can be used for a Broyden update
+    num_broyden_updates = 0  # number of consecutive Broyden-updated jacobians
+
     ari.allscatter_x(global_x, x)
 
     if x_limits is not None:
@@ -610,7 +678,6 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
         mu, nu = init_munu
     best_x_state = (mu, nu, norm_f, f.copy(), spow, None)  # need f.copy() b/c f is objfn mem
     rawJTJ_scratch = None
-    jtj_buf = ari.allocate_jtj_shared_mem_buf()
 
     try:
 
@@ -620,6 +687,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
             if len(msg) > 0:
                 break  # exit outer loop if an exit-message has been set
 
+            last_gain_ratio, broyden_gain_ratio = broyden_gain_ratio, None  # only valid directly after a step
+
             if norm_f < f_norm2_tol:
                 if oob_check_interval <= 1:
                     msg = "Sum of squares is at most %g" % f_norm2_tol
@@ -634,14 +703,29 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
 
             #printer.log("--- Outer Iter %d: norm_f = %g, mu=%g" % (k,norm_f,mu))
 
-            if profiler: profiler.memory_check("custom_leastsq: begin outer iter *before de-alloc*")
-            Jac = None
-
             if profiler: profiler.memory_check("custom_leastsq: begin outer iter")
 
+            use_broyden = bool(k > num_fd_iters and Jac is not None and last_gain_ratio is not None
+                               and last_gain_ratio >= broyden_min_gain_ratio
+                               and num_broyden_updates < max_broyden_updates)
+
             # unnecessary b/c global_x is already valid: ari.allgather_x(x, global_x)
-            if k >= num_fd_iters:
-                Jac = jac_fn(global_x)  # 'EP'-type, but doesn't actually allocate any more mem (!)
+            if use_broyden:
+                # Rank-one update of the previous Jac so that Jac_new * dx = df: Jac += (df - Jac dx) dx^T / |dx|^2
+                global_dx = global_x - global_x_prev
+                ari.fill_jv(Jac, global_dx, broyden_u)
+                broyden_u[:] = (f - f_prev - broyden_u) / _np.dot(global_dx, global_dx)
+                ari.rank_one_update_jac(Jac, broyden_u, global_dx)
+                num_broyden_updates += 1
+                if profiler: profiler.add_count("custom_leastsq: jacobian evaluations avoided")
+                printer.log("    (using Broyden-updated jacobian, %d consecutive)" % num_broyden_updates, 2)
+            elif k >= num_fd_iters:
+                if initial_jac_is_current:  # computed along with the initial f
+                    initial_jac_is_current = False
+                else:
+                    Jac = jac_fn(global_x)  # 'EP'-type, but doesn't actually allocate any more mem (!)
+                num_broyden_updates = 0
+                if profiler: profiler.add_count("custom_leastsq: jacobian evaluations")
             else:
                 # Note: x holds only number of "fine"-division params - need to use global_x, and
                 # Jac only holds a subset of the derivative and element columns and rows, respectively.
@@ -658,6 +742,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                         fdJac[:, i - pslice.start] = fd
                     #if comm is not None: comm.barrier()  # overkill for shared memory leader host barrier
                 Jac = fdJac
+                num_broyden_updates = 0
+
+            if max_broyden_updates > 0:
+                f_prev[:] = f; global_x_prev[:] = global_x  # for a Broyden update on the next iteration
 
             #DEBUG: compare with analytic jacobian (need to uncomment num_fd_iters DEBUG line above too)
             #Jac_analytic = jac_fn(x)
@@ -685,7 +773,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
             #JTJ, JTJ_shm = _mpit.mpidot(Jac.T, Jac, my_mpidot_qtys[0], my_mpidot_qtys[1],
             #                            my_mpidot_qtys[2], resource_alloc, JTJ, JTJ_shm)  # _np.dot(Jac.T,Jac) 'PP'
 
-            ari.fill_jtj(Jac, JTJ, jtj_buf)
+            if linear_solver is None:
+                ari.fill_jtj(Jac, JTJ, jtj_buf)
+            else:
+                ari.fill_jtj_diag(Jac, undamped_JTJ_diag)  # 'P'-type
             ari.fill_jtf(Jac, f, JTf)  # 'P'-type
 
             if profiler: profiler.add_time("custom_leastsq: dotprods", tm)
@@ -694,10 +785,11 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
             #assert(_np.isfinite(JTJ).all()), "Non-finite JTJ!" # NaNs tracking
             #assert(_np.isfinite(JTf).all()), "Non-finite JTf!" # NaNs tracking
 
-            idiag = ari.jtj_diag_indices(JTJ)
             norm_JTf = ari.infnorm_x(JTf)
             norm_x = ari.norm2_x(x)  # _np.linalg.norm(x)**2
-            undamped_JTJ_diag = JTJ[idiag].copy()  # 'P'-type
+            if linear_solver is None:
+                idiag = ari.jtj_diag_indices(JTJ)
+                undamped_JTJ_diag = JTJ[idiag].copy()  # 'P'-type
             #max_JTJ_diag = JTJ.diagonal().copy()
 
             JTf *= -1.0; minus_JTf = JTf  # use the same memory for -JTf below (shouldn't use JTf anymore)
@@ -734,6 +826,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                 #    JTJ.shape[0], _np.min(_np.abs(JTJ_evals)), _np.max(_np.abs(JTJ_evals)),
                 #                          num_large_svals, len(Jac_s)))
 
+            if norm_JTf < jac_norm_tol and use_broyden:
+                printer.log("    (recomputing jacobian before checking convergence)", 2)
+                continue  # confirm convergence with a true jacobian at the same x
+
             if norm_JTf < jac_norm_tol:
                 if oob_check_interval <= 1:
                     msg = "norm(jacobian) is at most %g" % jac_norm_tol
@@ -758,9 +854,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                         #tries to avoid making mu so large that dx is tiny and we declare victory prematurely
                 else:
                     mu, nu = init_munu
-                rawJTJ_scratch = JTJ.copy()  # allocates the memory for a copy of JTJ so only update mem elsewhere
+                if linear_solver is None:
+                    rawJTJ_scratch = JTJ.copy()  # allocates the memory for a copy of JTJ so only update mem elsewhere
                 best_x_state = mu, nu, norm_f, f.copy(), spow, rawJTJ_scratch  # update mu,nu,JTJ of initial best state
-            else:
+            elif linear_solver is None:
                 #on all other iterations, update JTJ of best_x_state if best_x == x, i.e. if we've just evaluated
                 # a previously accepted step that was deemed the best we've seen so far
                 if _np.allclose(x, best_x):
@@ -785,22 +882,19 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                         # dx = _np.dot(Jac_V, _np.diag(1 / reg_Jac_s**2), global_Jac_VT_mJTf
                         #But now we just compute reg_Jac_s here, and so the rest below.
                     else:
-                        # ok if assume fine-param-proc.size == 1 (otherwise need to sync setting local JTJ)
-                        JTJ[idiag] = undamped_JTJ_diag + mu  # augment normal equations
+                        add_to_diag = mu  # augment normal equations
 
                 elif damping_mode == 'JTJ':
                     if damping_basis == "singular_values":
                         reg_Jac_s = global_Jac_s + mu * dclip(global_Jac_s)
                     else:
                         add_to_diag = mu * dclip(undamped_JTJ_diag)
-                        JTJ[idiag] = undamped_JTJ_diag + add_to_diag  # ok if assume fine-param-proc.size == 1
 
                 elif damping_mode == 'invJTJ':
                     if damping_basis == "singular_values":
                         reg_Jac_s = global_Jac_s + mu * dclip(1.0 / global_Jac_s)
                     else:
                         add_to_diag = mu * dclip(1.0 / undamped_JTJ_diag)
-                        JTJ[idiag] = undamped_JTJ_diag + add_to_diag  # ok if assume fine-param-proc.size == 1
 
                 elif damping_mode == 'adaptive':
                     if damping_basis == "singular_values":
@@ -814,6 +908,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                 else:
                     raise ValueError("Invalid damping mode: %s" % damping_mode)
 
+                if damping_basis == "diagonal_values" and damping_mode != 'adaptive' and linear_solver is None:
+                    # ok if assume fine-param-proc.size == 1 (otherwise need to sync setting local JTJ)
+                    JTJ[idiag] = undamped_JTJ_diag + add_to_diag
+
                 #assert(_np.isfinite(JTJ).all()), "Non-finite JTJ (inner)!" # NaNs tracking
                 #assert(_np.isfinite(JTf).all()), "Non-finite JTf (inner)!" # NaNs tracking
 
@@ -825,11 +923,16 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                     if damping_basis == 'diagonal_values':
                         if damping_mode == 'adaptive':
                             for ii, add_to_diag in enumerate(add_to_diag_lst):
-                                JTJ[idiag] = undamped_JTJ_diag + add_to_diag  # ok if assume fine-param-proc.size == 1
-                                #dx_lst.append(_scipy.linalg.solve(JTJ, -JTf, sym_pos=True))
-                                #dx_lst.append(custom_solve(JTJ, -JTf, resource_alloc))
-                                _custom_solve(JTJ, minus_JTf, dx_lst[ii], ari, resource_alloc,
-                                              serial_solve_proc_threshold)
+                                if linear_solver is not None:
+                                    linear_solver(Jac, undamped_JTJ_diag, add_to_diag, minus_JTf, dx_lst[ii])
+                                else:
+                                    JTJ[idiag] = undamped_JTJ_diag + add_to_diag  # ok if fine-param-proc.size == 1
+                                    #dx_lst.append(_scipy.linalg.solve(JTJ, -JTf, sym_pos=True))
+                                    #dx_lst.append(custom_solve(JTJ, -JTf, resource_alloc))
+                                    _custom_solve(JTJ, minus_JTf, dx_lst[ii], ari, resource_alloc,
+                                                  serial_solve_proc_threshold)
+                        elif linear_solver is not None:
+                            linear_solver(Jac, undamped_JTJ_diag, add_to_diag, minus_JTf, dx)
                         else:
                             #dx = _scipy.linalg.solve(JTJ, -JTf, sym_pos=True)
                             _custom_solve(JTJ, minus_JTf, dx, ari, resource_alloc, serial_solve_proc_threshold)
@@ -875,7 +978,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                         ari.fill_jtf(Jac, df2, JTdf2)
                         JTdf2 *= -0.5  # keep using JTdf2 memory in solve call below
                         #dx2 = _scipy.linalg.solve(JTJ, -0.5 * JTdf2, sym_pos=True)  # Note: JTJ not init w/'adaptive'
-                        _custom_solve(JTJ, JTdf2, dx2, ari, resource_alloc, serial_solve_proc_threshold)
+                        if linear_solver is not None:
+                            linear_solver(Jac, undamped_JTJ_diag, add_to_diag, JTdf2, dx2)
+                        else:
+                            _custom_solve(JTJ, JTdf2, dx2, ari, resource_alloc, serial_solve_proc_threshold)
                         dx1[:] = dx[:]
                         dx += dx2  # add acceleration term to dx
                     except _scipy.linalg.LinAlgError:
@@ -985,6 +1091,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                     #MEM if profiler: profiler.memory_check("custom_leastsq: mid inner loop")
                     #print("DB: new_x = ", new_x)
 
+                    if norm_dx < (rel_xtol**2) * norm_x and use_broyden:
+                        f[:] = f_prev  # restore f, as it may have been overwritten (e.g. by acceleration term)
+                        break  # confirm convergence with a true jacobian at the same x (on the next outer iter)
+
                     if norm_dx < (rel_xtol**2) * norm_x:  # and mu < MU_TOL2:
                         if oob_check_interval <= 1:
                             msg = "Relative change, |dx|/|x|, is at most %g" % rel_xtol
@@ -1142,7 +1252,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
 
                         if dL / norm_f < rel_ftol and dF >= 0 and dF / norm_f < rel_ftol \
                            and dF / dL < 2.0 and accel_ratio <= alpha:
-                            if oob_check_interval <= 1:  # (if 0 then no oob checking is done)
+                            if use_broyden:  # confirm convergence with a true jacobian at the same x (next outer iter)
+                                f[:] = f_prev  # restore f, as obj_fn may have overwritten it
+                                break
+                            elif oob_check_interval <= 1:  # (if 0 then no oob checking is done)
                                 msg = "Both actual and predicted relative reductions in the" + \
                                     " sum of squares are at most %g" % rel_ftol
                                 converged = True; break
@@ -1202,6 +1315,7 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                                 printer.log("      Accepted%s! gain ratio=%g  mu * %g => %g"
                                             % (" UPHILL" if uphill_ok else "", dF / dL, mu_factor, mu), 2)
                                 last_accepted_dx = dx.copy()
+                                broyden_gain_ratio = dF / dL
                                 if new_x_is_known_inbounds and norm_f < min_norm_f:
                                     min_norm_f = norm_f
                                     best_x[:] = x[:]
@@ -1231,6 +1345,11 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                 # if this point is reached, either the linear solve failed
                 # or the error did not reduce.  In either case, reject increment.
 
+                if use_broyden:  # the step may be bad b/c of the approximate jacobian - recompute it at the same x
+                    printer.log("      Rejected%s with Broyden-updated jacobian - recomputing jacobian" % reject_msg, 2)
+                    f[:] = f_prev  # restore f, as obj_fn may have overwritten it
+                    break
+
                 #Increase damping (mu), then increase damping factor to
                 # accelerate further damping increases.
                 mu *= nu
@@ -1262,10 +1381,13 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     if comm is not None:
         comm.barrier()  # Just to be safe, so procs stay synchronized and we don't free anything too soon
 
-    ari.deallocate_jtj(JTJ)
+    if linear_solver is None:
+        ari.deallocate_jtj(JTJ)
+        ari.deallocate_jtj_shared_mem_buf(jtj_buf)
+    else:
+        ari.deallocate_jtf(undamped_JTJ_diag)
     ari.deallocate_jtf(JTf)
     ari.deallocate_jtf(x)
-    ari.deallocate_jtj_shared_mem_buf(jtj_buf)
     #ari.deallocate_x_for_jac(x_for_jac)
 
     if x_limits is not None:
@@ -1290,6 +1412,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     if num_fd_iters > 0:
         ari.deallocate_jac(fdJac)
 
+    if max_broyden_updates > 0:
+        ari.deallocate_f(f_prev)
+        ari.deallocate_f(broyden_u)
+
     ari.allgather_x(best_x, global_x)
     ari.deallocate_jtf(best_x)
 
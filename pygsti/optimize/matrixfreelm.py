@@ -0,0 +1,296 @@
+"""
+A matrix-free implementation of the Levenberg-Marquardt Algorithm
+"""
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import numpy as _np
+
+from pygsti.optimize import arraysinterface as _ari
+from pygsti.optimize.customlm import Optimizer as _Optimizer
+from pygsti.optimize.customlm import OptimizerResult as _OptimizerResult
+from pygsti.optimize.customlm import custom_leastsq as _custom_leastsq
+
+
+class MatrixFreeLMOptimizer(_Optimizer):
+    """
+    A Levenberg-Marquardt optimizer that never forms the `J^T J` matrix.
+
+    This runs :func:`custom_leastsq`, but each damped normal-equation system,
+    `(J^T J + mu D) dx = -J^T f`, is solved approximately using a diagonally (Jacobi)
+    preconditioned conjugate gradient method that only requires Jacobian-vector
+    products `J v` and `J^T w`.  This avoids the `O(N^2)` memory and `O(N^3)`
+    linear-solve costs of :class:`CustomLMOptimizer` (where `N` is the number of
+    model parameters), which dominate for models with many (e.g. 10k+) parameters.
+
+    Parameters
+    ----------
+    maxiter : int, optional
+        The maximum number of (outer) interations.
+
+    maxfev : int, optional
+        The maximum function evaluations.
+
+    tol : float or dict, optional
+        The tolerance, specified as a single float or as a dict
+        with keys `{'relx', 'relf', 'jac', 'maxdx'}`.  A single
+        float sets the `'relf'` and `'jac'` elemments and leaves
+        the others at their default values.
+
+    fditer : int optional
+        Internally compute the Jacobian using a finite-difference method
+        for the first `fditer` iterations.  This is useful when the initial
+        point lies at a special or singular point where the analytic Jacobian
+        is misleading.
+
+    first_fditer : int, optional
+        Number of finite-difference iterations applied to the first
+        stage of the optimization (only).  Unused.
+
+    damping_mode : {'identity', 'JTJ', 'invJTJ', 'adaptive'}
+        How damping is applied.  `'identity'` means that the damping parameter mu
+        multiplies the identity matrix.  `'JTJ'` means that mu multiplies the
+        diagonal values of the JTJ matrix, whereas `'invJTJ'` means mu multiplies
+        the reciprocals of these values instead.  The `'adaptive'` mode adaptively
+        chooses a damping strategy.
+
+    damping_clip : tuple, optional
+        A 2-tuple giving upper and lower bounds for the values that mu multiplies.
+        If `damping_mode == "identity"` then this argument is ignored.  If None,
+        then no clipping is applied.
+
+    init_munu : tuple, optional
+        If not None, a (mu, nu) tuple of 2 floats giving the initial values
+        for mu and nu.
+
+    cg_tol : float, optional
+        The relative residual tolerance of the inner conjugate gradient solve, i.e.
+        the solve stops once `|r| <= cg_tol * |J^T f|`.
+
+    cg_maxiter : int, optional
+        The maximum number of conjugate gradient iterations per linear solve.  If
+        `None`, the number of model parameters is used.
+
+    lsvec_mode : {'normal', 'percircuit'}
+        Whether the terms used in the least-squares optimization are the "elements" as computed
+        by the objective function's `.terms()` and `.lsvec()` methods (`'normal'` mode) or the
+        "per-circuit quantities" computed by the objective function's `.percircuit()` and
+        `.lsvec_percircuit()` methods (`'percircuit'` mode).
+
+    max_broyden_updates : int, optional
+        The maximum number of consecutive iterations that may use a Jacobian obtained by a
+        Broyden rank-one update (from the observed change in the objective function terms)
+        instead of a true Jacobian evaluation.  Zero, the default, disables Broyden updates.
+
+    broyden_min_gain_ratio : float, optional
+        A Broyden update is only used when the gain ratio of the previous accepted step,
+        i.e. the actual over the predicted decrease in the objective, is at least this value.
+    """
+    def __init__(self, maxiter=100, maxfev=100, tol=1e-6, fditer=0, first_fditer=0, damping_mode="identity",
+                 damping_clip=None, init_munu="auto", cg_tol=1e-4, cg_maxiter=None, lsvec_mode="normal",
+                 max_broyden_updates=0, broyden_min_gain_ratio=0.5):
+
+        if isinstance(tol, float): tol = {'relx': 1e-8, 'relf': tol, 'f': 1.0, 'jac': tol, 'maxdx': 1.0}
+        self.maxiter = maxiter
+        self.maxfev = maxfev
+        self.tol = tol
+        self.fditer = fditer
+        self.first_fditer = first_fditer
+        self.damping_mode = damping_mode
+        self.damping_clip = damping_clip
+        self.init_munu = init_munu
+        self.cg_tol = cg_tol
+        self.cg_maxiter = cg_maxiter
+        self.array_types = 10 * ('p',) + 2 * ('e',) + ('ep',)  # see custom_leastsq & _precond_cg_solve "-type"s
+        if max_broyden_updates > 0: self.array_types += ('e', 'e')  # f_prev and broyden_u
+        self.called_objective_methods = ('lsvec', 'dlsvec')  # the objective function methods we use (for mem estimate)
+        self.lsvec_mode = lsvec_mode
+        self.max_broyden_updates = max_broyden_updates
+        self.broyden_min_gain_ratio = broyden_min_gain_ratio
+
+    def _to_nice_serialization(self):
+        state = super()._to_nice_serialization()
+        state.update({
+            'maximum_iterations': self.maxiter,
+            'maximum_function_evaluations': self.maxfev,
+            'tolerance': self.tol,
+            'number_of_finite_difference_iterations': self.fditer,
+            'number_of_first_stage_finite_difference_iterations': self.first_fditer,
+            'damping_mode': self.damping_mode,
+            'damping_clip': self.damping_clip,
+            'initial_mu_and_nu': self.init_munu,
+            'conjugate_gradient_tolerance': self.cg_tol,
+            'conjugate_gradient_maximum_iterations': self.cg_maxiter,
+            'array_types': self.array_types,
+            'called_objective_function_methods': self.called_objective_methods,
+            'lsvec_mode': self.lsvec_mode,
+            'maximum_broyden_updates': self.max_broyden_updates,
+            'broyden_minimum_gain_ratio': self.broyden_min_gain_ratio
+        })
+        return state
+
+    @classmethod
+    def _from_nice_serialization(cls, state):
+        return cls(maxiter=state['maximum_iterations'],
+                   maxfev=state['maximum_function_evaluations'],
+                   tol=state['tolerance'],
+                   fditer=state['number_of_finite_difference_iterations'],
+                   first_fditer=state['number_of_first_stage_finite_difference_iterations'],
+                   damping_mode=state['damping_mode'],
+                   damping_clip=state['damping_clip'],
+                   init_munu=state['initial_mu_and_nu'],
+                   cg_tol=state['conjugate_gradient_tolerance'],
+                   cg_maxiter=state['conjugate_gradient_maximum_iterations'],
+                   lsvec_mode=state.get('lsvec_mode', 'normal'),
+                   max_broyden_updates=state.get('maximum_broyden_updates', 0),
+                   broyden_min_gain_ratio=state.get('broyden_minimum_gain_ratio', 0.5))
+
+    def run(self, objective, profiler, printer):
+        """
+        Perform the optimization.
+
+        Parameters
+        ----------
+        objective : ObjectiveFunction
+            The objective function to optimize.
+
+        profiler : Profiler
+            A profiler to track resource usage.
+
+        printer : VerbosityPrinter
+            printer to use for sending output to stdout.
+        """
+        nExtra = objective.ex  # number of additional "extra" elements
+
+        if self.lsvec_mode == 'normal':
+            objective_func = objective.lsvec
+            jacobian = objective.dlsvec
+            objective_and_jacobian = objective.lsvec_and_dlsvec
+            nEls = objective.layout.num_elements + nExtra  # 'e' for array types
+        elif self.lsvec_mode == 'percircuit':
+            objective_func = objective.lsvec_percircuit
+            jacobian = objective.dlsvec_percircuit
+            objective_and_jacobian = None
+            nEls = objective.layout.num_circuits + nExtra  # 'e' for array types
+        else:
+            raise ValueError("Invalid `lsvec_mode`: %s" % str(self.lsvec_mode))
+
+        x0 = objective.model.to_vector()
+        x_limits = objective.model.parameter_bounds
+
+        # Check memory limit can handle what custom_leastsq will "allocate" - note there's no nP * nP term
+        nP = len(x0)  # 'p' for array types
+        nBroyden = 2 * nEls if (self.max_broyden_updates > 0) else 0
+        objective.resource_alloc.check_can_allocate_memory(10 * nP + 2 * nEls + nEls * nP + nBroyden)  # see above
+
+        from ..layouts.distlayout import DistributableCOPALayout as _DL
+        ari = _ari.DistributedArraysInterface(objective.layout, self.lsvec_mode, nExtra) \
+            if isinstance(objective.layout, _DL) else _ari.UndistributedArraysInterface(nEls, nP)
+
+        cg_maxiter = self.cg_maxiter if (self.cg_maxiter is not None) else max(nP, 1)
+        cg_arrays = (ari.allocate_jtf(), ari.allocate_jtf(), ari.allocate_jtf(), ari.allocate_jtf(),
+                     ari.allocate_f(), x0.copy())  # r, z, p, Ap, Jp, global_p
+
+        def cg_solve(jac, jtj_diag, damping_diag, minus_jtf, dx):
+            num_iters, rel_resid = _precond_cg_solve(jac, jtj_diag, damping_diag, minus_jtf, dx, ari,
+                                                     self.cg_tol, cg_maxiter, cg_arrays)
+            printer.log("    (conjugate gradient solve: %d iterations, relative residual %g)"
+                        % (num_iters, rel_resid), 3)
+
+        opt_x, converged, msg, mu, nu, norm_f, f, _ = _custom_leastsq(
+            objective_func, jacobian, x0,
+            max_iter=self.maxiter,
+            num_fd_iters=self.fditer,
+            f_norm2_tol=self.tol.get('f', 1.0),
+            jac_norm_tol=self.tol.get('jac', 1e-6),
+            rel_ftol=self.tol.get('relf', 1e-6),
+            rel_xtol=self.tol.get('relx', 1e-8),
+            max_dx_scale=self.tol.get('maxdx', 1.0),
+            damping_mode=self.damping_mode,
+            damping_clip=self.damping_clip,
+            init_munu=self.init_munu,
+            resource_alloc=objective.resource_alloc,
+            arrays_interface=ari,
+            x_limits=x_limits,
+            max_broyden_updates=self.max_broyden_updates,
+            broyden_min_gain_ratio=self.broyden_min_gain_ratio,
+            obj_and_jac_fn=objective_and_jacobian,
+            linear_solver=cg_solve,
+            verbosity=printer - 1, profiler=profiler)
+
+        for ar in cg_arrays[0:4]:
+            ari.deallocate_jtf(ar)
+        ari.deallocate_f(cg_arrays[4])
+
+        printer.log("Least squares message = %s" % msg, 2)
+        assert(converged), "Failed to converge: %s" % msg
+        current_v = objective.model.to_vector()
+        if not _np.allclose(current_v, opt_x):  # ensure the last model evaluation was at opt_x
+            objective_func(opt_x)
+
+        unpenalized_f = f[0:-objective.ex] if (objective.ex > 0) else f
+        unpenalized_normf = sum(unpenalized_f**2)  # objective function without penalty factors
+        chi2k_qty = objective.chi2k_distributed_qty(norm_f)
+
+        return _OptimizerResult(objective, opt_x, norm_f, None, unpenalized_normf, chi2k_qty,
+                                {'msg': msg, 'mu': mu, 'nu': nu, 'fvec': f})
+
+
+def _precond_cg_solve(jac, jtj_diag, damping_diag, b, dx, ari, rel_tol, max_iter, work_arrays):
+    """
+    Approximately solve `(J^T J + diag(damping_diag)) dx = b` with a Jacobi-preconditioned conjugate gradient method.
+
+    `damping_diag` may be a float, adding the same damping to each diagonal element.
+    `dx` is filled with the solution (starting from `dx = 0`).  `work_arrays` is a
+    tuple of pre-allocated `(r, z, p, Ap, Jp, global_p)` arrays, where the first four
+    are `'jtf'`-type, `Jp` is `'e'`-type and `global_p` is a global parameter vector.
+
+    Returns
+    -------
+    num_iters : int
+        The number of CG iterations performed.
+    rel_resid : float
+        The final residual norm relative to `|b|`.
+    """
+    r, z, p, Ap, Jp, global_p = work_arrays
+    precond = jtj_diag + damping_diag
+    precond[precond <= 0] = 1.0  # guard against all-zero Jacobian columns (when the damping is zero too)
+
+    dx[:] = 0.0
+    r[:] = b
+    z[:] = r / precond
+    p[:] = z
+    rz = ari.dot_x(r, z)
+    norm_b = _np.sqrt(ari.norm2_x(b))
+    if norm_b == 0.0: return 0, 0.0
+    rel_resid = 1.0
+
+    for i in range(max_iter):
+        ari.allgather_x(p, global_p)
+        ari.fill_jv(jac, global_p, Jp)
+        ari.fill_jtf(jac, Jp, Ap)
+        Ap += damping_diag * p  # Ap = (J^T J + diag(damping_diag)) p
+
+        pAp = ari.dot_x(p, Ap)
+        if pAp <= 0: return i, rel_resid  # breakdown: no more (numerical) descent in this direction
+        alpha = rz / pAp
+        dx += alpha * p
+        r -= alpha * Ap
+
+        rel_resid = _np.sqrt(ari.norm2_x(r)) / norm_b
+        if rel_resid <= rel_tol:
+            return i + 1, rel_resid
+
+        z[:] = r / precond
+        rz_new = ari.dot_x(r, z)
+        p *= rz_new / rz
+        p += z
+        rz = rz_new
+
+    return max_iter, rel_resid
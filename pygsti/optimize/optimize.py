@@ -403,54 +403,54 @@ def _fmin_particle_swarm(f, x0, err_crit, iter_max, printer, popsize=100, c1=2,
     scipy.optimize.Result object
         Includes members 'x', 'fun', 'success', and 'message'.
     """
-        
-        # Initialize the population
-        n = len(x0)
-        x = _np.zeros((popsize, n))
-        v = _np.zeros((popsize, n))
-        f = _np.zeros(popsize)
-        pbest = _np.zeros((popsize, n))
-        fbest = _np.zeros(popsize)
-        gbest = _np.zeros(n)
-        fgbest = _np.inf
-    
-        # Initialize the population
-        for i in range(popsize):
-            x[i] = x0 + _np.random.uniform(-1, 1, n)
-            v[i] = _np.random.uniform(-1, 1, n)
-            f[i] = f(x[i])
-            pbest[i] = x[i]
-            fbest[i] = f[i]
-            if f[i] < fgbest:
-                gbest = x[i]
-                fgbest = f[i]
-    
-        # Main loop
-        for i in range(iter_max):
-            for j in range(popsize):
-                v[j] += c1 * _np.random.uniform(0, 1, n) * (pbest[j] - x[j]) + \
-                    c2 * _np.random.uniform(0, 1, n) * (gbest - x[j])
-                x[j] += v[j]
-                f[j] = f(x[j])
-                if f[j] < fbest[j]:
-                    pbest[j] = x[j]
-                    fbest[j] = f[j]
-                    if f[j] < fgbest:
-                        gbest = x[j]
-                        fgbest = f[j]
-    
-            printer.log("Particle Swarm: iteration %d gives min = %f" % (i, fgbest))
-            if fgbest < err_crit: break
-    
-        solution = _optResult()
-        solution.x = gbest
-        solution.fun = fgbest
-        if i < iter_max:
-            solution.success = True
-        else:
-            solution.success = False
-            solution.message = "Maximum iterations exceeded"
-        return solution
+
+    # Initialize the population
+    n = len(x0)
+    x = _np.zeros((popsize, n))
+    v = _np.zeros((popsize, n))
+    f = _np.zeros(popsize)
+    pbest = _np.zeros((popsize, n))
+    fbest = _np.zeros(popsize)
+    gbest = _np.zeros(n)
+    fgbest = _np.inf
+
+    # Initialize the population
+    for i in range(popsize):
+        x[i] = x0 + _np.random.uniform(-1, 1, n)
+        v[i] = _np.random.uniform(-1, 1, n)
+        f[i] = f(x[i])
+        pbest[i] = x[i]
+        fbest[i] = f[i]
+        if f[i] < fgbest:
+            gbest = x[i]
+            fgbest = f[i]
+
+    # Main loop
+    for i in range(iter_max):
+        for j in range(popsize):
+            v[j] += c1 * _np.random.uniform(0, 1, n) * (pbest[j] - x[j]) + \
+                c2 * _np.random.uniform(0, 1, n) * (gbest - x[j])
+            x[j] += v[j]
+            f[j] = f(x[j])
+            if f[j] < fbest[j]:
+                pbest[j] = x[j]
+                fbest[j] = f[j]
+                if f[j] < fgbest:
+                    gbest = x[j]
+                    fgbest = f[j]
+
+        printer.log("Particle Swarm: iteration %d gives min = %f" % (i, fgbest))
+        if fgbest < err_crit: break
+
+    solution = _optResult()
+    solution.x = gbest
+    solution.fun = fgbest
+    if i < iter_max:
+        solution.success = True
+    else:
+        solution.success = False
+        solution.message = "Maximum iterations exceeded"
+    return solution
 
 
 def _fmin_evolutionary(f, x0, num_generations, num_individuals, printer):
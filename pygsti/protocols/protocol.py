@@ -645,6 +645,7 @@ class ExperimentDesign(_TreeNode):
         # 'text-circuit-list' - a text circuit list file
         # 'json' - a json file
         # 'pickle' - a python pickle file (use only if really needed!)
+        # 'npz' - a binary numpy archive holding an object's arrays (see pygsti.serialization.npz)
         typ = 'serialized-object' if isinstance(self.all_circuits_needing_data, _circuits.CircuitList) \
             else 'text-circuit-list'
         self.auxfile_types = {'all_circuits_needing_data': typ,
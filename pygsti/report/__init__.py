@@ -17,6 +17,7 @@ from .notebook import Notebook
 from .report import Report
 from .reportables import *
 from .workspace import Workspace
+from .deferred import compute_deferred_figures, serve_report
 
 from .factory import *
 from .vbplot import *
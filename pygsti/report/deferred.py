@@ -0,0 +1,191 @@
+"""
+Functions for completing HTML reports whose figure computation was deferred
+"""
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import functools as _functools
+import http.server as _http_server
+import os as _os
+import pickle as _pickle
+import webbrowser as _webbrowser
+from pathlib import Path as _Path
+
+from pygsti.report import workspace as _ws
+from pygsti.baseobjs import VerbosityPrinter as _VerbosityPrinter
+
+DEFERRED_ITEMS_FILENAME = 'deferred_items.pkl'
+
+
+def write_deferred_items(figures_dir, deferred_items):
+    """
+    Save the switched items of a report whose computation was deferred.
+
+    The items are saved, along with the workspace outputs they belong to (and
+    so the inputs needed to compute them), to a single file within the report's
+    figures directory.
+
+    Parameters
+    ----------
+    figures_dir : str or Path
+        The report's figures directory, into which the HTML files of the
+        deferred items are written once they are computed.
+
+    deferred_items : dict
+        A dictionary mapping the DOM ids of deferred items to `(output, index)`
+        tuples, as populated by the `deferred_items` render option of
+        :class:`WorkspaceOutput` objects.
+
+    Returns
+    -------
+    None
+    """
+    for output, _ in deferred_items.values():
+        output.options['deferred_items'] = None  # rendering is done; don't pickle the dictionary itself
+    with _ws._plotly_pickling():
+        with open(str(_Path(figures_dir) / DEFERRED_ITEMS_FILENAME), 'wb') as f:
+            _pickle.dump(deferred_items, f)
+
+
+def _load_deferred_items(figures_dir, ws):
+    filename = _Path(figures_dir) / DEFERRED_ITEMS_FILENAME
+    if not filename.exists(): return {}
+    with _ws._plotly_pickling():
+        with open(str(filename), 'rb') as f:
+            deferred_items = _pickle.load(f)
+    for output, _ in deferred_items.values():
+        output.ws = ws
+    return deferred_items
+
+
+def _write_deferred_item(figures_dir, div_id, deferred_items):
+    """ Compute and write the HTML file of a deferred item, returning whether it was written """
+    filename = _Path(figures_dir) / (div_id + '.html')
+    if filename.exists(): return False  # already computed
+    output, i = deferred_items[div_id]
+    content = output.render_deferred_item(i, div_id)
+    tmp_filename = filename.with_suffix('.html.tmp')
+    with open(str(tmp_filename), 'w') as f:
+        f.write(content)
+    _os.replace(str(tmp_filename), str(filename))  # so partially-written files are never served
+    return True
+
+
+def compute_deferred_figures(report_dir, div_ids=None, ws=None, verbosity=0):
+    """
+    Compute the deferred tables and plots of an HTML report.
+
+    This is a "pre-computation" pass, writing the HTML files of (some or all
+    of) a lazily-generated report's deferred items so the report can then be
+    viewed like any other report with `embed_figures=False`, i.e. without
+    :func:`serve_report`.  Items that have already been computed are skipped.
+
+    Parameters
+    ----------
+    report_dir : str or Path
+        The directory of an HTML report written with `lazy=True`.
+
+    div_ids : iterable, optional
+        The DOM ids of the items to compute.  If None, all deferred items are computed.
+
+    ws : Workspace, optional
+        The workspace used to compute the items.  Giving one with a `cache_dir`
+        allows results to be shared with other reports.
+
+    verbosity : int, optional
+        Amount of detail to print to stdout.
+
+    Returns
+    -------
+    list
+        The DOM ids of the items that were computed.
+    """
+    printer = _VerbosityPrinter.create_printer(verbosity)
+    figures_dir = _Path(report_dir) / 'figures'
+    ws = ws or _ws.Workspace()
+    deferred_items = _load_deferred_items(figures_dir, ws)
+    computed = []
+    for div_id in (deferred_items.keys() if div_ids is None else div_ids):
+        if _write_deferred_item(figures_dir, div_id, deferred_items):
+            printer.log("Computed %s" % div_id, 2)
+            computed.append(div_id)
+    printer.log("Computed %d of %d deferred items" % (len(computed), len(deferred_items)))
+    return computed
+
+
+class _DeferredReportRequestHandler(_http_server.SimpleHTTPRequestHandler):
+    """ Serves a report's files, computing each deferred item when it is first requested """
+
+    def __init__(self, *args, report=None, **kwargs):
+        self.report = report
+        super().__init__(*args, directory=report['dir'], **kwargs)
+
+    def do_GET(self):
+        parts = self.path.split('?')[0].strip('/').split('/')
+        if len(parts) == 2 and parts[0] == 'figures' and parts[1].endswith('.html'):
+            div_id = parts[1][:-len('.html')]
+            if div_id in self.report['items']:
+                try:
+                    if _write_deferred_item(self.report['figures_dir'], div_id, self.report['items']):
+                        self.report['printer'].log("Computed %s" % div_id, 2)
+                except Exception as e:
+                    self.send_error(500, "Failed to compute %s: %s" % (div_id, str(e)))
+                    return
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        self.report['printer'].log(format % args, 3)
+
+
+def serve_report(report_dir, port=8000, ws=None, auto_open=False, verbosity=1):
+    """
+    Serve an HTML report over HTTP, computing deferred items on demand.
+
+    The tables and plots of a report written with `lazy=True` are computed only
+    when they are first viewed, and are written to the report's directory so
+    they're computed only once.  This function blocks until interrupted
+    (e.g. by Ctrl-C).
+
+    Parameters
+    ----------
+    report_dir : str or Path
+        The directory of an HTML report written with `lazy=True`.
+
+    port : int, optional
+        The (local) port to serve the report on.
+
+    ws : Workspace, optional
+        The workspace used to compute the items.
+
+    auto_open : bool, optional
+        Whether to open the report in a web browser.
+
+    verbosity : int, optional
+        Amount of detail to print to stdout.
+
+    Returns
+    -------
+    None
+    """
+    printer = _VerbosityPrinter.create_printer(verbosity)
+    report_dir = _Path(report_dir).absolute()
+    figures_dir = report_dir / 'figures'
+    ws = ws or _ws.Workspace()
+    report = {'dir': str(report_dir), 'figures_dir': figures_dir, 'printer': printer,
+              'items': _load_deferred_items(figures_dir, ws)}
+
+    handler = _functools.partial(_DeferredReportRequestHandler, report=report)
+    with _http_server.HTTPServer(('localhost', port), handler) as server:
+        url = 'http://localhost:%d/main.html' % server.server_address[1]
+        printer.log("Serving report at %s (%d deferred items); press Ctrl-C to stop" % (url, len(report['items'])))
+        if auto_open: _webbrowser.open(url)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
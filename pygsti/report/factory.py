@@ -662,6 +662,15 @@ def create_standard_report(results, filename, title="auto",
         - cachefile : str, optional
             filename with cached workspace results
 
+        - cache_dir : str, optional
+            A directory of persistent workspace results, shared between report
+            builds, that is used when `ws` is None.  See :class:`Workspace`.
+
+        - num_processes : int, optional
+            The number of local processes to render the report's tables and
+            plots with, in addition to any division among the processors of
+            `comm`.  Defaults to 1.
+
         - linlogPercentile : float, optional
             Specifies the colorscale transition point for any logL or chi2 color
             box plots.  The lower `(100 - linlogPercentile)` percentile of the
@@ -734,7 +743,7 @@ def create_standard_report(results, filename, title="auto",
     """
 
     # Wrap a call to the new factory method
-    ws = ws or _ws.Workspace()
+    ws = ws or _ws.Workspace(cache_dir=(advanced_options or {}).get('cache_dir', None))
 
     report = construct_standard_report(
         results, title, confidence_level, comm, ws, advanced_options, verbosity
@@ -742,13 +751,15 @@ def create_standard_report(results, filename, title="auto",
 
     advanced_options = advanced_options or {}
     precision = advanced_options.get('precision', None)
+    num_processes = advanced_options.get('num_processes', 1)
 
     if filename is not None:
         if filename.endswith(".pdf"):
             report.write_pdf(
                 filename, build_options=advanced_options,
                 brevity=brevity, precision=precision,
-                auto_open=auto_open, verbosity=verbosity
+                auto_open=auto_open, comm=comm, verbosity=verbosity,
+                num_processes=num_processes
             )
         else:
             resizable = advanced_options.get('resizable', True)
@@ -761,7 +772,8 @@ def create_standard_report(results, filename, title="auto",
                 connected=connected, build_options=advanced_options,
                 brevity=brevity, precision=precision,
                 resizable=resizable, autosize=autosize,
-                single_file=single_file, verbosity=verbosity
+                single_file=single_file, verbosity=verbosity,
+                comm=comm, num_processes=num_processes
             )
 
     return ws
@@ -1136,6 +1148,10 @@ def construct_standard_report(results, title="auto",
         A dictionary of advanced options for which the default values are usually
         are fine.  Here are the possible keys of `advanced_options`:
 
+        - cache_dir : str, optional
+            A directory of persistent workspace results, shared between report
+            builds, that is used when `ws` is None.  See :class:`Workspace`.
+
         - linlogPercentile : float, optional
             Specifies the colorscale transition point for any logL or chi2 color
             box plots.  The lower `(100 - linlogPercentile)` percentile of the
@@ -1174,9 +1190,9 @@ def construct_standard_report(results, title="auto",
     """
 
     printer = _VerbosityPrinter.create_printer(verbosity, comm=comm)
-    ws = ws or _ws.Workspace()
-
     advanced_options = advanced_options or {}
+    ws = ws or _ws.Workspace(cache_dir=advanced_options.get('cache_dir', None))
+
     linlogPercentile = advanced_options.get('linlog percentile', 5)
     nmthreshold = advanced_options.get('nmthreshold', DEFAULT_NONMARK_ERRBAR_THRESHOLD)
     embed_figures = advanced_options.get('embed_figures', True)
@@ -589,7 +589,8 @@ def merge_jinja_template(qtys, output_filename, template_dir=None, template_name
 
 def merge_jinja_template_dir(qtys, output_dir, template_dir=None, template_name='main.html',
                              auto_open=False, precision=None, link_to=None, connected=False, toggles=None,
-                             render_math=True, resizable=True, autosize='none', embed_figures=True, verbosity=0):
+                             render_math=True, resizable=True, autosize='none', embed_figures=True, verbosity=0,
+                             deferred_items=None):
     """
     Renders `qtys` and merges them into the HTML files under `template_dir`, saving the output under `output_dir`.
 
@@ -659,6 +660,12 @@ def merge_jinja_template_dir(qtys, output_dir, template_dir=None, template_name=
     verbosity : int, optional
         Amount of detail to print to stdout.
 
+    deferred_items : dict, optional
+        If not None (and `embed_figures` is False), the switched items of
+        outputs whose computation was deferred are not computed, but are
+        added to this dictionary (see :class:`WorkspaceOutput`'s
+        `deferred_items` render option).
+
     Returns
     -------
     None
@@ -691,7 +698,7 @@ def merge_jinja_template_dir(qtys, output_dir, template_dir=None, template_name=
                                               use_loadable_items=embed_figures,
                                               resizable=resizable, autosize=autosize,
                                               output_dir=figDir, link_to=link_to,
-                                              precision=precision),
+                                              precision=precision, deferred_items=deferred_items),
                           link_to=link_to
                           )
 
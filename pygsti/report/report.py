@@ -12,13 +12,42 @@ Internal model of a report during generation
 
 import pickle as _pickle
 import time as _time
+from collections import OrderedDict as _OrderedDict
 from collections import defaultdict as _defaultdict
 from pathlib import Path as _Path
 
+from pygsti.report import deferred as _deferred
 from pygsti.report import merge_helpers as _merge
 from pygsti.report import workspace as _ws
 from pygsti.report.notebook import Notebook as _Notebook
 from pygsti.baseobjs import VerbosityPrinter as _VerbosityPrinter
+from pygsti.tools import mptools as _mpt
+
+
+def _render_figures(tasks, workspace, params, serialize=False):
+    """
+    Render a list of `(section, figure_name, figure_kwargs)` tasks.
+
+    Returns a list of `(figure, render_time)` tuples, pickled (with plotly
+    pickling enabled) when `serialize` is True so they can be sent between
+    processes.
+    """
+    rendered = []
+    for section, name, figure_kwargs in tasks:
+        t0 = _time.time()
+        figure = section.render_figure(name, workspace, **params, **figure_kwargs)
+        rendered.append((figure, _time.time() - t0))
+    return _serialize(rendered) if serialize else rendered
+
+
+def _serialize(obj):
+    with _ws._plotly_pickling():
+        return _pickle.dumps(obj)
+
+
+def _deserialize(serialized):
+    with _ws._plotly_pickling():
+        return _pickle.loads(serialized)
 
 
 # TODO this whole thing needs to be rewritten with different reports as derived classes
@@ -62,6 +91,12 @@ class Report:
     workspace : Workspace, optional
         A ``Workspace`` used for caching figure computation. By
         default, a new workspace will be used.
+
+    Attributes
+    ----------
+    section_timings : OrderedDict
+        The time, in seconds, spent rendering the figures of each section
+        (keyed by section class name) during the most recent build.
     """
     def __init__(self, templates, results, sections, flags,
                  global_qtys, report_params, build_defaults=None,
@@ -75,25 +110,86 @@ class Report:
         self._workspace = workspace or _ws.Workspace()
         self._build_defaults = build_defaults or {}
         self._pdf_available = pdf_available
+        self.section_timings = _OrderedDict()
 
-    def _build(self, build_options=None):
-        """ Render all sections to a map of report elements for templating """
+    def _build(self, build_options=None, num_processes=1, comm=None, printer=None):
+        """
+        Render all sections to a map of report elements for templating.
+
+        Rendering happens in two stages: first each section computes the
+        quantities shared by its figures (see :meth:`Section.prepare`), then all
+        the (mutually independent) figures are rendered.  When `num_processes > 1`
+        or `comm` is given, the figures are divided among processes - first
+        between the ranks of `comm`, then between `num_processes` local processes -
+        and gathered back, in order, onto every rank.  The time spent on each
+        section is recorded in `self.section_timings`.
+        """
         full_params = {
             'results': self._results,
             **self._report_params
         }
         full_params.update(self._build_defaults)
         full_params.update(build_options or {})
+        brevity = full_params.get('brevity', 0)
+
         qtys = self._global_qtys.copy()
+        self.section_timings = _OrderedDict([(section.__class__.__name__, 0.0) for section in self._sections])
+        all_figure_kwargs = []
         for section in self._sections:
-            qtys.update(section.render(self._workspace, **full_params))
+            t0 = _time.time()
+            section_qtys, figure_kwargs = section.prepare(self._workspace, **full_params)
+            self.section_timings[section.__class__.__name__] += _time.time() - t0
+            qtys.update(section_qtys)
+            all_figure_kwargs.append(figure_kwargs)
+
+        if comm is not None and comm.Get_size() > 1:
+            # Use the root's quantities everywhere, so that all figures refer to the same switchboards
+            qtys, full_params, all_figure_kwargs = _deserialize(
+                comm.bcast(_serialize((qtys, full_params, all_figure_kwargs)), root=0))
+
+        tasks = [(section, name, figure_kwargs)
+                 for section, figure_kwargs in zip(self._sections, all_figure_kwargs)
+                 for name in section.figure_names(brevity)]
+
+        if comm is None and num_processes == 1:
+            rendered = _render_figures(tasks, self._workspace, full_params)
+        else:
+            full_params['comm'] = None  # each figure is rendered by a single process
+            rank, nranks = (comm.Get_rank(), comm.Get_size()) if (comm is not None) else (0, 1)
+            my_tasks = tasks[rank::nranks]
+            nchunks = max(min(num_processes, len(my_tasks)), 1)
+            chunks = [my_tasks[k::nchunks] for k in range(nchunks)]  # round-robin, as figures vary in cost
+            serialized_chunks = _mpt.starmap_with_kwargs(_render_figures, nchunks, nchunks,
+                                                         [(chunk, self._workspace, full_params) for chunk in chunks],
+                                                         [{'serialize': True}] * nchunks)
+            my_rendered = [None] * len(my_tasks)
+            for k, serialized_chunk in enumerate(serialized_chunks):
+                my_rendered[k::nchunks] = _deserialize(serialized_chunk)
+
+            if comm is not None:
+                rendered = [None] * len(tasks)
+                for r, serialized_rendered in enumerate(comm.allgather(_serialize(my_rendered))):
+                    rendered[r::nranks] = _deserialize(serialized_rendered)
+            else:
+                rendered = my_rendered
+
+            for figure, _ in rendered:  # outputs computed in other processes don't carry a workspace
+                if isinstance(figure, _ws.WorkspaceOutput) and figure.ws is None:
+                    figure.ws = self._workspace
+
+        for (section, name, _), (figure, render_time) in zip(tasks, rendered):
+            qtys[name] = figure
+            self.section_timings[section.__class__.__name__] += render_time
 
+        if printer is not None:
+            for section_name, t in self.section_timings.items():
+                printer.log("Rendered %s in %.2fs" % (section_name, t), 2)
         return qtys
 
     def write_html(self, path, auto_open=False, link_to=None,
                    connected=False, build_options=None, brevity=0,
                    precision=None, resizable=True, autosize='initial',
-                   single_file=False, verbosity=0):
+                   single_file=False, verbosity=0, comm=None, num_processes=1, lazy=False):
         """
         Write this report to the disk as a collection of HTML documents.
 
@@ -159,9 +255,32 @@ class Report:
 
         verbosity : int, optional
             Amount of detail to print to stdout.
+
+        comm : mpi4py.MPI.Comm, optional
+            When not None, an MPI communicator for distributing the rendering
+            of the report's figures across multiple processors.
+
+        num_processes : int, optional
+            The number of local processes to render the report's figures with.
+
+        lazy : bool, optional
+            If True, the report's tables and plots are not computed (unless
+            their values are already cached) but are saved, along with their
+            inputs, for computation when they are first viewed.  Such reports
+            must be viewed using :func:`pygsti.report.serve_report` or completed
+            by :func:`pygsti.report.compute_deferred_figures`.  This requires
+            that the report was constructed with the `embed_figures` advanced
+            option set to False.
         """
 
         build_options = build_options or {}
+        printer = _VerbosityPrinter.create_printer(verbosity, comm=comm)
+
+        # TODO this really should be a parameter of this method
+        embed_figures = self._report_params.get('embed_figures', True)
+        if lazy and (embed_figures or single_file or link_to):
+            raise ValueError(("Lazy reports require `embed_figures=False` (an advanced option when constructing"
+                              " the report), and cannot be single files or link to other formats."))
 
         toggles = _defaultdict(lambda: False)
         toggles.update(
@@ -171,10 +290,13 @@ class Report:
             toggles['BrevityLT' + str(k + 1)] = True
 
         # Render sections
-        qtys = self._build(build_options)
-
-        # TODO this really should be a parameter of this method
-        embed_figures = self._report_params.get('embed_figures', True)
+        was_lazy = self._workspace.lazy
+        self._workspace.lazy = lazy or was_lazy
+        try:
+            qtys = self._build(build_options, num_processes, comm, printer)
+        finally:
+            self._workspace.lazy = was_lazy
+        deferred_items = {} if lazy else None
 
         if single_file:
             assert(embed_figures), \
@@ -193,8 +315,11 @@ class Report:
                 link_to=link_to, connected=connected, toggles=toggles,
                 render_math=True, resizable=resizable,
                 autosize=autosize, embed_figures=embed_figures,
-                verbosity=verbosity
+                verbosity=verbosity, deferred_items=deferred_items
             )
+            if lazy:
+                _deferred.write_deferred_items(_Path(path) / 'figures', deferred_items)
+                printer.log("Deferred computation of %d tables and plots" % len(deferred_items))
 
     def write_notebook(self, path, auto_open=False, connected=False, verbosity=0):
         """
@@ -362,7 +487,7 @@ class Report:
     def write_pdf(self, path, latex_cmd='pdflatex', latex_flags=None,
                   build_options=None,
                   brevity=0, precision=None, auto_open=False,
-                  comm=None, verbosity=0):
+                  comm=None, verbosity=0, num_processes=1):
         """
         Write this report to the disk as a PDF document.
 
@@ -410,6 +535,9 @@ class Report:
 
         verbosity : int, optional
             Amount of detail to print to stdout.
+
+        num_processes : int, optional
+            The number of local processes to render the report's figures with.
         """
 
         if not self._pdf_available:
@@ -428,7 +556,7 @@ class Report:
         latex_flags = latex_flags or ["-interaction=nonstopmode", "-halt-on-error", "-shell-escape"]
 
         # Render sections
-        qtys = self._build(build_options)
+        qtys = self._build(build_options, num_processes, comm, printer)
         # TODO: filter while generating plots to remove need for sanitization
         qtys = {k: v for k, v in qtys.items()
                 if not(isinstance(v, _ws.Switchboard) or isinstance(v, _ws.SwitchboardView))}
@@ -75,11 +75,85 @@ class Section:
         dict (str -> any)
             Key-value map of report quantities used for this section.
         """
-        return {
-            k: v(workspace, brevity=brevity, **kwargs)
-            for k, v in self._figure_factories.items()
-            if v.__figure_brevity_limit__ is None or brevity < v.__figure_brevity_limit__
-        }
+        qtys, figure_kwargs = self.prepare(workspace, brevity=brevity, **kwargs)
+        kwargs.update(figure_kwargs)
+        qtys.update({
+            k: self.render_figure(k, workspace, brevity=brevity, **kwargs)
+            for k in self.figure_names(brevity)
+        })
+        return qtys
+
+    def prepare(self, workspace, **kwargs):
+        """
+        Compute the quantities that this section's figures depend upon.
+
+        Some sections need quantities (e.g. additional switchboards) that are
+        shared by several of their figures, and which must be computed before
+        any of these figures.  By default, there are no such quantities.
+
+        Parameters
+        ----------
+        workspace : Workspace
+            A ``Workspace`` used for caching figure computation.
+
+        **kwargs
+            All the reportable quantities used when computing the figures of
+            this section.
+
+        Returns
+        -------
+        qtys : dict (str -> any)
+            Key-value map of report quantities (other than figures) for this section.
+
+        figure_kwargs : dict (str -> any)
+            Additional keyword arguments to pass to each of this section's figure factories.
+        """
+        return {}, {}
+
+    def figure_names(self, brevity=0):
+        """
+        The names of the figures this section renders at a given level of brevity.
+
+        Parameters
+        ----------
+        brevity : int, optional
+            Level of brevity used when generating this section.
+
+        Returns
+        -------
+        list of str
+        """
+        return [k for k, v in self._figure_factories.items()
+                if v.__figure_brevity_limit__ is None or brevity < v.__figure_brevity_limit__]
+
+    def render_figure(self, name, workspace, brevity=0, **kwargs):
+        """
+        Render a single one of this section's figures.
+
+        Figures are computed independently of one another, so this can be
+        used to render the figures of a section in separate processes.
+
+        Parameters
+        ----------
+        name : str
+            The name of the figure, one of :method:`figure_names`.
+
+        workspace : Workspace
+            A ``Workspace`` used for caching figure computation.
+
+        brevity : int, optional
+            Level of brevity used when generating this section.
+
+        **kwargs
+            All additional reportable quantities used when computing
+            the figure.
+
+        Returns
+        -------
+        object
+            The rendered figure, usually a :class:`WorkspaceOutput`.
+        """
+        return self._figure_factories[name](workspace, brevity=brevity, **kwargs)
 
 
 from .datacomparison import DataComparisonSection
@@ -16,7 +16,7 @@ from pygsti.tools.mpitools import distribute_indices as _distribute_indices
 class DataComparisonSection(_Section):
     _HTML_TEMPLATE = 'tabs/DataComparison.html'
 
-    def render(self, workspace, results=None, dataset_labels=None, embed_figures=True, comm=None, **kwargs):
+    def prepare(self, workspace, results=None, dataset_labels=None, embed_figures=True, comm=None, **kwargs):
         #initialize a new "dataset comparison switchboard"
         dscmp_switchBd = workspace.Switchboard(
             ["Dataset1", "Dataset2"],
@@ -69,15 +69,7 @@ class DataComparisonSection(_Section):
                 all_dsComps[(d1, d2)] = dsc
                 dscmp_switchBd.dscmp[d1, d2] = all_dsComps[(d1, d2)]
 
-        return {
-            'dscmpSwitchboard': dscmp_switchBd,
-            **super().render(
-                workspace, all_dscomps=all_dsComps,
-                ds_switchboard=dscmp_switchBd,
-                dataset_labels=dataset_labels,
-                embed_figures=embed_figures, comm=comm, **kwargs
-            )
-        }
+        return {'dscmpSwitchboard': dscmp_switchBd}, {'all_dscomps': all_dsComps, 'ds_switchboard': dscmp_switchBd}
 
     @_Section.figure_factory(4)
     def dataset_comparison_summary(workspace, switchboard=None, dataset_labels=None, all_dscomps=None, **kwargs):
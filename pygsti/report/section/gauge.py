@@ -16,7 +16,7 @@ from pygsti.report.workspace import NotApplicable as _NotApplicable
 class GaugeInvariantsGatesSection(_Section):
     _HTML_TEMPLATE = 'tabs/GaugeInvariants_gates.html'
 
-    def render(self, workspace, results=None, dataset_labels=None, est_labels=None, embed_figures=True, **kwargs):
+    def prepare(self, workspace, results=None, dataset_labels=None, est_labels=None, embed_figures=True, **kwargs):
         # This section's figures depend on switchboards, which must be rendered in advance:
         # XXX this is so wack
         gi_switchboard = _create_single_metric_switchboard(
@@ -28,13 +28,10 @@ class GaugeInvariantsGatesSection(_Section):
 
         return {
             'metricSwitchboard_gi': gi_switchboard,
-            'metricSwitchboard_gr': gr_switchboard,
-            **super().render(
-                workspace, gr_switchboard=gr_switchboard,
-                gi_switchboard=gi_switchboard,
-                dataset_labels=dataset_labels, est_labels=est_labels,
-                embed_figures=embed_figures, **kwargs
-            )
+            'metricSwitchboard_gr': gr_switchboard
+        }, {
+            'gr_switchboard': gr_switchboard,
+            'gi_switchboard': gi_switchboard
         }
 
     @_Section.figure_factory(4)
@@ -140,21 +137,14 @@ class GaugeInvariantsGermsSection(_Section):
 class GaugeVariantSection(_Section):
     _HTML_TEMPLATE = 'tabs/GaugeVariants.html'
 
-    def render(self, workspace, results=None, dataset_labels=None, est_labels=None, embed_figures=True, **kwargs):
+    def prepare(self, workspace, results=None, dataset_labels=None, est_labels=None, embed_figures=True, **kwargs):
         # This section's figures depend on switchboards, which must be rendered in advance:
         # XXX this is SO wack
         gv_switchboard = _create_single_metric_switchboard(
             workspace, results, False, dataset_labels, est_labels, embed_figures
         )
 
-        return {
-            'metricSwitchboard_gv': gv_switchboard,
-            **super().render(
-                workspace, gv_switchboard=gv_switchboard,
-                dataset_labels=dataset_labels, est_labels=est_labels,
-                embed_figures=embed_figures, **kwargs
-            )
-        }
+        return {'metricSwitchboard_gv': gv_switchboard}, {'gv_switchboard': gv_switchboard}
 
     @_Section.figure_factory(4)
     def final_model_spam_vs_target_table(workspace, switchboard=None, confidence_level=None, ci_brevity=1, **kwargs):
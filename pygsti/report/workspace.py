@@ -11,6 +11,7 @@ Defines the Workspace class and supporting functionality.
 #***************************************************************************************************
 
 import collections as _collections
+import contextlib as _contextlib
 import inspect as _inspect
 import itertools as _itertools
 import os as _os
@@ -27,6 +28,7 @@ from pygsti.report import merge_helpers as _merge
 from pygsti.report import plotly_plot_ex as _plotly_ex
 from pygsti import baseobjs as _baseobjs
 from pygsti.baseobjs.smartcache import CustomDigestError as _CustomDigestError
+from pygsti.baseobjs.smartcache import _call_key
 from pygsti.baseobjs import _compatibility as _compat
 
 _PYGSTI_WORKSPACE_INITIALIZED = False
@@ -139,6 +141,16 @@ def disable_plotly_pickling():
             del plotlyDictClass.__saved_setattr__
 
 
+@_contextlib.contextmanager
+def _plotly_pickling():
+    """ A context within which plotly figures may be pickled and un-pickled """
+    enable_plotly_pickling()
+    try:
+        yield
+    finally:
+        disable_plotly_pickling()
+
+
 def ws_custom_digest(md5, v):
     """
     A "digest" function for hashing several special types
@@ -163,6 +175,12 @@ def ws_custom_digest(md5, v):
         raise _CustomDigestError()
 
 
+def _switched_item_content(div_html, div_js):
+    """ The HTML for a single switched item, with any JS preceding it in a script block """
+    scriptJS = "<script>\n%s\n</script>\n" % div_js if div_js else ""
+    return "{script}{html}".format(script=scriptJS, html=div_html)
+
+
 def random_id():
     """
     Returns a random document-objet-model (DOM) ID
@@ -193,9 +211,36 @@ class Workspace(object):
     ----------
     cachefile : str, optional
         filename with cached workspace results
+
+    cache_max_bytes : int, optional
+        The maximum (estimated) number of bytes the workspace's cached results
+        may occupy before some are evicted.  `None` means there is no limit.
+
+    cache_eviction : {"lru", "cost"}
+        How cached results are chosen for eviction: least-recently-used first,
+        or those cheapest to recompute per byte first.
+
+    cache_spill_dir : str, optional
+        A directory that evicted results are pickled into (and re-loaded from
+        when needed again), or `None` to simply discard them.
+
+    cache_dir : str, optional
+        A directory of persistent, content-addressed results that is shared by
+        all the workspaces (possibly in different processes) given the same
+        directory.  Results computed by any of them are saved there, one file
+        per result, and loaded lazily by the others instead of being recomputed,
+        e.g. when re-building a report after only some of its inputs change.
+
+    lazy : bool, optional
+        Whether the tables, plots, etc. created by this workspace defer computing
+        their (not already cached) switched values until these are rendered.
+        When rendered as HTML with the `defer_computation` render option, values
+        aren't computed at all but saved for later computation - see
+        :func:`pygsti.report.compute_deferred_figures`.
     """
 
-    def __init__(self, cachefile=None):
+    def __init__(self, cachefile=None, cache_max_bytes=None, cache_eviction="lru", cache_spill_dir=None,
+                 cache_dir=None, lazy=False):
         """
         Initialize a Workspace object.
 
@@ -203,9 +248,29 @@ class Workspace(object):
         ----------
         cachefile : str, optional
             filename with cached workspace results
+
+        cache_max_bytes : int, optional
+            The maximum (estimated) number of bytes of cached results, or `None`
+            for no limit.
+
+        cache_eviction : {"lru", "cost"}
+            How cached results are chosen for eviction.
+
+        cache_spill_dir : str, optional
+            A directory to pickle evicted results into, or `None` to discard them.
+
+        cache_dir : str, optional
+            A directory of persistent results shared between workspaces, or
+            `None` to only cache results in memory.
+
+        lazy : bool, optional
+            Whether switched values are computed only when they're rendered.
         """
         self._register_components(False)
-        self.smartCache = _baseobjs.SmartCache()
+        self.lazy = lazy
+        self.smartCache = _baseobjs.SmartCache(max_bytes=cache_max_bytes, eviction=cache_eviction,
+                                               spill_dir=cache_spill_dir, persistent_dir=cache_dir)
+        self.smartCache.pickle_context = _plotly_pickling
         if cachefile is not None:
             self.load_cache(cachefile)
         self.smartCache.add_digest(ws_custom_digest)
@@ -256,14 +321,15 @@ class Workspace(object):
                 if isinstance(v, WorkspaceOutput):  # hasattr(v,'ws') == True for plotly dicts (why?)
                     print('Updated {} object to set ws to self'.format(type(v)))
                     v.ws = self
-            self.smartCache.cache.update(oldCache)
+            self.smartCache.update(oldCache)
 
     def __getstate__(self):
-        return {'smartCache': self.smartCache}
+        return {'smartCache': self.smartCache, 'lazy': self.lazy}
 
     def __setstate__(self, state_dict):
         self._register_components(False)
         self.smartCache = state_dict['smartCache']
+        self.lazy = state_dict.get('lazy', False)
 
     def _makefactory(self, cls, autodisplay):  # , printer=_objs.VerbosityPrinter(1)):
         # XXX this indirection is so wild -- can we please rewrite directly?
@@ -604,6 +670,10 @@ class Workspace(object):
         result.  If multiple arguments are `NotApplicable` instances, the
         first is used as the result.
 
+        If this workspace is lazy, then evaluations that aren't already cached
+        are not performed, and :class:`DeferredValue` objects are returned in
+        place of their results.
+
         Parameters
         ----------
         fn : function
@@ -709,7 +779,12 @@ class Workspace(object):
                 if isinstance(v, NotApplicable):
                     key = "NA"; result = v; break
             else:
-                key, result = self.smartCache.cached_compute(fn, argVals)
+                if self.lazy:
+                    key = _call_key(fn, tuple(argVals) + ({},), self.smartCache.customDigests)
+                    result = self.smartCache.cache[key] if (key in self.smartCache.cache) \
+                        else DeferredValue(fn, argVals)
+                else:
+                    key, result = self.smartCache.cached_compute(fn, argVals)
 
             if key not in storedKeys or key == 'INEFFECTIVE':
                 switchpos_map[pos] = len(resultValues)
@@ -1266,6 +1341,16 @@ class Switchboard(_collections.OrderedDict):
             return self[attr]
         return getattr(self.__dict__, attr)
 
+    def __reduce__(self):
+        # an OrderedDict is re-created by calling its class without arguments and then setting its items
+        return (Switchboard.__new__, (Switchboard,), (self.__dict__.copy(), list(self.items())))
+
+    def __setstate__(self, state):
+        state_dict, items = state
+        self.__dict__.update(state_dict)
+        for key, val in items:
+            super(Switchboard, self).__setitem__(key, val)
+
 
 class SwitchboardView(object):
     """
@@ -1441,6 +1526,8 @@ class SwitchValue(object):
 
     def __getattr__(self, attr):
         #use __dict__ so no chance for recursive __getattr__
+        if 'base' not in self.__dict__:  # e.g. while un-pickling
+            raise AttributeError(attr)
         return getattr(self.__dict__['base'], attr)
 
     def __len__(self): return len(self.base)
@@ -1451,6 +1538,49 @@ class SwitchValue(object):
     #def __truediv__(self, x):  return self.base / x
 
 
+class DeferredValue(object):
+    """
+    A switched value of a :class:`WorkspaceOutput` whose computation has been put off.
+
+    Lazy workspaces create these in place of the results of (not already
+    cached) function evaluations, which are then computed, using a
+    workspace's cache, only when they are needed.
+
+    Parameters
+    ----------
+    fn : function
+        The function to evaluate.
+
+    arg_vals : list
+        The arguments to `fn`.
+    """
+
+    def __init__(self, fn, arg_vals):
+        self.fn = fn
+        self.arg_vals = arg_vals
+
+    def evaluate(self, ws):
+        """
+        Compute this value.
+
+        Parameters
+        ----------
+        ws : Workspace
+            The workspace whose cache is used.  Any workspace outputs created
+            while computing the value (e.g. plots within a table) are computed
+            eagerly, even if `ws` is lazy.
+
+        Returns
+        -------
+        object
+        """
+        lazy, ws.lazy = ws.lazy, False
+        try:
+            return ws.smartCache.cached_compute(self.fn, self.arg_vals)[1]
+        finally:
+            ws.lazy = lazy
+
+
 class WorkspaceOutput(object):
     """
     Base class for all forms of data-visualization within a `Workspace` context.
@@ -1488,6 +1618,7 @@ class WorkspaceOutput(object):
         'autosize': 'none',
         'link_to': None,
         'valign': 'top',
+        'deferred_items': None,
 
         #Latex specific
         'latex_cmd': "pdflatex",
@@ -1586,6 +1717,13 @@ class WorkspaceOutput(object):
             Whether the switched items should be vertically aligned by their
             tops or bottoms (when they're different heights).
 
+        deferred_items : dict, optional
+            When not None and `switched_item_mode == "separate files"`, switched
+            items that are :class:`DeferredValue` objects (see the `lazy` argument
+            of :class:`Workspace`) are not computed when rendering as "html".
+            Instead, their (not yet written) files are added to this dictionary,
+            which maps the items' DOM ids to `(output_object, index)` tuples.
+
         latex_cmd : str, optional
             The system command or executable used to compile LaTeX documents.
             Usually `"pdflatex"`.
@@ -1733,6 +1871,44 @@ class WorkspaceOutput(object):
 
         return ret
 
+    def _switched_items(self):
+        """ The list of this object's switched values (e.g. tables or figures) """
+        raise NotImplementedError("Derived classes must implement this")
+
+    def _evaluate_deferred(self, indices=None):
+        """ Computes any switched values (optionally only those at `indices`) that are :class:`DeferredValue`s """
+        items = self._switched_items()
+        for i in (range(len(items)) if indices is None else indices):
+            if isinstance(items[i], DeferredValue):
+                items[i] = items[i].evaluate(self.ws)
+
+    def _render_html_item(self, i, div_id):
+        """ Renders the `i`-th switched item as HTML, returning an `(html, js)` tuple """
+        raise NotImplementedError("Derived classes must implement this")
+
+    def render_deferred_item(self, i, div_id):
+        """
+        Computes and renders a single switched item, as it is written to a separate HTML file.
+
+        This is used to complete, on demand, the items of a report whose
+        computation was deferred (see the `deferred_items` render option).
+
+        Parameters
+        ----------
+        i : int
+            The index of the switched item.
+
+        div_id : str
+            The DOM id of the item, which is also the base name of its file.
+
+        Returns
+        -------
+        str
+            The contents of the item's HTML file.
+        """
+        self._evaluate_deferred([i])
+        return _switched_item_content(*self._render_html_item(i, div_id))
+
     def _render_html(self, id, div_htmls, div_jss, div_ids, switchpos_map,
                      switchboards, switch_indices, div_css_classes=None,
                      link_to=None, link_to_files_dir=None, embed_figures=True):
@@ -1812,12 +1988,9 @@ class WorkspaceOutput(object):
         #   style='display: none' or 'visibility: hidden'
         html = "<div id='%s' class='pygsti-wsoutput-group'>\n" % id
 
-        div_contents = []
         if div_jss is None: div_jss = [""] * len(div_htmls)
-        for divHTML, divJS in zip(div_htmls, div_jss):
-            scriptJS = "<script>\n%s\n</script>\n" % divJS if divJS else ""
-            div_contents.append(("{script}{html}".format(
-                script=scriptJS, html=divHTML)))
+        div_contents = [(_switched_item_content(divHTML, divJS) if (divHTML is not None) else None)
+                        for divHTML, divJS in zip(div_htmls, div_jss)]  # None => a deferred item
 
         if embed_figures:
             #Inline div contents
@@ -1833,6 +2006,7 @@ class WorkspaceOutput(object):
 
             #Create separate files with div contents
             for divContent, divFilenm in zip(div_contents, div_filenames):
+                if divContent is None: continue  # deferred items are written later, when computed
                 with open(_os.path.join(str(link_to_files_dir), divFilenm), 'w') as f:
                     f.write(divContent)
         html += "\n</div>\n"  # ends pygsti-wsoutput-group div
@@ -2071,28 +2245,18 @@ class WorkspaceTable(WorkspaceOutput):
             embeddable output.  For `"html"`, keys are `"html"` and `"js"`.
             For `"latex"`, there is a single key `"latex"`.
         """
-        resizable = self.options.get('resizable', True)
-        autosize = self.options.get('autosize', 'none')
-        precision = self.options.get('precision', None)
         switched_item_mode = self.options.get('switched_item_mode', 'inline')
         overrideIDs = self.options.get('switched_item_id_overrides', {})
         output_dir = self.options.get('output_dir', None)
-
-        if precision is None:
-            precDict = {'normal': 6, 'polar': 3, 'sci': 0}
-        elif _compat.isint(precision):
-            precDict = {'normal': precision, 'polar': precision, 'sci': precision}
-        else:
-            assert('normal' in precision), "Must at least specify 'normal' precision"
-            p = precision['normal']
-            precDict = {'normal': p,
-                        'polar': precision.get('polar', p),
-                        'sci': precision.get('sci', p)}
+        deferred_items = self.options.get('deferred_items', None)
+        precDict = self._precision_dict()
 
         ID = self.ID
         tableID = "table_" + ID
 
         if typ == "html":
+            defer = bool(deferred_items is not None and switched_item_mode == 'separate files')
+            if not defer: self._evaluate_deferred()
 
             divHTML = []
             divIDs = []
@@ -2102,26 +2266,14 @@ class WorkspaceTable(WorkspaceOutput):
                 tableDivID = tableID + "_%d" % i
                 if i in overrideIDs: tableDivID = overrideIDs[i]
 
-                if isinstance(table, NotApplicable):
-                    table_dict = table.render("html", tableDivID)
+                if isinstance(table, DeferredValue):  # only when `defer` is True
+                    deferred_items[tableDivID] = (self, i)
+                    html, js = None, None
                 else:
-                    table_dict = table.render("html", table_id=tableDivID + "_tbl",
-                                              tableclass="dataTable",
-                                              precision=precDict['normal'],
-                                              polarprecision=precDict['polar'],
-                                              sciprecision=precDict['sci'],
-                                              resizable=resizable, autosize=(autosize == "continual"),
-                                              click_to_display=self.options['click_to_display'],
-                                              link_to=self.options['link_to'],
-                                              output_dir=output_dir)
+                    html, js = self._render_html_item(i, tableDivID)
 
-                if switched_item_mode == 'separate files':
-                    divJS.append(self._form_table_js(tableDivID, table_dict['html'], table_dict['js'], None))
-                else:
-                    #otherwise just add plot handers (table_dict['js']) to divJS for later
-                    divJS.append(table_dict['js'])
-
-                divHTML.append(table_dict['html'])
+                divJS.append(js)
+                divHTML.append(html)
                 divIDs.append(tableDivID)
 
             if switched_item_mode == 'inline':
@@ -2141,7 +2293,8 @@ class WorkspaceTable(WorkspaceOutput):
 
             return {'html': base['html'], 'js': js}
 
-        elif typ == "latex":
+        self._evaluate_deferred()
+        if typ == "latex":
 
             render_includes = self.options.get('render_includes', True)
             leave_src = self.options.get('leave_includes_src', False)
@@ -2276,6 +2429,48 @@ class WorkspaceTable(WorkspaceOutput):
                 "Can only render %s format for a non-switched table" % typ
             return {typ: self.tables[0].render(typ)}
 
+    def _switched_items(self):
+        return self.tables
+
+    def _precision_dict(self):
+        """ The 'normal', 'polar' and 'sci' precisions given by the `precision` render option """
+        precision = self.options.get('precision', None)
+        if precision is None:
+            return {'normal': 6, 'polar': 3, 'sci': 0}
+        elif _compat.isint(precision):
+            return {'normal': precision, 'polar': precision, 'sci': precision}
+        else:
+            assert('normal' in precision), "Must at least specify 'normal' precision"
+            p = precision['normal']
+            return {'normal': p,
+                    'polar': precision.get('polar', p),
+                    'sci': precision.get('sci', p)}
+
+    def _render_html_item(self, i, div_id):
+        table = self.tables[i]
+        precDict = self._precision_dict()
+        autosize = self.options.get('autosize', 'none')
+
+        if isinstance(table, NotApplicable):
+            table_dict = table.render("html", div_id)
+        else:
+            table_dict = table.render("html", table_id=div_id + "_tbl",
+                                      tableclass="dataTable",
+                                      precision=precDict['normal'],
+                                      polarprecision=precDict['polar'],
+                                      sciprecision=precDict['sci'],
+                                      resizable=self.options.get('resizable', True),
+                                      autosize=(autosize == "continual"),
+                                      click_to_display=self.options['click_to_display'],
+                                      link_to=self.options['link_to'],
+                                      output_dir=self.options.get('output_dir', None))
+
+        if self.options.get('switched_item_mode', 'inline') == 'separate files':
+            js = self._form_table_js(div_id, table_dict['html'], table_dict['js'], None)
+        else:
+            js = table_dict['js']  # just plot handlers, to be added to the table's JS later
+        return table_dict['html'], js
+
     def saveas(self, filename, index=None, verbosity=0):
         """
         Saves this workspace table object to a file.
@@ -2501,12 +2696,11 @@ class WorkspacePlot(WorkspaceOutput):
         overrideIDs = self.options.get('switched_item_id_overrides', {})
         switched_item_mode = self.options.get('switched_item_mode', 'inline')
         output_dir = self.options.get('output_dir', None)
+        deferred_items = self.options.get('deferred_items', None)
 
         if valign == 'top':
-            abswrap_cls = 'abswrap'
             relwrap_cls = 'relwrap'
         elif valign == 'bottom':
-            abswrap_cls = 'bot_abswrap'
             relwrap_cls = 'bot_relwrap'
         else:
             raise ValueError("Invalid 'valign' value: %s" % valign)
@@ -2535,6 +2729,8 @@ class WorkspacePlot(WorkspaceOutput):
             #  the JS returned into an on-ready handler and triggering the
             #  initialization and creation of the plots.
             handlersOnly = bool(resizable == "handlers only")
+            defer = bool(deferred_items is not None and switched_item_mode == 'separate files')
+            if not defer: self._evaluate_deferred()
 
             divHTML = []
             divIDs = []
@@ -2544,27 +2740,18 @@ class WorkspacePlot(WorkspaceOutput):
                 plotDivID = plotID + "_%d" % i
                 if i in overrideIDs: plotDivID = overrideIDs[i]
 
-                if isinstance(fig, NotApplicable):
-                    fig_dict = fig.render(typ, plotDivID)
-                else:
-                    #use auto-sizing (fluid layout)
-                    #fig.plotlyfig.update_layout(template=DEFAULT_PLOTLY_TEMPLATE)  #slow: set default theme in plot_ex
-                    fig_dict = _plotly_ex.plot_ex(
-                        fig.plotlyfig, show_link=False, resizable=resizable,
-                        lock_aspect_ratio=True, master=True, validate=VALIDATE_PLOTLY,  # bool(i==iMaster)
-                        click_to_display=self.options['click_to_display'],
-                        link_to=self.options['link_to'], link_to_id=plotDivID,
-                        rel_figure_dir=_os.path.basename(
-                            str(output_dir)) if not (output_dir in (None, False)) else None)
-
                 if switched_item_mode == 'separate files':
                     assert(handlersOnly is False)  # doesn't make sense to put only handlers in a separate file
-                    divJS.append(self._form_plot_js(plotDivID, fig_dict['js'], None))
+
+                if isinstance(fig, DeferredValue):  # only when `defer` is True
+                    deferred_items[plotDivID] = (self, i)
+                    html, js = None, None
                 else:
-                    divJS.append(fig_dict['js'])
+                    html, js = self._render_html_item(i, plotDivID)
 
                 divIDs.append(plotDivID)
-                divHTML.append("<div class='%s'>%s</div>" % (abswrap_cls, fig_dict['html']))
+                divJS.append(js)
+                divHTML.append(html)
 
             if switched_item_mode == 'inline':
                 base = self._render_html(plotID, divHTML, None, divIDs, self.switchpos_map,
@@ -2586,7 +2773,8 @@ class WorkspacePlot(WorkspaceOutput):
 
             return {'html': base['html'], 'js': js}
 
-        elif typ == "latex":
+        self._evaluate_deferred()
+        if typ == "latex":
             assert('output_dir' in self.options and self.options['output_dir']), \
                 "Cannot render a plot as 'latex' without a valid " +\
                 "'output_dir' render option (regardless of switched_item_mode)"
@@ -2745,11 +2933,39 @@ class WorkspacePlot(WorkspaceOutput):
                     index = 0
                 else:
                     raise ValueError("Must supply `index` argument for a non-trivially-switched WorkspacePlot")
+            self._evaluate_deferred([index])
             _plotly_to_matplotlib(self.figs[index], filename)
 
         else:
             raise ValueError("Unknown file type for %s" % filename)
 
+    def _switched_items(self):
+        return self.figs
+
+    def _render_html_item(self, i, div_id):
+        fig = self.figs[i]
+        output_dir = self.options.get('output_dir', None)
+        abswrap_cls = 'bot_abswrap' if self.options.get('valign', 'top') == 'bottom' else 'abswrap'
+
+        if isinstance(fig, NotApplicable):
+            fig_dict = fig.render("html", div_id)
+        else:
+            #use auto-sizing (fluid layout)
+            #fig.plotlyfig.update_layout(template=DEFAULT_PLOTLY_TEMPLATE)  #slow: set default theme in plot_ex
+            fig_dict = _plotly_ex.plot_ex(
+                fig.plotlyfig, show_link=False, resizable=self.options.get('resizable', True),
+                lock_aspect_ratio=True, master=True, validate=VALIDATE_PLOTLY,  # bool(i==iMaster)
+                click_to_display=self.options['click_to_display'],
+                link_to=self.options['link_to'], link_to_id=div_id,
+                rel_figure_dir=_os.path.basename(
+                    str(output_dir)) if not (output_dir in (None, False)) else None)
+
+        if self.options.get('switched_item_mode', 'inline') == 'separate files':
+            js = self._form_plot_js(div_id, fig_dict['js'], None)
+        else:
+            js = fig_dict['js']
+        return "<div class='%s'>%s</div>" % (abswrap_cls, fig_dict['html']), js
+
     def _form_plot_js(self, plot_id, plot_handlers, switchboard_init_js):
 
         resizable = self.options.get('resizable', True)
@@ -2839,6 +3055,7 @@ class WorkspaceText(WorkspaceOutput):
         switched_item_mode = self.options.get('switched_item_mode', 'inline')
         overrideIDs = self.options.get('switched_item_id_overrides', {})
         output_dir = self.options.get('output_dir', None)
+        self._evaluate_deferred()  # text is cheap to compute, so is never deferred when rendering
 
         ID = self.ID
         textID = "text_" + ID
@@ -3090,6 +3307,9 @@ class WorkspaceText(WorkspaceOutput):
             #remove all other files
             _shutil.rmtree(tempDir)
 
+    def _switched_items(self):
+        return self.texts
+
     def _form_text_js(self, text_id, text_html, switchboard_init_js):
 
         content = ""
@@ -11,6 +11,7 @@ pyGSTi Serialization Python Package
 #***************************************************************************************************
 
 from . import json
+from . import npz
 
 #Users may not have msgpack, which is fine.
 try:
@@ -41,7 +41,7 @@ def _class_hasattr(instance, attr):
     return hasattr(instance.__class__, attr)
 
 
-def encode_obj(py_obj, binary):
+def encode_obj(py_obj, binary, array_store=None):
     """
     Returns JSON-compatible version of `py_obj`.
 
@@ -59,6 +59,12 @@ def encode_obj(py_obj, binary):
     binary : bool
         Whether the output is allowed to have binary-mode strings or not.
 
+    array_store : dict, optional
+        If not None, the (non-object) numpy arrays within `py_obj` are not
+        encoded but are instead added to this dictionary, keyed by the name
+        they are referenced by in the output.  This allows arrays to be stored
+        separately, in their native binary format.
+
     Returns
     -------
     object
@@ -121,7 +127,7 @@ def encode_obj(py_obj, binary):
             else:
                 raise ValueError("Can't get state of %s object" % type(py_obj))
 
-        d = {k: encode_obj(v, binary) for k, v in state.items()}
+        d = {k: encode_obj(v, binary, array_store) for k, v in state.items()}
 
         #DEBUG (instead of above line)
         #import json as _json
@@ -145,7 +151,7 @@ def encode_obj(py_obj, binary):
         encode_std_base = bool('__init_args__' not in d)
 
         if encode_std_base:
-            std_encode = _encode_std_obj(py_obj, binary)
+            std_encode = _encode_std_obj(py_obj, binary, array_store)
             if std_encode is not py_obj:  # if there's something to encode
                 # this pygsti object is also a standard-object instance
                 assert(isinstance(std_encode, dict))
@@ -161,13 +167,13 @@ def encode_obj(py_obj, binary):
 
     #Special case: a plotly Figure object - these need special help being serialized
     elif is_plotly_fig and hasattr(py_obj, 'to_dict'):
-        return {'__plotlyfig__': _encode_std_obj(py_obj.to_dict(), binary)}
+        return {'__plotlyfig__': _encode_std_obj(py_obj.to_dict(), binary, array_store)}
 
     else:
-        return _encode_std_obj(py_obj, binary)
+        return _encode_std_obj(py_obj, binary, array_store)
 
 
-def _encode_std_obj(py_obj, binary):
+def _encode_std_obj(py_obj, binary, array_store=None):
     """
     Helper to :func:`encode_obj` that encodes only "standard" (non-pyGSTi) types
 
@@ -179,6 +185,9 @@ def _encode_std_obj(py_obj, binary):
     binary : bool
         whether to use binary-mode strings
 
+    array_store : dict, optional
+        dictionary to store numpy arrays in (see :func:`encode_obj`).
+
     Returns
     -------
     dict
@@ -186,25 +195,25 @@ def _encode_std_obj(py_obj, binary):
     # Other builtin or standard object encoding
     #print("Encoding std type: ",str(type(py_obj)))
     if isinstance(py_obj, tuple):
-        return {'__tuple__': [encode_obj(v, binary) for v in py_obj]}
+        return {'__tuple__': [encode_obj(v, binary, array_store) for v in py_obj]}
     elif isinstance(py_obj, list):
-        return {'__list__': [encode_obj(v, binary) for v in py_obj]}
+        return {'__list__': [encode_obj(v, binary, array_store) for v in py_obj]}
     elif isinstance(py_obj, set):
-        return {'__set__': [encode_obj(v, binary) for v in py_obj]}
+        return {'__set__': [encode_obj(v, binary, array_store) for v in py_obj]}
     elif isinstance(py_obj, slice):
-        return {'__slice__': [encode_obj(py_obj.start, binary),
-                              encode_obj(py_obj.stop, binary),
-                              encode_obj(py_obj.step, binary)]}
+        return {'__slice__': [encode_obj(py_obj.start, binary, array_store),
+                              encode_obj(py_obj.stop, binary, array_store),
+                              encode_obj(py_obj.step, binary, array_store)]}
     elif isinstance(py_obj, range):
         return {'__range__': (py_obj.start, py_obj.stop, py_obj.step)}
     elif isinstance(py_obj, _collections.OrderedDict):
-        return {'__odict__': [(encode_obj(k, binary), encode_obj(v, binary))
+        return {'__odict__': [(encode_obj(k, binary, array_store), encode_obj(v, binary, array_store))
                               for k, v in py_obj.items()]}
     elif isinstance(py_obj, _collections.Counter):
-        return {'__counter__': [(encode_obj(k, binary), encode_obj(v, binary))
+        return {'__counter__': [(encode_obj(k, binary, array_store), encode_obj(v, binary, array_store))
                                 for k, v in dict(py_obj).items()]}
     elif isinstance(py_obj, dict):
-        return {'__ndict__': [(encode_obj(k, binary), encode_obj(v, binary))
+        return {'__ndict__': [(encode_obj(k, binary, array_store), encode_obj(v, binary, array_store))
                               for k, v in py_obj.items()]}
     elif isinstance(py_obj, _uuid.UUID):
         return {'__uuid__': str(py_obj.hex)}
@@ -218,6 +227,10 @@ def _encode_std_obj(py_obj, binary):
         return {'__string__': _tobin(py_obj)}
 
     #Numpy encoding
+    elif array_store is not None and isinstance(py_obj, _np.ndarray) and not py_obj.dtype.hasobject:
+        name = 'arr%d' % len(array_store)
+        array_store[name] = py_obj
+        return {'__ndarray_ref__': name}
     elif isinstance(py_obj, _np.ndarray):
         # If the dtype is structured, store the interface description;
         # otherwise, store the corresponding array protocol type string:
@@ -230,7 +243,7 @@ def _encode_std_obj(py_obj, binary):
 
         if kind == 'O':
             #Special case of object arrays:  store flattened array data
-            data = [encode_obj(el, binary) for el in py_obj.flat]
+            data = [encode_obj(el, binary, array_store) for el in py_obj.flat]
             assert(len(data) == _np.product(py_obj.shape))
         else:
             data = py_obj.tobytes() if binary else _tostr(_base64.b64encode(py_obj.tobytes()))
@@ -253,9 +266,9 @@ def _encode_std_obj(py_obj, binary):
         if kind == 'O':
             raise TypeError("Cannot serialize sparse matrices of *objects*!")
 
-        return {'__scipy_csrmatrix__': encode_obj(py_obj.data, binary),
-                'indices': encode_obj(py_obj.indices, binary),
-                'indptr': encode_obj(py_obj.indptr, binary),
+        return {'__scipy_csrmatrix__': encode_obj(py_obj.data, binary, array_store),
+                'indices': encode_obj(py_obj.indices, binary, array_store),
+                'indptr': encode_obj(py_obj.indptr, binary, array_store),
                 'dtype': descr,
                 'kind': kind,
                 'shape': py_obj.shape}
@@ -272,7 +285,7 @@ def _encode_std_obj(py_obj, binary):
     return py_obj  # assume the bare py_obj is json-able
 
 
-def decode_obj(json_obj, binary):
+def decode_obj(json_obj, binary, array_store=None):
     """
     Inverse of :func:`encode_obj`.
 
@@ -292,6 +305,10 @@ def decode_obj(json_obj, binary):
         `'name'`.  The value of this argument should match that used in the
         original call to :func:`encode_obj`.
 
+    array_store : dict, optional
+        A dictionary (or mapping) holding the numpy arrays referenced by `json_obj`,
+        as populated by the `array_store` argument of :func:`encode_obj`.
+
     Returns
     -------
     object
@@ -318,7 +335,7 @@ def decode_obj(json_obj, binary):
             class_ = getattr(module, _tostr(clsname))
 
             if B('__init_fn__') in json_obj:  # construct via this function instead of class_.__init__
-                ifn_modname, ifn_fnname = decode_obj(json_obj[B('__init_fn__')], binary)
+                ifn_modname, ifn_fnname = decode_obj(json_obj[B('__init_fn__')], binary, array_store)
                 if ifn_modname is None and ifn_fnname == "__new__":  # special behavior
                     initfn = class_.__new__
                 else:
@@ -327,7 +344,7 @@ def decode_obj(json_obj, binary):
                 initfn = class_  # just use the class a the callable initialization function
 
             if B('__init_args__') in json_obj:  # construct via __init__
-                args = decode_obj(json_obj[B('__init_args__')], binary)
+                args = decode_obj(json_obj[B('__init_args__')], binary, array_store)
                 instance = initfn(*args)
 
             else:  # init via __new__ and set state
@@ -340,7 +357,7 @@ def decode_obj(json_obj, binary):
             state_dict = {}
             for k, v in json_obj.items():
                 if k in (B('__pygstiobj__'), B('__init_args__'), B('__std_base__')): continue
-                state_dict[_tostr(k)] = decode_obj(v, binary)
+                state_dict[_tostr(k)] = decode_obj(v, binary, array_store)
             state_obj = state_dict.get('__state_obj__', state_dict)
 
             #Set state
@@ -355,21 +372,21 @@ def decode_obj(json_obj, binary):
 
             #update instance with std-object info if needed (only if __init__ not called)
             if B('__std_base__') in json_obj:
-                _decode_std_base(json_obj[B('__std_base__')], instance, binary)
+                _decode_std_base(json_obj[B('__std_base__')], instance, binary, array_store)
 
             return instance
 
         elif B('__plotlyfig__') in json_obj:
             import plotly.graph_objs as go
-            return go.Figure(decode_obj(json_obj[B('__plotlyfig__')], binary))
+            return go.Figure(decode_obj(json_obj[B('__plotlyfig__')], binary, array_store))
 
         else:
-            return _decode_std_obj(json_obj, binary)
+            return _decode_std_obj(json_obj, binary, array_store)
     else:
         return json_obj
 
 
-def _decode_std_base(json_obj, start, binary):
+def _decode_std_base(json_obj, start, binary, array_store=None):
     """
     Helper to :func:`decode_obj` for decoding pyGSTi objects that are derived from a standard type.
 
@@ -385,6 +402,9 @@ def _decode_std_base(json_obj, start, binary):
     binary : bool
         Whether or not to use binary-mode strings as dict keys.
 
+    array_store : dict, optional
+        The numpy arrays referenced by `json_obj` (see :func:`decode_obj`).
+
     Returns
     -------
     object
@@ -396,16 +416,16 @@ def _decode_std_base(json_obj, start, binary):
         assert(B('__init_args') in json_obj), "No support for sub-classing tuple"
     elif B('__list__') in json_obj:
         for v in json_obj[B('__list__')]:
-            start.append(decode_obj(v, binary))
+            start.append(decode_obj(v, binary, array_store))
     elif B('__set__') in json_obj:
         for v in json_obj[B('__set__')]:
-            start.add(decode_obj(v, binary))
+            start.add(decode_obj(v, binary, array_store))
     elif B('__ndict__') in json_obj:
         for k, v in json_obj[B('__ndict__')]:
-            start[decode_obj(k, binary)] = decode_obj(v, binary)
+            start[decode_obj(k, binary, array_store)] = decode_obj(v, binary, array_store)
     elif B('__odict__') in json_obj:
         for k, v in json_obj[B('__odict__')]:
-            start[decode_obj(k, binary)] = decode_obj(v, binary)
+            start[decode_obj(k, binary, array_store)] = decode_obj(v, binary, array_store)
     elif B('__uuid__') in json_obj:
         assert(False), "No support for sub-classing UUID"
     elif B('__ndarray__') in json_obj:
@@ -420,7 +440,7 @@ def _decode_std_base(json_obj, start, binary):
         assert(False), "No support for sub-classing slice"
 
 
-def _decode_std_obj(json_obj, binary):
+def _decode_std_obj(json_obj, binary, array_store=None):
     """
     Helper to :func:`decode_obj` that decodes standard (non-pyGSTi) types.
 
@@ -432,6 +452,9 @@ def _decode_std_obj(json_obj, binary):
     binary : bool
         Whether or not to use binary-mode strings as dict keys.
 
+    array_store : dict, optional
+        The numpy arrays referenced by `json_obj` (see :func:`decode_obj`).
+
     Returns
     -------
     object
@@ -439,27 +462,27 @@ def _decode_std_obj(json_obj, binary):
     B = _tobin if binary else _ident
 
     if B('__tuple__') in json_obj:
-        return tuple([decode_obj(v, binary) for v in json_obj[B('__tuple__')]])
+        return tuple([decode_obj(v, binary, array_store) for v in json_obj[B('__tuple__')]])
     elif B('__list__') in json_obj:
-        return list([decode_obj(v, binary) for v in json_obj[B('__list__')]])
+        return list([decode_obj(v, binary, array_store) for v in json_obj[B('__list__')]])
     elif B('__set__') in json_obj:
-        return set([decode_obj(v, binary) for v in json_obj[B('__set__')]])
+        return set([decode_obj(v, binary, array_store) for v in json_obj[B('__set__')]])
     elif B('__slice__') in json_obj:
         v = json_obj[B('__slice__')]
-        return slice(decode_obj(v[0], binary), decode_obj(v[1], binary),
-                     decode_obj(v[2], binary))
+        return slice(decode_obj(v[0], binary, array_store), decode_obj(v[1], binary, array_store),
+                     decode_obj(v[2], binary, array_store))
     elif B('__range__') in json_obj:
         start, stop, step = json_obj[B('__range__')]
         return range(start, stop, step)
     elif B('__ndict__') in json_obj:
-        return dict([(decode_obj(k, binary), decode_obj(v, binary))
+        return dict([(decode_obj(k, binary, array_store), decode_obj(v, binary, array_store))
                      for k, v in json_obj[B('__ndict__')]])
     elif B('__odict__') in json_obj:
-        return _collections.OrderedDict(
-            [(decode_obj(k, binary), decode_obj(v, binary)) for k, v in json_obj[B('__odict__')]])
+        return _collections.OrderedDict([(decode_obj(k, binary, array_store), decode_obj(v, binary, array_store))
+                                         for k, v in json_obj[B('__odict__')]])
     elif B('__counter__') in json_obj:
-        return _collections.Counter(
-            {decode_obj(k, binary): decode_obj(v, binary) for k, v in json_obj[B('__counter__')]})
+        return _collections.Counter({decode_obj(k, binary, array_store): decode_obj(v, binary, array_store)
+                                     for k, v in json_obj[B('__counter__')]})
     elif B('__uuid__') in json_obj:
         return _uuid.UUID(hex=_tostr(json_obj[B('__uuid__')]))
     elif B('__bytes__') in json_obj:
@@ -470,6 +493,9 @@ def _decode_std_obj(json_obj, binary):
             json_obj[B('__string__')]
 
     # check for numpy
+    elif B('__ndarray_ref__') in json_obj:
+        assert(array_store is not None), "Cannot decode an array reference without an array store!"
+        return array_store[_tostr(json_obj[B('__ndarray_ref__')])]
     elif B('__ndarray__') in json_obj:
         # Check if 'kind' is in json_obj to enable decoding of data
         # serialized with older versions:
@@ -480,7 +506,7 @@ def _decode_std_obj(json_obj, binary):
             descr = json_obj[B('dtype')]
 
         if json_obj[B('kind')] == 'O':  # special decoding for object-type arrays
-            data = [decode_obj(el, binary) for el in json_obj[B('__ndarray__')]]
+            data = [decode_obj(el, binary, array_store) for el in json_obj[B('__ndarray__')]]
             flat_ar = _np.empty(len(data), dtype=_np.dtype(descr))
             for i, el in enumerate(data):
                 flat_ar[i] = el  # can't just make a np.array(data) because data may be, e.g., tuples
@@ -495,9 +521,9 @@ def _decode_std_obj(json_obj, binary):
                      for d in json_obj[B('dtype')]]
         else:
             descr = json_obj[B('dtype')]
-        data = decode_obj(json_obj[B('__scipy_csrmatrix__')], binary)
-        indices = decode_obj(json_obj[B('indices')], binary)
-        indptr = decode_obj(json_obj[B('indptr')], binary)
+        data = decode_obj(json_obj[B('__scipy_csrmatrix__')], binary, array_store)
+        indices = decode_obj(json_obj[B('indices')], binary, array_store)
+        indptr = decode_obj(json_obj[B('indptr')], binary, array_store)
         return _sps.csr_matrix((data, indices, indptr), dtype=_np.dtype(descr))
     elif B('__npgeneric__') in json_obj:
         data = json_obj[B('__npgeneric__')] if binary else \
@@ -0,0 +1,169 @@
+"""
+Defines a binary, numpy-archive-based format for serializing pyGSTi objects
+"""
+#***************************************************************************************************
+# Copyright 2015, 2019 National Technology & Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains certain rights
+# in this software.
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License.  You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
+#***************************************************************************************************
+
+import contextlib as _contextlib
+import json as _json
+import os as _os
+import struct as _struct
+import tempfile as _tempfile
+import zipfile as _zipfile
+
+import numpy as _np
+
+from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
+from pygsti.serialization.jsoncodec import encode_obj
+from pygsti.serialization.jsoncodec import decode_obj
+
+MANIFEST_NAME = 'manifest.json'
+_LOCAL_HEADER_SIZE = 30  # size of the fixed part of a zip file's local file header
+
+
+def dump(obj, f):
+    """
+    Serialize a pyGSTi object to a binary numpy archive.
+
+    The object is encoded using its nice serialization, if it's a
+    :class:`NicelySerializable` object, and otherwise as by
+    :func:`pygsti.serialization.json.dump`.  In either case, all of its (non-object)
+    numpy arrays are written, in their native binary format, as separate members of
+    an uncompressed `.npz` file that also holds a small JSON manifest describing
+    the rest of the object.  This avoids the cost of text-encoding large arrays,
+    and allows them to be memory-mapped when the object is loaded (see :func:`load`).
+
+    Parameters
+    ----------
+    obj : object
+        object to serialize.
+
+    f : str or Path or file
+        the filename or (seekable, binary-mode) file to write to.
+
+    Returns
+    -------
+    None
+    """
+    arrays = {}
+    if isinstance(obj, _NicelySerializable):
+        with _nice_array_store(arrays):
+            manifest = {'nice_serialization': obj.to_nice_serialization()}
+    else:
+        manifest = {'encoded_obj': encode_obj(obj, False, arrays)}
+
+    if hasattr(f, 'write'):
+        _write_archive(f, manifest, arrays)
+        return
+
+    # write to a temporary file that is then renamed, rather than rewriting `f` in place,
+    # so that the memory-mapped arrays of objects previously loaded from `f` stay valid.
+    filename = _os.fspath(f)
+    fd, tmp_filename = _tempfile.mkstemp(dir=_os.path.dirname(_os.path.abspath(filename)), suffix='.tmp')
+    try:
+        with _os.fdopen(fd, 'wb') as tmp:
+            _write_archive(tmp, manifest, arrays)
+        _os.replace(tmp_filename, filename)
+    except BaseException:
+        _os.remove(tmp_filename)
+        raise
+
+
+def _write_archive(f, manifest, arrays):
+    """ Writes `manifest` and `arrays` as the members of an uncompressed zip archive to the (binary) file `f` """
+    with _zipfile.ZipFile(f, 'w', compression=_zipfile.ZIP_STORED, allowZip64=True) as zf:
+        zf.writestr(MANIFEST_NAME, _json.dumps(manifest))
+        for name, ar in arrays.items():
+            with zf.open(name + '.npy', 'w', force_zip64=True) as af:
+                _np.lib.format.write_array(af, ar, allow_pickle=False)
+
+
+def load(f, mmap=True):
+    """
+    Load a pyGSTi object from a binary numpy archive written by :func:`dump`.
+
+    Parameters
+    ----------
+    f : str or Path or file
+        the filename or (binary-mode) file to read from.
+
+    mmap : bool, optional
+        Whether the arrays of the loaded object should be (copy-on-write)
+        memory-maps of the file rather than being read into memory.  In
+        this case an array's data is only read when it's first accessed, and
+        changes to it are never written back to the file.  Arrays can only be
+        memory-mapped when `f` is a filename.
+
+    Returns
+    -------
+    object
+    """
+    with _zipfile.ZipFile(f, 'r') as zf:
+        manifest = _json.loads(zf.read(MANIFEST_NAME).decode('utf-8'))
+        arrays = _ArchiveArrays(zf, str(f) if (mmap and not hasattr(f, 'read')) else None)
+        if 'nice_serialization' in manifest:
+            with _nice_array_store(arrays):
+                return _NicelySerializable.from_nice_serialization(manifest['nice_serialization'])
+        return decode_obj(manifest['encoded_obj'], False, arrays)
+
+
+@_contextlib.contextmanager
+def _nice_array_store(arrays):
+    """ Makes nicely-serializable objects store and retrieve their dense arrays in `arrays` """
+    _NicelySerializable._array_store = arrays
+    try:
+        yield
+    finally:
+        _NicelySerializable._array_store = None
+
+
+class _ArchiveArrays(object):
+    """
+    The arrays of an uncompressed numpy archive, read (or memory-mapped) only when they're needed.
+
+    Parameters
+    ----------
+    zf : zipfile.ZipFile
+        The open archive.
+
+    filename : str, optional
+        The archive's filename, used to memory-map its arrays.  If None, arrays
+        are read into memory.
+    """
+
+    def __init__(self, zf, filename=None):
+        self.zf = zf
+        self.filename = filename
+
+    def __getitem__(self, name):
+        info = self.zf.getinfo(name + '.npy')
+        if self.filename is None or info.compress_type != _zipfile.ZIP_STORED:
+            with self.zf.open(info) as af:
+                return _np.lib.format.read_array(af, allow_pickle=False)
+
+        with open(self.filename, 'rb') as fp:
+            # the array's .npy data starts after the member's local header, whose
+            # name and extra-field lengths may differ from those in the central directory
+            fp.seek(info.header_offset)
+            header = fp.read(_LOCAL_HEADER_SIZE)
+            name_len, extra_len = _struct.unpack('<HH', header[26:30])
+            fp.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len)
+            version = _np.lib.format.read_magic(fp)
+            if version == (1, 0):
+                shape, fortran_order, dtype = _np.lib.format.read_array_header_1_0(fp)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = _np.lib.format.read_array_header_2_0(fp)
+            else:  # no public header reader for other versions; just read the array
+                return _ArchiveArrays(self.zf)[name]
+            offset = fp.tell()
+
+        if _np.prod(shape) == 0:  # memory-maps can't be empty
+            return _np.empty(shape, dtype, order='F' if fortran_order else 'C')
+        return _np.memmap(self.filename, dtype=dtype, mode='c', offset=offset, shape=shape,
+                          order='F' if fortran_order else 'C')
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""Compare CHPForwardSimulator shots/second for the one-process-per-shot and pooled, batched modes.
+
+Usage: python benchmark_chp_pool.py <path to chp executable> [num_shots]
+"""
+import sys
+import time
+
+import pygsti
+from pygsti.circuits import Circuit
+from pygsti.forwardsims import CHPForwardSimulator
+from pygsti.models import modelconstruction as mc
+from pygsti.processors import QubitProcessorSpec
+
+
+def shots_per_second(chpexe, num_shots, num_workers, shots_per_run):
+    sim = CHPForwardSimulator(chpexe, shots=num_shots, num_workers=num_workers, shots_per_run=shots_per_run)
+    pspec = QubitProcessorSpec(4, ['Gi', 'Gxpi', 'Gypi', 'Gcnot'], geometry='line')
+    model = mc.create_crosstalk_free_model(pspec, depolarization_strengths={'Gi': 0.01, 'Gxpi': 0.01},
+                                           simulator=sim, evotype='chp')
+    circuit = Circuit([('Gxpi', 0), ('Gcnot', 0, 1), ('Gypi', 2), ('Gcnot', 2, 3), ('Gi', 1)], num_lines=4)
+
+    tStart = time.time()
+    model.probabilities(circuit)
+    return num_shots / (time.time() - tStart)
+
+
+if __name__ == '__main__':
+    chpexe = sys.argv[1]
+    num_shots = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print(f"pyGSTi {pygsti.__version__}, {num_shots} shots of a 4-qubit circuit")
+    for num_workers, shots_per_run in [(1, 1), (1, 100), (None, 1), (None, 100)]:
+        rate = shots_per_second(chpexe, num_shots, num_workers, shots_per_run)
+        print(f"num_workers={str(num_workers):>4}, shots_per_run={shots_per_run:>4}: {rate:10.1f} shots/s")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Report the lines/second achieved when reading a text-format data set file.
+
+Usage: python benchmark_parse_datafile.py [num_lines] [num_processes ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.io import stdinput
+
+
+def write_datafile(filename, num_lines, seed=0):
+    rng = np.random.RandomState(seed)
+    fiducials = ['{}', 'Gx', 'Gy', 'GxGx', 'GxGxGx', 'GyGyGy']
+    germs = ['Gx', 'Gy', 'GxGy', 'GxGxGy', 'GxGyGy', 'Gi']
+    with open(filename, 'w') as f:
+        f.write("## Outcomes = 0, 1\n")
+        for i in range(num_lines):
+            # roughly half of the circuit strings are repeats, as in data files with multiple passes
+            k = rng.randint(num_lines // 2 + 1)
+            k, i_germ = divmod(k, len(germs)); k, i_prep = divmod(k, len(fiducials))
+            k, i_meas = divmod(k, len(fiducials))
+            circuit_str = "%s(%s)^%d%s" % (fiducials[i_prep], germs[i_germ], k % 64 + 1, fiducials[i_meas])
+            if k >= 64: circuit_str += "@%d" % (k // 64)  # keep circuits distinct without making them long
+            n0 = rng.randint(1000)
+            f.write("%s 0:%d 1:%d\n" % (circuit_str, n0, 1000 - n0))
+
+
+def lines_per_second(filename, num_lines, num_processes, general_parser=False):
+    parser = stdinput.StdInputParser()
+    orig_read_datalines = stdinput.StdInputParser._read_datalines
+    if general_parser:  # force the line-by-line parser used for time-stamped data blocks
+        def fallback(*args, **kwargs): raise stdinput._StreamingParseFallback()
+        stdinput.StdInputParser._read_datalines = fallback
+
+    stdinput._global_parse_cache[False].clear(); stdinput._global_parse_cache[True].clear()
+    try:
+        tStart = time.time()
+        parser.parse_datafile(filename, show_progress=False, num_processes=num_processes)
+        return num_lines / (time.time() - tStart)
+    finally:
+        stdinput.StdInputParser._read_datalines = orig_read_datalines
+
+
+if __name__ == '__main__':
+    num_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    process_counts = [int(x) for x in sys.argv[2:]] or [1, 2, 4]
+
+    fd, filename = tempfile.mkstemp(suffix='.txt'); os.close(fd)
+    try:
+        write_datafile(filename, num_lines)
+        print(f"pyGSTi {pygsti.__version__}, {num_lines} data lines")
+        print(f"general line-by-line parser:    {lines_per_second(filename, num_lines, 1, True):10.0f} lines/s")
+        for num_processes in process_counts:
+            rate = lines_per_second(filename, num_lines, num_processes)
+            print(f"streaming, num_processes={num_processes:>3}: {rate:10.0f} lines/s")
+    finally:
+        os.remove(filename)
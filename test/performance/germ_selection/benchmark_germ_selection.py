@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Time greedy ("breadth-first") germ selection and its candidate-germ scoring.
+
+Runs `find_germs_breadthfirst` on the candidate germs (without powers and cycles) up to a given length, and
+then times scoring every candidate as an addition to the selected germs by diagonalizing each candidate's
+(dense) deriv-dagger-deriv sum, as germ selection formerly did, and by the low-rank update it now uses.
+
+Usage: python benchmark_germ_selection.py [modelpack] [max_candidate_length] [num_models]
+"""
+import importlib
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.algorithms import germselection as germsel
+
+
+if __name__ == '__main__':
+    modelpack = importlib.import_module('pygsti.modelpacks.' + (sys.argv[1] if len(sys.argv) > 1 else 'smq2Q_XYCNOT'))
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    num_models = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    target = modelpack.target_model()
+    candidates = pygsti.circuits.list_all_circuits_without_powers_and_cycles(list(target.operations.keys()),
+                                                                             max_length)
+    models = germsel.randomize_model_list([target], 1e-2, num_models, seed=1234)
+    print(f"pyGSTi {pygsti.__version__}, {len(candidates)} candidate germs, {target.num_params} parameters")
+
+    tStart = time.time()
+    germs = germsel.find_germs_breadthfirst(models, candidates, randomize=False, pretest=False, verbosity=0)
+    print(f"find_germs_breadthfirst: {time.time() - tStart:8.2f}s, {len(germs)} germs selected")
+
+    model = models[0]
+    germ_lengths = np.array([len(germ) for germ in candidates])
+    factors = germsel._compute_bulk_twirled_ddd_factors(model, candidates, germ_lengths=germ_lengths)
+    DDD = np.matmul(factors, factors.conjugate().transpose(0, 2, 1))
+    selected = [candidates.index(germ) for germ in germs]
+    currentDDD = np.sum(DDD[selected], axis=0)
+
+    tStart = time.time()
+    dense = [np.linalg.eigvalsh(currentDDD + DDD[i]) for i in range(len(candidates))]
+    print(f"dense candidate scoring:    {time.time() - tStart:8.2f}s")
+
+    tStart = time.time()
+    currentFactor = germsel._compact_ddd_factor(np.concatenate(factors[selected], axis=1))
+    low_rank = germsel._low_rank_update_eigenvalues(currentFactor, factors)
+    print(f"low-rank candidate scoring: {time.time() - tStart:8.2f}s, max eigenvalue difference = "
+          f"{max([np.max(np.abs(d[-len(lr):] - lr)) for d, lr in zip(dense, low_rank)]):.2g}")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""Time long-sequence GST with and without fitting early iterations to random mini-batches of circuits.
+
+Runs `run_iterative_gst` normally and with `minibatch_fractions`, so that all but the last iteration only
+fit to (growing) random subsets of their circuits, and reports the wall times and final objective values.
+
+Usage: python benchmark_minibatch_gst.py [modelpack] [max_length] [fraction1,fraction2,...]
+"""
+import importlib
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.algorithms import core
+
+
+if __name__ == '__main__':
+    modelpack = importlib.import_module('pygsti.modelpacks.' + (sys.argv[1] if len(sys.argv) > 1 else 'smq1Q_XYI'))
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    fractions = [float(x) for x in sys.argv[3].split(',')] if len(sys.argv) > 3 else [0.1, 0.3]
+
+    target = modelpack.target_model("full TP")
+    max_lengths = [2**i for i in range(int(np.log2(max_length)) + 1)]
+    circuit_lists = pygsti.circuits.create_lsgst_circuit_lists(target, modelpack.prep_fiducials(),
+                                                               modelpack.meas_fiducials(), modelpack.germs(),
+                                                               max_lengths)
+    datagen_model = target.depolarize(op_noise=0.01, spam_noise=0.01).rotate(max_rotate=0.01, seed=1234)
+    dataset = pygsti.data.simulate_data(datagen_model, circuit_lists[-1], num_samples=1000, seed=1234)
+    print(f"pyGSTi {pygsti.__version__}, {len(circuit_lists[-1])} circuits, {target.num_params} parameters")
+
+    for minibatch_fractions in (None, fractions):
+        tStart = time.time()
+        models, _, final_objfn = core.run_iterative_gst(dataset, target.copy(), circuit_lists, {'tol': 1e-6},
+                                                        ['chi2'], [], None, verbosity=0,
+                                                        minibatch_fractions=minibatch_fractions, minibatch_seed=1234)
+        print(f"minibatch_fractions={minibatch_fractions}: {time.time() - tStart:8.2f}s, "
+              f"final chi2 = {final_objfn.fn():.3f}")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""Time the creation of layouts with and without a layout cache directory.
+
+Usage: python benchmark_layout_cache.py [max_max_length]
+"""
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.forwardsims import MapForwardSimulator, MatrixForwardSimulator
+from pygsti.modelpacks import smq2Q_XYICNOT
+
+
+if __name__ == '__main__':
+    max_max_length = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+
+    model = smq2Q_XYICNOT.target_model('full TP').depolarize(op_noise=0.01)
+    circuits = smq2Q_XYICNOT.create_gst_experiment_design(max_max_length).all_circuits_needing_data
+    dataset = pygsti.data.simulate_data(model, circuits, 100, seed=1234)
+
+    print(f"pyGSTi {pygsti.__version__}, {len(circuits)} 2-qubit GST circuits with L <= {max_max_length}")
+    print("simulator                 no cache      store       load")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for sim in (MatrixForwardSimulator(layout_cache_dir=cache_dir),
+                    MapForwardSimulator(max_cache_size=1000, layout_cache_dir=cache_dir)):
+            model.sim = sim
+            times = []
+            ref_probs = None
+            for layout_cache_dir in (None, cache_dir, cache_dir):  # no cache, then populate & load the cache
+                sim.layout_cache_dir = layout_cache_dir
+                tStart = time.time()
+                layout = sim.create_layout(circuits, dataset, array_types=('E', 'EP'))
+                times.append(time.time() - tStart)
+
+                probs = np.empty(layout.num_elements, 'd')
+                sim.bulk_fill_probs(probs, layout)
+                probs = np.concatenate([probs[layout.indices(c)] for c in circuits])
+                if ref_probs is None: ref_probs = probs
+                assert np.allclose(probs, ref_probs)
+            print(f"{type(sim).__name__:24s}  {times[0]:8.2f}s  {times[1]:8.2f}s  {times[2]:8.2f}s")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+"""Time the creation of MatrixForwardSimulator layouts for the circuit lists of iterative GST.
+
+Usage: python benchmark_layout_creation.py [max_max_length]
+"""
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.forwardsims import MatrixForwardSimulator
+from pygsti.modelpacks import smq1Q_XYI
+
+
+if __name__ == '__main__':
+    max_max_length = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+
+    model = smq1Q_XYI.target_model('full TP')
+    model.sim = MatrixForwardSimulator()
+    max_lengths = [2**i for i in range(int(np.log2(max_max_length)) + 1)]
+    circuit_lists = pygsti.circuits.create_lsgst_circuit_lists(
+        model, smq1Q_XYI.prep_fiducials(), smq1Q_XYI.meas_fiducials(), smq1Q_XYI.germs(), max_lengths)
+
+    print(f"pyGSTi {pygsti.__version__}, 1-qubit GST circuit lists with L <= {max_max_length}")
+    print("     L  circuits     create     extend")
+    layout = None
+    total_create = total_extend = 0.0
+    for L, circuits in zip(max_lengths, circuit_lists):
+        tStart = time.time()
+        model.sim.create_layout(circuits, array_types=('E', 'EP'))
+        create_time = time.time() - tStart
+
+        tStart = time.time()
+        layout = model.sim.create_layout(circuits, array_types=('E', 'EP')) if layout is None \
+            else model.sim.extend_layout(layout, circuits, array_types=('E', 'EP'))
+        extend_time = time.time() - tStart
+
+        total_create += create_time; total_extend += extend_time
+        print(f"{L:6d}  {len(circuits):8d}  {create_time:8.2f}s  {extend_time:8.2f}s")
+    print(f" total  {'':8s}  {total_create:8.2f}s  {total_extend:8.2f}s")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Time long-sequence GST with and without Broyden updates of the Jacobian in `custom_leastsq`.
+
+Runs `run_iterative_gst` with the map forward simulator (where each Jacobian costs about one forward
+pass per parameter) and reports the wall time and the number of Jacobian evaluations made and avoided.
+
+Usage: python benchmark_broyden.py [modelpack] [max_length] [max_broyden_updates]
+"""
+import importlib
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.algorithms import core
+from pygsti.baseobjs.profiler import Profiler
+from pygsti.baseobjs.resourceallocation import ResourceAllocation
+from pygsti.forwardsims import MapForwardSimulator
+
+
+if __name__ == '__main__':
+    modelpack = importlib.import_module('pygsti.modelpacks.' + (sys.argv[1] if len(sys.argv) > 1 else 'smq1Q_XYI'))
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    max_broyden_updates = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    target = modelpack.target_model("full TP")
+    max_lengths = [2**i for i in range(int(np.log2(max_length)) + 1)]
+    circuit_lists = pygsti.circuits.create_lsgst_circuit_lists(target, modelpack.prep_fiducials(),
+                                                               modelpack.meas_fiducials(), modelpack.germs(),
+                                                               max_lengths)
+    datagen_model = target.depolarize(op_noise=0.01, spam_noise=0.01).rotate(max_rotate=0.01, seed=1234)
+    dataset = pygsti.data.simulate_data(datagen_model, circuit_lists[-1], num_samples=1000, seed=1234)
+    print(f"pyGSTi {pygsti.__version__}, {len(circuit_lists[-1])} circuits, {target.num_params} parameters")
+
+    final_vecs = []
+    for num_updates in (0, max_broyden_updates):
+        start_model = target.copy()
+        start_model.sim = MapForwardSimulator()
+        profiler = Profiler()
+        tStart = time.time()
+        models, _, _ = core.run_iterative_gst(dataset, start_model, circuit_lists,
+                                              optimizer={'tol': 1e-6, 'max_broyden_updates': num_updates},
+                                              iteration_objfn_builders=['chi2'], final_objfn_builders=[],
+                                              resource_alloc=ResourceAllocation(profiler=profiler), verbosity=0)
+        elapsed = time.time() - tStart
+        final_vecs.append(models[-1].to_vector())
+        print(f"max_broyden_updates={num_updates}: {elapsed:8.2f}s, "
+              f"{profiler.counters.get('custom_leastsq: jacobian evaluations', 0)} jacobian evaluations, "
+              f"{profiler.counters.get('custom_leastsq: jacobian evaluations avoided', 0)} avoided")
+    print(f"|difference| of final parameter vectors = {np.linalg.norm(final_vecs[0] - final_vecs[1]):.1e}")
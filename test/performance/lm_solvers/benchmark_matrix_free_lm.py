@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Time a least-squares GST fit with the dense and matrix-free Levenberg-Marquardt optimizers.
+
+Compares `CustomLMOptimizer` (which forms and solves the dense J^T J system) with `MatrixFreeLMOptimizer`
+(which solves it iteratively using only Jacobian-vector products).
+
+Usage: python benchmark_matrix_free_lm.py [modelpack] [max_length]
+"""
+import importlib
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import pygsti
+from pygsti.algorithms import core
+from pygsti.optimize import CustomLMOptimizer, MatrixFreeLMOptimizer
+
+
+def time_fit(dataset, start_model, circuits, optimizer):
+    tracemalloc.start()
+    tStart = time.time()
+    opt_result, model = core.run_gst_fit_simple(dataset, start_model, circuits, optimizer, "chi2",
+                                                resource_alloc=None, verbosity=0)
+    elapsed = time.time() - tStart
+    peak_mem = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak_mem, model, opt_result
+
+
+if __name__ == '__main__':
+    modelpack = importlib.import_module('pygsti.modelpacks.' + (sys.argv[1] if len(sys.argv) > 1 else 'smq2Q_XYCNOT'))
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    target = modelpack.target_model("full TP")
+    max_lengths = [2**i for i in range(int(np.log2(max_length)) + 1)]
+    circuits = pygsti.circuits.create_lsgst_circuits(target, modelpack.prep_fiducials(), modelpack.meas_fiducials(),
+                                                     modelpack.germs(), max_lengths)
+    datagen_model = target.depolarize(op_noise=0.01, spam_noise=0.01).rotate(max_rotate=0.01, seed=1234)
+    dataset = pygsti.data.simulate_data(datagen_model, circuits, num_samples=10000, seed=1234)
+    print(f"pyGSTi {pygsti.__version__}, {len(circuits)} circuits, {target.num_params} parameters")
+
+    for optimizer in (CustomLMOptimizer(tol=1e-6), MatrixFreeLMOptimizer(tol=1e-6)):
+        elapsed, peak_mem, model, opt_result = time_fit(dataset, target.copy(), circuits, optimizer)
+        print(f"{type(optimizer).__name__:>22s}: {elapsed:8.2f}s, peak memory {peak_mem / 1024**2:8.1f} MB, "
+              f"chi2 = {opt_result.f:.2f}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Time long-sequence GST with and without reusing outcome probabilities between objective function calls.
+
+`TimeIndependentMDCObjectiveFunction` remembers the parameter vector its probabilities were computed at, so
+that the Jacobian evaluated by `custom_leastsq` at a just-accepted point doesn't recompute the probabilities
+already computed for the objective function there.  This script disables that reuse for comparison.
+
+Usage: python benchmark_probs_reuse.py [modelpack] [max_length] [sim]
+"""
+import importlib
+import sys
+import time
+from unittest import mock
+
+import numpy as np
+
+import pygsti
+from pygsti.algorithms import core
+from pygsti.objectivefns.objectivefns import TimeIndependentMDCObjectiveFunction
+
+
+if __name__ == '__main__':
+    modelpack = importlib.import_module('pygsti.modelpacks.' + (sys.argv[1] if len(sys.argv) > 1 else 'smq1Q_XYI'))
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    sim_type = sys.argv[3] if len(sys.argv) > 3 else 'matrix'
+
+    target = modelpack.target_model("full TP")
+    max_lengths = [2**i for i in range(int(np.log2(max_length)) + 1)]
+    circuit_lists = pygsti.circuits.create_lsgst_circuit_lists(target, modelpack.prep_fiducials(),
+                                                               modelpack.meas_fiducials(), modelpack.germs(),
+                                                               max_lengths)
+    datagen_model = target.depolarize(op_noise=0.01, spam_noise=0.01).rotate(max_rotate=0.01, seed=1234)
+    dataset = pygsti.data.simulate_data(datagen_model, circuit_lists[-1], num_samples=1000, seed=1234)
+    print(f"pyGSTi {pygsti.__version__}, {len(circuit_lists[-1])} circuits, {target.num_params} parameters, "
+          f"{sim_type} simulator")
+
+    final_vecs = []
+    for reuse in (False, True):
+        start_model = target.copy()
+        start_model.sim = sim_type
+        with mock.patch.object(TimeIndependentMDCObjectiveFunction, '_probs_are_current',
+                               (lambda self, paramvec: False) if not reuse
+                               else TimeIndependentMDCObjectiveFunction._probs_are_current):
+            tStart = time.time()
+            models, _, _ = core.run_iterative_gst(dataset, start_model, circuit_lists, optimizer={'tol': 1e-6},
+                                                  iteration_objfn_builders=['chi2'], final_objfn_builders=['logl'],
+                                                  resource_alloc=None, verbosity=0)
+            elapsed = time.time() - tStart
+        final_vecs.append(models[-1].to_vector())
+        print(f"reuse probabilities={reuse}: {elapsed:8.2f}s")
+    print(f"|difference| of final parameter vectors = {np.linalg.norm(final_vecs[0] - final_vecs[1]):.1e}")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Compare the finite-difference and adjoint derivative modes of MapForwardSimulator on 2-qubit GST circuits.
+
+Usage: python benchmark_map_dprobs.py [max_max_length] [parameterization]
+"""
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.forwardsims import MapForwardSimulator
+from pygsti.modelpacks import smq2Q_XYICNOT
+
+
+def time_dprobs(model, circuits, derivative_mode):
+    model.sim = MapForwardSimulator(max_cache_size=None, derivative_mode=derivative_mode)
+    layout = model.sim.create_layout(circuits, array_types=('ep',))
+    dprobs = np.empty((layout.num_elements, model.num_params), 'd')
+    tStart = time.time()
+    model.sim.bulk_fill_dprobs(dprobs, layout)
+    return time.time() - tStart, layout, dprobs
+
+
+if __name__ == '__main__':
+    max_max_length = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    parameterization = sys.argv[2] if len(sys.argv) > 2 else 'full TP'
+
+    model = smq2Q_XYICNOT.target_model(parameterization).depolarize(op_noise=0.01, spam_noise=0.01)
+    max_lengths = [2**i for i in range(int(np.log2(max_max_length)) + 1)]
+    circuits = pygsti.circuits.create_lsgst_circuits(
+        model, smq2Q_XYICNOT.prep_fiducials(), smq2Q_XYICNOT.meas_fiducials(), smq2Q_XYICNOT.germs(), max_lengths)
+
+    print(f"pyGSTi {pygsti.__version__}, {len(circuits)} circuits (L <= {max_max_length}), "
+          f"{model.num_params} '{parameterization}' parameters")
+    fd_time, fd_layout, fd_dprobs = time_dprobs(model, circuits, "finite-difference")
+    adj_time, adj_layout, adj_dprobs = time_dprobs(model, circuits, "adjoint")
+    max_diff = max(np.max(np.abs(fd_dprobs[fd_layout.indices(c)] - adj_dprobs[adj_layout.indices(c)]))
+                   for c in circuits)
+    print(f"finite-difference: {fd_time:8.2f}s")
+    print(f"adjoint:           {adj_time:8.2f}s  (speedup {fd_time / adj_time:.1f}x, "
+          f"max |difference| = {max_diff:.1e})")
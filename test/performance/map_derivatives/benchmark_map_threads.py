@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""Time MapForwardSimulator probabilities and derivatives using different numbers of threads.
+
+Usage: python benchmark_map_threads.py [max_max_length] [max_cache_size] [num_threads ...]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.forwardsims import MapForwardSimulator
+from pygsti.modelpacks import smq2Q_XYICNOT
+
+
+if __name__ == '__main__':
+    max_max_length = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    max_cache_size = None if (len(sys.argv) <= 2 or sys.argv[2] == 'None') else int(sys.argv[2])
+    thread_counts = [int(n) for n in sys.argv[3:]] or [1, 2, 4]
+
+    model = smq2Q_XYICNOT.target_model('full TP').depolarize(op_noise=0.01, spam_noise=0.01)
+    circuits = smq2Q_XYICNOT.create_gst_experiment_design(max_max_length).all_circuits_needing_data
+    model.sim = MapForwardSimulator(max_cache_size=max_cache_size, num_atoms=1)
+    layout = model.sim.create_layout(circuits, array_types=('ep',))
+    levels = layout.atoms[0].table.row_levels()
+
+    print(f"pyGSTi {pygsti.__version__}, {len(circuits)} 2-qubit GST circuits with L <= {max_max_length}, "
+          f"max_cache_size={max_cache_size} ({max(levels) + 1} table levels), {os.cpu_count()} cores")
+    print("threads      probs     dprobs")
+    ref_dprobs = None
+    for num_threads in thread_counts:
+        model.sim = MapForwardSimulator(max_cache_size=max_cache_size, num_atoms=1, num_threads=num_threads)
+        probs = np.empty(layout.num_elements, 'd')
+        dprobs = np.empty((layout.num_elements, model.num_params), 'd')
+        tStart = time.time()
+        model.sim.bulk_fill_probs(probs, layout)
+        tProbs = time.time() - tStart
+        tStart = time.time()
+        model.sim.bulk_fill_dprobs(dprobs, layout)
+        tDprobs = time.time() - tStart
+
+        if ref_dprobs is None: ref_dprobs = dprobs
+        assert np.allclose(dprobs, ref_dprobs)
+        print(f"{num_threads:7d}  {tProbs:8.2f}s  {tDprobs:8.2f}s")
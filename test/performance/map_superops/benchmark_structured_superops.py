@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Time MapForwardSimulator probabilities of random circuits on a multi-qubit Lindblad-noise model.
+
+Compares acting with each exponentiated error generator via its Taylor series (as was always done
+before) with acting with its precomputed (and possibly diagonal or sparse) exponential.
+
+Usage: python benchmark_structured_superops.py [num_qubits] [circuit_depth]
+"""
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.evotypes.densitymx import opreps
+from pygsti.models import modelconstruction as mc
+from pygsti.processors import QubitProcessorSpec
+
+
+def time_probs(pspec, lindblad_error_coeffs, circuits, max_precomputed_exp_dim):
+    opreps._MAX_PRECOMPUTED_EXP_DIM = max_precomputed_exp_dim  # (only affects reps created after this)
+    model = mc.create_crosstalk_free_model(pspec, lindblad_error_coeffs=lindblad_error_coeffs, evotype='densitymx')
+    model.sim = pygsti.forwardsims.MapForwardSimulator(max_cache_size=0)
+    layout = model.sim.create_layout(circuits)
+    probs = np.empty(layout.num_elements, 'd')
+    tStart = time.time()
+    model.sim.bulk_fill_probs(probs, layout)
+    return time.time() - tStart, probs
+
+
+if __name__ == '__main__':
+    num_qubits = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+    pspec = QubitProcessorSpec(num_qubits, ['Gxpi2', 'Gypi2', 'Gcnot'], geometry='line')
+    lindblad_error_coeffs = {'Gxpi2': {('H', 'X'): 0.01, ('S', 'Y'): 0.002},
+                             'Gypi2': {('H', 'Y'): 0.01, ('S', 'X'): 0.002},
+                             'Gcnot': {('H', 'ZZ'): 0.01, ('S', 'XX'): 0.002}}
+    model = mc.create_crosstalk_free_model(pspec, lindblad_error_coeffs=lindblad_error_coeffs, evotype='densitymx')
+    layer_labels = [lbl for lbl in model.primitive_op_labels if lbl.name != '{idle}']
+    rng = np.random.default_rng(1234)
+    circuits = [pygsti.circuits.Circuit([layer_labels[i] for i in rng.integers(len(layer_labels), size=depth)],
+                                        line_labels=pspec.qubit_labels) for _ in range(300)]
+
+    print(f"pyGSTi {pygsti.__version__}, {len(circuits)} random {num_qubits}-qubit circuits of depth {depth}")
+    default_max_dim = opreps._MAX_PRECOMPUTED_EXP_DIM
+    taylor_time, taylor_probs = time_probs(pspec, lindblad_error_coeffs, circuits, 0)
+    exp_time, exp_probs = time_probs(pspec, lindblad_error_coeffs, circuits, default_max_dim)
+    print(f"Taylor series:            {taylor_time:8.3f}s")
+    print(f"precomputed exponentials: {exp_time:8.3f}s  (speedup {taylor_time / exp_time:.1f}x, "
+          f"max |difference| = {np.max(np.abs(taylor_probs - exp_probs)):.1e})")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Time the probabilities of GST circuits at many model parameter vectors (e.g. bootstrapped or sampled models).
+
+Compares looping over `model.from_vector` + `bulk_fill_probs` with a single `bulk_fill_probs_multi` call.
+
+Usage: python benchmark_probs_multi.py [modelpack] [max_length] [num_vectors]
+"""
+import importlib
+import sys
+import time
+
+import numpy as np
+
+import pygsti
+from pygsti.forwardsims import MapForwardSimulator, MatrixForwardSimulator
+
+
+def time_loop(model, layout, param_vectors):
+    probs = np.empty((len(param_vectors), layout.num_elements), 'd')
+    orig_vec = model.to_vector()
+    tStart = time.time()
+    for k, param_vec in enumerate(param_vectors):
+        model.from_vector(param_vec)
+        model.sim.bulk_fill_probs(probs[k], layout)
+    elapsed = time.time() - tStart
+    model.from_vector(orig_vec)
+    return elapsed, probs
+
+
+def time_multi(model, layout, param_vectors):
+    probs = np.empty((len(param_vectors), layout.num_elements), 'd')
+    tStart = time.time()
+    model.sim.bulk_fill_probs_multi(probs, layout, param_vectors)
+    return time.time() - tStart, probs
+
+
+if __name__ == '__main__':
+    modelpack = importlib.import_module('pygsti.modelpacks.' + (sys.argv[1] if len(sys.argv) > 1 else 'smq1Q_XYI'))
+    max_length = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    num_vectors = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    target = modelpack.target_model()
+    max_lengths = [2**i for i in range(int(np.log2(max_length)) + 1)]
+    circuits = pygsti.circuits.create_lsgst_circuits(target, modelpack.prep_fiducials(), modelpack.meas_fiducials(),
+                                                     modelpack.germs(), max_lengths)
+    print(f"pyGSTi {pygsti.__version__}, {len(circuits)} circuits, {num_vectors} parameter vectors")
+
+    for sim in (MatrixForwardSimulator(), MapForwardSimulator()):
+        model = modelpack.target_model("full TP")
+        model.sim = sim
+        layout = model.sim.create_layout(circuits)
+        rng = np.random.default_rng(1234)
+        param_vectors = model.to_vector() + 0.01 * rng.standard_normal((num_vectors, model.num_params))
+        loop_time, loop_probs = time_loop(model, layout, param_vectors)
+        multi_time, multi_probs = time_multi(model, layout, param_vectors)
+        print(f"{type(sim).__name__:>24s}: loop {loop_time:8.3f}s, multi {multi_time:8.3f}s "
+              f"(speedup {loop_time / multi_time:.1f}x, max |difference| = "
+              f"{np.max(np.abs(loop_probs - multi_probs)):.1e})")
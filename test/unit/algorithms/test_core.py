@@ -1,3 +1,5 @@
+from unittest import mock
+
 import numpy as np
 
 import pygsti.circuits as pc
@@ -5,8 +7,11 @@ import pygsti.data as pdata
 from pygsti.algorithms import core
 from pygsti.baseobjs import Label
 from pygsti.circuits import Circuit, CircuitList
+from pygsti.forwardsims import MatrixForwardSimulator
+from pygsti.layouts.evaltree import EvalTree
 from pygsti.objectivefns import Chi2Function, FreqWeightedChi2Function, \
     PoissonPicDeltaLogLFunction
+from pygsti.optimize import MatrixFreeLMOptimizer
 from . import fixtures
 from ..util import BaseCase
 
@@ -195,6 +200,115 @@ class CoreMC2GSTTester(CoreStdData, BaseCase):
         )
         # TODO assert correctness
 
+    def test_do_iterative_mc2gst_single_precision(self):
+        self.mdl_clgst.sim = MatrixForwardSimulator(precision="single")
+        models, _, _ = core.run_iterative_gst(
+            self.ds, self.mdl_clgst, self.lsgstStrings,
+            optimizer={'tol': 1e-5},
+            iteration_objfn_builders=['chi2'],
+            final_objfn_builders=[],
+            resource_alloc=None
+        )
+        self.assertEqual(models[0].sim.precision, "single")
+        self.assertEqual(models[-1].sim.precision, "double")  # the last iteration always uses double precision
+
+    def test_do_iterative_mc2gst_matrix_free(self):
+        models, _, _ = core.run_iterative_gst(
+            self.ds, self.mdl_clgst, self.lsgstStrings,
+            optimizer={'tol': 1e-5},
+            iteration_objfn_builders=['chi2'],
+            final_objfn_builders=[],
+            resource_alloc=None
+        )
+        mf_models, _, _ = core.run_iterative_gst(
+            self.ds, self.mdl_clgst, self.lsgstStrings,
+            optimizer=MatrixFreeLMOptimizer(tol=1e-5, cg_tol=1e-8),
+            iteration_objfn_builders=['chi2'],
+            final_objfn_builders=[],
+            resource_alloc=None
+        )
+        self.assertLess(np.linalg.norm(mf_models[-1].to_vector() - models[-1].to_vector()), 1e-3)
+
+    def test_do_iterative_mc2gst_broyden_updates(self):
+        models, _, _ = core.run_iterative_gst(
+            self.ds, self.mdl_clgst, self.lsgstStrings,
+            optimizer={'tol': 1e-5},
+            iteration_objfn_builders=['chi2'],
+            final_objfn_builders=[],
+            resource_alloc=None
+        )
+        broyden_models, _, _ = core.run_iterative_gst(
+            self.ds, self.mdl_clgst, self.lsgstStrings,
+            optimizer={'tol': 1e-5, 'max_broyden_updates': 3},
+            iteration_objfn_builders=['chi2'],
+            final_objfn_builders=[],
+            resource_alloc=None
+        )
+        self.assertLess(np.linalg.norm(broyden_models[-1].to_vector() - models[-1].to_vector()), 1e-3)
+
+    def test_do_iterative_mc2gst_minibatches(self):
+        models, _, objfn = core.run_iterative_gst(
+            self.ds, self.mdl_clgst, self.lsgstStrings,
+            optimizer={'tol': 1e-5},
+            iteration_objfn_builders=['chi2'],
+            final_objfn_builders=[],
+            resource_alloc=None
+        )
+
+        batches = []  # (number of circuits sampled from, mini-batch) pairs
+
+        def sample_circuit_minibatch(circuits, size, rng, comm):
+            batch = sample_fn(circuits, size, rng, comm)
+            batches.append((len(circuits), batch))
+            return batch
+
+        sample_fn = core._sample_circuit_minibatch
+        with mock.patch.object(core, '_sample_circuit_minibatch', side_effect=sample_circuit_minibatch), \
+                mock.patch.object(EvalTree, 'create_subtree', autospec=True,
+                                  side_effect=EvalTree.create_subtree) as create_subtree:
+            minibatch_models, minibatch_optimums, final_objfn = core.run_iterative_gst(
+                self.ds, self.mdl_clgst, self.lsgstStrings,
+                optimizer={'tol': 1e-5},
+                iteration_objfn_builders=['chi2'],
+                final_objfn_builders=[],
+                resource_alloc=None,
+                minibatch_fractions=[0.25, 0.5],
+                minibatch_seed=1234,
+                minibatch_min_size=10
+            )
+        self.assertEqual(len(batches), 2 * (len(self.lsgstStrings) - 1))  # no mini-batches in the last iteration
+        for (nCircuits, batch), fraction in zip(batches, [0.25, 0.5] * (len(self.lsgstStrings) - 1)):
+            self.assertEqual(len(batch), round(fraction * nCircuits))
+            self.assertArraysAlmostEqual(batch.circuit_weights, nCircuits / len(batch))
+        self.assertTrue(create_subtree.called)  # mini-batch layouts are built from the iteration's layout
+
+        self.assertEqual(len(minibatch_models), len(models))
+        self.assertEqual(len(final_objfn.circuits), len(self.lsgstStrings[-1]))  # last fit uses all circuits
+        self.assertAlmostEqual(final_objfn.fn(), objfn.fn(), places=2)  # (estimates may differ by a gauge)
+
+        # results are for all of an iteration's circuits, even when it was fit to mini-batches
+        model_vecs = [mdl.to_vector() for mdl in minibatch_models]  # (evaluating objectives updates the final model)
+        for circuits, v, opt_result in zip(self.lsgstStrings, model_vecs, minibatch_optimums):
+            self.assertEqual(len(opt_result.objective_func.circuits), len(circuits))
+            self.assertAlmostEqual(opt_result.f, opt_result.objective_func.fn(v))
+
+        with self.assertRaises(ValueError):
+            core.run_iterative_gst(self.ds, self.mdl_clgst, self.lsgstStrings, {'tol': 1e-5}, ['chi2'], [], None,
+                                   minibatch_fractions=[0.5, 2.0])
+
+    def test_do_iterative_mc2gst_minibatches_of_all_circuits(self):
+        models, _, _ = core.run_iterative_gst(self.ds, self.mdl_clgst, self.lsgstStrings, {'tol': 1e-5}, ['chi2'],
+                                              [], None)
+
+        # with the default minimum size (twice the number of model parameters) every mini-batch would hold all
+        # of an iteration's circuits, so only ordinary fits are done
+        with mock.patch.object(core, '_sample_circuit_minibatch') as sample_circuit_minibatch:
+            minibatch_models, _, _ = core.run_iterative_gst(self.ds, self.mdl_clgst, self.lsgstStrings,
+                                                            {'tol': 1e-5}, ['chi2'], [], None,
+                                                            minibatch_fractions=[0.25, 0.5])
+        self.assertFalse(sample_circuit_minibatch.called)
+        self.assertArraysAlmostEqual(minibatch_models[-1].to_vector(), models[-1].to_vector())
+
     def test_do_iterative_mc2gst_regularize_factor(self):
         obj_builder = Chi2Function.builder(
             name='chi2',
@@ -76,6 +76,25 @@ class GermSelectionTester(GermSelectionData, BaseCase):
         )
         # TODO assert correctness
 
+    def test_low_rank_ddd_eigenvalues(self):
+        germ_lengths = np.array([len(g) for g in self.germ_set])
+        DDD = germsel._compute_bulk_twirled_ddd(self.mdl_target_noisy, self.germ_set, germ_lengths=germ_lengths)
+        factors = germsel._compute_bulk_twirled_ddd_factors(self.mdl_target_noisy, self.germ_set,
+                                                            germ_lengths=germ_lengths)
+        self.assertLess(factors.shape[2], factors.shape[1])
+        self.assertArraysAlmostEqual(np.matmul(factors, factors.conjugate().transpose(0, 2, 1)), DDD)
+
+        currentDDD = np.sum(DDD[0:3], axis=0)
+        currentFactor = germsel._compact_ddd_factor(np.concatenate(factors[0:3], axis=1))
+        self.assertLessEqual(currentFactor.shape[1], 3 * factors.shape[2])
+        self.assertArraysAlmostEqual(np.dot(currentFactor, currentFactor.conjugate().T), currentDDD)
+
+        testEigenvals = germsel._low_rank_update_eigenvalues(currentFactor, factors[3:])
+        for i, eigenvals in enumerate(testEigenvals):
+            dense_eigenvals = np.linalg.eigvalsh(currentDDD + DDD[3 + i])
+            self.assertArraysAlmostEqual(eigenvals, dense_eigenvals[-len(eigenvals):])
+            self.assertArraysAlmostEqual(dense_eigenvals[:-len(eigenvals)], 0)
+
     def test_randomize_model_list(self):
         # XXX does this need coverage?  EGN: does it take a long time?
         neighborhood = germsel.randomize_model_list(
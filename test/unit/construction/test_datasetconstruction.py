@@ -62,6 +62,26 @@ class DataSetConstructionTester(BaseCase):
         for dr1, dr2 in zip(dataset1.values(), dataset2.values()):
             self.assertEqual(dr1.counts, dr2.counts)
 
+    def test_generate_timedep_fake_data(self):
+        times = [0.0, 0.5, 1.0]
+        circuits = self.circuit_list[0:20]
+        mdl = self.depolGateset.copy()
+        mdl.sim = 'map'  # the matrix simulator can't simulate time-dependent circuits
+        dataset = pdata.simulate_data(mdl, circuits, num_samples=100,
+                                      sample_error='multinomial', seed=100, times=times)
+        self.assertEqual(len(dataset), len(circuits))
+        for circuit in circuits:
+            row_times, row_counts = dataset[circuit].counts_as_timeseries()
+            self.assertEqual(list(row_times), times)
+            for counts in row_counts:
+                self.assertEqual(sum(counts.values()), 100)
+
+        dataset = pdata.simulate_data(mdl, circuits, num_samples=100,
+                                      sample_error='none', times=times)
+        probs = mdl.probabilities(circuits[5])
+        for outcome, count in dataset[circuits[5]].counts_at_time(0.5).items():
+            self.assertAlmostEqual(count, 100 * probs[outcome], places=4)
+
     def test_generate_fake_data_raises_on_bad_sample_error(self):
         with self.assertRaises(ValueError):
             pdata.simulate_data(self.dataset, self.circuit_list, num_samples=None,
@@ -0,0 +1,60 @@
+import numpy as np
+
+from pygsti.io import metadir
+from pygsti.modelpacks import smq1Q_XYI
+from pygsti.serialization import npz
+from ..util import BaseCase, with_temp_path
+
+
+class NpzSerializationTester(BaseCase):
+
+    @with_temp_path
+    def test_explicit_model(self, pth):
+        mdl = smq1Q_XYI.target_model().depolarize(op_noise=0.01)
+        npz.dump(mdl, pth + ".npz")
+        mdl2 = npz.load(pth + ".npz")
+        self.assertTrue(isinstance(mdl2, type(mdl)))
+        self.assertAlmostEqual(mdl.frobeniusdist(mdl2), 0)
+
+        # arrays are memory-mapped copy-on-write, so loaded models can be modified
+        mdl2.from_vector(0.9 * mdl2.to_vector())
+        self.assertGreater(mdl.frobeniusdist(mdl2), 1e-3)
+        self.assertAlmostEqual(mdl.frobeniusdist(npz.load(pth + ".npz", mmap=False)), 0)
+
+    @with_temp_path
+    def test_encoded_obj(self, pth):
+        obj = {'a': np.arange(10.).reshape(2, 5), 'b': [np.zeros((0, 3)), (1, 'x')],
+               'c': np.asfortranarray(np.ones((3, 4), complex)), 'o': np.array([1, 'a'], dtype=object)}
+        npz.dump(obj, pth + ".npz")
+        obj2 = npz.load(pth + ".npz")
+        self.assertEqual(set(obj2.keys()), set(obj.keys()))
+        self.assertArraysAlmostEqual(obj2['a'], obj['a'])
+        self.assertArraysAlmostEqual(obj2['c'], obj['c'])
+        self.assertEqual(obj2['b'][0].shape, (0, 3))
+        self.assertEqual(obj2['b'][1], (1, 'x'))
+        self.assertEqual(list(obj2['o']), [1, 'a'])
+
+        #Arrays are ordinary numpy archive members
+        self.assertArraysAlmostEqual(np.load(pth + ".npz")['arr0'], obj['a'])
+
+    @with_temp_path
+    def test_resave_while_loaded(self, pth):
+        obj = {'a': np.arange(1000.), 'b': np.ones((50, 50))}
+        npz.dump(obj, pth + ".npz")
+        obj2 = npz.load(pth + ".npz")
+
+        # the file is replaced rather than rewritten, so the memory-maps of `obj2` stay valid
+        npz.dump({'a': np.zeros(10)}, pth + ".npz")
+        self.assertArraysAlmostEqual(obj2['a'], obj['a'])
+        self.assertArraysAlmostEqual(obj2['b'], obj['b'])
+        self.assertArraysAlmostEqual(npz.load(pth + ".npz")['a'], np.zeros(10))
+
+    @with_temp_path
+    def test_metadir_auxfile(self, pth):
+        mdl = smq1Q_XYI.target_model()
+        metadir.write_meta_based_dir(pth, {'x': 1, 'models': {'a': mdl, 'b': mdl.depolarize(0.1)}},
+                                     {'models': 'dict:npz'})
+        loaded = metadir.load_meta_based_dir(pth)
+        self.assertEqual(loaded['x'], 1)
+        self.assertAlmostEqual(mdl.frobeniusdist(loaded['models']['a']), 0)
+        self.assertGreater(mdl.frobeniusdist(loaded['models']['b']), 1e-3)
@@ -121,3 +121,69 @@ class DataSetLoaderTester(BaseCase):
         self.assertEqual(ds[Circuit('Gc2')].aux['test'], 1)
         self.assertEqual(ds[Circuit('Gc3')].aux['test'], 1)
         self.assertEqual(ds[Circuit('Gc4')].aux['test'], 1)
+
+    @with_temp_path
+    def test_load_aggregates_duplicate_lines(self, pth):
+        contents = ("## Outcomes = 0, 1\n"
+                    "Gc1 0:1 1:2\n"
+                    "Gc2 0:5 1:5\n"
+                    "Gc1 0:3 1:4\n")
+        with open(pth, 'w') as f:
+            f.write(contents)
+
+        ds = io.read_dataset(pth)
+        self.assertEqual(list(ds.keys()), [Circuit('Gc1'), Circuit('Gc2')])
+        self.assertEqual(ds[Circuit('Gc1')]['0'], 4)
+        self.assertEqual(ds[Circuit('Gc1')]['1'], 6)
+        self.assertEqual(list(ds[Circuit('Gc1')].time), [0, 0, 1, 1])
+
+        ds = io.read_dataset(pth, collision_action="overwrite")
+        self.assertEqual(ds[Circuit('Gc1')]['0'], 3)
+
+    @with_temp_path
+    def test_load_in_parallel(self, pth):
+        with open(pth, 'w') as f:
+            f.write("## Columns = 0 count, 1 count\n")
+            for i in range(200):
+                f.write("Gx^%d %d -- # {'i': %d}\n" % (i, i, i) if i % 7 == 0 else "Gx^%d %d 3\n" % (i, i))
+
+        ds = io.read_dataset(pth, ignore_zero_count_lines=False)
+        ds_parallel = io.read_dataset(pth, ignore_zero_count_lines=False, num_processes=3)
+        self.assertEqual(list(ds.keys()), list(ds_parallel.keys()))
+        self.assertArraysEqual(ds.oliData, ds_parallel.oliData)
+        self.assertArraysEqual(ds.repData, ds_parallel.repData)
+        self.assertEqual(ds_parallel[Circuit('Gx^7')].aux['i'], 7)
+        self.assertEqual(ds_parallel[Circuit('Gx^5')]['1'], 3)
+
+    @with_temp_path
+    def test_load_infers_line_labels(self, pth):
+        from pygsti.io import stdinput
+        with open(pth, 'w') as f:
+            f.write("## Outcomes = 00, 11\n")
+            for i in range(20):
+                f.write("Gx:%d^%dGy:%d 00:1 11:2\n" % (i % 3, i + 1, i % 3 + 1))
+
+        ds = io.read_dataset(pth)
+        self.assertEqual(list(ds.keys())[0].line_labels, (0, 1))
+        self.assertEqual(list(ds.keys())[2].line_labels, (2, 3))
+
+        # the layer-label cache used to infer line labels is bounded
+        cache_info = stdinput._layer_explicit_sslbls.cache_info()
+        self.assertIsNotNone(cache_info.maxsize)
+        self.assertLessEqual(cache_info.currsize, cache_info.maxsize)
+
+    @with_temp_path
+    def test_load_timeseries_datafile(self, pth):
+        contents = ("## 0 = 0\n"
+                    "## 1 = 1\n"
+                    "Gx 0101\n"
+                    "Gy 110\n")
+        with open(pth, 'w') as f:
+            f.write(contents)
+
+        parser = io.StdInputParser()
+        for num_processes in (1, 2):
+            ds = parser.parse_tddatafile(pth, show_progress=False, num_processes=num_processes)
+            self.assertEqual(list(ds[Circuit('Gx')].outcomes), [('0',), ('1',), ('0',), ('1',)])
+            self.assertEqual(list(ds[Circuit('Gy')].time), [0, 1, 2])
+            self.assertEqual(ds[Circuit('Gy')]['1'], 2)
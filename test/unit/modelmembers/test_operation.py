@@ -880,6 +880,45 @@ class StochasticNoiseOpTester(BaseCase):
                                0.99)  # b/c X dephasing w/rate is 0.1^2 = 0.01
 
 
+class DensitymxStructuredActionTester(BaseCase):
+    """Tests that densitymx reps act with their (diagonal or sparse) matrices correctly"""
+
+    def setUp(self):
+        try:
+            Evotype.cast('densitymx')
+        except ImportError:
+            self.skipTest("'densitymx' evotype isn't built (no cython)")
+        self.state = np.array([0.5, 0.1, -0.2, 0.3, 0.05, 0.0, 0.2, -0.1, 0.0, 0.1, 0.3, 0.0, 0.2, 0.0, -0.1, 0.4])
+
+    def _check_action(self, operation, mx):
+        v = self.state[0:operation.dim]
+        self.assertArraysAlmostEqual(operation._rep.acton(FullState(v, 'densitymx')._rep).to_dense('HilbertSchmidt'),
+                                     mx @ v)
+        self.assertArraysAlmostEqual(
+            operation._rep.adjoint_acton(FullState(v, 'densitymx')._rep).to_dense('HilbertSchmidt'), mx.T @ v)
+
+    def test_standard_op(self):
+        cnot = op.StaticStandardOp('Gcnot', 'pp', 'densitymx')
+        self.assertEqual(cnot._rep.structure, 'sparse')  # a signed permutation in the Pauli-product basis
+        self._check_action(cnot, cnot.to_dense())
+
+    def test_stochastic_op(self):
+        sop = op.StochasticNoiseOp(statespace.default_space_for_dim(4), evotype='densitymx')
+        sop.from_vector(np.array([0.1, 0.2, 0.0]))
+        self.assertEqual(sop._rep.structure, 'diagonal')
+        self._check_action(sop, sop.to_dense())
+
+    def test_exp_errorgen_op(self):
+        eg = op.LindbladErrorgen.from_elementary_errorgens({('H', 'X'): 0.1, ('S', 'Y'): 0.02}, "H+S",
+                                                           evotype='densitymx', state_space=1)
+        expop = op.ExpErrorgenOp(eg)
+        self.assertIsNotNone(expop._rep.exp_rep)  # cheaper than a Taylor series for a 1-qubit gate
+        self._check_action(expop, expop.to_dense())
+
+        expop.from_vector(expop.to_vector() * 2)  # the precomputed exponential must be updated
+        self._check_action(expop, expop.to_dense())
+
+
 class DepolarizeOpTester(BaseCase):
     def test_depol_noise_op(self):
         state_space = statespace.default_space_for_dim(4)
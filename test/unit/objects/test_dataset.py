@@ -7,7 +7,7 @@ import pygsti.circuits as pc
 from pygsti.baseobjs import outcomelabeldict as ld
 from pygsti.circuits import Circuit
 from pygsti.data import DataSet
-from ..util import BaseCase
+from ..util import BaseCase, with_temp_path
 
 
 class DataSetTester(BaseCase):
@@ -314,6 +314,17 @@ class DataSetStaticInstanceTester(DataSetMethodBase, DefaultDataSetInstance, Bas
         with self.assertRaises(ValueError):
             self.dsRow.scale_inplace(2.0)
 
+    @with_temp_path
+    def test_write_read_columnar(self, tmp_path):
+        self.ds.write_columnar(tmp_path)
+        ds_loaded = DataSet(file_to_load_from=tmp_path)
+        self.assertIsInstance(ds_loaded.oliData, np.memmap)
+        self.assertEqual(list(ds_loaded.keys()), list(self.ds.keys()))
+        self.assertEqual(ds_loaded.uuid, self.ds.uuid)
+        for circuit in self.ds:
+            self.assertEqual(ds_loaded[circuit].counts, self.ds[circuit].counts)
+            self.assertArraysEqual(ds_loaded[circuit].time, self.ds[circuit].time)
+
 
 class RawSeriesDataSetInstanceTester(DataSetMethodBase, RawSeriesDataSetInstance, BaseCase):
     def test_build_repetition_counts(self):
@@ -333,3 +344,13 @@ class RawSeriesDatasetStaticInstanceTester(DataSetMethodBase, RawSeriesDataSetIn
     def test_raise_on_build_repetition_counts(self):
         with self.assertRaises(ValueError):
             self.ds._add_explicit_repetition_counts()
+
+    @with_temp_path
+    def test_write_read_columnar(self, tmp_path):
+        self.ds.write_columnar(tmp_path)
+        ds_loaded = DataSet()
+        ds_loaded.read_columnar(tmp_path, mmap_mode=None)
+        self.assertIsNone(ds_loaded.repData)
+        for circuit in self.ds:
+            self.assertEqual(ds_loaded[circuit].outcomes, self.ds[circuit].outcomes)
+            self.assertArraysEqual(ds_loaded[circuit].time, self.ds[circuit].time)
@@ -1,5 +1,8 @@
+import pickle
+
 import numpy as np
 
+from pygsti.layouts.evaltree import EvalTree
 from ..util import BaseCase
 
 
@@ -56,3 +59,91 @@ from ..util import BaseCase
 #    else:
 #        assert(None not in circuits[0:nFinal])
 #        return circuits[0:nFinal]
+
+
+class EvalTreeTester(BaseCase):
+    def setUp(self):
+        self.circuits = [(), ('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gy'), ('Gy', 'Gx', 'Gy', 'Gy'), ('Gx', 'Gy'),
+                         ('Gy', 'Gx', 'Gy', 'Gy', 'Gx')]
+        self.tree = EvalTree.create(self.circuits)
+
+    def test_levelize(self):
+        leaves, waves = self.tree.levelize()
+        self.assertEqual(len(leaves) + sum(len(iDest) for iDest, _, _ in waves), len(self.tree))
+
+        # "run" the tree a wave at a time, checking each wave only uses earlier results
+        circuits = {iDest: (() if iRight is None else (iRight,)) for iDest, iLeft, iRight in leaves}
+        for iDest, iLeft, iRight in waves:
+            self.assertTrue(all(i in circuits for i in np.concatenate((iLeft, iRight))))
+            circuits.update({k: circuits[l] + circuits[r] for k, l, r in zip(iDest, iLeft, iRight)})
+        self.assertEqual([circuits[i] for i in range(len(self.circuits))], self.circuits)
+
+        self.assertIs(self.tree.levelize()[1], waves)  # cached
+
+    def test_extend(self):
+        base_tree = EvalTree.create(self.circuits[0:4])
+        tree = base_tree.create_extension(self.circuits)
+        self.assertEqual(len(tree), len(self.tree))
+
+        leaves, waves = tree.levelize()
+        circuits = {iDest: (() if iRight is None else (iRight,)) for iDest, iLeft, iRight in leaves}
+        for iDest, iLeft, iRight in waves:
+            circuits.update({k: circuits[l] + circuits[r] for k, l, r in zip(iDest, iLeft, iRight)})
+        self.assertEqual([circuits[i] for i in range(len(self.circuits))], self.circuits)
+
+        with self.assertRaises(ValueError):
+            tree.create_extension(self.circuits[0:3])
+
+    def test_subtree(self):
+        indices = [6, 2, 0]
+        tree = self.tree.create_subtree(indices)
+        self.assertLessEqual(len(tree), len(self.tree))
+        self.assertEqual(sorted(iDest for iDest, _, _ in tree), list(range(len(tree))))
+
+        leaves, waves = tree.levelize()
+        circuits = {iDest: (() if iRight is None else (iRight,)) for iDest, iLeft, iRight in leaves}
+        for iDest, iLeft, iRight in waves:
+            circuits.update({k: circuits[l] + circuits[r] for k, l, r in zip(iDest, iLeft, iRight)})
+        self.assertEqual([circuits[i] for i in range(len(indices))], [self.circuits[i] for i in indices])
+
+        self.assertFalse(tree.extendable)
+        with self.assertRaises(ValueError):
+            tree.create_extension(self.circuits)
+
+    def test_layer_tuples(self):
+        layer_tuples = self.tree.layer_tuples()
+        self.assertEqual(sorted(layer_tuples.keys()), list(range(len(self.tree))))
+        self.assertEqual([layer_tuples[i] for i in range(len(self.circuits))], self.circuits)
+
+    def test_create_reusing(self):
+        base_tree = EvalTree.create(self.circuits[0:4])
+        tree = base_tree.create_reusing(self.circuits)  # extends `base_tree`
+        self.assertTrue(tree.extendable)
+        self.assertEqual(len(tree), len(self.tree))
+        self.assertEqual([tree.layer_tuples()[i] for i in range(len(self.circuits))], self.circuits)
+
+        sub_circuits = [self.circuits[6], self.circuits[2]]
+        tree = self.tree.create_reusing(sub_circuits)  # a sub-tree of `self.tree`
+        self.assertFalse(tree.extendable)
+        self.assertEqual([tree.layer_tuples()[i] for i in range(len(sub_circuits))], sub_circuits)
+
+        other_circuits = [('Gy', 'Gy', 'Gy', 'Gy', 'Gy')]
+        tree = base_tree.create_reusing(other_circuits)  # a new tree
+        self.assertEqual(list(tree), list(EvalTree.create(other_circuits)))
+
+    def test_extend_repeatedly(self):
+        base_tree = EvalTree.create(self.circuits[0:3])
+        tree = base_tree.create_extension(self.circuits[0:5]).create_extension(self.circuits)
+        self.assertEqual([tree.layer_tuples()[i] for i in range(len(self.circuits))], self.circuits)
+
+        # trees without an evaluation dictionary (already extended or unpickled) rebuild it to give the same result
+        self.assertEqual(list(base_tree.create_extension(self.circuits[0:5]).create_extension(self.circuits)),
+                         list(tree))
+        unpickled_tree = pickle.loads(pickle.dumps(base_tree.create_extension(self.circuits[0:5])))
+        self.assertEqual(list(unpickled_tree.create_extension(self.circuits)), list(tree))
+
+    def test_pickle(self):
+        tree = pickle.loads(pickle.dumps(self.tree))
+        self.assertEqual(list(tree), list(self.tree))
+        self.assertNotIn('_eval_dict', tree.__dict__)  # rebuilt when needed, rather than stored
+        self.assertEqual(len(tree.create_extension(self.circuits + [('Gy',)])), len(self.tree) + 1)
@@ -1,5 +1,6 @@
 # XXX rewrite or remove
 
+import os
 from unittest import mock
 
 import numpy as np
@@ -7,10 +8,12 @@ import numpy as np
 import pygsti.models as models
 from pygsti.forwardsims.forwardsim import ForwardSimulator
 from pygsti.forwardsims.mapforwardsim import MapForwardSimulator
+from pygsti.forwardsims.matrixforwardsim import MatrixForwardSimulator
+from pygsti.forwardsims.weakforwardsim import WeakForwardSimulator
 from pygsti.models import ExplicitOpModel
 from pygsti.circuits import Circuit
 from pygsti.baseobjs import Label as L
-from ..util import BaseCase
+from ..util import BaseCase, with_temp_path
 
 
 def Ls(*args):
@@ -72,6 +75,23 @@ class ForwardSimBase(object):
         self.fwdsim.bulk_fill_probs(pmx, self.layout)
         # TODO assert correctness
 
+    def test_bulk_fill_probs_multi(self):
+        orig_vec = self.model.to_vector()
+        param_vectors = orig_vec + 0.01 * np.random.default_rng(1234).standard_normal((3, self.nP))
+        pmxs = np.empty((3, self.nEls), 'd')
+        self.fwdsim.bulk_fill_probs_multi(pmxs, self.layout, param_vectors)
+        self.assertArraysAlmostEqual(self.model.to_vector(), orig_vec)  # parameters are restored
+
+        pmx = np.empty(self.nEls, 'd')
+        for param_vec, multi_pmx in zip(param_vectors, pmxs):
+            self.model.from_vector(param_vec)
+            self.fwdsim.bulk_fill_probs(pmx, self.layout)
+            self.assertArraysAlmostEqual(multi_pmx, pmx)
+        self.model.from_vector(orig_vec)
+
+        with self.assertRaises(ValueError):
+            self.fwdsim.bulk_fill_probs_multi(pmxs, self.layout, param_vectors[:, 1:])  # wrong number of params
+
     def test_bulk_fill_dprobs(self):
         dmx = np.empty((self.nEls, self.nP), 'd')
         pmx = np.empty(self.nEls, 'd')
@@ -144,6 +164,78 @@ class MatrixForwardSimTester(ForwardSimBase, BaseCase):
         hgflat = self.fwdsim._hoperation(L('Gx'), flat=True)
         # TODO assert correctness
 
+    def test_extend_layout(self):
+        circuits = [Circuit(c) for c in [('Gx',), ('Gx', 'Gx'), ('Gy', 'Gx', 'Gx'), ('Gx', 'Gy', 'Gi', 'Gx')]]
+        layout = self.fwdsim.extend_layout(self.layout, circuits)
+        fresh_layout = self.fwdsim.create_layout(circuits)
+        self.assertEqual(layout.num_elements, fresh_layout.num_elements)
+
+        probs = np.empty(layout.num_elements, 'd')
+        fresh_probs = np.empty(fresh_layout.num_elements, 'd')
+        self.fwdsim.bulk_fill_probs(probs, layout)
+        self.fwdsim.bulk_fill_probs(fresh_probs, fresh_layout)
+        for c in circuits:
+            self.assertArraysAlmostEqual(probs[layout.indices(c)], fresh_probs[fresh_layout.indices(c)])
+
+    def test_subset_layout(self):
+        circuits = [Circuit(c) for c in [('Gx',), ('Gx', 'Gx'), ('Gy', 'Gx', 'Gx'), ('Gx', 'Gy', 'Gi', 'Gx')]]
+        layout = self.fwdsim.create_layout(circuits)
+        sub_circuits = [circuits[3], circuits[1]]
+        sub_layout = self.fwdsim.extend_layout(layout, sub_circuits)
+        self.assertFalse(sub_layout.atoms[0].tree.extendable)  # a sub-tree of `layout`'s tree, not a new one
+
+        probs = np.empty(layout.num_elements, 'd')
+        sub_probs = np.empty(sub_layout.num_elements, 'd')
+        self.fwdsim.bulk_fill_probs(probs, layout)
+        self.fwdsim.bulk_fill_probs(sub_probs, sub_layout)
+        for c in sub_circuits:
+            self.assertArraysAlmostEqual(sub_probs[sub_layout.indices(c)], probs[layout.indices(c)])
+
+    @with_temp_path
+    def test_extend_cached_layout(self, tmp_path):
+        circuits = [Circuit(c) for c in [('Gx',), ('Gx', 'Gx'), ('Gy', 'Gx', 'Gx'), ('Gx', 'Gy', 'Gi', 'Gx')]]
+        model = self.model.copy()
+        model.sim = MatrixForwardSimulator(layout_cache_dir=tmp_path)
+        model.sim.create_layout(circuits[0:2])
+        base_layout = model.sim.create_layout(circuits[0:2])  # loaded from the cache
+        self.assertGreater(len(os.listdir(tmp_path)), 0)
+        self.assertNotIn('_double_expanded_circuits', base_layout.atoms[0].__dict__)  # not pickled
+        self.assertNotIn('_instrument_expansions', base_layout.atoms[0].__dict__)
+
+        model.sim.layout_cache_dir = None
+        layout = model.sim.extend_layout(base_layout, circuits)
+        fresh_layout = model.sim.create_layout(circuits)
+        self.assertTrue(layout.atoms[0].tree.extendable)
+        self.assertEqual(len(layout.atoms[0].tree), len(fresh_layout.atoms[0].tree))
+
+        probs = np.empty(layout.num_elements, 'd')
+        fresh_probs = np.empty(fresh_layout.num_elements, 'd')
+        model.sim.bulk_fill_probs(probs, layout)
+        model.sim.bulk_fill_probs(fresh_probs, fresh_layout)
+        for c in circuits:
+            self.assertArraysAlmostEqual(probs[layout.indices(c)], fresh_probs[fresh_layout.indices(c)])
+
+    def test_single_precision(self):
+        single_sim = MatrixForwardSimulator(self.model, precision="single")
+        self.assertEqual(single_sim.copy().precision, "single")
+        layout = single_sim.create_layout([('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy') * 8], array_types=('e', 'ep', 'epp'))
+        nEls = layout.num_elements
+
+        pmx, single_pmx = np.empty(nEls, 'd'), np.empty(nEls, 'd')
+        dmx, single_dmx = np.empty((nEls, self.nP), 'd'), np.empty((nEls, self.nP), 'd')
+        self.fwdsim.bulk_fill_dprobs(dmx, layout, pr_array_to_fill=pmx)
+        single_sim.bulk_fill_dprobs(single_dmx, layout, pr_array_to_fill=single_pmx)
+        self.assertLess(np.max(np.abs(single_pmx - pmx)), 1e-5)
+        self.assertLess(np.max(np.abs(single_dmx - dmx)), 1e-4)
+
+        hmx, single_hmx = np.empty((nEls, self.nP, self.nP), 'd'), np.empty((nEls, self.nP, self.nP), 'd')
+        self.fwdsim.bulk_fill_hprobs(hmx, layout)
+        single_sim.bulk_fill_hprobs(single_hmx, layout)
+        self.assertLess(np.max(np.abs(single_hmx - hmx)), 1e-3)
+
+        with self.assertRaises(ValueError):
+            MatrixForwardSimulator(self.model, precision="half")
+
     #REMOVE
     #def test_hproduct(self):
     #    self.fwdsim.hproduct(Ls('Gx', 'Gx'), flat=True, wrt_filter1=[0, 1], wrt_filter2=[1, 2, 3])
@@ -421,3 +513,173 @@ class MapForwardSimTester(ForwardSimBase, BaseCase):
         super(MapForwardSimTester, cls).setUpClass()
         cls.model = cls.model.copy()
         cls.model.sim = MapForwardSimulator()
+
+    @with_temp_path
+    def test_layout_cache_dir(self, tmp_path):
+        circuits = [('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gy'), ('Gy', 'Gi'), ('Gi',)]
+        model = self.model.copy()
+        model.sim = MapForwardSimulator(max_cache_size=None, num_atoms=2)
+        fresh_layout = model.sim.create_layout(circuits)
+
+        model.sim.layout_cache_dir = tmp_path
+        model.sim.create_layout(circuits)
+        self.assertEqual(len(os.listdir(tmp_path)), 3)  # the division into atoms and each atom
+        layout = model.sim.create_layout(circuits)  # loaded from the cache
+        self.assertEqual(len(os.listdir(tmp_path)), 3)
+
+        probs = np.empty(layout.num_elements, 'd')
+        fresh_probs = np.empty(fresh_layout.num_elements, 'd')
+        model.sim.bulk_fill_probs(probs, layout)
+        model.sim.bulk_fill_probs(fresh_probs, fresh_layout)
+        for c in circuits:
+            self.assertArraysAlmostEqual(probs[layout.indices(c)], fresh_probs[fresh_layout.indices(c)])
+
+    def test_dprobs_with_prefix_cache(self):
+        circuits = [('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gy'), ('Gy', 'Gi'), ('Gi',)]
+        model = self.model.copy()
+        model.from_vector(model.to_vector() + 0.01 * np.arange(model.num_params) / model.num_params)
+        model.sim = MapForwardSimulator(max_cache_size=None, num_atoms=1)
+        layout = model.sim.create_layout(circuits, array_types=('ep',))
+        self.assertGreater(layout.atoms[0].cache_size, 0)
+
+        #Parameters of the idle gate only affect the rows of circuits containing it
+        rows_by_param = layout.atoms[0].table_rows_by_param(model)
+        table = layout.atoms[0].table.contents
+        for i in model.operations['Gi'].gpindices_as_array():
+            self.assertEqual(len(rows_by_param[i]), 2)
+            self.assertTrue(all(L('Gi') in table[k][2].circuit_without_povm for k in rows_by_param[i]))
+
+        dmx = np.empty((layout.num_elements, model.num_params), 'd')
+        model.sim.bulk_fill_dprobs(dmx, layout)
+
+        matrix_model = model.copy()
+        matrix_model.sim = 'matrix'
+        matrix_layout = matrix_model.sim.create_layout(circuits, array_types=('ep',))
+        matrix_dmx = np.empty((matrix_layout.num_elements, model.num_params), 'd')
+        matrix_model.sim.bulk_fill_dprobs(matrix_dmx, matrix_layout)
+        for c in circuits:
+            self.assertArraysAlmostEqual(dmx[layout.indices(c)], matrix_dmx[matrix_layout.indices(c)], places=5)
+
+    def test_adjoint_dprobs(self):
+        circuits = [('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gx', 'Gx'), ('Gy', 'Gi'), ()]
+        model = self.model.copy()
+        model.from_vector(model.to_vector() + 0.01 * np.arange(model.num_params) / model.num_params)
+        model.sim = MapForwardSimulator(max_cache_size=None, num_atoms=1, derivative_mode="adjoint")
+        layout = model.sim.create_layout(circuits, array_types=('ep',))
+        dmx = np.empty((layout.num_elements, model.num_params), 'd')
+        model.sim.bulk_fill_dprobs(dmx, layout)
+
+        matrix_model = model.copy()
+        matrix_model.sim = 'matrix'
+        matrix_layout = matrix_model.sim.create_layout(circuits, array_types=('ep',))
+        matrix_dmx = np.empty((matrix_layout.num_elements, model.num_params), 'd')
+        matrix_model.sim.bulk_fill_dprobs(matrix_dmx, matrix_layout)
+        for c in circuits:
+            self.assertArraysAlmostEqual(dmx[layout.indices(c)], matrix_dmx[matrix_layout.indices(c)], places=10)
+
+        #Parameter subsets
+        dmx_sub = np.empty((layout.num_elements, 3), 'd')
+        model.sim._mapfill_dprobs_atom_adjoint(dmx_sub, slice(0, layout.num_elements), slice(0, 3),
+                                               layout.atoms[0], slice(4, 7), None)
+        self.assertArraysAlmostEqual(dmx_sub, dmx[:, 4:7])
+
+    def test_threaded_dprobs(self):
+        # enough circuits that (unless prefixes are cached) table levels are divided among threads
+        circuits = [('Gx', 'Gy', 'Gi')[i % 3:] + ('Gx',) * (i % 5) + ('Gy',) * (i % 7) for i in range(60)]
+        model = self.model.copy()
+        model.from_vector(model.to_vector() + 0.01 * np.arange(model.num_params) / model.num_params)
+        for max_cache_size in (0, None):
+            model.sim = MapForwardSimulator(max_cache_size=max_cache_size, num_atoms=1)
+            layout = model.sim.create_layout(circuits, array_types=('ep',))
+            dmx = np.empty((layout.num_elements, model.num_params), 'd')
+            model.sim.bulk_fill_dprobs(dmx, layout)
+
+            model.sim = MapForwardSimulator(max_cache_size=max_cache_size, num_atoms=1, num_threads=3)
+            threaded_dmx = np.empty((layout.num_elements, model.num_params), 'd')
+            model.sim.bulk_fill_dprobs(threaded_dmx, layout)
+            self.assertArraysAlmostEqual(threaded_dmx, dmx, places=12)
+
+    def test_invalid_derivative_mode(self):
+        with self.assertRaises(ValueError):
+            MapForwardSimulator(derivative_mode="backwards")
+        with self.assertRaises(ValueError):
+            MapForwardSimulator(num_threads=0)
+
+
+class _CoinFlipForwardSimulator(WeakForwardSimulator):
+    def _compute_circuit_outcome_for_shot(self, spc_circuit, resource_alloc, time=None):
+        return ('1',) if np.random.random() < 0.25 else ('0',)
+
+
+class WeakForwardSimTester(BaseCase):
+    def setUp(self):
+        self.model = models.create_explicit_model_from_expressions([('Q0',)], ['Gx'], ["X(pi/8,Q0)"])
+
+    def test_compute_circuit_outcomes_for_shots(self):
+        self.model.sim = _CoinFlipForwardSimulator(shots=1000)
+        outcomes, counts = self.model.sim._compute_circuit_outcomes_for_shots(Circuit("Gx"), 1000, None)
+        self.assertEqual(set(outcomes), {('0',), ('1',)})
+        self.assertEqual(counts.dtype.kind, 'i')
+        self.assertEqual(sum(counts), 1000)
+
+    def test_merge_outcome_counts(self):
+        from pygsti.forwardsims.weakforwardsim import _merge_outcome_counts
+        outcomes, counts = _merge_outcome_counts([((('0',), ('1',)), np.array([3, 1])),
+                                                  ((('1',), ('2',)), np.array([2, 5]))])
+        self.assertEqual(outcomes, (('0',), ('1',), ('2',)))
+        self.assertArraysEqual(counts, np.array([3, 3, 5]))
+
+    def test_multiprocess_sampling(self):
+        self.model.sim = _CoinFlipForwardSimulator(shots=1000, num_processes=2)
+        probs = self.model.sim.probs(Circuit("Gx"))
+        self.assertAlmostEqual(sum(probs.values()), 1.0)
+        self.assertAlmostEqual(probs[('1',)], 0.25, delta=0.1)
+
+        pool = self.model.sim._pool
+        self.assertIsNotNone(pool)
+
+        bulk_probs = self.model.sim.bulk_probs([Circuit("Gx"), Circuit("GxGx"), Circuit("GxGxGx")])
+        self.assertEqual(len(bulk_probs), 3)
+        for circuit_probs in bulk_probs.values():
+            self.assertAlmostEqual(sum(circuit_probs.values()), 1.0)
+        self.assertIs(self.model.sim._pool, pool)  # processes are reused across calls
+
+        self.model.sim.close()
+        self.assertIsNone(self.model.sim._pool)
+
+
+class CHPForwardSimTester(BaseCase):
+    # CHP itself isn't available in the test environment, so only test program construction & output parsing
+    def setUp(self):
+        from pygsti.forwardsims.chpforwardsim import CHPForwardSimulator
+        from pygsti.modelmembers.operations import StaticStandardOp, ComposedOp, EmbeddedOp
+        from pygsti.modelmembers.states import ComputationalBasisState
+        from pygsti.modelmembers.povms import ComputationalBasisPOVM
+
+        self.sim = CHPForwardSimulator(__file__, shots=5, shots_per_run=2)  # any existing file will do
+        self.model = ExplicitOpModel(['Q0', 'Q1'], simulator=self.sim, evotype='chp')
+        self.model['rho0'] = ComputationalBasisState([0, 0], evotype='chp')
+        self.model['Mdefault'] = ComputationalBasisPOVM(2, evotype='chp')
+        self.model['Gxi'] = ComposedOp([
+            EmbeddedOp(['Q0', 'Q1'], ['Q0'], StaticStandardOp('Gxpi', evotype='chp')),
+            EmbeddedOp(['Q0', 'Q1'], ['Q1'], StaticStandardOp('Gi', evotype='chp'))])
+
+    def test_offset_chp_str(self):
+        from pygsti.forwardsims.chpforwardsim import _offset_chp_str
+        self.assertEqual(_offset_chp_str('h 0\nc 0 1\n\nm 1\n', 4), 'h 4\nc 4 5\nm 5\n')
+
+    def test_batched_program(self):
+        layer_ops = self.sim._resolve_circuit_layer_operators(Circuit([L('Gxi')]))
+        program = self.sim._create_chp_program(layer_ops, 2)
+        self.assertEqual(program, '#\nh 0\np 0\np 0\nh 0\nm 0\nm 1\nh 2\np 2\np 2\nh 2\nm 2\nm 3\n')
+
+        out = ("Outcome of measuring qubit 0: 1\nOutcome of measuring qubit 1: 0\n"
+               "Outcome of measuring qubit 3: 1 (random)\nOutcome of measuring qubit 2: 0\n")
+        self.assertEqual(self.sim._parse_chp_output(out, 2), [('10',), ('01',)])
+
+    def test_single_shot(self):
+        out = "Outcome of measuring qubit 0: 1\nOutcome of measuring qubit 1: 0 (random)\n"
+        with mock.patch.object(self.sim, '_run_chp_program', return_value=out) as run_chp_program:
+            outcome = self.sim._compute_circuit_outcome_for_shot(Circuit([L('Gxi')]), None)
+        run_chp_program.assert_called_once_with('#\nh 0\np 0\np 0\nh 0\nm 0\nm 1\n')
+        self.assertEqual(outcome, ('10',))
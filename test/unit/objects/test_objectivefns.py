@@ -1,3 +1,5 @@
+from unittest import mock
+
 import numpy as np
 
 import pygsti
@@ -319,6 +321,33 @@ class TimeIndependentMDSObjectiveFunctionTester(ObjectiveFunctionData):
                 self.assertArraysAlmostEqual(dterms / nEls, 2 * lsvec[:, None] * dlsvec / nEls,
                                              places=4)  # each *element* should match to 4 places
 
+    def test_lsvec_and_dlsvec(self):
+        if not self.computes_lsvec:
+            return
+
+        v0 = self.model.to_vector()
+        v1 = v0 + 0.01
+        for objfn in self.objfns:
+            lsvec = objfn.lsvec(v1).copy()
+            dlsvec = objfn.dlsvec(v1).copy()
+
+            objfn.lsvec(v0)  # so probabilities must be recomputed at v1 below
+            fused_lsvec, fused_dlsvec = objfn.lsvec_and_dlsvec(v1)
+            self.assertArraysAlmostEqual(fused_lsvec, lsvec)
+            self.assertArraysAlmostEqual(fused_dlsvec, dlsvec)
+
+    def test_probs_reused_at_same_paramvec(self):
+        v0 = self.model.to_vector()
+        for objfn in self.objfns:
+            terms = objfn.terms(v0).copy()
+            with mock.patch.object(objfn.model.sim, 'bulk_fill_probs') as mock_fill_probs:
+                self.assertArraysAlmostEqual(objfn.terms(v0), terms)
+                mock_fill_probs.assert_not_called()
+
+                objfn.clear_probs_cache()
+                objfn.terms(v0)
+                mock_fill_probs.assert_called_once()
+
     def test_approximate_hessian(self):
         if not self.enable_hessian_tests:
             return  # don't test the hessian for this objective function
@@ -412,6 +441,9 @@ class TVDFunctionTester(TimeIndependentMDSObjectiveFunctionTester, BaseCase):
     def test_derivative(self):
         self.skipTest("Derivatives for TVDFunction aren't implemented yet.")
 
+    def test_lsvec_and_dlsvec(self):
+        self.skipTest("Derivatives for TVDFunction aren't implemented yet.")
+
 
 class TimeDependentMDSObjectiveFunctionTester(ObjectiveFunctionData):
     """
@@ -1,5 +1,7 @@
 import numpy as np
 
+from pygsti.circuits import Circuit
+from pygsti.layouts.prefixtable import PrefixTable
 from ..util import BaseCase
 
 
@@ -60,3 +62,38 @@ from ..util import BaseCase
 #    else:
 #        assert(None not in circuits[0:nFinal])
 #        return circuits[0:nFinal]
+
+
+class PrefixTableTester(BaseCase):
+    def setUp(self):
+        self.circuits = [Circuit(c) for c in [('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gy'), ('Gx', 'Gy', 'Gx', 'Gx'),
+                                              ('Gy', 'Gy'), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gy', 'Gx', 'Gy')]]
+
+    def _run_table(self, table):
+        """ Follow the table's instructions, returning the circuits it computes and its number of applies """
+        cached = [None] * table.cache_size
+        computed = [None] * len(self.circuits)
+        for iDest, iStart, remainder, iCache in table.contents:
+            computed[iDest] = (() if iStart is None else cached[iStart]) + remainder.layertup
+            if iCache is not None:
+                self.assertIsNone(cached[iCache])  # each cache slot is filled exactly once
+                cached[iCache] = computed[iDest]
+        return computed, sum([len(remainder) for _, _, remainder, _ in table.contents])
+
+    def test_table(self):
+        for max_cache_size, expected_applies in [(0, 19), (1, 11), (None, 9)]:
+            table = PrefixTable(self.circuits, max_cache_size)
+            computed, nApplies = self._run_table(table)
+            self.assertEqual(computed, [c.layertup for c in self.circuits])
+            self.assertEqual(nApplies, expected_applies)
+            self.assertTrue(max_cache_size is None or table.cache_size <= max_cache_size)
+
+    def test_row_levels(self):
+        table = PrefixTable(self.circuits, None)
+        levels = table.row_levels()
+        cache_levels = {}
+        for level, (_, iStart, _, iCache) in zip(levels, table.contents):
+            self.assertEqual(level, 0 if iStart is None else cache_levels[iStart] + 1)
+            if iCache is not None: cache_levels[iCache] = level
+        self.assertGreater(max(levels), 0)
+        self.assertTrue(np.all(PrefixTable(self.circuits, 0).row_levels() == 0))
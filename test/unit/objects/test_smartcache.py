@@ -1,9 +1,13 @@
+import os
 import pickle
+import threading
 import time
 
+import numpy as np
+
 import pygsti
 from pygsti.baseobjs import smartcache as sc
-from ..util import BaseCase
+from ..util import BaseCase, with_temp_path
 
 
 @sc.smart_cached
@@ -50,3 +54,150 @@ class SmartCacheTester(BaseCase):
         a = pickle.dumps(slow_fib.cache)
         newcache = pickle.loads(a)
         # TODO assert correctness
+
+    def test_timing_aggregates(self):
+        cache = sc.SmartCache()
+        for i in range(50):
+            cache.cached_compute(slow_fib, (i % 3,))
+        self.assertEqual(len(cache.callTimes['slow_fib']), 3)
+        self.assertEqual(cache.callTimes['slow_fib'].count, 3)
+        self.assertGreater(cache.callTimes['slow_fib'].total, 0.0)
+        self.assertEqual(cache.fhits['slow_fib'], 47)
+
+
+def array_of_size(n):
+    time.sleep(0.002)  # so caching is "effective"
+    return np.zeros(n, 'd')
+
+
+def lock_for(n):
+    time.sleep(0.002)
+    return threading.Lock()
+
+
+class BoundedSmartCacheTester(BaseCase):
+    def test_lru_eviction(self):
+        cache = sc.SmartCache(max_bytes=3000)
+        for n in (100, 101, 102):  # each result is ~800 bytes
+            cache.cached_compute(array_of_size, (n,))
+        cache.cached_compute(array_of_size, (100,))  # now the most recently used
+        cache.cached_compute(array_of_size, (103,))  # evicts the least recently used (n=101)
+
+        self.assertLessEqual(cache.nbytes, 3000)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(sorted([len(v) for v in cache.cache.values()]), [100, 102, 103])
+
+        # results larger than the whole budget aren't cached
+        cache.cached_compute(array_of_size, (1000,))
+        self.assertEqual(len(cache.cache), 3)
+
+    def test_cost_eviction(self):
+        cache = sc.SmartCache(max_bytes=3000, eviction="cost")
+        cache.cached_compute(slow_fib, (10,))  # expensive and small, so should be kept
+        for n in range(100, 110):
+            cache.cached_compute(array_of_size, (n,))
+        self.assertIn(89, cache.cache.values())
+        self.assertLessEqual(cache.nbytes, 3000)
+
+        with self.assertRaises(ValueError):
+            sc.SmartCache(eviction="foobar")
+
+    @with_temp_path
+    def test_spill_to_disk(self, pth):
+        cache = sc.SmartCache(max_bytes=1000, spill_dir=pth)
+        _, a = cache.cached_compute(array_of_size, (100,))
+        cache.cached_compute(array_of_size, (101,))  # spills the n=100 result
+        self.assertEqual(len(cache.spilled), 1)
+        self.assertEqual(len(os.listdir(pth)), 1)
+
+        _, a2 = cache.cached_compute(array_of_size, (100,))  # re-loaded from disk
+        self.assertArraysEqual(a, a2)
+        self.assertEqual(cache.fhits['array_of_size'], 1)
+        self.assertEqual(len(cache.spilled), 1)  # now the n=101 result is spilled
+
+    def test_pickle_bounded(self):
+        cache = sc.SmartCache(max_bytes=3000)
+        cache.cached_compute(array_of_size, (100,))
+        newcache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(newcache.nbytes, cache.nbytes)
+        self.assertEqual(newcache.max_bytes, 3000)
+
+    def test_pickle_bounded_unpickleable(self):
+        cache = sc.SmartCache(max_bytes=3000, eviction="cost")
+        cache.cached_compute(array_of_size, (100,))
+        cache.cached_compute(lock_for, (1,))  # the result can't be pickled, so is dropped
+        newcache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(len(newcache.cache), 1)
+        self.assertEqual(list(newcache.entry_priorities.keys()), list(newcache.cache.keys()))
+
+        newcache.cached_compute(array_of_size, (100,))  # a hit, which updates the recency order
+        for n in (101, 102, 103):
+            newcache.cached_compute(array_of_size, (n,))
+        self.assertLessEqual(newcache.nbytes, 3000)
+
+
+_n_norm_calls = [0]
+
+
+def counted_norm(a, scale=1.0):
+    time.sleep(0.002)
+    _n_norm_calls[0] += 1
+    return (scale() if callable(scale) else scale) * np.linalg.norm(a)
+
+
+class PersistentSmartCacheTester(BaseCase):
+    def setUp(self):
+        _n_norm_calls[0] = 0
+
+    @with_temp_path
+    def test_shared_persistent_store(self, pth):
+        a = np.arange(10.0)
+        cache1 = sc.SmartCache(persistent_dir=pth)
+        _, r1 = cache1.cached_compute(counted_norm, (a,), {'scale': 2.0})
+        self.assertEqual(_n_norm_calls[0], 1)
+
+        # a separate cache (e.g. in another process) loads the result instead of recomputing it
+        cache2 = sc.SmartCache(persistent_dir=pth)
+        _, r2 = cache2.cached_compute(counted_norm, (a.copy(),), {'scale': 2.0})
+        self.assertEqual(_n_norm_calls[0], 1)
+        self.assertEqual(r1, r2)
+        self.assertEqual(cache2.persistent_hits, 1)
+        self.assertEqual(cache2.hits['counted_norm'], 1)
+
+        cache2.cached_compute(counted_norm, (a,), {'scale': 3.0})  # different arguments => computed
+        self.assertEqual(_n_norm_calls[0], 2)
+
+        # corrupt entries are just treated as misses
+        entry_dir = os.path.join(pth, 'counted_norm')
+        for fname in os.listdir(entry_dir):
+            with open(os.path.join(entry_dir, fname), 'wb') as f:
+                f.write(b'garbage')
+        cache3 = sc.SmartCache(persistent_dir=pth)
+        _, r3 = cache3.cached_compute(counted_norm, (a,), {'scale': 2.0})
+        self.assertEqual(r3, r1)
+        self.assertEqual(_n_norm_calls[0], 3)
+
+    @with_temp_path
+    def test_undigestable_args_not_persisted(self, pth):
+        cache = sc.SmartCache(persistent_dir=pth)
+        _, r = cache.cached_compute(counted_norm, (np.ones(4),), {'scale': np.float64(0.5)})
+        self.assertEqual(r, 1.0)
+        _, r = cache.cached_compute(counted_norm, (np.ones(4), lambda: 0.5))  # functions can't be stably digested
+        self.assertEqual(r, 1.0)
+        self.assertEqual(_n_norm_calls[0], 2)
+        self.assertEqual(len(os.listdir(os.path.join(pth, 'counted_norm'))), 1)
+
+    def test_stable_digest(self):
+        self.assertEqual(sc.stable_digest((1, 'a', np.arange(3.0), {'x': 1, 'y': [2.0]})),
+                         sc.stable_digest((1, 'a', np.arange(3.0), {'y': [2.0], 'x': 1})))
+        self.assertNotEqual(sc.stable_digest(np.arange(3.0)), sc.stable_digest(np.arange(3)))
+        self.assertNotEqual(sc.stable_digest([1, 2]), sc.stable_digest((1, 2)))
+
+        mdl = pygsti.models.create_explicit_model_from_expressions([('Q0',)], ['Gx'], ["X(pi/2,Q0)"])
+        self.assertEqual(sc.stable_digest(mdl), sc.stable_digest(mdl.copy()))
+        mdl2 = mdl.copy()
+        mdl2.operations['Gx'][0, 0] = 0.5
+        self.assertNotEqual(sc.stable_digest(mdl), sc.stable_digest(mdl2))
+
+        with self.assertRaises(sc.UnstableDigestError):
+            sc.stable_digest(lambda x: x)
@@ -41,3 +41,54 @@ class CustomLMTester(BaseCase):
         xf, converged, msg, *_ = lm.custom_leastsq(g, gjac, x0, max_iter=100, arrays_interface=ari,
                                                    x_limits=xlimits)
         self.assertAlmostEqual(xf[0], 1.0)
+
+    def test_custom_leastsq_broyden_updates(self):
+        # fit y = a * exp(b * t) + c, counting true jacobian evaluations
+        t = np.linspace(0, 1, 20)
+        y = 2.0 * np.exp(-1.5 * t) + 0.5
+
+        def obj_fn(x, oob_check=False): return x[0] * np.exp(x[1] * t) + x[2] - y
+
+        def jac_fn(x):
+            jac_fn.num_calls += 1
+            return np.column_stack((np.exp(x[1] * t), x[0] * t * np.exp(x[1] * t), np.ones(len(t))))
+
+        x0 = np.array([1.0, 0.0, 0.0], 'd')
+        results = {}
+        for max_broyden_updates in (0, 3):
+            jac_fn.num_calls = 0
+            ari = _ari.UndistributedArraysInterface(20, 3)
+            xf, converged, msg, *_ = lm.custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-20, jac_norm_tol=1e-10,
+                                                       rel_ftol=1e-12, max_iter=100, arrays_interface=ari,
+                                                       max_broyden_updates=max_broyden_updates)
+            self.assertTrue(converged)
+            self.assertArraysAlmostEqual(xf, np.array([2.0, -1.5, 0.5]), places=5)
+            results[max_broyden_updates] = jac_fn.num_calls
+        self.assertLess(results[3], results[0])
+
+    def test_custom_leastsq_obj_and_jac_fn(self):
+        t = np.linspace(0, 1, 20)
+        y = 2.0 * np.exp(-1.5 * t) + 0.5
+
+        def obj_fn(x, oob_check=False): return x[0] * np.exp(x[1] * t) + x[2] - y
+
+        def jac_fn(x):
+            jac_fn.num_calls += 1
+            return np.column_stack((np.exp(x[1] * t), x[0] * t * np.exp(x[1] * t), np.ones(len(t))))
+
+        def obj_and_jac_fn(x):
+            obj_and_jac_fn.num_calls += 1
+            return obj_fn(x), np.column_stack((np.exp(x[1] * t), x[0] * t * np.exp(x[1] * t), np.ones(len(t))))
+
+        x0 = np.array([1.0, 0.0, 0.0], 'd')
+        results = {}
+        for fused in (None, obj_and_jac_fn):
+            jac_fn.num_calls = obj_and_jac_fn.num_calls = 0
+            ari = _ari.UndistributedArraysInterface(20, 3)
+            xf, converged, msg, *_ = lm.custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-20, jac_norm_tol=1e-10,
+                                                       rel_ftol=1e-12, max_iter=100, arrays_interface=ari,
+                                                       obj_and_jac_fn=fused)
+            self.assertTrue(converged)
+            self.assertArraysAlmostEqual(xf, np.array([2.0, -1.5, 0.5]), places=5)
+            results[fused is not None] = (jac_fn.num_calls, obj_and_jac_fn.num_calls)
+        self.assertEqual(results[True], (results[False][0] - 1, 1))
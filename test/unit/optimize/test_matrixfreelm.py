@@ -0,0 +1,90 @@
+import numpy as np
+
+from pygsti.optimize import arraysinterface as _ari
+from pygsti.optimize import customlm as lm
+from pygsti.optimize import matrixfreelm as mflm
+from ..util import BaseCase
+
+
+def rosenbrock(x):
+    return np.array([10 * (x[1] - x[0]**2), 1 - x[0]], 'd')
+
+
+def rosenbrock_jac(x):
+    return np.array([[-20 * x[0], 10.0],
+                     [-1.0, 0.0]], 'd')
+
+
+def cg_linear_solver(ari, cg_tol=1e-10, cg_maxiter=100):
+    cg_arrays = (ari.allocate_jtf(), ari.allocate_jtf(), ari.allocate_jtf(), ari.allocate_jtf(),
+                 ari.allocate_f(), np.zeros(ari.num_global_params, 'd'))
+
+    def solve(jac, jtj_diag, damping_diag, minus_jtf, dx):
+        mflm._precond_cg_solve(jac, jtj_diag, damping_diag, minus_jtf, dx, ari, cg_tol, cg_maxiter, cg_arrays)
+    return solve
+
+
+class MatrixFreeLMTester(BaseCase):
+    def test_cg_linear_solver_rosenbrock(self):
+        x0 = np.array([-1.2, 1.0], 'd')
+        ari = _ari.UndistributedArraysInterface(2, 2)
+        xf, converged, msg, mu, nu, norm_f, f, jtj = lm.custom_leastsq(
+            rosenbrock, rosenbrock_jac, x0, f_norm2_tol=1e-20, rel_ftol=1e-12, jac_norm_tol=1e-12, max_iter=200,
+            max_dx_scale=None, arrays_interface=ari, linear_solver=cg_linear_solver(ari))
+        self.assertTrue(converged)
+        self.assertIsNone(jtj)
+        self.assertArraysAlmostEqual(xf, np.array([1.0, 1.0]))
+        self.assertArraysAlmostEqual(f, rosenbrock(xf))
+
+    def test_cg_linear_solver_agrees_with_direct_solve(self):
+        rng = np.random.default_rng(1234)
+        A = rng.normal(size=(30, 8))
+        b = rng.normal(size=30)
+
+        def obj_fn(x, oob_check=False): return np.dot(A, x) - b
+        def jac_fn(x): return A
+
+        x0 = np.zeros(8, 'd')
+        ari = _ari.UndistributedArraysInterface(30, 8)
+        xf_mf, *_ = lm.custom_leastsq(obj_fn, jac_fn, x0, rel_ftol=1e-12, jac_norm_tol=1e-10,
+                                      arrays_interface=ari, linear_solver=cg_linear_solver(ari))
+        xf_lm, *_ = lm.custom_leastsq(obj_fn, jac_fn, x0, rel_ftol=1e-12, jac_norm_tol=1e-10,
+                                      arrays_interface=_ari.UndistributedArraysInterface(30, 8))
+        self.assertArraysAlmostEqual(xf_mf, np.linalg.lstsq(A, b, rcond=None)[0], places=5)
+        self.assertArraysAlmostEqual(xf_mf, xf_lm, places=5)
+
+    def test_cg_linear_solver_damping_modes(self):
+        x0 = np.array([-1.2, 1.0], 'd')
+        for damping_mode in ('JTJ', 'adaptive'):
+            ari = _ari.UndistributedArraysInterface(2, 2)
+            xf, converged, *_ = lm.custom_leastsq(
+                rosenbrock, rosenbrock_jac, x0, f_norm2_tol=1e-20, rel_ftol=1e-12, jac_norm_tol=1e-12, max_iter=200,
+                max_dx_scale=None, damping_mode=damping_mode, arrays_interface=ari,
+                linear_solver=cg_linear_solver(ari))
+            self.assertTrue(converged)
+            self.assertArraysAlmostEqual(xf, np.array([1.0, 1.0]), places=5)
+
+    def test_cg_linear_solver_x_limits(self):
+        x0 = np.array([6.0], 'd')
+        xlimits = np.array([[1.0, 10.0]], 'd')
+        ari = _ari.UndistributedArraysInterface(1, 1)
+        xf, converged, msg, *_ = lm.custom_leastsq(lambda x: np.array([x[0]**2], 'd'),
+                                                   lambda x: np.array([[2 * x[0]]], 'd'), x0,
+                                                   max_iter=100, arrays_interface=ari, x_limits=xlimits,
+                                                   linear_solver=cg_linear_solver(ari))
+        self.assertAlmostEqual(xf[0], 1.0)
+
+    def test_linear_solver_raises_on_singular_values_basis(self):
+        ari = _ari.UndistributedArraysInterface(2, 2)
+        with self.assertRaises(ValueError):
+            lm.custom_leastsq(rosenbrock, rosenbrock_jac, np.array([-1.2, 1.0], 'd'), arrays_interface=ari,
+                              damping_basis='singular_values', linear_solver=cg_linear_solver(ari))
+
+    def test_serialization(self):
+        opt = mflm.MatrixFreeLMOptimizer(maxiter=10, damping_mode='JTJ', cg_tol=1e-6, cg_maxiter=20,
+                                         max_broyden_updates=2)
+        opt2 = mflm.MatrixFreeLMOptimizer.from_nice_serialization(opt.to_nice_serialization())
+        self.assertEqual(opt2.damping_mode, 'JTJ')
+        self.assertEqual(opt2.cg_tol, 1e-6)
+        self.assertEqual(opt2.cg_maxiter, 20)
+        self.assertEqual(opt2.max_broyden_updates, 2)
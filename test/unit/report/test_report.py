@@ -0,0 +1,136 @@
+import pickle
+
+import pygsti
+from pygsti.baseobjs.smartcache import SmartCache
+from pygsti.modelpacks import smq1Q_XYI
+from pygsti.report.report import Report
+from pygsti.report.section import Section
+from pygsti.report.workspace import DeferredValue, Switchboard, Workspace
+from ..util import BaseCase
+
+
+class SquaringWorkspace(object):
+    """ Stands in for a Workspace, whose factories compute each figure """
+    def Square(self, x):
+        return x ** 2
+
+
+class ShiftedSquaresSection(Section):
+    def prepare(self, workspace, offset=0, **kwargs):
+        return {'section_offset': offset}, {'shift': offset + 1}
+
+    @Section.figure_factory()
+    def square_a(workspace, x=0, shift=0, **kwargs):
+        return workspace.Square(x) + shift
+
+    @Section.figure_factory(1)
+    def square_b(workspace, x=0, shift=0, **kwargs):
+        return workspace.Square(x + 1) + shift
+
+
+class CubesSection(Section):
+    @Section.figure_factory()
+    def cube(workspace, x=0, **kwargs):
+        return workspace.Square(x) * x
+
+
+class ReportBuildTester(BaseCase):
+    def setUp(self):
+        self.report = Report({}, None, [ShiftedSquaresSection(), CubesSection()], set(),
+                             {'title': 'Test'}, {'x': 3, 'offset': 10}, workspace=SquaringWorkspace())
+
+    def test_build(self):
+        qtys = self.report._build()
+        self.assertEqual(qtys, {'title': 'Test', 'section_offset': 10, 'square_a': 20, 'square_b': 27, 'cube': 27})
+        self.assertEqual(list(self.report.section_timings.keys()), ['ShiftedSquaresSection', 'CubesSection'])
+
+        qtys = self.report._build({'brevity': 1})
+        self.assertNotIn('square_b', qtys)
+
+    def test_section_render(self):
+        section = ShiftedSquaresSection()
+        self.assertEqual(section.figure_names(), ['square_a', 'square_b'])
+        self.assertEqual(section.render(SquaringWorkspace(), x=2, offset=1),
+                         {'section_offset': 1, 'square_a': 6, 'square_b': 11})
+
+    def test_parallel_build(self):
+        serial_qtys = self.report._build()
+        parallel_qtys = self.report._build(num_processes=2)
+        self.assertEqual(parallel_qtys, serial_qtys)
+        self.assertEqual(len(self.report.section_timings), 2)
+
+
+class SwitchboardPickleTester(BaseCase):
+    def test_pickle(self):
+        # switchboards are sent to the processes rendering a report's figures
+        switchboard = Switchboard(LazyWorkspace(), ['switch'], [['a', 'b']], ['buttons'])
+        switchboard.add('switched', [0])
+        switchboard.switched[:] = [1, 2]
+        switchboard.add_unswitched('unswitched', 3)
+
+        copy = pickle.loads(pickle.dumps(switchboard))
+        self.assertEqual(list(copy.keys()), ['switched', 'unswitched'])
+        self.assertEqual(list(copy.switched[:]), [1, 2])
+        self.assertIs(copy.switched.parent, copy)
+        self.assertEqual(copy.unswitched, 3)
+        self.assertEqual(copy.switchNames, ['switch'])
+
+
+class StandardReportBuildTester(BaseCase):
+    @classmethod
+    def setUpClass(cls):
+        edesign = smq1Q_XYI.create_gst_experiment_design(2)
+        ds = pygsti.data.simulate_data(smq1Q_XYI.target_model().depolarize(op_noise=0.01),
+                                       edesign.all_circuits_needing_data, 100, seed=1234)
+        gaugeopt_suite = pygsti.protocols.GSTGaugeOptSuite(gaugeopt_target=smq1Q_XYI.target_model())
+        results = pygsti.protocols.StandardGST(modes="full TP", gaugeopt_suite=gaugeopt_suite, verbosity=0).run(
+            pygsti.protocols.ProtocolData(edesign, ds))
+        cls.report = pygsti.report.construct_standard_report(results, title="Test", verbosity=0)
+
+    def test_parallel_build(self):
+        serial_qtys = self.report._build({'brevity': 4})
+        parallel_qtys = self.report._build({'brevity': 4}, num_processes=2)
+        self.assertEqual(list(parallel_qtys.keys()), list(serial_qtys.keys()))
+        for name, qty in serial_qtys.items():
+            self.assertIsInstance(parallel_qtys[name], type(qty))
+        self.assertEqual(list(self.report.section_timings.keys()),
+                         [section.__class__.__name__ for section in self.report._sections])
+
+
+class LazyWorkspace(object):
+    """ Stands in for a (lazy) Workspace, as Workspace construction needs a display environment """
+    switched_compute = Workspace.switched_compute
+
+    def __init__(self):
+        self.lazy = True
+        self.smartCache = SmartCache()
+
+
+class DeferredValueTester(BaseCase):
+    def setUp(self):
+        self.ws = LazyWorkspace()
+        self.calls = []
+
+    def square(self, x):
+        self.calls.append(x)
+        return x ** 2
+
+    def test_lazy_switched_compute(self):
+        values, _, _, _ = self.ws.switched_compute(self.square, 3)
+        self.assertEqual(self.calls, [])
+        self.assertIsInstance(values[0], DeferredValue)
+
+        self.assertEqual(values[0].evaluate(self.ws), 9)
+        self.assertEqual(self.calls, [3])
+        self.assertTrue(self.ws.lazy)
+
+        # now cached, so not deferred
+        values, _, _, _ = self.ws.switched_compute(self.square, 3)
+        self.assertEqual(values, [9])
+        self.assertEqual(self.calls, [3])
+
+    def test_eager_switched_compute(self):
+        self.ws.lazy = False
+        values, _, _, _ = self.ws.switched_compute(self.square, 3)
+        self.assertEqual(values, [9])
+        self.assertEqual(self.calls, [3])